@@ -23,16 +23,37 @@
 #             | call | number | string | ID
 
 import ply.yacc as yacc
-from LexicoPLY.ExpressionLanguageLex import tokens
+from LexicoPLY.ExpressionLanguageLex import tokens, lexer, fim_do_token
 from SintaticoPLY import SintaxeAbstrata as sa
+from SintaticoPLY.TabelaSpans import TabelaSpans
+
+# Tabela de posições preenchida durante parse_com_posicoes (None = desligada)
+spans = None
+
+def _span(p, no, simbolo=None):
+    """Registra o trecho do fonte do nó: a regra inteira ou só o símbolo indicado.
+
+    Com tracking=True o yacc dá a cada símbolo `lexpos` (início) e
+    `endlexpos` (início do seu último token).
+    """
+    if spans is not None:
+        simbolos = p.slice
+        if simbolo is None:
+            primeiro, ultimo = simbolos[1], simbolos[-1]
+        else:
+            primeiro = ultimo = simbolos[simbolo]
+        spans.registrar(no, primeiro.lexpos, getattr(ultimo, "endlexpos", ultimo.lexpos))
+    return no
+
 # Precedência
 precedence = (
     ('left', 'OR'),
     ('left', 'AND'),
     ('left', 'EQUALS', 'LT', 'GT', 'LTEQUALS', 'GTEQUALS'),
     ('left', 'PLUS', 'MINUS'),    
-    ('left', 'TIMES', 'DIVIDE'),
+    ('left', 'TIMES', 'DIVIDE', 'PERCENTUAL'),
     ('right', 'UMINUS','NOT'),
+    ('right', 'EXPO'),
 )
 
 # definição de trecho
@@ -40,7 +61,7 @@ def p_program(p):
     '''program : statements
                | empty '''
     statements = p[1] if p[1] is not None else []
-    p[0] = sa.Block(statements)
+    p[0] = _span(p, sa.Block(statements))
 
 # lista de comandos
 def p_statements_multiple(p):
@@ -54,40 +75,40 @@ def p_statements_single(p):
 # Declaração de Função: função nomeFunção(parametro1, parametro2) ... end
 def p_statement_funcdecl(p):
     '''statement : FUNCTION NAME LPAREN parameters RPAREN statements END'''
-    p[0] = sa.FunctionDecl(sa.String(p[2]), p[4], sa.Block(p[6]))
+    p[0] = _span(p, sa.FunctionDecl(_span(p, sa.String(p[2]), 2), p[4], _span(p, sa.Block(p[6]), 6)))
 
 def p_statement_for(p):
     '''statement : FOR NAME ATRIB expression COMMA expression DO statements END
                  | FOR NAME ATRIB expression COMMA expression COMMA expression DO statements END'''
     
-    var_name = sa.String(p[2])     
+    var_name = _span(p, sa.String(p[2]), 2)
     start_exp = p[4]
     
     # Caso 1: SEM passo (len = 10) -> for i = 1, 10 do ...
     if len(p) == 10:
         end_exp = p[6]
         step_exp = None # ou sa.Number(1) se preferir
-        body = sa.Block(p[8])
+        body = _span(p, sa.Block(p[8]), 8)
         
     # Caso 2: COM passo (len = 12) -> for i = 1, 10, 2 do ...
     else:
         end_exp = p[6]
         step_exp = p[8]
-        body = sa.Block(p[10])
+        body = _span(p, sa.Block(p[10]), 10)
 
-    p[0] = sa.For(var_name, start_exp, end_exp, step_exp, body)
+    p[0] = _span(p, sa.For(var_name, start_exp, end_exp, step_exp, body))
 
 
 def p_statement_while(p):
     '''statement : WHILE expression DO statements END'''
-    p[0] = sa.While(p[2], sa.Block(p[4]))
+    p[0] = _span(p, sa.While(p[2], _span(p, sa.Block(p[4]), 4)))
 
 
 # If / Else
 def p_statement_if(p):
     '''statement : IF expression THEN statements if_tail'''
     elseif_list, else_body = p[5]
-    p[0] = sa.If(p[2], sa.Block(p[4]), else_body, elseif_list)
+    p[0] = _span(p, sa.If(p[2], _span(p, sa.Block(p[4]), 4), else_body, elseif_list))
 
 def p_if_tail_end(p):
     '''if_tail : END'''
@@ -95,7 +116,7 @@ def p_if_tail_end(p):
 
 def p_if_tail_else(p):
     '''if_tail : ELSE statements END'''
-    p[0] = ([], sa.Block(p[2]))
+    p[0] = ([], _span(p, sa.Block(p[2]), 2))
 
 def p_if_tail_elseif(p):
     '''if_tail : elseif_list END'''
@@ -103,15 +124,15 @@ def p_if_tail_elseif(p):
 
 def p_if_tail_elseif_else(p):
     '''if_tail : elseif_list ELSE statements END'''
-    p[0] = (p[1], sa.Block(p[3]))
+    p[0] = (p[1], _span(p, sa.Block(p[3]), 3))
 
 def p_elseif_list_single(p):
     '''elseif_list : ELSEIF expression THEN statements'''
-    p[0] = [(p[2], sa.Block(p[4]))]
+    p[0] = [(p[2], _span(p, sa.Block(p[4]), 4))]
 
 def p_elseif_list_multi(p):
     '''elseif_list : elseif_list ELSEIF expression THEN statements'''
-    p[0] = p[1] + [(p[3], sa.Block(p[5]))]
+    p[0] = p[1] + [(p[3], _span(p, sa.Block(p[5]), 5))]
 
 #-----------------------
 def p_empty(p):
@@ -123,22 +144,22 @@ def p_empty(p):
 # Atribuição: local x = 10
 def p_statement_assign_local(p):
     '''statement : LOCAL NAME ATRIB expression'''
-    p[0] = sa.Assign(sa.String(p[2]), p[4], is_local=True)
+    p[0] = _span(p, sa.Assign(_span(p, sa.String(p[2]), 2), p[4], is_local=True))
 
 # Atribuição existente: x = 10
 def p_statement_assign(p):
     '''statement : NAME ATRIB expression'''
-    p[0] = sa.Assign(sa.String(p[1]), p[3], is_local=False)
+    p[0] = _span(p, sa.Assign(_span(p, sa.String(p[1]), 1), p[3], is_local=False))
 
 # Print é um caso especial de chamada de função em lua
 def p_statement_print(p):
     '''statement : PRINT LPAREN expression RPAREN'''
-    p[0] = sa.FunctionCall("print", [p[3]])
+    p[0] = _span(p, sa.FunctionCall("print", [p[3]]))
 
 # Retorno
 def p_statement_return(p):
     '''statement : RETURN expression'''
-    p[0] = sa.Return(p[2])
+    p[0] = _span(p, sa.Return(p[2]))
 
 # Chamada de função solta: funcao(x)
 def p_statement_call(p):
@@ -150,11 +171,11 @@ def p_statement_call(p):
 # Parâmetros na declaração: (a, b, c)
 def p_parameters_multi(p):
     '''parameters : NAME COMMA parameters'''
-    p[0] = [sa.String(p[1])] + p[3]
+    p[0] = [_span(p, sa.String(p[1]), 1)] + p[3]
 
 def p_parameters_single(p):
     '''parameters : NAME'''
-    p[0] = [sa.String(p[1])]
+    p[0] = [_span(p, sa.String(p[1]))]
 
 def p_parameters_empty(p):
     '''parameters : '''
@@ -177,17 +198,19 @@ def p_arguments_empty(p):
 
 def p_expression_uminus(p):
     '''expression : MINUS expression %prec UMINUS'''
-    p[0] = sa.BinOp(sa.Number(0), '-', p[2]) 
+    p[0] = _span(p, sa.BinOp(_span(p, sa.Number(0), 1), '-', p[2]))
 
 def p_expression_not(p):
     '''expression : NOT expression'''
-    p[0] = sa.UnOp('not', p[2])
+    p[0] = _span(p, sa.UnOp('not', p[2]))
 
 def p_expression_binop(p):
     '''expression : expression PLUS expression
                   | expression MINUS expression
                   | expression TIMES expression
                   | expression DIVIDE expression
+                  | expression PERCENTUAL expression
+                  | expression EXPO expression
                   | expression EQUALS expression
                   | expression LTEQUALS expression
                   | expression GTEQUALS expression
@@ -195,7 +218,7 @@ def p_expression_binop(p):
                   | expression GT expression
                   | expression AND expression
                   | expression OR expression'''
-    p[0] = sa.BinOp(p[1], p[2], p[3])
+    p[0] = _span(p, sa.BinOp(p[1], p[2], p[3]))
 
 def p_expression_call(p):
     '''expression : function_call'''
@@ -204,7 +227,7 @@ def p_expression_call(p):
 # Regra auxiliar para chamada de função (usada tanto em expression quanto statement)
 def p_function_call(p):
     '''function_call : NAME LPAREN arguments RPAREN'''
-    p[0] = sa.FunctionCall(sa.String(p[1]), p[3])
+    p[0] = _span(p, sa.FunctionCall(_span(p, sa.String(p[1]), 1), p[3]))
 
 def p_expression_atom(p):
     '''expression : NUMBER
@@ -225,6 +248,23 @@ def p_expression_atom(p):
         p[0] = sa.Boolean(False)
     elif p.slice[1].type == 'NIL':
         p[0] = sa.Nil() 
+    _span(p, p[0])
+
+def parse_com_posicoes(parser, codigo):
+    """Faz o parse guardando o trecho do fonte de cada nó.
+
+    Retorna (arvore, TabelaSpans).
+    """
+    global spans
+    tabela = TabelaSpans(codigo, medir_token=fim_do_token)
+    spans = tabela
+    analisador_lexico = lexer.clone()
+    analisador_lexico.lineno = 1
+    try:
+        arvore = parser.parse(codigo, lexer=analisador_lexico, tracking=True)
+    finally:
+        spans = None
+    return arvore, tabela
 
 def p_error(p):
     if p:
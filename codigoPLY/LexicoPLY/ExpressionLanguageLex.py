@@ -113,3 +113,12 @@ def t_error(t):
     t.lexer.skip(1)
 
 lexer = lex.lex()
+
+
+def fim_do_token(fonte, pos):
+    """Offset logo depois do token que começa em `pos`."""
+    medidor = lexer.clone()
+    medidor.input(fonte)
+    medidor.lexpos = pos
+    medidor.token()
+    return medidor.lexpos
@@ -0,0 +1,301 @@
+from collections import Counter
+
+try:
+    from .InstrucoesMIPS import (
+        CHAMADAS,
+        Instrucao,
+        eh_virtual,
+    )
+    from .GrafoFluxo import GrafoFluxo
+except ImportError:
+    from InstrucoesMIPS import (
+        CHAMADAS,
+        Instrucao,
+        eh_virtual,
+    )
+    from GrafoFluxo import GrafoFluxo
+
+
+# ==============================================
+#   ALOCACAO DE REGISTRADORES (LINEAR SCAN)
+# ==============================================
+#
+# O EmissorMIPS emite registradores virtuais ("%N"). Para cada funcao
+# (e para o main):
+#   1. calcula a vivacidade dos virtuais nos blocos basicos da lista
+#      (GrafoFluxo);
+#   2. transforma cada virtual em um intervalo [primeira, ultima posicao];
+#   3. percorre os intervalos por inicio (Poletto & Sarkar), dando $t a
+#      quem nao atravessa chamadas e $s a quem atravessa um jal;
+#   4. quem atravessa um jal e nao acha $s livre fica com um $t livre,
+#      guardado por quem chama (caller-saved): sw a cada definicao e lw
+#      depois de cada jal em que esta vivo. So quando custa menos que o
+#      spill (um lw por uso), ou seja, quando atravessa menos jal do que
+#      tem usos;
+#   5. sem registrador livre, o intervalo que termina mais tarde vai para
+#      um slot na pilha, lido/escrito via $t8/$t9 em torno de cada uso.
+#
+# Os $s usados sao devolvidos para o gerador salvar no prologo da funcao
+# (callee-saved). Os $t so sao salvos por quem chama, e so os vivos.
+
+REGISTRADORES_TEMPORARIOS = tuple(f"$t{i}" for i in range(8))
+REGISTRADORES_SALVOS = tuple(f"$s{i}" for i in range(8))
+REGISTRADORES_SPILL = ("$t8", "$t9")
+
+
+class Intervalo:
+    __slots__ = ("virtual", "inicio", "fim", "cruza_chamada", "registrador", "guardado")
+
+    def __init__(self, virtual, posicao):
+        self.virtual = virtual
+        self.inicio = posicao
+        self.fim = posicao
+        self.cruza_chamada = False
+        self.registrador = None  # None depois da alocacao = spill
+        self.guardado = False  # $t salvo na definicao e relido depois dos jal
+
+    def __repr__(self):
+        destino = self.registrador or "pilha"
+        if self.guardado:
+            destino += " (guardado)"
+        return f"{self.virtual}[{self.inicio}, {self.fim}] -> {destino}"
+
+
+class Alocacao:
+    """Resultado do linear scan para uma lista de instrucoes."""
+
+    def __init__(self, itens, intervalos):
+        self.itens = itens
+        self.intervalos = intervalos
+        self.registradores = {
+            iv.virtual: iv.registrador for iv in intervalos if iv.registrador is not None
+        }
+        spills = [iv.virtual for iv in intervalos if iv.registrador is None]
+        self.slots = {virtual: indice for indice, virtual in enumerate(spills)}
+        guardados = [iv for iv in intervalos if iv.guardado]
+        self.guardados = {iv.virtual: len(spills) + indice for indice, iv in enumerate(guardados)}
+        self._guardados = guardados
+        self.salvos = sorted(
+            {r for r in self.registradores.values() if r in REGISTRADORES_SALVOS},
+            key=REGISTRADORES_SALVOS.index,
+        )
+
+    @property
+    def spills(self):
+        return len(self.slots)
+
+    @property
+    def slots_pilha(self):
+        """Slots que o quadro precisa: spills e $t guardados em chamadas."""
+        return len(self.slots) + len(self.guardados)
+
+    def reescrever(self, base=0, registrador_base="$sp"):
+        """
+        Devolve uma copia das instrucoes so com registradores fisicos.
+        Os slots de spill (e depois deles os dos $t guardados) ficam em
+        `base + 4*i(registrador_base)`.
+        """
+        saida = []
+        for posicao, item in enumerate(self.itens):
+            if not isinstance(item, Instrucao):
+                saida.append(item)
+                continue
+            nova = Instrucao(item.op, *item.operandos, comentario=item.comentario, alvos=item.alvos)
+            mapa = {}
+            antes = []
+            depois = []
+            livres = list(REGISTRADORES_SPILL)
+            for virtual in item.usados():
+                if eh_virtual(virtual) and virtual not in mapa:
+                    if virtual in self.slots:
+                        mapa[virtual] = livres.pop(0)
+                        antes.append(Instrucao("lw", mapa[virtual], self._slot(virtual, base, registrador_base)))
+                    else:
+                        mapa[virtual] = self.registradores[virtual]
+            for virtual in item.definidos():
+                if not eh_virtual(virtual):
+                    continue
+                if virtual in self.slots:
+                    # A escrita acontece depois das leituras: $t8 pode ser reaproveitado.
+                    mapa[virtual] = mapa.get(virtual, REGISTRADORES_SPILL[0])
+                    depois.append(Instrucao("sw", mapa[virtual], self._slot(virtual, base, registrador_base)))
+                else:
+                    mapa[virtual] = self.registradores[virtual]
+            nova.substituir(mapa)
+            for virtual in item.definidos():
+                if virtual in self.guardados:
+                    depois.append(Instrucao("sw", mapa[virtual], self._slot(virtual, base, registrador_base)))
+            if item.op in CHAMADAS:
+                for iv in self._guardados:
+                    if iv.inicio < posicao < iv.fim:
+                        depois.append(Instrucao("lw", iv.registrador, self._slot(iv.virtual, base, registrador_base)))
+            saida.extend(antes)
+            saida.append(nova)
+            saida.extend(depois)
+        return saida
+
+    def _slot(self, virtual, base, registrador_base):
+        indice = self.slots[virtual] if virtual in self.slots else self.guardados[virtual]
+        return f"{base + 4 * indice}({registrador_base})"
+
+
+class AlocadorRegistradores:
+    def __init__(self, temporarios=REGISTRADORES_TEMPORARIOS, salvos=REGISTRADORES_SALVOS):
+        self.temporarios = tuple(temporarios)
+        self.salvos = tuple(salvos)
+
+    def alocar(self, itens):
+        itens = list(itens)
+        intervalos = calcular_intervalos(itens)
+        self._chamadas = [
+            posicao for posicao, item in enumerate(itens)
+            if isinstance(item, Instrucao) and item.op in CHAMADAS
+        ]
+        self._usos = Counter(
+            virtual for item in itens if isinstance(item, Instrucao) for virtual in _virtuais(item.usados())
+        )
+        self._varrer(sorted(intervalos.values(), key=lambda iv: (iv.inicio, iv.fim)))
+        return Alocacao(itens, list(intervalos.values()))
+
+    def _varrer(self, intervalos):
+        ativos = []
+        livres_t = list(self.temporarios)
+        livres_s = list(self.salvos)
+
+        for atual in intervalos:
+            # Libera quem ja terminou. Terminar na posicao em que `atual` comeca
+            # basta: a instrucao le os operandos antes de escrever o destino.
+            for antigo in [iv for iv in ativos if iv.fim <= atual.inicio]:
+                ativos.remove(antigo)
+                if antigo.registrador in self.salvos:
+                    livres_s.append(antigo.registrador)
+                else:
+                    livres_t.append(antigo.registrador)
+
+            if not atual.cruza_chamada and livres_t:
+                atual.registrador = livres_t.pop(0)
+            elif livres_s:
+                atual.registrador = livres_s.pop(0)
+            elif livres_t and self._vale_guardar(atual):
+                atual.registrador = livres_t.pop(0)
+            else:
+                candidatos = [
+                    iv for iv in ativos
+                    if not atual.cruza_chamada or iv.registrador in self.salvos or self._vale_guardar(atual)
+                ]
+                vitima = max(candidatos, key=lambda iv: iv.fim, default=None)
+                if vitima is None or vitima.fim <= atual.fim:
+                    continue  # o proprio `atual` vai para a pilha
+                atual.registrador = vitima.registrador
+                vitima.registrador = None
+                vitima.guardado = False
+                ativos.remove(vitima)
+            atual.guardado = atual.cruza_chamada and atual.registrador not in self.salvos
+            ativos.append(atual)
+
+    def _vale_guardar(self, intervalo):
+        """$t guardado (um lw por jal) custa menos que o spill (um lw por uso)?"""
+        atravessadas = sum(1 for p in self._chamadas if intervalo.inicio < p < intervalo.fim)
+        return atravessadas < self._usos[intervalo.virtual]
+
+
+# ==============================================
+#   INTERVALOS DE VIDA
+# ==============================================
+
+def _virtuais(registradores):
+    return [r for r in registradores if eh_virtual(r)]
+
+
+def vivacidade_virtuais(grafo):
+    """Vivacidade (GrafoFluxo) contando so os registradores virtuais."""
+    return grafo.vivacidade(
+        lambda item: _virtuais(item.usados()), lambda item: _virtuais(item.definidos())
+    )
+
+
+def calcular_intervalos(itens):
+    """virtual -> Intervalo cobrindo toda posicao em que ele esta vivo."""
+    grafo = GrafoFluxo(itens)
+    vivacidade = vivacidade_virtuais(grafo)
+    intervalos = {}
+
+    def estender(virtual, posicao):
+        intervalo = intervalos.get(virtual)
+        if intervalo is None:
+            intervalos[virtual] = Intervalo(virtual, posicao)
+        else:
+            intervalo.inicio = min(intervalo.inicio, posicao)
+            intervalo.fim = max(intervalo.fim, posicao)
+
+    # O intervalo e o fecho: cada uso ou definicao (na ordem da lista, que
+    # e a ordem dos intervalos), o inicio do primeiro bloco em que o virtual
+    # esta vivo na entrada e o fim do ultimo em que esta vivo na saida. Com
+    # os vetores de bits, cada virtual so e decodificado na primeira vez.
+    for indice, item in enumerate(itens):
+        for virtual in _virtuais(item.definidos()) + _virtuais(item.usados()):
+            estender(virtual, indice)
+    vistos = 0
+    for bloco in grafo.blocos:
+        novos = vivacidade.entradas[bloco.numero] & ~vistos
+        if novos:
+            vistos |= novos
+            for virtual in vivacidade.conjunto(novos):
+                estender(virtual, bloco.inicio)
+    vistos = 0
+    for bloco in reversed(grafo.blocos):
+        novos = vivacidade.saidas[bloco.numero] & ~vistos
+        if novos:
+            vistos |= novos
+            for virtual in vivacidade.conjunto(novos):
+                estender(virtual, bloco.fim - 1)
+
+    # Os blocos com jal sao percorridos de tras para frente, para marcar
+    # quem esta vivo depois da chamada.
+    for bloco in grafo.blocos:
+        if not any(
+            isinstance(item, Instrucao) and item.op in CHAMADAS for item in itens[bloco.inicio:bloco.fim]
+        ):
+            continue
+        vivos = vivacidade.saidas[bloco.numero]
+        for indice in range(bloco.fim - 1, bloco.inicio - 1, -1):
+            item = itens[indice]
+            definidos = vivacidade.vetor(_virtuais(item.definidos()))
+            if isinstance(item, Instrucao) and item.op in CHAMADAS:
+                for virtual in vivacidade.conjunto(vivos & ~definidos):
+                    intervalos[virtual].cruza_chamada = True
+            vivos = (vivos & ~definidos) | vivacidade.vetor(_virtuais(item.usados()))
+    return intervalos
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main():
+    try:
+        from .InstrucoesMIPS import analisar_instrucao, renderizar
+    except ImportError:
+        from InstrucoesMIPS import analisar_instrucao, renderizar
+
+    codigo = """
+    lw %0, n
+    li %1, 1
+    sub %2, %0, %1
+    move $a0, %2
+    jal func_f
+    move %3, $v0
+    mul %4, %0, %3
+    move $v0, %4
+    """
+    itens = [analisar_instrucao(linha) for linha in codigo.strip().splitlines()]
+    alocacao = AlocadorRegistradores().alocar(itens)
+    for intervalo in sorted(alocacao.intervalos, key=lambda iv: iv.inicio):
+        print(intervalo)
+    print(f"\n$s a salvar: {alocacao.salvos}, spills: {alocacao.spills}, "
+          f"$t guardados: {len(alocacao.guardados)}\n")
+    print(renderizar(alocacao.reescrever()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+import heapq
+import time
+from bisect import bisect_left, insort
+
+try:
+    from . import SymbolTable as st
+    from .VisitorSemantico import VisitorSemantico, _criar_parser
+    from .AuxiliarAST import nome_no
+except ImportError:
+    import SymbolTable as st
+    from VisitorSemantico import VisitorSemantico, _criar_parser
+    from AuxiliarAST import nome_no
+
+
+# ==============================================
+#   ANALISE SEMANTICA INCREMENTAL
+# ==============================================
+#
+# Cada comando do nivel superior do programa (em especial cada
+# FunctionDecl) e uma "unidade". Para cada unidade guardamos:
+#   - os erros/avisos que ela produziu;
+#   - dependencias: a assinatura de cada simbolo global que ela consultou,
+#     no estado em que o encontrou (None se ainda nao existia);
+#   - efeitos: a assinatura final de cada simbolo global que ela criou ou
+#     alterou (ex.: declaracao de funcao, atribuicao a global).
+#
+# Dois indices mantem o ambiente global sem reexecutar as unidades:
+#   - historico: nome -> unidades (em ordem) que tem efeito sobre o nome; o
+#     estado visto por uma unidade e o efeito da ultima anterior a ela;
+#   - dependentes: nome -> unidades que consultaram o nome.
+# Depois de uma edicao so sao reanalisadas a unidade editada e as unidades
+# que dependem de um nome cujo estado visivel mudou (ex.: aridade de uma
+# funcao chamada). Cada reanalise parte de uma tabela vazia e os globais
+# consultados sao materializados sob demanda a partir do historico, entao o
+# custo nao depende de quantas unidades vem antes da editada.
+
+
+def _assinatura(simbolo):
+    """Resumo imutavel do que uma unidade enxerga de um simbolo."""
+    if simbolo is None:
+        return None
+    params = simbolo.get(st.PARAMS)
+    return (
+        simbolo[st.CATEGORY],
+        simbolo[st.TYPE],
+        tuple(params) if params is not None else None,
+        simbolo[st.IS_LOCAL],
+    )
+
+
+def _restaurar_simbolo(nome, assinatura):
+    categoria, tipo, params, is_local = assinatura
+    existente = st.lookup_symbol(nome, current_scope_only=True)
+    if existente is not None:
+        existente[st.CATEGORY] = categoria
+        existente[st.TYPE] = tipo
+        existente[st.IS_LOCAL] = is_local
+        if params is not None:
+            existente[st.PARAMS] = list(params)
+        return
+    st.add_symbol(
+        nome,
+        categoria,
+        symbol_type=tipo,
+        params=list(params) if params is not None else None,
+        is_local=is_local,
+    )
+
+
+class _VisitorRastreado(VisitorSemantico):
+    """VisitorSemantico que registra as dependencias globais da unidade atual."""
+
+    def __init__(self, builtins=None, ambiente=None):
+        super().__init__(builtins=builtins)
+        self.dependencias = {}
+        # ambiente(nome) -> assinatura global visivel antes da unidade (ou
+        # None); sem ele, o escopo global e o que ja esta na tabela.
+        self.ambiente = ambiente
+        self.materializados = set()
+
+    def _materializar(self, nome):
+        self.materializados.add(nome)
+        assinatura = self.ambiente(nome)
+        if assinatura is None or (nome, 0) in st.scopeIndex:
+            return
+        categoria, tipo, params, is_local = assinatura
+        simbolo = {
+            st.NAME: nome,
+            st.CATEGORY: categoria,
+            st.TYPE: tipo,
+            st.SCOPE: 0,
+            st.IS_LOCAL: is_local,
+            st.OFFSET: None,
+            st.VALUE: None,
+        }
+        if params is not None:
+            simbolo[st.PARAMS] = list(params)
+        # Fora de symbolTable: so o que a unidade cria la conta como efeito.
+        st.scopeIndex[(nome, 0)] = simbolo
+
+    def _buscar(self, nome):
+        if self.ambiente is not None and nome not in self.materializados:
+            self._materializar(nome)
+        simbolo = super()._buscar(nome)
+        if nome not in self.dependencias and (
+            simbolo is None or simbolo[st.SCOPE] == 0
+        ):
+            self.dependencias[nome] = _assinatura(simbolo)
+        return simbolo
+
+    def visitAssign(self, node):
+        # Declarar um local no escopo global depende de o nome estar livre.
+        if getattr(node, "is_local", False):
+            self._buscar(self._extrair_nome(node.name))
+        return super().visitAssign(node)
+
+    def visitFunctionDecl(self, node):
+        self._buscar(self._extrair_nome(node.name))
+        return super().visitFunctionDecl(node)
+
+
+class Unidade:
+    def __init__(self, stmt):
+        self.stmt = stmt
+        self.erros = []
+        self.avisos = []
+        self.dependencias = {}
+        self.efeitos = {}
+        self.ordem = 0  # posicao atual em AnaliseIncremental.unidades
+
+    def __repr__(self):
+        return f"Unidade({self.stmt.__class__.__name__}, deps={len(self.dependencias)})"
+
+
+class AnaliseIncremental:
+    def __init__(self, arvore, builtins=None):
+        self.arvore = arvore
+        self.builtins = builtins
+        self.unidades = [Unidade(stmt) for stmt in arvore.statements or []]
+        self._renumerar(0)
+        self._analisar_tudo()
+        self._historico = {}
+        self._dependentes = {}
+        for unidade in self.unidades:
+            self._indexar(unidade, {}, {})
+        self.reanalisadas = list(range(len(self.unidades)))
+
+    # ------------------------------------------
+    # Resultado agregado (mesma ordem da analise completa)
+    # ------------------------------------------
+
+    @property
+    def erros(self):
+        return [erro for unidade in self.unidades for erro in unidade.erros]
+
+    @property
+    def avisos(self):
+        return [aviso for unidade in self.unidades for aviso in unidade.avisos]
+
+    def relatorio(self):
+        visitor = self._instalar_ambiente(len(self.unidades))
+        visitor.erros = self.erros
+        visitor.avisos = self.avisos
+        return visitor.relatorio()
+
+    # ------------------------------------------
+    # Edicoes
+    # ------------------------------------------
+
+    def substituir(self, indice, stmt):
+        unidade = self.unidades[indice]
+        unidade.stmt = stmt
+        self.arvore.statements[indice] = stmt
+        self._reanalisar([unidade])
+
+    def inserir(self, indice, stmt):
+        unidade = Unidade(stmt)
+        self.unidades.insert(indice, unidade)
+        self.arvore.statements.insert(indice, stmt)
+        self._renumerar(indice)
+        self._reanalisar([unidade])
+
+    def remover(self, indice):
+        removida = self.unidades[indice]
+        self._indexar(removida, removida.dependencias, removida.efeitos, saiu=True)
+        self.unidades.pop(indice)
+        del self.arvore.statements[indice]
+        self._renumerar(indice)
+        self._reanalisar(self._afetadas(removida.efeitos, indice - 1))
+
+    def substituir_funcao(self, nome, nova_decl):
+        for indice, unidade in enumerate(self.unidades):
+            stmt = unidade.stmt
+            if stmt.__class__.__name__ == "FunctionDecl" and nome_no(stmt.name) == nome:
+                self.substituir(indice, nova_decl)
+                return indice
+        raise KeyError(f"Funcao '{nome}' nao encontrada no nivel superior")
+
+    # ------------------------------------------
+    # Motor
+    # ------------------------------------------
+
+    def _analisar_tudo(self):
+        visitor = _VisitorRastreado(self.builtins)
+        for unidade in self.unidades:
+            self._analisar_unidade(visitor, unidade)
+
+    def _renumerar(self, inicio):
+        for indice in range(inicio, len(self.unidades)):
+            self.unidades[indice].ordem = indice
+
+    def _indexar(self, unidade, dependencias, efeitos, saiu=False):
+        """Atualiza historico/dependentes de `unidade` a partir do estado antigo."""
+        novas = {} if saiu else unidade.dependencias
+        novos = {} if saiu else unidade.efeitos
+        for nome in dependencias.keys() - novas.keys():
+            self._dependentes[nome].discard(unidade)
+        for nome in novas.keys() - dependencias.keys():
+            self._dependentes.setdefault(nome, set()).add(unidade)
+        for nome in efeitos.keys() - novos.keys():
+            historico = self._historico[nome]
+            del historico[bisect_left(historico, unidade.ordem, key=_ordem)]
+        for nome in novos.keys() - efeitos.keys():
+            insort(self._historico.setdefault(nome, []), unidade, key=_ordem)
+
+    def _estado(self, nome, ordem):
+        """Assinatura global de `nome` visivel antes da unidade na posicao `ordem`."""
+        historico = self._historico.get(nome)
+        if not historico:
+            return None
+        posicao = bisect_left(historico, ordem, key=_ordem)
+        return historico[posicao - 1].efeitos[nome] if posicao else None
+
+    def _afetadas(self, nomes, apos):
+        """Unidades depois de `apos` cuja entrada difere do estado atual."""
+        afetadas = {}
+        for nome in nomes:
+            for unidade in self._dependentes.get(nome, ()):
+                if unidade.ordem > apos and (
+                    unidade.dependencias[nome] != self._estado(nome, unidade.ordem)
+                ):
+                    afetadas[id(unidade)] = unidade
+        return list(afetadas.values())
+
+    def _instalar_ambiente(self, ate):
+        """Recria na tabela o escopo global visivel antes da unidade `ate`."""
+        visitor = _VisitorRastreado(self.builtins)
+        ambiente = {}
+        for unidade in self.unidades[:ate]:
+            ambiente.update(unidade.efeitos)
+        for nome, assinatura in ambiente.items():
+            _restaurar_simbolo(nome, assinatura)
+        return visitor
+
+    def _analisar_unidade(self, visitor, unidade):
+        n_erros = len(visitor.erros)
+        n_avisos = len(visitor.avisos)
+        n_tabela = len(st.symbolTable)
+        visitor.dependencias = {}
+
+        unidade.stmt.accept(visitor)
+
+        efeitos = {}
+        for simbolo in st.symbolTable[n_tabela:]:
+            if simbolo[st.SCOPE] == 0:
+                efeitos[simbolo[st.NAME]] = _assinatura(simbolo)
+        for nome, antes in visitor.dependencias.items():
+            if antes is not None and nome not in efeitos:
+                depois = _assinatura(st.lookup_symbol(nome))
+                if depois != antes:
+                    efeitos[nome] = depois
+
+        unidade.erros = visitor.erros[n_erros:]
+        unidade.avisos = visitor.avisos[n_avisos:]
+        unidade.dependencias = visitor.dependencias
+        unidade.efeitos = efeitos
+
+    def _reanalisar(self, iniciais):
+        # Fila por posicao: uma unidade so e analisada depois de todas as
+        # anteriores que poderiam alterar o ambiente que ela enxerga.
+        self.reanalisadas = []
+        fila = [(unidade.ordem, id(unidade), unidade) for unidade in iniciais]
+        heapq.heapify(fila)
+        pendentes = {id(unidade) for unidade in iniciais}
+        visitor = _VisitorRastreado(self.builtins)
+
+        while fila:
+            ordem, _, unidade = heapq.heappop(fila)
+            pendentes.discard(id(unidade))
+
+            st.reset_table(st.DEFAULT_BUILTINS if self.builtins is None else self.builtins)
+            visitor.materializados = set()
+            visitor.ambiente = lambda nome: self._estado(nome, ordem)
+            dependencias, efeitos = unidade.dependencias, unidade.efeitos
+            self._analisar_unidade(visitor, unidade)
+            self._indexar(unidade, dependencias, efeitos)
+            self.reanalisadas.append(ordem)
+
+            alterados = [
+                nome
+                for nome in efeitos.keys() | unidade.efeitos.keys()
+                if efeitos.get(nome) != unidade.efeitos.get(nome)
+            ]
+            for afetada in self._afetadas(alterados, ordem):
+                if id(afetada) not in pendentes:
+                    pendentes.add(id(afetada))
+                    heapq.heappush(fila, (afetada.ordem, id(afetada), afetada))
+
+
+def _ordem(unidade):
+    return unidade.ordem
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def _programa_sintetico(n_funcoes):
+    linhas = ["local base = 1", "function f0(a)", "    return a + base", "end"]
+    for i in range(1, n_funcoes):
+        linhas += [f"function f{i}(a)", f"    return f{i - 1}(a) + base", "end"]
+    linhas.append(f"print(f{n_funcoes - 1}(1))")
+    return "\n".join(linhas)
+
+
+def main(n_funcoes=2000):
+    parser = _criar_parser()
+    arvore = parser.parse(_programa_sintetico(n_funcoes))
+
+    inicio = time.perf_counter()
+    analise = AnaliseIncremental(arvore)
+    t_completa = time.perf_counter() - inicio
+    print(f"Analise completa ({n_funcoes} funcoes): {t_completa * 1000:.1f} ms, "
+          f"{len(analise.erros)} erro(s)")
+
+    alvo = n_funcoes // 2
+
+    # Edicao que preserva a assinatura: so a propria funcao e reanalisada.
+    nova = parser.parse(f"function f{alvo}(a)\n return a * 2\nend").statements[0]
+    inicio = time.perf_counter()
+    analise.substituir_funcao(f"f{alvo}", nova)
+    t_corpo = time.perf_counter() - inicio
+    print(f"Edicao de corpo: {t_corpo * 1000:.2f} ms, "
+          f"unidades reanalisadas: {analise.reanalisadas}")
+
+    # Mudanca de aridade: a funcao que chama f{alvo} tambem e reanalisada.
+    nova = parser.parse(f"function f{alvo}(a, b)\n return a + b\nend").statements[0]
+    inicio = time.perf_counter()
+    analise.substituir_funcao(f"f{alvo}", nova)
+    t_aridade = time.perf_counter() - inicio
+    print(f"Mudanca de aridade: {t_aridade * 1000:.2f} ms, "
+          f"unidades reanalisadas: {analise.reanalisadas}")
+    for erro in analise.erros:
+        print(f"    {erro}")
+
+
+if __name__ == "__main__":
+    main()
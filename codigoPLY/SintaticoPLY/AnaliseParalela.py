@@ -0,0 +1,319 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+
+try:
+    from . import AbstractVisitor
+    from . import SymbolTable as st
+    from .AuxiliarAST import filhos_no, nome_no
+    from .AnaliseIncremental import (
+        AnaliseIncremental,
+        _VisitorRastreado,
+        _assinatura,
+        _restaurar_simbolo,
+        _criar_parser,
+    )
+except ImportError:
+    import AbstractVisitor
+    import SymbolTable as st
+    from AuxiliarAST import filhos_no, nome_no
+    from AnaliseIncremental import (
+        AnaliseIncremental,
+        _VisitorRastreado,
+        _assinatura,
+        _restaurar_simbolo,
+        _criar_parser,
+    )
+
+
+# ==============================================
+#   ANALISE SEMANTICA PARALELA
+# ==============================================
+#
+# 1a passada (sequencial, barata): percorre o nivel superior registrando
+#    apenas a assinatura de cada FunctionDecl cujo corpo nao escreve em
+#    globais; os demais comandos sao analisados normalmente.
+# 2a passada (paralela): os corpos adiados sao analisados em um pool de
+#    processos, cada um contra o ambiente global (somente leitura) visivel
+#    no ponto da sua declaracao.
+# Os diagnosticos sao guardados por unidade, entao a ordem final e a mesma
+# da analise sequencial. Eles voltam do pool com o caminho (indices dos
+# filhos) do no a partir da raiz da unidade, e o pai reencontra o no.
+
+
+class _EscritasGlobais(AbstractVisitor.AbstractVisitor):
+    """Descobre se um corpo de funcao atribui a algum nome nao local."""
+
+    def __init__(self, params):
+        self.escopos = [set(params)]
+        self.escreve = False
+
+    def _declarado(self, nome):
+        return any(nome in escopo for escopo in self.escopos)
+
+    def _em_escopo(self, bloco, nomes=()):
+        self.escopos.append(set(nomes))
+        bloco.accept(self)
+        self.escopos.pop()
+
+    def visitNumber(self, node):
+        pass
+
+    def visitString(self, node):
+        pass
+
+    def visitVar(self, node):
+        pass
+
+    def visitBoolean(self, node):
+        pass
+
+    def visitNil(self, node):
+        pass
+
+    def visitUnOp(self, node):
+        pass
+
+    def visitBinOp(self, node):
+        pass
+
+    def visitFunctionCall(self, node):
+        pass
+
+    def visitAssign(self, node):
+        nome = nome_no(node.name)
+        if getattr(node, "is_local", False):
+            self.escopos[-1].add(nome)
+        elif not self._declarado(nome):
+            self.escreve = True
+
+    def visitFunctionDecl(self, node):
+        self.escopos[-1].add(nome_no(node.name))
+        self._em_escopo(node.body, [nome_no(p) for p in node.params])
+
+    def visitFor(self, node):
+        self._em_escopo(node.body, [nome_no(node.var)])
+
+    def visitWhile(self, node):
+        self._em_escopo(node.body)
+
+    def visitReturn(self, node):
+        pass
+
+    def visitIf(self, node):
+        self._em_escopo(node.then_body)
+        for item in node.elseif_list or []:
+            self._em_escopo(item[1])
+        if node.else_body:
+            self._em_escopo(node.else_body)
+
+    def visitBlock(self, node):
+        for stmt in node.statements or []:
+            stmt.accept(self)
+
+
+def _corpo_isolado(decl):
+    visitor = _EscritasGlobais([nome_no(p) for p in decl.params])
+    decl.body.accept(visitor)
+    return not visitor.escreve
+
+
+def _caminhos(raiz):
+    """id(no) -> indices dos filhos de `raiz` ate o no."""
+    caminhos = {}
+    pilha = [(raiz, ())]
+    while pilha:
+        no, caminho = pilha.pop()
+        caminhos[id(no)] = caminho
+        for posicao, filho in enumerate(filhos_no(no)):
+            pilha.append((filho, caminho + (posicao,)))
+    return caminhos
+
+
+def _seguir(raiz, caminho):
+    no = raiz
+    for posicao in caminho:
+        no = filhos_no(no)[posicao]
+    return no
+
+
+# ------------------------------------------
+# Trabalhadores do pool
+# ------------------------------------------
+
+_TRABALHO = {}
+
+
+def _inicializar_trabalhador(efeitos, stmts, builtins):
+    _TRABALHO["efeitos"] = efeitos
+    _TRABALHO["stmts"] = stmts
+    if builtins is not None:
+        # MappingProxyType nao e serializavel: o escopo viaja como dicts
+        builtins = MappingProxyType(
+            {nome: MappingProxyType(simbolo) for nome, simbolo in builtins.items()}
+        )
+    _TRABALHO["builtins"] = builtins
+
+
+def _analisar_lote(indices):
+    """Analisa FunctionDecls adiadas (indices crescentes) numa tabela viva."""
+    efeitos = _TRABALHO["efeitos"]
+    stmts = _TRABALHO["stmts"]
+
+    visitor = _VisitorRastreado(_TRABALHO["builtins"])
+    ambiente = {}
+    for efeito in efeitos[: indices[0]]:
+        ambiente.update(efeito)
+    for nome, assinatura in ambiente.items():
+        _restaurar_simbolo(nome, assinatura)
+
+    resultados = []
+    posicao = indices[0]
+    for indice in indices:
+        # Corpos isolados so alteram o escopo global com a propria
+        # assinatura, entao basta aplicar os efeitos das unidades no meio.
+        for efeito in efeitos[posicao:indice]:
+            for nome, assinatura in efeito.items():
+                _restaurar_simbolo(nome, assinatura)
+        posicao = indice + 1
+
+        n_erros = len(visitor.erros)
+        n_avisos = len(visitor.avisos)
+        visitor.dependencias = {}
+        stmts[indice].accept(visitor)
+        erros = visitor.erros[n_erros:]
+        avisos = visitor.avisos[n_avisos:]
+        if erros or avisos:
+            caminhos = _caminhos(stmts[indice])
+            for diagnostico in erros + avisos:
+                if diagnostico.no is not None:
+                    diagnostico.caminho = caminhos.get(id(diagnostico.no))
+        resultados.append((indice, erros, avisos, visitor.dependencias))
+    return resultados
+
+
+def _serializavel(builtins):
+    if builtins is None:
+        return None
+    return {nome: dict(simbolo) for nome, simbolo in builtins.items()}
+
+
+def _dividir(indices, n_lotes):
+    tamanho = max(1, -(-len(indices) // n_lotes))
+    return [indices[i:i + tamanho] for i in range(0, len(indices), tamanho)]
+
+
+class AnaliseParalela(AnaliseIncremental):
+    def __init__(self, arvore, processos=None, lotes_por_processo=4, builtins=None):
+        self.processos = processos or os.cpu_count() or 1
+        self.lotes_por_processo = lotes_por_processo
+        super().__init__(arvore, builtins)
+
+    def _analisar_tudo(self):
+        adiadas = self._coletar_declaracoes()
+        if adiadas:
+            self._analisar_corpos(adiadas)
+
+    def _coletar_declaracoes(self):
+        visitor = _VisitorRastreado(self.builtins)
+        adiadas = []
+        for indice, unidade in enumerate(self.unidades):
+            stmt = unidade.stmt
+            if stmt.__class__.__name__ != "FunctionDecl" or not _corpo_isolado(stmt):
+                self._analisar_unidade(visitor, unidade)
+                continue
+
+            # So a assinatura entra no escopo global; erros de redeclaracao
+            # sao reportados pela 2a passada, junto com os do corpo.
+            nome = nome_no(stmt.name)
+            unidade.efeitos = {}
+            if st.lookup_symbol(nome, current_scope_only=True) is None:
+                st.add_function(nome, params=[nome_no(p) for p in stmt.params])
+                unidade.efeitos[nome] = _assinatura(st.lookup_symbol(nome))
+            adiadas.append(indice)
+        return adiadas
+
+    def _analisar_corpos(self, adiadas):
+        efeitos = [unidade.efeitos for unidade in self.unidades]
+        stmts = {indice: self.unidades[indice].stmt for indice in adiadas}
+
+        if self.processos <= 1:
+            _inicializar_trabalhador(efeitos, stmts, self.builtins)
+            lotes_resultado = [_analisar_lote(adiadas)]
+        else:
+            lotes = _dividir(adiadas, self.processos * self.lotes_por_processo)
+            metodos = multiprocessing.get_all_start_methods()
+            contexto = multiprocessing.get_context(
+                "fork" if "fork" in metodos else None
+            )
+            with ProcessPoolExecutor(
+                max_workers=self.processos,
+                mp_context=contexto,
+                initializer=_inicializar_trabalhador,
+                initargs=(efeitos, stmts, _serializavel(self.builtins)),
+            ) as pool:
+                lotes_resultado = list(pool.map(_analisar_lote, lotes))
+
+        for resultados in lotes_resultado:
+            for indice, erros, avisos, dependencias in resultados:
+                unidade = self.unidades[indice]
+                for diagnostico in erros + avisos:
+                    if diagnostico.no is None and diagnostico.caminho is not None:
+                        diagnostico.no = _seguir(unidade.stmt, diagnostico.caminho)
+                unidade.erros = erros
+                unidade.avisos = avisos
+                unidade.dependencias = dependencias
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def _programa_sintetico(n_funcoes):
+    linhas = ["local base = 1"]
+    for i in range(n_funcoes):
+        linhas += [
+            f"function f{i}(a, b)",
+            "    local s = 0",
+            "    for k = 1, a do",
+            "        if k > b then",
+            "            s = s + k * base",
+            "        elseif k == b then",
+            "            s = s - 1",
+            "        else",
+            "            s = s + 2",
+            "        end",
+            "    end",
+            "    while s > 100 do",
+            "        s = s - 100",
+            "    end",
+            "    return s",
+            "end",
+        ]
+    linhas.append(f"print(f{n_funcoes - 1}(10, 3))")
+    return "\n".join(linhas)
+
+
+def main(n_funcoes=4000):
+    parser = _criar_parser()
+    arvore = parser.parse(_programa_sintetico(n_funcoes))
+    print(f"Programa com {n_funcoes} funcoes, {os.cpu_count()} nucleo(s) disponiveis")
+
+    inicio = time.perf_counter()
+    referencia = AnaliseIncremental(arvore)
+    t_seq = time.perf_counter() - inicio
+    print(f"  sequencial: {t_seq * 1000:.0f} ms")
+
+    for processos in (1, 2, 4, 8):
+        inicio = time.perf_counter()
+        analise = AnaliseParalela(arvore, processos=processos)
+        tempo = time.perf_counter() - inicio
+        iguais = (analise.erros, analise.avisos) == (referencia.erros, referencia.avisos)
+        print(f"  {processos} processo(s): {tempo * 1000:.0f} ms "
+              f"(speedup {t_seq / tempo:.2f}x, diagnosticos iguais: {iguais})")
+
+
+if __name__ == "__main__":
+    main()
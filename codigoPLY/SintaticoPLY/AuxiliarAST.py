@@ -0,0 +1,48 @@
+# ==============================================
+#   AUXILIARES DA AST
+# ==============================================
+#
+# Consultas pequenas sobre os nos de SintaxeAbstrata usadas pelas analises
+# e otimizacoes, para nao repetir em cada passe como ler um nome ou
+# percorrer os elseif.
+
+
+def nome_no(node):
+    """Texto de um nome da AST (Var, parametro, nome de funcao ou str)."""
+    return node.value if hasattr(node, "value") else str(node)
+
+
+def ramos_elseif(elseif_list):
+    """Pares (condicao, bloco) dos elseif; o parser sempre monta tuplas."""
+    return elseif_list or []
+
+
+def filhos_no(no):
+    """Filhos diretos de `no` (expressoes e blocos), na ordem do fonte."""
+    classe = no.__class__.__name__
+    if classe == "Block":
+        return no.statements or []
+    if classe == "BinOp":
+        return [no.left, no.right]
+    if classe == "UnOp":
+        return [no.operand]
+    if classe == "FunctionCall":
+        return no.args
+    if classe == "Assign":
+        return [no.exp]
+    if classe == "Return":
+        return [no.exp] if no.exp is not None else []
+    if classe == "For":
+        return [no.start, no.end] + ([no.step] if no.step is not None else []) + [no.body]
+    if classe == "While":
+        return [no.condition, no.body]
+    if classe == "If":
+        filhos = [no.condition, no.then_body]
+        for condicao, corpo in ramos_elseif(no.elseif_list):
+            filhos += [condicao, corpo]
+        if no.else_body:
+            filhos.append(no.else_body)
+        return filhos
+    if classe == "FunctionDecl":
+        return [no.body]
+    return []
@@ -0,0 +1,181 @@
+import argparse
+import glob
+import os
+import sys
+
+try:
+    from .Compilador import Compilador
+    from .SimuladorMIPS import ErroSimulacao, simular
+except ImportError:
+    from Compilador import Compilador
+    from SimuladorMIPS import ErroSimulacao, simular
+
+
+# ==============================================
+#   CORPUS DE BENCHMARKS
+# ==============================================
+#
+# Compila cada programa de codigoPLY/benchmarks sem otimizacoes (ou com as
+# passadas de `base`) e com as otimizacoes padrao, compara o tamanho do
+# codigo gerado e executa as duas versoes no SimuladorMIPS (instrucoes
+# executadas, ciclos estimados e acessos a memoria). As saidas precisam
+# ser identicas, e nenhum programa pode falhar na compilacao ou na
+# simulacao. Com --noreorder a versao otimizada sai com os delay slots
+# preenchidos (ver Escalonador) e os ciclos deixam de contar os nops do
+# montador. No fim, uma recursao de cauda com 10 milhoes de voltas confere
+# que a RecursaoCauda nao deixa a pilha crescer.
+#
+#   python Benchmarks.py                              # -O0 x padrao
+#   python Benchmarks.py --base constantes,codigo_morto
+#   python Benchmarks.py --noreorder
+
+PASTA_CORPUS = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+
+
+def carregar_corpus(pasta=PASTA_CORPUS):
+    programas = []
+    for caminho in sorted(glob.glob(os.path.join(pasta, "*.lua"))):
+        with open(caminho, encoding="utf-8") as arquivo:
+            programas.append((os.path.basename(caminho), arquivo.read()))
+    return programas
+
+
+def medir(programas, passes=None, executar=True, noreorder=False):
+    """
+    programa -> ResultadoCompilacao, com as otimizacoes `passes`. Com
+    `executar`, o resultado da simulacao fica em estatisticas["execucao"]
+    (ResultadoSimulacao, ou a mensagem de ErroSimulacao).
+    """
+    compilador = Compilador(passes, noreorder=noreorder)
+    resultados = {}
+    for nome, codigo in programas:
+        resultado = compilador.compilar(codigo)
+        if executar and resultado.sucesso:
+            try:
+                resultado.estatisticas["execucao"] = simular(resultado.assembly)
+            except ErroSimulacao as exc:
+                resultado.estatisticas["execucao"] = str(exc)
+        resultados[nome] = resultado
+    return resultados
+
+
+# Mesma funcao da demonstracao de RecursaoCauda; a resposta e a soma de
+# n % 7 para n = 1..profundidade.
+_RECURSAO_PROFUNDA = """
+function conta(n, total)
+    if n == 0 then
+        return total
+    end
+    return conta(n - 1, total + n % 7)
+end
+print(conta({profundidade}, 0))
+"""
+
+
+def verificar_recursao_profunda(profundidade=10_000_000, noreorder=False, passes=None):
+    """
+    Mensagem de erro, ou None se a pilha usada por `conta` com
+    `profundidade` voltas e a mesma que com poucas voltas.
+    """
+    compilador = Compilador(passes, noreorder=noreorder)
+    pilhas = []
+    for voltas in (10, profundidade):
+        resultado = compilador.compilar(_RECURSAO_PROFUNDA.format(profundidade=voltas))
+        if not resultado.sucesso:
+            return f"nao compilou: {resultado.erros[:1]}"
+        try:
+            execucao = simular(resultado.assembly, limite=voltas * 40 + 1000)
+        except ErroSimulacao as exc:
+            return str(exc)
+        ciclos, resto = divmod(voltas, 7)
+        esperado = f"{ciclos * 21 + resto * (resto + 1) // 2}\n"
+        if execucao.saida != esperado:
+            return f"saida {execucao.saida!r}, esperado {esperado!r}"
+        pilhas.append(execucao.pilha)
+    if pilhas[1] > pilhas[0]:
+        return f"pilha cresceu de {pilhas[0]} para {pilhas[1]} bytes"
+    return None
+
+
+def main(pasta=PASTA_CORPUS, base=(), noreorder=False):
+    programas = carregar_corpus(pasta)
+    if not programas:
+        print(f"Nenhum programa .lua em {pasta}")
+        return 1
+
+    sem = medir(programas, passes=base)
+    referencia = "base" if base else "-O0"
+    com = medir(programas, noreorder=noreorder)
+
+    colunas = ("estaticas", "executadas", "ciclos", "memoria")
+    largura = max([16] + [len(nome) for nome, _ in programas])
+    print(f"{'':{largura}}" + "".join(f" {titulo:>24}" for titulo in colunas))
+    print(f"{'programa':{largura}}" + f" {referencia:>7} {'otim.':>7} {'ganho':>8}" * len(colunas))
+    print("-" * (largura + 25 * len(colunas)))
+    totais = {coluna: [0, 0] for coluna in colunas}
+    divergentes = []
+    falhas = []
+    for nome, _ in programas:
+        antes, depois = sem[nome], com[nome]
+        if not antes.sucesso or not depois.sucesso:
+            print(f"{nome:{largura}} falhou: {(antes.erros + depois.erros)[:1]}")
+            falhas.append(nome)
+            continue
+        exec_antes = antes.estatisticas["execucao"]
+        exec_depois = depois.estatisticas["execucao"]
+        if isinstance(exec_antes, str) or isinstance(exec_depois, str):
+            erro = exec_antes if isinstance(exec_antes, str) else exec_depois
+            print(f"{nome:{largura}} erro na simulacao: {erro}")
+            falhas.append(nome)
+            continue
+        if exec_antes.saida != exec_depois.saida:
+            divergentes.append(nome)
+
+        valores = {
+            "estaticas": (antes.estatisticas["instrucoes"], depois.estatisticas["instrucoes"]),
+            "executadas": (exec_antes.instrucoes, exec_depois.instrucoes),
+            "ciclos": (exec_antes.ciclos, exec_depois.ciclos),
+            "memoria": (exec_antes.acessos_memoria, exec_depois.acessos_memoria),
+        }
+        linha = f"{nome:{largura}}"
+        for coluna in colunas:
+            v_antes, v_depois = valores[coluna]
+            totais[coluna][0] += v_antes
+            totais[coluna][1] += v_depois
+            linha += f" {v_antes:7} {v_depois:7} {_reducao(v_antes, v_depois):>8}"
+        print(linha)
+    print("-" * (largura + 25 * len(colunas)))
+    linha = f"{'total':{largura}}"
+    for coluna in colunas:
+        v_antes, v_depois = totais[coluna]
+        linha += f" {v_antes:7} {v_depois:7} {_reducao(v_antes, v_depois):>8}"
+    print(linha)
+
+    if falhas:
+        print(f"\n[ERRO] Nao compilaram ou falharam na simulacao: {', '.join(falhas)}")
+    if divergentes:
+        print(f"\n[ERRO] Saida diferente entre {referencia} e otimizado: {', '.join(divergentes)}")
+    if falhas or divergentes:
+        return 1
+
+    erro = verificar_recursao_profunda(noreorder=noreorder)
+    if erro is not None:
+        print(f"\n[ERRO] Recursao de cauda com 10 milhoes de voltas: {erro}")
+        return 1
+    print("\nRecursao de cauda com 10 milhoes de voltas: ok, pilha constante")
+    return 0
+
+
+def _reducao(antes, depois):
+    if not antes:
+        return "-"
+    return f"{(antes - depois) / antes * 100:.1f}%"
+
+
+if __name__ == "__main__":
+    argumentos = argparse.ArgumentParser(description="Mede o corpus de benchmarks")
+    argumentos.add_argument("--base", default="", help="otimizacoes da versao de referencia")
+    argumentos.add_argument("--noreorder", action="store_true",
+                            help="versao otimizada com os delay slots preenchidos")
+    opcoes = argumentos.parse_args()
+    sys.exit(main(base=tuple(nome for nome in opcoes.base.split(",") if nome), noreorder=opcoes.noreorder))
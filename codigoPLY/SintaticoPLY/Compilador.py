@@ -0,0 +1,304 @@
+import argparse
+import os
+import sys
+
+try:
+    from .VisitorSemantico import VisitorSemantico, _criar_parser
+    from .OtimizadorConstantes import OtimizadorConstantes
+    from .EliminacaoCodigoMorto import EliminacaoCodigoMorto
+    from .InferenciaTipos import InferenciaTipos
+    from .GeradorAssembly import GeradorAssembly
+    from .QuadrosPilha import QuadrosPilha
+    from .PropagacaoCondicional import PropagacaoCondicional
+    from .NumeracaoValores import NumeracaoValores
+    from .MovimentacaoInvariantes import MovimentacaoInvariantes
+    from .ExpansaoEmLinha import ExpansaoEmLinha
+    from .RecursaoCauda import RecursaoCauda
+    from .EmissorMIPS import EmissorMIPS
+    from .Peephole import Peephole
+    from .Escalonador import Escalonador
+    from . import IR
+    from . import SSA
+except ImportError:
+    from VisitorSemantico import VisitorSemantico, _criar_parser
+    from OtimizadorConstantes import OtimizadorConstantes
+    from EliminacaoCodigoMorto import EliminacaoCodigoMorto
+    from InferenciaTipos import InferenciaTipos
+    from GeradorAssembly import GeradorAssembly
+    from QuadrosPilha import QuadrosPilha
+    from PropagacaoCondicional import PropagacaoCondicional
+    from NumeracaoValores import NumeracaoValores
+    from MovimentacaoInvariantes import MovimentacaoInvariantes
+    from ExpansaoEmLinha import ExpansaoEmLinha
+    from RecursaoCauda import RecursaoCauda
+    from EmissorMIPS import EmissorMIPS
+    from Peephole import Peephole
+    from Escalonador import Escalonador
+    import IR
+    import SSA
+
+from ExpressionLanguageParser import parse_com_posicoes
+
+
+# ==============================================
+#   PIPELINE DE COMPILACAO
+# ==============================================
+#
+# parse -> VisitorSemantico -> otimizacoes na AST -> InferenciaTipos
+#       -> QuadrosPilha -> GeradorAssembly (AST -> IR) -> IR.verificar
+#       -> otimizacoes na IR (em SSA) -> EmissorMIPS (IR -> MIPS)
+#       -> Peephole -> Escalonador (no assembly de cada funcao)
+#
+# Cada otimizacao tem um nome em PASSES e pode ser ligada/desligada.
+# "cse" reaproveita, ja na geracao da IR, valores calculados no mesmo
+# bloco (ver GeradorAssembly), e "escolha" troca cadeias if/elseif sobre
+# uma variavel e constantes por tabela de saltos ou busca binaria. "cauda"
+# troca a recursao de cauda por laco na IR recem-gerada (as outras
+# chamadas de cauda viram `j` no EmissorMIPS) e "inline" expande chamadas
+# a funcoes pequenas. As da IR ("sccp", "gvn", "licm") rodam com a funcao
+# em SSA; com qualquer uma delas ligada as variaveis promoviveis viram
+# temporarios (ver SSA).
+# "selecao" escolhe imediatos e desvios fundidos no EmissorMIPS e
+# "reducao" troca mul/div/%/^ por constante por deslocamentos e somas (ver
+# ReducaoForca).
+# "escalonamento" reordena cada bloco para que o uso de um lw nao venha
+# logo depois dele (ver Escalonador). Com `noreorder` o assembly sai com
+# `.set noreorder` e os delay slots preenchidos (com instrucoes uteis se o
+# escalonamento estiver ligado, senao com nop); no MARS, isso pede o
+# "Delayed branching" ligado.
+
+PASSES = ("constantes", "codigo_morto", "cse", "escolha", "cauda", "inline", "sccp", "gvn", "licm", "selecao", "reducao", "peephole", "escalonamento")
+PASSES_IR = ("sccp", "gvn", "licm")
+
+
+class ResultadoCompilacao:
+    def __init__(self):
+        self.assembly = None
+        self.ir = None  # IR.Modulo
+        self.erros = []  # textos ja formatados (sintaxe ou semantica)
+        self.avisos = []
+        self.estatisticas = {}
+
+    @property
+    def sucesso(self):
+        return self.assembly is not None
+
+
+class Compilador:
+    """
+    Args:
+        passes: nomes das otimizacoes a executar (padrao: todas de PASSES);
+            use () para compilar sem otimizar
+        noreorder: preenche os delay slots (`.set noreorder`)
+    """
+
+    def __init__(self, passes=None, noreorder=False):
+        self.passes = tuple(PASSES if passes is None else passes)
+        desconhecidos = set(self.passes) - set(PASSES)
+        if desconhecidos:
+            raise ValueError(f"Otimizacoes desconhecidas: {', '.join(sorted(desconhecidos))}")
+        self.noreorder = noreorder
+        self._parser = None
+
+    @property
+    def parser(self):
+        if self._parser is None:
+            self._parser = _criar_parser()
+        return self._parser
+
+    def compilar(self, codigo):
+        resultado = ResultadoCompilacao()
+        try:
+            arvore, spans = parse_com_posicoes(self.parser, codigo)
+        except SyntaxError as exc:
+            resultado.erros.append(f"[ERRO] {exc}")
+            return resultado
+        if arvore is None:
+            resultado.erros.append("[ERRO] Programa vazio ou invalido")
+            return resultado
+
+        semantico = VisitorSemantico(spans=spans)
+        arvore.accept(semantico)
+        resultado.erros = [erro.formatar(spans) for erro in semantico.erros]
+        resultado.avisos = [aviso.formatar(spans) for aviso in semantico.avisos]
+        if resultado.erros:
+            return resultado
+
+        self._otimizar(arvore, spans, resultado.estatisticas)
+
+        gerador = GeradorAssembly(
+            tipos=InferenciaTipos(arvore),
+            quadros=QuadrosPilha(arvore),
+            cse="cse" in self.passes,
+            escolha="escolha" in self.passes,
+        )
+        arvore.accept(gerador)
+        resultado.ir = gerador.finalizar()
+        if gerador.cse:
+            resultado.estatisticas["subexpressoes_comuns"] = gerador.reaproveitadas
+        if gerador.escolha:
+            resultado.estatisticas["escolhas"] = gerador.escolhas
+        problemas = IR.verificar(resultado.ir)
+        if not problemas:
+            self._otimizar_ir(resultado.ir, resultado.estatisticas)
+            problemas = IR.verificar(resultado.ir, ssa=False)
+        if problemas:
+            resultado.erros = [f"[ERRO interno] IR invalida: {p}" for p in problemas]
+            return resultado
+        peephole = Peephole() if "peephole" in self.passes else None
+        escalonador = None
+        if "escalonamento" in self.passes or self.noreorder:
+            escalonador = Escalonador(reordenar="escalonamento" in self.passes, atrasos=self.noreorder)
+        emissor = EmissorMIPS(
+            resultado.ir,
+            peephole=peephole,
+            selecao="selecao" in self.passes,
+            reducao="reducao" in self.passes,
+            cauda="cauda" in self.passes,
+            escalonador=escalonador,
+        )
+        resultado.assembly = emissor.emitir()
+        if peephole is not None:
+            resultado.estatisticas["peephole"] = {
+                nome: total for nome, total in peephole.removidas.items() if total
+            }
+        resultado.estatisticas["instrucoes"] = contar_instrucoes(resultado.assembly)
+        resultado.estatisticas["spills"] = emissor.spills
+        resultado.estatisticas["funcoes_folha"] = emissor.folhas
+        resultado.estatisticas["funcoes_sem_quadro"] = emissor.sem_quadro
+        if emissor.selecao:
+            resultado.estatisticas["imediatos"] = emissor.imediatos
+            resultado.estatisticas["desvios_fundidos"] = emissor.desvios_fundidos
+        if emissor.reducao:
+            resultado.estatisticas["reducoes"] = emissor.reducoes
+        if emissor.cauda:
+            resultado.estatisticas["chamadas_de_cauda"] = emissor.caudas
+        if gerador.escolha:
+            resultado.estatisticas["tabelas_de_saltos"] = emissor.tabelas
+            resultado.estatisticas["buscas_binarias"] = emissor.buscas
+        if escalonador is not None and escalonador.reordenar:
+            resultado.estatisticas["load_use"] = (escalonador.bolhas_antes, escalonador.bolhas_depois)
+        if self.noreorder:
+            resultado.estatisticas["delay_slots_preenchidos"] = escalonador.preenchidos
+            resultado.estatisticas["delay_slots_com_nop"] = escalonador.nops
+        return resultado
+
+    def _otimizar(self, arvore, spans, estatisticas):
+        if "constantes" in self.passes:
+            otimizador = OtimizadorConstantes(spans=spans)
+            otimizador.otimizar(arvore)
+            estatisticas["constantes_dobradas"] = otimizador.dobradas
+            estatisticas["constantes_propagadas"] = otimizador.propagadas
+        if "codigo_morto" in self.passes:
+            eliminacao = EliminacaoCodigoMorto()
+            eliminacao.otimizar(arvore)
+            estatisticas["comandos_removidos"] = eliminacao.comandos_removidos
+            estatisticas["funcoes_removidas"] = eliminacao.funcoes_removidas
+
+    def _otimizar_ir(self, modulo, estatisticas):
+        if "cauda" in self.passes:
+            recursao = RecursaoCauda()
+            for funcao in modulo.funcoes.values():
+                recursao.otimizar(funcao)
+            estatisticas["recursoes_em_laco"] = recursao.chamadas
+        if "inline" in self.passes:
+            expansao = ExpansaoEmLinha()
+            expansao.otimizar(modulo)
+            estatisticas["chamadas_expandidas"] = expansao.expandidas
+            estatisticas["funcoes_expandidas"] = expansao.removidas
+        if not set(PASSES_IR) & set(self.passes):
+            # Os Phi de and/or (GeradorAssembly) saem mesmo sem otimizar.
+            for funcao in modulo.funcoes.values():
+                SSA.sair_da_ssa(funcao)
+            return
+        efeitos = SSA.efeitos_globais(modulo)
+        sccp = PropagacaoCondicional()
+        gvn = NumeracaoValores(efeitos)
+        licm = MovimentacaoInvariantes(efeitos)
+        promovidas = mortas = 0
+        for funcao in modulo.funcoes.values():
+            promovidas += SSA.construir_ssa(funcao, SSA.promoviveis(funcao, efeitos))
+            SSA.propagar_copias(funcao)
+            if "sccp" in self.passes:
+                sccp.otimizar(funcao)
+            if "gvn" in self.passes:
+                gvn.otimizar(funcao)
+            if "licm" in self.passes:
+                licm.otimizar(funcao)
+            SSA.propagar_copias(funcao)
+            mortas += SSA.remover_mortas(funcao)
+            SSA.sair_da_ssa(funcao)
+        estatisticas["variaveis_promovidas"] = promovidas
+        if "sccp" in self.passes:
+            estatisticas["valores_constantes"] = sccp.constantes
+            estatisticas["desvios_dobrados"] = sccp.desvios
+        if "gvn" in self.passes:
+            estatisticas["valores_redundantes"] = gvn.redundantes
+            estatisticas["acessos_removidos"] = gvn.acessos_removidos
+        if "licm" in self.passes:
+            estatisticas["invariantes_movidas"] = licm.movidas
+        estatisticas["instrucoes_mortas"] = mortas
+
+
+def contar_instrucoes(assembly):
+    """Instrucoes na secao .text (sem rotulos, diretivas e comentarios)."""
+    total = 0
+    no_texto = False
+    for linha in assembly.splitlines():
+        linha = linha.split("#", 1)[0].strip()
+        if not linha:
+            continue
+        if linha.startswith("."):
+            no_texto = linha.startswith(".text") or (no_texto and not linha.startswith(".data"))
+            continue
+        if no_texto and not linha.endswith(":"):
+            total += 1
+    return total
+
+
+# ==============================================
+#              LINHA DE COMANDO
+# ==============================================
+
+def main(argv=None):
+    argumentos = argparse.ArgumentParser(description="Compila um programa Lua para MIPS")
+    argumentos.add_argument("arquivo", help="arquivo .lua de entrada")
+    argumentos.add_argument("-o", "--saida", help="arquivo .asm de saida")
+    argumentos.add_argument("-O0", dest="sem_otimizacao", action="store_true",
+                            help="desliga todas as otimizacoes")
+    argumentos.add_argument("--passes", help="otimizacoes separadas por virgula")
+    argumentos.add_argument("--ir", action="store_true", help="mostra a IR gerada")
+    argumentos.add_argument("--noreorder", action="store_true",
+                            help="preenche os delay slots (.set noreorder)")
+    opcoes = argumentos.parse_args(argv)
+
+    if opcoes.sem_otimizacao:
+        passes = ()
+    elif opcoes.passes is not None:
+        passes = tuple(nome for nome in opcoes.passes.split(",") if nome)
+    else:
+        passes = None
+
+    with open(opcoes.arquivo, encoding="utf-8") as arquivo:
+        codigo = arquivo.read()
+    resultado = Compilador(passes, noreorder=opcoes.noreorder).compilar(codigo)
+
+    for aviso in resultado.avisos:
+        print(aviso)
+    for erro in resultado.erros:
+        print(erro)
+    if opcoes.ir and resultado.ir is not None:
+        print(IR.formatar(resultado.ir))
+    if not resultado.sucesso:
+        return 1
+
+    saida = opcoes.saida or os.path.splitext(opcoes.arquivo)[0] + ".asm"
+    with open(saida, "w", encoding="utf-8") as arquivo:
+        arquivo.write(resultado.assembly)
+    detalhes = ", ".join(f"{chave}: {valor}" for chave, valor in resultado.estatisticas.items())
+    print(f"Assembly gerado em {saida} ({detalhes})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
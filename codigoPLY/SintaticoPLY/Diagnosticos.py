@@ -0,0 +1,257 @@
+import json
+import string
+import sys
+
+ERRO = "erro"
+AVISO = "aviso"
+
+# codigo -> (severidade, modelo da mensagem)
+CATALOGO = {
+    "E001": (ERRO, "Variavel '{nome}' usada sem ter sido declarada"),
+    "E002": (ERRO, "Funcao '{nome}' chamada sem ter sido declarada"),
+    "E003": (ERRO, "'{nome}' nao e uma funcao, mas foi chamada como uma"),
+    "E004": (ERRO, "Funcao '{nome}' espera {esperados} argumento(s), recebeu {recebidos}"),
+    "E005": (ERRO, "Condicao de {contexto} deve ser boolean, mas recebeu '{tipo}'"),
+    "E006": (ERRO, "For: valor inicial deve ser numero, recebeu '{tipo}'"),
+    "E007": (ERRO, "For: valor final deve ser numero, recebeu '{tipo}'"),
+    "E008": (ERRO, "For: passo deve ser numero, recebeu '{tipo}'"),
+    "E009": (ERRO, "{mensagem}"),
+    "W001": (AVISO, "Operador '-' aplicado a tipo '{tipo}' (esperado: number)"),
+    "W002": (AVISO, "Operador '{op}': lado {lado} e '{tipo}', esperado 'number'"),
+}
+
+_PREFIXOS = {ERRO: "[ERRO]", AVISO: "[AVISO]"}
+
+
+class Diagnostico:
+    """Registro de um problema; a mensagem so e montada quando pedida."""
+
+    __slots__ = ("codigo", "no", "caminho", "valores", "repeticoes")
+
+    def __init__(self, codigo, no=None, valores=()):
+        self.codigo = codigo
+        self.no = no
+        # Indices dos filhos da raiz da unidade ate o no; quem manda o
+        # registro para outro processo preenche, quem recebe resolve o no.
+        self.caminho = None
+        self.valores = valores  # argumentos na ordem em que foram passados
+        self.repeticoes = 1
+
+    @property
+    def severidade(self):
+        return CATALOGO[self.codigo][0]
+
+    @property
+    def args(self):
+        return dict(zip(campos_do_modelo(self.codigo), self.valores))
+
+    @property
+    def mensagem(self):
+        return _modelo_posicional(self.codigo).format(*self.valores)
+
+    def chave(self):
+        return (self.codigo, self.valores)
+
+    def localizar(self, spans):
+        """(linha, coluna) do no no fonte, se houver tabela de posicoes."""
+        if spans is None:
+            return None
+        if self.no is None:
+            return None
+        return spans.localizar(self.no)
+
+    def formatar(self, spans=None):
+        local = self.localizar(spans)
+        if local is None:
+            return str(self)
+        return f"{_PREFIXOS[self.severidade]} linha {local[0]}, coluna {local[1]}: {self.mensagem}"
+
+    def como_dict(self, spans=None):
+        registro = {
+            "codigo": self.codigo,
+            "severidade": self.severidade,
+            "mensagem": self.mensagem,
+            "args": self.args,
+            "repeticoes": self.repeticoes,
+        }
+        local = self.localizar(spans)
+        if local is not None:
+            registro["linha"], registro["coluna"] = local
+        return registro
+
+    # O no da AST nao atravessa processos (analise paralela): vai so o
+    # caminho, que vale em qualquer processo com a mesma arvore (fork ou spawn).
+    def __getstate__(self):
+        return (self.codigo, self.valores, self.repeticoes, self.caminho)
+
+    def __setstate__(self, estado):
+        self.codigo, self.valores, self.repeticoes, self.caminho = estado
+        self.no = None
+
+    def __eq__(self, outro):
+        if not isinstance(outro, Diagnostico):
+            return NotImplemented
+        return self.chave() == outro.chave()
+
+    def __hash__(self):
+        return hash(self.chave())
+
+    def __str__(self):
+        return f"{_PREFIXOS[self.severidade]} {self.mensagem}"
+
+    def __repr__(self):
+        return f"Diagnostico({self.codigo}, {self.args})"
+
+
+_CAMPOS = {}
+_POSICIONAIS = {}
+
+
+def campos_do_modelo(codigo):
+    """Nomes dos campos do modelo, na ordem em que aparecem."""
+    campos = _CAMPOS.get(codigo)
+    if campos is None:
+        modelo = CATALOGO[codigo][1]
+        campos = tuple(
+            nome for _, nome, _, _ in string.Formatter().parse(modelo) if nome
+        )
+        _CAMPOS[codigo] = campos
+    return campos
+
+
+def _modelo_posicional(codigo):
+    """Modelo com '{0}', '{1}'... no lugar dos nomes (formatacao mais barata)."""
+    modelo = _POSICIONAIS.get(codigo)
+    if modelo is None:
+        modelo = CATALOGO[codigo][1]
+        for indice, campo in enumerate(campos_do_modelo(codigo)):
+            modelo = modelo.replace("{" + campo + "}", "{" + str(indice) + "}")
+        _POSICIONAIS[codigo] = modelo
+    return modelo
+
+
+class ColetorDiagnosticos:
+    """
+    Guarda os diagnosticos de uma analise.
+
+    Args:
+        limite_por_codigo: maximo de registros guardados por codigo
+        limite_total: maximo de registros guardados no total
+        deduplicar: se True, diagnosticos iguais (mesmo codigo e argumentos)
+            viram um unico registro com contador de repeticoes
+    """
+
+    def __init__(self, limite_por_codigo=None, limite_total=None, deduplicar=False):
+        self.limite_por_codigo = limite_por_codigo
+        self.limite_total = limite_total
+        self.deduplicar = deduplicar
+
+        self.erros = []
+        self.avisos = []
+        self.contagem = {}  # codigo -> ocorrencias (inclusive suprimidas)
+        self.suprimidos = 0
+        self._guardados = {}  # codigo -> registros guardados
+        self._vistos = {}  # chave -> Diagnostico (so com deduplicar)
+        self._sem_filtros = (
+            limite_por_codigo is None and limite_total is None and not deduplicar
+        )
+
+    def registrar(self, codigo, no=None, valores=()):
+        """Registra um diagnostico; `valores` segue a ordem dos campos do modelo."""
+        self.contagem[codigo] = self.contagem.get(codigo, 0) + 1
+
+        if self._sem_filtros:
+            diagnostico = Diagnostico(codigo, no, valores)
+            if CATALOGO[codigo][0] == ERRO:
+                self.erros.append(diagnostico)
+            else:
+                self.avisos.append(diagnostico)
+            return diagnostico
+
+        if self.deduplicar:
+            chave = (codigo, valores)
+            existente = self._vistos.get(chave)
+            if existente is not None:
+                existente.repeticoes += 1
+                return existente
+
+        guardados = self._guardados.get(codigo, 0)
+        if (
+            self.limite_por_codigo is not None and guardados >= self.limite_por_codigo
+        ) or (
+            self.limite_total is not None
+            and len(self.erros) + len(self.avisos) >= self.limite_total
+        ):
+            self.suprimidos += 1
+            return None
+
+        diagnostico = Diagnostico(codigo, no, valores)
+        self._guardados[codigo] = guardados + 1
+        if self.deduplicar:
+            self._vistos[chave] = diagnostico
+        if CATALOGO[codigo][0] == ERRO:
+            self.erros.append(diagnostico)
+        else:
+            self.avisos.append(diagnostico)
+        return diagnostico
+
+    def todos(self):
+        return self.erros + self.avisos
+
+
+def escrever_jsonl(diagnosticos, destino=None, spans=None):
+    """Escreve um objeto JSON por linha (arquivo, stream ou stdout)."""
+    if isinstance(destino, str):
+        with open(destino, "w", encoding="utf-8") as arquivo:
+            return escrever_jsonl(diagnosticos, arquivo, spans)
+    destino = destino or sys.stdout
+    total = 0
+    for diagnostico in diagnosticos:
+        destino.write(json.dumps(diagnostico.como_dict(spans), ensure_ascii=False))
+        destino.write("\n")
+        total += 1
+    return total
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main(n_avisos=300000):
+    import io
+    import time
+
+    try:
+        from . import SintaxeAbstrata as a
+        from .VisitorSemantico import VisitorSemantico
+    except ImportError:
+        import SintaxeAbstrata as a
+        from VisitorSemantico import VisitorSemantico
+
+    # local texto = "lua"; local r = texto + 1 (repetido): um aviso por soma
+    comandos = [a.Assign(a.String("texto"), a.String("lua"), is_local=True)]
+    for i in range(n_avisos):
+        soma = a.BinOp(a.Var("texto"), "+", a.Number(i))
+        comandos.append(a.Assign(a.String("r"), soma))
+    arvore = a.Block(comandos)
+
+    for titulo, opcoes in (
+        ("sem limites", {}),
+        ("deduplicado", {"deduplicar": True}),
+        ("limite de 100 por codigo", {"limite_por_codigo": 100}),
+    ):
+        inicio = time.perf_counter()
+        visitor = VisitorSemantico(**opcoes)
+        arvore.accept(visitor)
+        tempo = time.perf_counter() - inicio
+        coletor = visitor.diagnosticos
+        print(f"{titulo:28} {tempo * 1000:7.0f} ms | guardados: {len(coletor.avisos):7} "
+              f"| ocorrencias: {coletor.contagem} | suprimidos: {coletor.suprimidos}")
+
+    saida = io.StringIO()
+    escrever_jsonl(visitor.avisos[:2], saida)
+    print(saida.getvalue(), end="")
+
+
+if __name__ == "__main__":
+    main()
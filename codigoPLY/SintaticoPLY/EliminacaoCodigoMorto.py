@@ -0,0 +1,290 @@
+try:
+    from . import SintaxeAbstrata as a
+    from . import AbstractVisitor
+    from .GrafoChamadas import GrafoChamadas
+    from .AuxiliarAST import filhos_no, nome_no, ramos_elseif
+except ImportError:
+    import SintaxeAbstrata as a
+    import AbstractVisitor
+    from GrafoChamadas import GrafoChamadas
+    from AuxiliarAST import filhos_no, nome_no, ramos_elseif
+
+
+# ==============================================
+#   ELIMINACAO DE CODIGO MORTO
+# ==============================================
+#
+# Roda depois do OtimizadorConstantes (que transforma `x > 5` com x
+# constante em um literal) e altera a AST no lugar:
+#   - if/elseif com condicao literal viram so o ramo escolhido;
+#   - `while false` / `while nil` somem;
+#   - dentro de funcoes, comandos depois de um return (ou de um if cujos
+#     ramos todos retornam) sao removidos;
+#   - funcoes que nao sao alcancaveis a partir do nivel superior, seguindo
+#     o grafo de chamadas (GrafoChamadas), sao removidas.
+#
+# So contam como literais boolean, nil e string. Numeros ficam de fora: em
+# Lua 0 e verdadeiro, mas o codigo gerado testa contra zero.
+# No nivel superior o return e ignorado pelo GeradorAssembly, entao o que
+# vem depois dele continua sendo executado e nao e removido.
+
+
+class EliminacaoCodigoMorto(AbstractVisitor.AbstractVisitor):
+    """
+    Os visit* de comando devolvem a lista de comandos que substitui o no
+    (vazia para remover); os de expressao nao mudam nada.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.comandos_removidos = 0
+        self.funcoes_removidas = 0
+        self._em_funcao = False
+
+    def otimizar(self, arvore):
+        arvore.accept(self)
+        # O grafo e montado depois da poda: chamadas em ramos mortos nao contam.
+        alcancaveis = GrafoChamadas(arvore).alcancaveis()
+        self._remover_funcoes(arvore, alcancaveis)
+        return arvore
+
+    # ------------------------------------------
+    # Expressoes (inalteradas)
+    # ------------------------------------------
+
+    def visitNumber(self, node):
+        return node
+
+    def visitString(self, node):
+        return node
+
+    def visitBoolean(self, node):
+        return node
+
+    def visitNil(self, node):
+        return node
+
+    def visitVar(self, node):
+        return node
+
+    def visitUnOp(self, node):
+        return node
+
+    def visitBinOp(self, node):
+        return node
+
+    def visitFunctionCall(self, node):
+        return [node]
+
+    # ------------------------------------------
+    # Comandos
+    # ------------------------------------------
+
+    def visitAssign(self, node):
+        return [node]
+
+    def visitReturn(self, node):
+        return [node]
+
+    def visitFunctionDecl(self, node):
+        em_funcao = self._em_funcao
+        self._em_funcao = True
+        node.body.accept(self)
+        self._em_funcao = em_funcao
+        return [node]
+
+    def visitFor(self, node):
+        node.body.accept(self)
+        return [node]
+
+    def visitWhile(self, node):
+        if _verdade(node.condition) is False:
+            self._descartar(node)
+            return []
+        node.body.accept(self)
+        return [node]
+
+    def visitIf(self, node):
+        ramos = [(node.condition, node.then_body)] + list(ramos_elseif(node.elseif_list))
+        vivos = []
+        senao = node.else_body
+        for indice, (condicao, corpo) in enumerate(ramos):
+            valor = _verdade(condicao)
+            if valor is False:
+                self._descartar(corpo)
+                continue
+            if valor is True:
+                # Ramo sempre tomado: vira o "else" e o resto nunca executa.
+                for _, descartado in ramos[indice + 1:]:
+                    self._descartar(descartado)
+                if senao is not None:
+                    self._descartar(senao)
+                senao = corpo
+                break
+            vivos.append((condicao, corpo))
+
+        for _, corpo in vivos:
+            corpo.accept(self)
+        if senao is not None:
+            senao.accept(self)
+
+        if not vivos:
+            if senao is None:
+                return []
+            if _declara_locais(senao):
+                # Mantem o escopo do bloco: `if true then ... end`.
+                return [a.If(a.Boolean(True), senao)]
+            return list(senao.statements or [])
+
+        node.condition, node.then_body = vivos[0]
+        node.elseif_list = vivos[1:]
+        node.else_body = senao
+        return [node]
+
+    def visitBlock(self, node):
+        novos = []
+        comandos = node.statements or []
+        for indice, stmt in enumerate(comandos):
+            novos.extend(stmt.accept(self))
+            if self._em_funcao and novos and _termina(novos[-1]):
+                for morto in comandos[indice + 1:]:
+                    self._descartar(morto)
+                break
+        node.statements = novos
+        return [node]
+
+    # ------------------------------------------
+    # Auxiliares
+    # ------------------------------------------
+
+    def _descartar(self, no):
+        self.comandos_removidos += _contar_comandos(no)
+
+    def _remover_funcoes(self, no, alcancaveis):
+        for bloco in _blocos_filhos(no):
+            mantidos = []
+            for stmt in bloco.statements or []:
+                if (
+                    stmt.__class__.__name__ == "FunctionDecl"
+                    and nome_no(stmt.name) not in alcancaveis
+                ):
+                    self.funcoes_removidas += 1
+                    self._descartar(stmt)
+                    continue
+                self._remover_funcoes(stmt, alcancaveis)
+                mantidos.append(stmt)
+            bloco.statements = mantidos
+
+
+def _blocos_filhos(no):
+    return [filho for filho in filhos_no(no) if filho.__class__.__name__ == "Block"] + (
+        [no] if no.__class__.__name__ == "Block" else []
+    )
+
+
+def _verdade(condicao):
+    """True/False se a condicao e um literal com valor conhecido, senao None."""
+    classe = condicao.__class__.__name__
+    if classe == "Boolean":
+        return bool(condicao.value)
+    if classe == "Nil":
+        return False
+    if classe == "String":
+        return True
+    return None
+
+
+def _termina(stmt):
+    """O comando nunca deixa o fluxo seguir para o proximo?"""
+    classe = stmt.__class__.__name__
+    if classe == "Return":
+        return True
+    if classe == "If" and stmt.else_body:
+        corpos = [stmt.then_body, stmt.else_body]
+        corpos += [corpo for _, corpo in ramos_elseif(stmt.elseif_list)]
+        return all(_bloco_termina(corpo) for corpo in corpos)
+    return False
+
+
+def _bloco_termina(bloco):
+    comandos = bloco.statements or []
+    return bool(comandos) and _termina(comandos[-1])
+
+
+def _declara_locais(bloco):
+    return any(
+        stmt.__class__.__name__ == "Assign" and getattr(stmt, "is_local", False)
+        for stmt in bloco.statements or []
+    )
+
+
+def _contar_comandos(no):
+    classe = no.__class__.__name__
+    total = 0 if classe == "Block" else 1
+    for filho in filhos_no(no):
+        if filho.__class__.__name__ in _COMANDOS:
+            total += _contar_comandos(filho)
+    return total
+
+
+_COMANDOS = ("Block", "Assign", "FunctionDecl", "For", "While", "Return", "If", "FunctionCall")
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main():
+    import os
+    import sys
+
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    try:
+        from .VisitorSemantico import _criar_parser
+        from .VisitorPrettyPrinter import VisitorPrettyPrinter
+        from .OtimizadorConstantes import OtimizadorConstantes
+    except ImportError:
+        from VisitorSemantico import _criar_parser
+        from VisitorPrettyPrinter import VisitorPrettyPrinter
+        from OtimizadorConstantes import OtimizadorConstantes
+
+    codigo = """
+    local depurar = false
+    function auxiliar(n)
+        return n + 1
+    end
+    function nunca_usada(n)
+        return auxiliar(n) * 2
+    end
+    function sinal(n)
+        if n < 0 then
+            return -1
+        else
+            return 1
+        end
+        print("inalcancavel")
+    end
+    if depurar then
+        print("depurando")
+    elseif true then
+        print(sinal(-5))
+    else
+        print("nunca")
+    end
+    while depurar do
+        print("laco morto")
+    end
+    """
+    arvore = _criar_parser().parse(codigo)
+    OtimizadorConstantes().otimizar(arvore)
+    eliminacao = EliminacaoCodigoMorto()
+    eliminacao.otimizar(arvore)
+    print(f"Comandos removidos: {eliminacao.comandos_removidos}, "
+          f"funcoes removidas: {eliminacao.funcoes_removidas}\n")
+    print(arvore.accept(VisitorPrettyPrinter()))
+
+
+if __name__ == "__main__":
+    main()
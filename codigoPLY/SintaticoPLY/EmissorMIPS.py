@@ -0,0 +1,751 @@
+from collections import Counter
+
+try:
+    from . import IR
+    from . import ReducaoForca
+    from .RecursaoCauda import chamada_de_cauda
+    from .InstrucoesMIPS import CHAMADAS, Comentario, Instrucao, Rotulo, renderizar
+    from .AlocadorRegistradores import AlocadorRegistradores
+    from .QuadrosPilha import CABECALHO_QUADRO
+except ImportError:
+    import IR
+    import ReducaoForca
+    from RecursaoCauda import chamada_de_cauda
+    from InstrucoesMIPS import CHAMADAS, Comentario, Instrucao, Rotulo, renderizar
+    from AlocadorRegistradores import AlocadorRegistradores
+    from QuadrosPilha import CABECALHO_QUADRO
+
+
+# ==============================================
+#   EMISSOR MIPS (IR -> ASSEMBLY)
+# ==============================================
+#
+# Traduz cada Funcao da IR para instrucoes MIPS com os temporarios como
+# registradores virtuais, roda o AlocadorRegistradores e monta o quadro
+# de pilha (ver QuadrosPilha). Blocos inalcancaveis nao sao emitidos e
+# saltos para o bloco seguinte viram fall-through.
+#
+# Convencao de chamada (o32): os 4 primeiros argumentos vao em $a0-$a3 e
+# os demais na area de saida, no fundo do quadro de quem chama
+# (`4*(i-4)($sp)` no jal); a funcao chamada os le em `4*(i-4)($fp)`. O
+# valor volta em $v0 ($v1 fica livre: nao ha retorno multiplo). Quem
+# atravessa um jal mora em $s (salvos no prologo so quando usados) ou, sem
+# $s livre, em $t guardado por quem chama (ver AlocadorRegistradores).
+#
+# Funcoes folha (sem jal) nao salvam $ra: ele chega intacto ao `jr`. Se
+# alem disso o corpo nao usa $fp (nem locais na memoria, nem spills) e nao
+# ha $s a salvar, a funcao nao monta quadro nenhum.
+#
+# Com `cauda` ligada, `return g(...)` (ate 4 argumentos) poe os argumentos
+# em $a0-$a3, desmonta o quadro e salta com `j` para g, que volta direto
+# para quem chamou: a pilha nao cresce. Uma funcao cujas unicas chamadas
+# sao de cauda tambem e folha.
+#
+# Com `selecao` ligada, o temporario definido uma unica vez por Const vira
+# operando imediato onde o MIPS tem a forma com imediato (addiu, slti,
+# andi, ori), $zero quando vale 0, e vai direto para $aN/$v0 em chamadas
+# e retornos; a Const cujos usos foram todos absorvidos nao gera `li`.
+# Uma comparacao usada so pelo Desvio do proprio bloco vira o desvio
+# correspondente (blt, bge, beq, ...) em vez de slt/sgt + beq $zero.
+#
+# Um IR.Escolha (cadeia if/elseif sobre constantes) com casos densos vira
+# tabela de saltos: o valor menos o menor caso indexa um `.word` com os
+# rotulos (buracos vao para o `senao`), com um sltiu para o intervalo e
+# `jr` no fim. Casos esparsos viram busca binaria com desvios contra
+# imediatos, e as folhas de ate BUSCA_LINEAR casos testam um a um.
+#
+# `%` (mod) e `^` (pow) nao existem no MIPS: mod e div + mfhi com a
+# correcao de sinal do Lua (o resto tem o sinal do divisor) e pow e um
+# laco de quadrados sucessivos (expoente negativo da 0). Com `reducao`
+# ligada, mul/div/mod/pow por constante viram as sequencias de
+# ReducaoForca quando elas existem.
+#
+# Por ultimo, depois do peephole, o Escalonador (se houver) reordena cada
+# bloco contra o load-use; com delay slots preenchidos, o .text comeca
+# com `.set noreorder`.
+
+_BINARIAS = {
+    "add": "add",
+    "sub": "sub",
+    "mul": "mul",
+    "eq": "seq",
+    "ne": "sne",
+    "lt": "slt",
+    "le": "sle",
+    "gt": "sgt",
+    "ge": "sge",
+    "and": "and",
+    "or": "or",
+}
+
+_IMEDIATAS = {"add": "addiu", "lt": "slti", "and": "andi", "or": "ori"}
+_COMUTATIVAS = ("add", "and", "or")
+
+# Desvio tomado quando a comparacao e verdadeira, a comparacao negada e a
+# mesma comparacao com os operandos trocados.
+_DESVIOS = {"eq": "beq", "ne": "bne", "lt": "blt", "le": "ble", "gt": "bgt", "ge": "bge"}
+_NEGADAS = {"eq": "ne", "ne": "eq", "lt": "ge", "ge": "lt", "gt": "le", "le": "gt"}
+_ESPELHADAS = {"eq": "eq", "ne": "ne", "lt": "gt", "gt": "lt", "le": "ge", "ge": "le"}
+
+
+# Tabela de saltos quando ao menos 1 em DENSIDADE_TABELA entradas e caso e
+# a tabela tem ate TABELA_MAXIMA palavras; senao, busca binaria.
+DENSIDADE_TABELA = 3
+TABELA_MAXIMA = 4096
+BUSCA_LINEAR = 3
+
+
+def _cabe_imediato(valor, op=None):
+    """`valor` cabe no campo de 16 bits (sem sinal em andi/ori)."""
+    if op in ("and", "or"):
+        return 0 <= valor <= 0xFFFF
+    return -0x8000 <= valor <= 0x7FFF
+
+
+def rotulo_funcao(nome):
+    return f"func_{nome}"
+
+
+class EmissorMIPS:
+    """
+    Args:
+        modulo: IR.Modulo (fora da SSA)
+        alocador: AlocadorRegistradores (padrao: todos os $t/$s)
+        peephole: Peephole opcional, aplicado ao codigo final de cada funcao
+        selecao: usa imediatos e funde comparacoes nos desvios
+        reducao: troca mul/div/mod/pow por constante por sequencias
+            mais baratas (ReducaoForca)
+        cauda: chamadas de cauda viram `j` depois do epilogo
+        escalonador: Escalonador opcional, aplicado depois do peephole
+    """
+
+    def __init__(self, modulo, alocador=None, peephole=None, selecao=False, reducao=False,
+                 cauda=False, escalonador=None):
+        self.modulo = modulo
+        self.alocador = alocador or AlocadorRegistradores()
+        self.peephole = peephole
+        self.escalonador = escalonador
+        self.selecao = selecao
+        self.reducao = reducao
+        self.cauda = cauda
+        self.spills = 0
+        self.imediatos = 0  # usos de constante absorvidos
+        self.desvios_fundidos = 0
+        self.reducoes = 0  # operacoes trocadas por sequencias de ReducaoForca
+        self.folhas = 0  # funcoes sem jal (sem salvar $ra)
+        self.sem_quadro = 0  # folhas que nem montam quadro
+        self.caudas = 0  # chamadas de cauda emitidas com `j`
+        self.tabelas = 0  # Escolha emitidos como tabela de saltos
+        self.buscas = 0  # Escolha emitidos como busca binaria
+
+        self._dados = [".data\n"]
+        self._globais = set()
+        self._strings = {}
+        self._num_strings = 0
+        self._rotulos = 0
+        self._itens = None  # lista da funcao sendo emitida
+        self._funcao = None  # fornece registradores virtuais novos
+        self._constantes = {}  # numero do temp -> valor (selecao/reducao)
+        self._omitidas = set()  # Const sem `li`
+        self._fundidas = {}  # rotulo do bloco -> Binaria fundida no Desvio
+        self._rotulos_funcoes = {rotulo_funcao(nome) for nome in modulo.funcoes}
+        self._parametros_pilha = {}  # parametro alem de $a3 -> offset em $fp
+        self._saida = 0  # argumentos na area de saida da funcao sendo emitida
+
+    # ------------------------------------------
+    # Secao .data
+    # ------------------------------------------
+
+    def _operando(self, variavel):
+        if variavel.global_:
+            if variavel.nome not in self._globais:
+                self._globais.add(variavel.nome)
+                self._dados.append(f"{variavel.nome}: .word 0\n")
+            return variavel.nome
+        if variavel in self._parametros_pilha:
+            return f"{self._parametros_pilha[variavel]}($fp)"
+        return f"{-(CABECALHO_QUADRO + 4 + 4 * variavel.slot)}($fp)"
+
+    def _string(self, texto):
+        if texto not in self._strings:
+            if texto == "\n":
+                rotulo = "newline"
+                conteudo = "\\n"
+            else:
+                rotulo = f"str_{self._num_strings}"
+                self._num_strings += 1
+                conteudo = texto.replace("\\", "\\\\").replace('"', '\\"')
+            self._strings[texto] = rotulo
+            self._dados.append(f'{rotulo}: .asciiz "{conteudo}"\n')
+        return self._strings[texto]
+
+    # ------------------------------------------
+    # Emissao
+    # ------------------------------------------
+
+    def emitir(self):
+        """Programa completo em texto (.data + .text)."""
+        principal = self._emitir_principal(self.modulo.principal)
+        funcoes = []
+        for nome, funcao in self.modulo.funcoes.items():
+            if nome != IR.PRINCIPAL:
+                funcoes += self._emitir_funcao(funcao)
+        noreorder = ".set noreorder\n" if self.escalonador is not None and self.escalonador.atrasos else ""
+        return (
+            "".join(self._dados)
+            + "\n"
+            + ".text\n" + noreorder + ".globl main\nmain:\n"
+            + renderizar(principal)
+            + renderizar(funcoes)
+        )
+
+    def _emitir_principal(self, funcao):
+        self._parametros_pilha = {}
+        corpo = self._corpo(funcao, fim=None)
+        alocacao = self.alocador.alocar(corpo)
+        self.spills += alocacao.spills
+        saida = 4 * self._saida
+        reserva = saida + 4 * alocacao.slots_pilha
+        codigo = []
+        if reserva:
+            # O main nunca retorna: basta reservar a area de saida e os slots.
+            codigo.append(Instrucao("addiu", "$sp", "$sp", f"-{reserva}"))
+        codigo.extend(alocacao.reescrever(saida))
+        return self._finalizar(codigo)
+
+    def _emitir_funcao(self, funcao):
+        rotulo = rotulo_funcao(funcao.nome)
+        fim = f"{rotulo}_end"
+        corpo = []
+        # So parametros que ainda moram na memoria (a SSA pode ter promovido
+        # o resto para temporarios lidos via IR.Parametro).
+        em_memoria = {
+            instrucao.variavel
+            for instrucao in funcao.instrucoes()
+            if instrucao.__class__.__name__ in ("Carrega", "Armazena")
+        }
+        # Os alem de $a3 ja estao na pilha, na area de saida de quem chamou.
+        self._parametros_pilha = {
+            variavel: 4 * (indice - 4) for indice, variavel in enumerate(funcao.parametros) if indice >= 4
+        }
+        for indice, variavel in enumerate(funcao.parametros[:4]):
+            if variavel in em_memoria:
+                corpo.append(Instrucao("sw", f"$a{indice}", self._operando(variavel)))
+        corpo += self._corpo(funcao, fim)
+
+        # Quadro: $ra, $fp, locais, $s salvos, spills e $t guardados, e no
+        # fundo a area de saida.
+        alocacao = self.alocador.alocar(corpo)
+        self.spills += alocacao.spills
+        base_salvos = CABECALHO_QUADRO + 4 * funcao.slots
+        saida = 4 * self._saida
+        quadro = base_salvos + 4 * (len(alocacao.salvos) + alocacao.slots_pilha) + saida
+        reescrito = alocacao.reescrever(-quadro + saida, "$fp")
+        self._parametros_pilha = {}
+
+        folha = not any(
+            item.__class__.__name__ == "Instrucao" and item.op in CHAMADAS for item in corpo
+        )
+        if folha:
+            self.folhas += 1
+            usa_quadro = alocacao.salvos or any(
+                "$fp" in str(operando)
+                for item in reescrito
+                if item.__class__.__name__ == "Instrucao"
+                for operando in item.operandos
+            )
+            if not usa_quadro:
+                self.sem_quadro += 1
+                codigo = [Rotulo(rotulo)] + reescrito
+                codigo += [Rotulo(fim), Instrucao("jr", "$ra")]
+                return self._finalizar(codigo)
+
+        codigo = [Rotulo(rotulo), Instrucao("addiu", "$sp", "$sp", f"-{quadro}")]
+        if not folha:
+            codigo.append(Instrucao("sw", "$ra", f"{quadro - 4}($sp)"))
+        codigo += [
+            Instrucao("sw", "$fp", f"{quadro - 8}($sp)"),
+            Instrucao("addiu", "$fp", "$sp", f"{quadro}"),
+        ]
+        for indice, reg in enumerate(alocacao.salvos):
+            codigo.append(Instrucao("sw", reg, f"{-(base_salvos + 4 + 4 * indice)}($fp)"))
+        epilogo = []
+        for indice, reg in enumerate(alocacao.salvos):
+            epilogo.append(Instrucao("lw", reg, f"{-(base_salvos + 4 + 4 * indice)}($fp)"))
+        epilogo.append(Instrucao("move", "$sp", "$fp"))
+        if not folha:
+            epilogo.append(Instrucao("lw", "$ra", "-4($sp)"))
+        epilogo.append(Instrucao("lw", "$fp", "-8($sp)"))
+        for item in reescrito:
+            if self._eh_salto_de_cauda(item):
+                # O quadro sai antes do salto; os argumentos ja estao em $aN.
+                codigo += [Instrucao(instrucao.op, *instrucao.operandos) for instrucao in epilogo]
+            codigo.append(item)
+        codigo.append(Rotulo(fim))
+        codigo += epilogo + [Instrucao("jr", "$ra")]
+        return self._finalizar(codigo)
+
+    def _eh_salto_de_cauda(self, item):
+        return (
+            item.__class__.__name__ == "Instrucao"
+            and item.op == "j"
+            and item.alvo() in self._rotulos_funcoes
+        )
+
+    def _finalizar(self, codigo):
+        """Peephole e escalonamento no codigo pronto da funcao."""
+        if self.peephole is not None:
+            codigo = self.peephole.otimizar(codigo)
+        if self.escalonador is not None:
+            codigo = self.escalonador.escalonar(codigo)
+        return codigo
+
+    def _corpo(self, funcao, fim):
+        """
+        Instrucoes (com registradores virtuais) dos blocos alcancaveis.
+        `fim` e o rotulo do epilogo; None no main.
+        """
+        alcancaveis = funcao.alcancaveis()
+        blocos = [bloco for bloco in funcao.blocos if bloco.rotulo in alcancaveis]
+        alvos = {alvo for bloco in blocos for alvo in bloco.sucessores()}
+        self._funcao = funcao
+        self._preparar(blocos)
+        usos = Counter(
+            temp.numero
+            for bloco in blocos
+            for instrucao in bloco.instrucoes + [bloco.terminador]
+            for temp in instrucao.usados()
+        )
+        self._itens = []
+        self._saida = 0
+        for indice, bloco in enumerate(blocos):
+            seguinte = blocos[indice + 1].rotulo if indice + 1 < len(blocos) else fim
+            if indice > 0 or bloco.rotulo in alvos:
+                self._itens.append(Rotulo(bloco.rotulo))
+            comparacao = self._fundidas.get(bloco.rotulo)
+            cauda = self._chamada_de_cauda(bloco, usos, fim)
+            for instrucao in bloco.instrucoes:
+                if instrucao is cauda:
+                    self._salto_de_cauda(instrucao)
+                elif instrucao is not comparacao:
+                    self._instrucao(instrucao)
+            if cauda is None:
+                self._terminador(bloco.terminador, seguinte, fim, comparacao)
+        itens, self._itens, self._funcao = self._itens, None, None
+        return itens
+
+    # ------------------------------------------
+    # Selecao de instrucoes
+    # ------------------------------------------
+
+    def _preparar(self, blocos):
+        """Acha as constantes, as comparacoes fundidas e as Const sem `li`."""
+        self._constantes, self._omitidas, self._fundidas = {}, set(), {}
+        if not (self.selecao or self.reducao):
+            return
+        definicoes, usos = Counter(), Counter()
+        for bloco in blocos:
+            for instrucao in bloco.instrucoes + [bloco.terminador]:
+                if instrucao.destino is not None:
+                    definicoes[instrucao.destino.numero] += 1
+                usos.update(temp.numero for temp in instrucao.usados())
+        for bloco in blocos:
+            for instrucao in bloco.instrucoes:
+                if (
+                    instrucao.__class__.__name__ == "Const"
+                    and type(instrucao.valor) is int
+                    and definicoes[instrucao.destino.numero] == 1
+                ):
+                    self._constantes[instrucao.destino.numero] = instrucao.valor
+
+        for bloco in blocos:
+            comparacao = self._comparacao_do_desvio(bloco, usos) if self.selecao else None
+            if comparacao is not None:
+                self._fundidas[bloco.rotulo] = comparacao
+                self.desvios_fundidos += 1
+
+        absorvidos = Counter()
+        for bloco in blocos:
+            comparacao = self._fundidas.get(bloco.rotulo)
+            for instrucao in bloco.instrucoes + [bloco.terminador]:
+                if instrucao is comparacao:
+                    continue
+                if comparacao is not None and instrucao is bloco.terminador:
+                    temps = self._selecionar_desvio(comparacao)[2]
+                else:
+                    temps = self._absorvidos(instrucao)
+                absorvidos.update(temp.numero for temp in temps)
+        self.imediatos += sum(absorvidos.values())
+        self._omitidas = {
+            numero for numero in self._constantes if absorvidos[numero] == usos[numero]
+        }
+
+    def _comparacao_do_desvio(self, bloco, usos):
+        """Binaria de comparacao que so alimenta o Desvio do bloco, ou None."""
+        terminador = bloco.terminador
+        if terminador.__class__.__name__ != "Desvio" or usos[terminador.condicao.numero] != 1:
+            return None
+        for posicao in range(len(bloco.instrucoes) - 1, -1, -1):
+            instrucao = bloco.instrucoes[posicao]
+            if instrucao.destino is not None and instrucao.destino.numero == terminador.condicao.numero:
+                break
+        else:
+            return None
+        if instrucao.__class__.__name__ != "Binaria" or instrucao.op not in _DESVIOS:
+            return None
+        # Os operandos precisam chegar intactos ao desvio.
+        operandos = {temp.numero for temp in instrucao.usados()}
+        for seguinte in bloco.instrucoes[posicao + 1:]:
+            if seguinte.destino is not None and seguinte.destino.numero in operandos:
+                return None
+        return instrucao
+
+    def _constante(self, temp):
+        return self._constantes.get(temp.numero)
+
+    def _imediato(self, temp):
+        """Valor de `temp` para a selecao de imediatos (None sem `selecao`)."""
+        return self._constante(temp) if self.selecao else None
+
+    def _absorvidos(self, instrucao):
+        """Temporarios constantes que `instrucao` le sem precisar do `li`."""
+        classe = instrucao.__class__.__name__
+        if classe == "Binaria":
+            reduzida = self._reduzir(instrucao, lambda: "%0")
+            if reduzida is not None:
+                return reduzida[1]
+            return self._selecionar_binaria(instrucao.op, instrucao.esquerda, instrucao.direita)[2]
+        if classe == "Armazena":
+            return [instrucao.origem] if self._imediato(instrucao.origem) == 0 else []
+        if classe == "Chamada":
+            return [arg for arg in instrucao.argumentos[:4] if self._imediato(arg) is not None]
+        if classe == "Imprime":
+            valor = instrucao.valor
+            if valor.tipo not in (IR.STR, IR.BOOL, IR.NIL) and self._imediato(valor) is not None:
+                return [valor]
+            return []
+        if classe == "Retorno" and instrucao.valor is not None:
+            return [instrucao.valor] if self._imediato(instrucao.valor) is not None else []
+        return []
+
+    def _selecionar_binaria(self, op, esquerda, direita):
+        """(op MIPS, operandos lidos, temporarios absorvidos) de `esquerda op direita`."""
+        k_esquerda, k_direita = self._imediato(esquerda), self._imediato(direita)
+        if op == "sub" and k_direita is not None and _cabe_imediato(-k_direita):
+            return "addiu", [str(esquerda), str(-k_direita)], [direita]
+        if op in _IMEDIATAS:
+            if k_direita is not None and _cabe_imediato(k_direita, op):
+                return _IMEDIATAS[op], [str(esquerda), str(k_direita)], [direita]
+            if op in _COMUTATIVAS and k_esquerda is not None and _cabe_imediato(k_esquerda, op):
+                return _IMEDIATAS[op], [str(direita), str(k_esquerda)], [esquerda]
+        operandos, absorvidos = [], []
+        for temp, valor in ((esquerda, k_esquerda), (direita, k_direita)):
+            if valor == 0:
+                operandos.append("$zero")
+                absorvidos.append(temp)
+            else:
+                operandos.append(str(temp))
+        return _BINARIAS.get(op, op), operandos, absorvidos
+
+    def _selecionar_desvio(self, comparacao):
+        """(comparacao, operandos do desvio, temporarios absorvidos)."""
+        op, esquerda, direita = comparacao.op, comparacao.esquerda, comparacao.direita
+        k_esquerda, k_direita = self._imediato(esquerda), self._imediato(direita)
+        if k_esquerda is not None and k_direita is None:
+            # O primeiro operando do desvio tem que ser registrador.
+            op, esquerda, direita = _ESPELHADAS[op], direita, esquerda
+            k_esquerda, k_direita = k_direita, k_esquerda
+        operandos, absorvidos = [str(esquerda), str(direita)], []
+        if k_esquerda == 0:
+            operandos[0] = "$zero"
+            absorvidos.append(esquerda)
+        if k_direita == 0:
+            operandos[1] = "$zero"
+            absorvidos.append(direita)
+        elif k_direita is not None and _cabe_imediato(k_direita):
+            operandos[1] = str(k_direita)
+            absorvidos.append(direita)
+        return op, operandos, absorvidos
+
+    def _reduzir(self, instrucao, novo):
+        """
+        (instrucoes, temporarios absorvidos) de ReducaoForca para a
+        Binaria com operando constante, ou None.
+        """
+        if not self.reducao:
+            return None
+        op, esquerda, direita = instrucao.op, instrucao.esquerda, instrucao.direita
+        destino = str(instrucao.destino)
+        k_esquerda, k_direita = self._constante(esquerda), self._constante(direita)
+        if op == "mul" and k_direita is None and k_esquerda is not None:
+            esquerda, direita, k_direita = direita, esquerda, k_esquerda
+        construtor = {
+            "mul": ReducaoForca.multiplicar,
+            "div": ReducaoForca.dividir,
+            "mod": ReducaoForca.resto,
+            "pow": ReducaoForca.potencia,
+        }.get(op)
+        if construtor is None or k_direita is None:
+            return None
+        itens = construtor(destino, str(esquerda), k_direita, novo)
+        if itens is None:
+            return None
+        return itens, [direita]
+
+    def _novo_registrador(self):
+        return str(self._funcao.novo_temp(IR.INT))
+
+    def _emit(self, op, *operandos, comentario=None):
+        self._itens.append(Instrucao(op, *operandos, comentario=comentario))
+
+    def _novo_rotulo(self, prefixo):
+        rotulo = f"{prefixo}_{self._rotulos}"
+        self._rotulos += 1
+        return rotulo
+
+    def _instrucao(self, instrucao):
+        classe = instrucao.__class__.__name__
+        destino = str(instrucao.destino) if instrucao.destino is not None else None
+
+        if classe == "Const":
+            if instrucao.destino.numero not in self._omitidas:
+                self._emit("li", destino, str(instrucao.valor))
+        elif classe == "EnderecoString":
+            self._emit("la", destino, self._string(instrucao.texto))
+        elif classe == "Copia":
+            self._emit("move", destino, str(instrucao.origem))
+        elif classe == "Unaria":
+            if instrucao.op == "neg":
+                self._emit("neg", destino, str(instrucao.origem))
+            else:
+                self._emit("seq", destino, str(instrucao.origem), "$zero")
+        elif classe == "Binaria":
+            reduzida = self._reduzir(instrucao, self._novo_registrador)
+            if reduzida is not None:
+                self._itens += reduzida[0]
+                self.reducoes += 1
+                return
+            op, operandos, _ = self._selecionar_binaria(instrucao.op, instrucao.esquerda, instrucao.direita)
+            if op == "div":
+                self._emit("div", *operandos)
+                self._emit("mflo", destino)
+            elif op == "mod":
+                self._resto(destino, operandos, self._constante(instrucao.direita))
+            elif op == "pow":
+                self._potencia(destino, *operandos)
+            else:
+                self._emit(op, destino, *operandos)
+        elif classe == "Parametro":
+            if instrucao.indice < 4:
+                self._emit("move", destino, f"$a{instrucao.indice}")
+            else:
+                self._emit("lw", destino, f"{4 * (instrucao.indice - 4)}($fp)")
+        elif classe == "Carrega":
+            self._emit("lw", destino, self._operando(instrucao.variavel))
+        elif classe == "Armazena":
+            origem = "$zero" if self._imediato(instrucao.origem) == 0 else str(instrucao.origem)
+            self._emit("sw", origem, self._operando(instrucao.variavel))
+        elif classe == "Chamada":
+            # Primeiro os da pilha: os `move` para $aN ficam colados no jal.
+            extras = instrucao.argumentos[4:]
+            for indice, argumento in enumerate(extras):
+                self._emit("sw", str(argumento), f"{4 * indice}($sp)")
+            self._saida = max(self._saida, len(extras))
+            for indice, argumento in enumerate(instrucao.argumentos[:4]):
+                self._mover(f"$a{indice}", argumento)
+            self._emit("jal", rotulo_funcao(instrucao.funcao))
+            if destino is not None:
+                self._emit("move", destino, "$v0")
+        elif classe == "Imprime":
+            self._imprime(instrucao.valor)
+        elif classe == "Nota":
+            self._itens.append(Comentario(instrucao.texto))
+        elif classe == "Phi":
+            raise ValueError(f"Phi precisa sair da SSA antes da emissao: {instrucao}")
+        else:
+            raise ValueError(f"Instrucao de IR desconhecida: {instrucao}")
+
+    def _resto(self, destino, operandos, divisor=None):
+        """
+        `%` do Lua: o resto do div tem o sinal do dividendo; se ele nao for
+        zero e tiver o sinal oposto ao do divisor, soma o divisor.
+        """
+        pronto = self._novo_rotulo("Mod")
+        self._emit("div", *operandos)
+        self._emit("mfhi", destino)
+        if divisor is not None:
+            # Sinal do divisor conhecido: basta olhar o do resto.
+            self._emit("bgez" if divisor > 0 else "blez", destino, pronto)
+        else:
+            sinais = self._novo_registrador()
+            self._emit("beq", destino, "$zero", pronto)
+            self._emit("xor", sinais, destino, operandos[1])
+            self._emit("bgez", sinais, pronto)
+        self._emit("addu", destino, destino, operandos[1])
+        self._itens.append(Rotulo(pronto))
+
+    def _potencia(self, destino, base, expoente):
+        """Quadrados sucessivos: le o expoente do bit mais baixo ao mais alto."""
+        laco, par = self._novo_rotulo("Pow"), self._novo_rotulo("PowPar")
+        negativo, pronto = self._novo_rotulo("PowNeg"), self._novo_rotulo("PowFim")
+        fator, restante, bit = (self._novo_registrador() for _ in range(3))
+        self._emit("li", destino, "1")
+        self._emit("bltz", expoente, negativo)
+        self._emit("move", fator, base)
+        self._emit("move", restante, expoente)
+        self._itens.append(Rotulo(laco))
+        self._emit("beq", restante, "$zero", pronto)
+        self._emit("andi", bit, restante, "1")
+        self._emit("beq", bit, "$zero", par)
+        self._emit("mul", destino, destino, fator)
+        self._itens.append(Rotulo(par))
+        self._emit("mul", fator, fator, fator)
+        self._emit("srl", restante, restante, "1")
+        self._emit("j", laco)
+        self._itens.append(Rotulo(negativo))
+        self._emit("move", destino, "$zero")
+        self._itens.append(Rotulo(pronto))
+
+    def _imprime(self, valor):
+        registrador = str(valor)
+        if valor.tipo == IR.STR:
+            self._emit("move", "$a0", registrador)
+            self._emit("li", "$v0", "4", comentario="print_string")
+        elif valor.tipo == IR.BOOL:
+            pronto = self._novo_rotulo("PrintBool")
+            self._emit("la", "$a0", self._string("true"))
+            self._emit("bne", registrador, "$zero", pronto)
+            self._emit("la", "$a0", self._string("false"))
+            self._itens.append(Rotulo(pronto))
+            self._emit("li", "$v0", "4", comentario="print_string")
+        elif valor.tipo == IR.NIL:
+            self._emit("la", "$a0", self._string("nil"))
+            self._emit("li", "$v0", "4", comentario="print_string")
+        else:
+            self._mover("$a0", valor)
+            self._emit("li", "$v0", "1", comentario="print_int")
+        self._emit("syscall")
+        self._emit("la", "$a0", self._string("\n"))
+        self._emit("li", "$v0", "4")
+        self._emit("syscall")
+
+    def _chamada_de_cauda(self, bloco, usos, fim):
+        if not self.cauda or fim is None:
+            return None
+        chamada = chamada_de_cauda(bloco, usos)
+        if chamada is None or len(chamada.argumentos) > 4 or chamada.funcao not in self.modulo.funcoes:
+            return None
+        return chamada
+
+    def _salto_de_cauda(self, chamada):
+        """Argumentos em $aN e `j`; o epilogo entra depois da alocacao."""
+        for indice, argumento in enumerate(chamada.argumentos):
+            self._mover(f"$a{indice}", argumento)
+        self._emit("j", rotulo_funcao(chamada.funcao), comentario="chamada de cauda")
+        self.caudas += 1
+
+    def _mover(self, registrador, temp):
+        """Copia `temp` para um registrador fisico (com `li` se for constante)."""
+        valor = self._imediato(temp)
+        if valor is not None:
+            self._emit("li", registrador, str(valor))
+        else:
+            self._emit("move", registrador, str(temp))
+
+    def _terminador(self, terminador, seguinte, fim, comparacao=None):
+        """`comparacao`: Binaria fundida no Desvio (ja nao foi emitida)."""
+        classe = terminador.__class__.__name__
+        if classe == "Salto":
+            if terminador.alvo != seguinte:
+                self._emit("j", terminador.alvo)
+        elif classe == "Desvio":
+            if comparacao is not None:
+                op, operandos, _ = self._selecionar_desvio(comparacao)
+                se_verdadeiro, se_falso = _DESVIOS[op], _DESVIOS[_NEGADAS[op]]
+            else:
+                operandos = [str(terminador.condicao), "$zero"]
+                se_verdadeiro, se_falso = "bne", "beq"
+            if terminador.falso == seguinte:
+                self._emit(se_verdadeiro, *operandos, terminador.verdadeiro)
+            elif terminador.verdadeiro == seguinte:
+                self._emit(se_falso, *operandos, terminador.falso)
+            else:
+                self._emit(se_falso, *operandos, terminador.falso)
+                self._emit("j", terminador.verdadeiro)
+        elif classe == "Escolha":
+            self._escolha(terminador, seguinte)
+        elif classe == "Retorno":
+            if fim is None:
+                self._emit("li", "$v0", "10")
+                self._emit("syscall")
+                return
+            if terminador.valor is not None:
+                self._mover("$v0", terminador.valor)
+            else:
+                self._emit("li", "$v0", "0")
+            if seguinte != fim:
+                self._emit("j", fim)
+        else:
+            raise ValueError(f"Terminador de IR desconhecido: {terminador}")
+
+    def _escolha(self, escolha, seguinte):
+        casos = sorted(escolha.casos)
+        minimo, maximo = casos[0][0], casos[-1][0]
+        tamanho = maximo - minimo + 1
+        if tamanho <= TABELA_MAXIMA and tamanho <= DENSIDADE_TABELA * len(casos):
+            self._tabela(str(escolha.valor), casos, escolha.padrao)
+        else:
+            self.buscas += 1
+            self._buscar(str(escolha.valor), casos, escolha.padrao, seguinte)
+
+    def _tabela(self, valor, casos, padrao):
+        """Salto indireto por `.word`: indice = valor - menor caso."""
+        self.tabelas += 1
+        minimo = casos[0][0]
+        tamanho = casos[-1][0] - minimo + 1
+        rotulos = dict(casos)
+        entradas = [rotulos.get(minimo + indice, padrao) for indice in range(tamanho)]
+        tabela = self._novo_rotulo("tabela")
+        self._dados.append(f"{tabela}: .word {', '.join(entradas)}\n")
+
+        indice = valor
+        if minimo != 0:
+            indice = self._novo_registrador()
+            if _cabe_imediato(-minimo):
+                self._emit("addiu", indice, valor, str(-minimo))
+            else:
+                menor = self._novo_registrador()
+                self._emit("li", menor, str(minimo))
+                self._emit("subu", indice, valor, menor)
+        # Sem sinal, um indice negativo tambem fica acima do tamanho.
+        dentro = self._novo_registrador()
+        self._emit("sltiu", dentro, indice, str(tamanho))
+        self._emit("beq", dentro, "$zero", padrao)
+        deslocamento, alvo = self._novo_registrador(), self._novo_registrador()
+        self._emit("sll", deslocamento, indice, "2")
+        self._emit("lw", alvo, f"{tabela}({deslocamento})")
+        self._itens.append(Instrucao("jr", alvo, alvos=list(dict.fromkeys(entradas))))
+
+    def _buscar(self, valor, casos, padrao, seguinte):
+        """Busca binaria pelos `casos` ordenados; `seguinte` vem logo depois."""
+        if len(casos) <= BUSCA_LINEAR:
+            for constante, rotulo in casos:
+                self._emit("beq", valor, self._operando_imediato(constante), rotulo)
+            if padrao != seguinte:
+                self._emit("j", padrao)
+            return
+        meio = len(casos) // 2
+        direita = self._novo_rotulo("busca")
+        self._emit("bge", valor, self._operando_imediato(casos[meio][0]), direita)
+        self._buscar(valor, casos[:meio], padrao, direita)
+        self._itens.append(Rotulo(direita))
+        self._buscar(valor, casos[meio:], padrao, seguinte)
+
+    def _operando_imediato(self, valor):
+        """Imediato de um desvio; fora de 16 bits, um registrador com `li`."""
+        if _cabe_imediato(valor):
+            return str(valor)
+        registrador = self._novo_registrador()
+        self._emit("li", registrador, str(valor))
+        return registrador
+
@@ -0,0 +1,404 @@
+try:
+    from .InstrucoesMIPS import (
+        CHAMADAS,
+        DESVIOS_CONDICIONAIS,
+        SALTOS,
+        Instrucao,
+        Rotulo,
+        base_memoria,
+        eh_registrador,
+    )
+    from .GrafoFluxo import GrafoFluxo
+except ImportError:
+    from InstrucoesMIPS import (
+        CHAMADAS,
+        DESVIOS_CONDICIONAIS,
+        SALTOS,
+        Instrucao,
+        Rotulo,
+        base_memoria,
+        eh_registrador,
+    )
+    from GrafoFluxo import GrafoFluxo
+
+
+# ==============================================
+#   ESCALONAMENTO DE INSTRUCOES
+# ==============================================
+#
+# Roda no codigo final de cada funcao (registradores fisicos, depois do
+# Peephole). O modelo e o pipeline classico de 5 estagios (R2000/R3000),
+# o mesmo que o SimuladorMIPS usa para os ciclos:
+#   - o valor de um `lw` so sai um ciclo depois: a instrucao seguinte que
+#     o le espera uma bolha (load-use);
+#   - desvios e saltos (inclusive jal/jr) tem delay slot: a instrucao
+#     seguinte sempre executa. Sem `.set noreorder` o montador poe um nop
+#     ali; com ele, o slot e nosso.
+#
+# Cada bloco basico (GrafoFluxo) e cortado em regioes nas barreiras
+# (jal, jalr, syscall); a regiao termina no desvio/salto/barreira, que
+# fica por ultimo. Dentro dela, o grafo de dependencias tem:
+#   - leitura depois de escrita (latencia LATENCIA_LW se quem escreve e o
+#     lw, 1 no resto), escrita depois de leitura e escrita depois de
+#     escrita, com HI/LO como um registrador a mais (div/mult -> mflo/mfhi);
+#   - memoria: sw contra qualquer acesso que possa ser o mesmo endereco.
+#     Mesmo registrador base com deslocamentos diferentes nao colide (se a
+#     base muda no meio, as dependencias do registrador ja ordenam), nem
+#     rotulo de dados contra a pilha ($sp/$fp), nem rotulos diferentes.
+# O escalonamento por lista anda ciclo a ciclo: entre as instrucoes
+# prontas, vai a de maior altura (caminho mais longo ate o fim da regiao,
+# contando as latencias); sem nenhuma pronta, a que fica pronta antes (a
+# bolha fica onde nao ha o que fazer). Empate: a ordem original.
+#
+# Com `atrasos` (para `.set noreorder`), cada desvio/salto/jal/jr leva no
+# delay slot uma instrucao da propria regiao que nada depois dela le ou
+# sobrescreve, que nao escreve o que o desvio le (nem toca $ra num jal) e
+# que o montador monta como uma instrucao so (nada de li/la/lw de rotulo,
+# blt e outras pseudo-instrucoes que viram duas). Sem candidata, `nop`.
+# Comentarios andam junto com a instrucao seguinte.
+
+LATENCIA_LW = 2
+
+_HILO = "$hilo"  # HI e LO, escritos por div/mult e lidos por mflo/mfhi
+_ATRASADAS = DESVIOS_CONDICIONAIS | SALTOS | CHAMADAS  # tem delay slot
+_BARREIRAS = CHAMADAS | frozenset(["syscall"])
+_PILHA = ("$sp", "$fp")
+
+# Instrucoes reais (uma so no montador) com todos os operandos registradores.
+_REAIS = frozenset([
+    "add", "addu", "sub", "subu", "mul", "and", "or", "xor", "nor",
+    "slt", "sltu", "sllv", "srlv", "srav", "move", "neg", "not", "mflo", "mfhi",
+])
+_IMEDIATO_COM_SINAL = frozenset(["addiu", "slti", "sltiu"])
+_IMEDIATO_SEM_SINAL = frozenset(["andi", "ori", "xori"])
+_DESLOCAMENTOS = frozenset(["sll", "srl", "sra"])
+
+
+def _inteiro(texto):
+    try:
+        return int(texto, 0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _lidos(instrucao):
+    """Registradores lidos (syscall le $v0 e $a0; mflo/mfhi leem HI/LO)."""
+    if instrucao.op == "syscall":
+        return ["$v0", "$a0"]
+    if instrucao.op in ("mflo", "mfhi"):
+        return [_HILO]
+    return instrucao.usados()
+
+
+def _escritos(instrucao):
+    if instrucao.op in ("div", "divu", "mult"):
+        return [_HILO]
+    return instrucao.definidos()
+
+
+def _endereco(instrucao):
+    """(base, deslocamento) de um lw/sw: base None para rotulo de dados."""
+    operando = instrucao.operandos[1]
+    base = base_memoria(operando)
+    if base is None:
+        return None, operando
+    return base, _inteiro(operando[: operando.index("(")] or "0")
+
+
+def _colidem(a, b):
+    """Dois acessos (base, deslocamento) podem cair no mesmo endereco."""
+    (base_a, desloc_a), (base_b, desloc_b) = a, b
+    if base_a is None and base_b is None:
+        return desloc_a == desloc_b
+    if base_a is None or base_b is None:
+        return (base_a or base_b) not in _PILHA
+    if base_a == base_b and desloc_a is not None and desloc_b is not None:
+        return desloc_a == desloc_b
+    return True
+
+
+def cabe_no_atraso(instrucao):
+    """`instrucao` vira uma unica instrucao de maquina (pode ir num delay slot)."""
+    op, operandos = instrucao.op, instrucao.operandos
+    if op in _REAIS:
+        return all(eh_registrador(operando) for operando in operandos)
+    if op in _IMEDIATO_COM_SINAL or op in _IMEDIATO_SEM_SINAL or op in _DESLOCAMENTOS:
+        valor = _inteiro(operandos[2])
+        if valor is None:
+            return False
+        if op in _DESLOCAMENTOS:
+            return 0 <= valor <= 31
+        if op in _IMEDIATO_SEM_SINAL:
+            return 0 <= valor <= 0xFFFF
+        return -0x8000 <= valor <= 0x7FFF
+    if op == "li":
+        valor = _inteiro(operandos[1])
+        return valor is not None and -0x8000 <= valor <= 0xFFFF
+    if op in ("lw", "sw"):
+        base, deslocamento = _endereco(instrucao)
+        return base is not None and deslocamento is not None and -0x8000 <= deslocamento <= 0x7FFF
+    return False
+
+
+def bolhas(itens):
+    """lw seguidos de uma instrucao que le o registrador carregado."""
+    total = 0
+    carregado = None
+    for item in itens:
+        if not isinstance(item, Instrucao):
+            continue
+        if carregado is not None and carregado in _lidos(item):
+            total += 1
+        carregado = item.operandos[0] if item.op == "lw" else None
+    return total
+
+
+class Escalonador:
+    """
+    Args:
+        reordenar: escalona cada regiao para esconder a latencia do lw
+            (sem ele nenhuma instrucao muda de lugar)
+        atrasos: preenche os delay slots (codigo para `.set noreorder`);
+            sem `reordenar`, todos levam nop
+    """
+
+    def __init__(self, reordenar=True, atrasos=False):
+        self.reordenar = reordenar
+        self.atrasos = atrasos
+        self.bolhas_antes = 0  # pares lw -> uso no codigo recebido
+        self.bolhas_depois = 0  # e no codigo escalonado
+        self.preenchidos = 0  # delay slots com instrucao util
+        self.nops = 0  # delay slots com nop
+
+    def escalonar(self, itens):
+        itens = list(itens)
+        saida = []
+        for bloco in GrafoFluxo(itens).blocos:
+            regiao = []
+            for item in itens[bloco.inicio:bloco.fim]:
+                if isinstance(item, Rotulo):
+                    saida.append(item)
+                    continue
+                regiao.append(item)
+                if isinstance(item, Instrucao) and (item.op in _ATRASADAS or item.op in _BARREIRAS):
+                    saida += self._regiao(regiao)
+                    regiao = []
+            saida += self._regiao(regiao)
+        self.bolhas_antes += bolhas(itens)
+        self.bolhas_depois += bolhas(saida)
+        return saida
+
+    # ------------------------------------------
+    # Regiao: instrucoes sem barreira + o desvio/barreira do fim
+    # ------------------------------------------
+
+    def _regiao(self, itens):
+        fim = None
+        for indice in range(len(itens) - 1, -1, -1):
+            item = itens[indice]
+            if isinstance(item, Instrucao):
+                if item.op in _ATRASADAS or item.op in _BARREIRAS:
+                    fim = item
+                break
+        # Cada instrucao leva os comentarios que vem antes dela.
+        instrucoes, comentarios, anteriores = [], {}, []
+        for item in itens:
+            if item is fim:
+                break
+            if isinstance(item, Instrucao):
+                comentarios[len(instrucoes)] = anteriores
+                instrucoes.append(item)
+                anteriores = []
+            else:
+                anteriores.append(item)
+
+        sucessores, altura = self._dependencias(instrucoes, fim)
+        atraso = self.atrasos and fim is not None and fim.op in _ATRASADAS
+        preenchedor = None
+        if atraso and self.reordenar:
+            preenchedor = self._preenchedor(instrucoes, sucessores, fim)
+        if self.reordenar:
+            ordem = self._ordenar(instrucoes, sucessores, altura, preenchedor)
+        else:
+            ordem = list(range(len(instrucoes)))
+
+        saida = []
+        for indice in ordem:
+            saida += comentarios[indice]
+            saida.append(instrucoes[indice])
+        if preenchedor is not None:
+            saida += comentarios[preenchedor]
+        saida += anteriores
+        if fim is not None:
+            saida.append(fim)
+        if atraso:
+            if preenchedor is not None:
+                saida.append(instrucoes[preenchedor])
+                self.preenchidos += 1
+            else:
+                saida.append(Instrucao("nop"))
+                self.nops += 1
+        return saida
+
+    def _dependencias(self, instrucoes, fim):
+        """
+        sucessores[i] = [(j, latencia)] com j > i; altura[i] = caminho mais
+        longo de i ate o fim da regiao (o `fim` le com a latencia normal).
+        """
+        sucessores = [[] for _ in instrucoes]
+        escritor = {}  # registrador -> ultima instrucao que o escreve
+        leitores = {}  # registrador -> quem o leu depois disso
+        acessos = []  # (indice, eh_sw, endereco)
+
+        def ligar(origem, destino, latencia):
+            sucessores[origem].append((destino, latencia))
+
+        def latencia(origem):
+            return LATENCIA_LW if instrucoes[origem].op == "lw" else 1
+
+        for indice, instrucao in enumerate(instrucoes):
+            for registrador in _lidos(instrucao):
+                if registrador in escritor:
+                    ligar(escritor[registrador], indice, latencia(escritor[registrador]))
+            for registrador in _escritos(instrucao):
+                if registrador in escritor:
+                    ligar(escritor[registrador], indice, 1)
+                for leitor in leitores.get(registrador, ()):
+                    if leitor != indice:
+                        ligar(leitor, indice, 1)
+            if instrucao.op in ("lw", "sw"):
+                eh_sw = instrucao.op == "sw"
+                endereco = _endereco(instrucao)
+                for anterior, anterior_sw, outro in acessos:
+                    if (eh_sw or anterior_sw) and _colidem(endereco, outro):
+                        ligar(anterior, indice, 1)
+                acessos.append((indice, eh_sw, endereco))
+            for registrador in _lidos(instrucao):
+                leitores.setdefault(registrador, []).append(indice)
+            for registrador in _escritos(instrucao):
+                escritor[registrador] = indice
+                leitores[registrador] = []
+
+        altura = [1] * len(instrucoes)
+        for registrador in _lidos(fim) if fim is not None else ():
+            if registrador in escritor:
+                altura[escritor[registrador]] = latencia(escritor[registrador])
+        for indice in range(len(instrucoes) - 1, -1, -1):
+            for sucessor, espera in sucessores[indice]:
+                altura[indice] = max(altura[indice], espera + altura[sucessor])
+        return sucessores, altura
+
+    def _preenchedor(self, instrucoes, sucessores, fim):
+        """Instrucao da regiao que pode ir para o delay slot de `fim`, ou None."""
+        lidos = set(fim.usados())
+        candidatas = []
+        for indice, instrucao in enumerate(instrucoes):
+            if sucessores[indice] or not cabe_no_atraso(instrucao):
+                continue
+            escritos = set(_escritos(instrucao))
+            if escritos & lidos:
+                continue
+            if fim.op in CHAMADAS and "$ra" in escritos | set(_lidos(instrucao)):
+                continue
+            candidatas.append(indice)
+        if not candidatas:
+            return None
+        # Um lw no slot ainda pode custar a bolha no destino: fica por ultimo.
+        return max(candidatas, key=lambda i: (instrucoes[i].op != "lw", i))
+
+    def _ordenar(self, instrucoes, sucessores, altura, fora):
+        """Escalonamento por lista; `fora` (o preenchedor) nao entra."""
+        pendentes = [0] * len(instrucoes)
+        for indice, lista in enumerate(sucessores):
+            for sucessor, _ in lista:
+                pendentes[sucessor] += 1
+        pronto_em = [0] * len(instrucoes)
+        prontas = [i for i in range(len(instrucoes)) if not pendentes[i] and i != fora]
+        ordem = []
+        ciclo = 0
+        while prontas:
+            ciclo = max(ciclo, min(pronto_em[i] for i in prontas))
+            escolhida = max(
+                (i for i in prontas if pronto_em[i] <= ciclo), key=lambda i: (altura[i], -i)
+            )
+            prontas.remove(escolhida)
+            ordem.append(escolhida)
+            for sucessor, espera in sucessores[escolhida]:
+                pronto_em[sucessor] = max(pronto_em[sucessor], ciclo + espera)
+                pendentes[sucessor] -= 1
+                if not pendentes[sucessor] and sucessor != fora:
+                    prontas.append(sucessor)
+            ciclo += 1
+        return ordem
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main():
+    import os
+    import sys
+
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    try:
+        from .InstrucoesMIPS import analisar_instrucao, renderizar
+        from .Compilador import Compilador
+        from .SimuladorMIPS import simular
+    except ImportError:
+        from InstrucoesMIPS import analisar_instrucao, renderizar
+        from Compilador import Compilador
+        from SimuladorMIPS import simular
+
+    codigo = """
+    lw $t0, -12($fp)
+    addu $t1, $t0, $t0
+    lw $t2, -16($fp)
+    sw $t1, -20($fp)
+    addu $t3, $t2, $t1
+    li $t4, 3
+    lw $t5, x
+    bne $t3, $t5, Fim
+    move $a0, $t4
+    jal func_f
+Fim:
+    jr $ra
+    """
+    itens = [analisar_instrucao(linha) for linha in codigo.strip().splitlines()]
+    for atrasos in (False, True):
+        escalonador = Escalonador(atrasos=atrasos)
+        print(renderizar(escalonador.escalonar(itens)))
+        print(f"bolhas load-use: {escalonador.bolhas_antes} -> {escalonador.bolhas_depois}, "
+              f"delay slots: {escalonador.preenchidos} uteis, {escalonador.nops} nop\n")
+
+    programa = """
+    function soma(n)
+        local total = 0
+        local i = 1
+        while i <= n do
+            total = total + i * i
+            i = i + 1
+        end
+        return total
+    end
+    local s = 0
+    for k = 1, 200 do
+        s = s + soma(k) % 1000
+    end
+    print(s)
+    """
+    passes = ("constantes", "codigo_morto", "peephole")
+    for nome, compilador in (
+        ("sem escalonar", Compilador(passes)),
+        ("escalonado", Compilador(passes + ("escalonamento",))),
+        ("noreorder", Compilador(passes + ("escalonamento",), noreorder=True)),
+    ):
+        execucao = simular(compilador.compilar(programa).assembly)
+        print(f"{nome:14} saida {execucao.saida.strip()}: {execucao.instrucoes} instrucoes, "
+              f"{execucao.bolhas} bolhas, {execucao.atrasos} nops do montador, ~{execucao.ciclos} ciclos")
+
+
+if __name__ == "__main__":
+    main()
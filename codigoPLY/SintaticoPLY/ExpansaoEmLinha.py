@@ -0,0 +1,314 @@
+import copy
+from collections import Counter
+
+try:
+    from . import IR
+    from . import SSA
+except ImportError:
+    import IR
+    import SSA
+
+
+# ==============================================
+#   EXPANSAO EM LINHA (INLINING)
+# ==============================================
+#
+# Troca `chama f(...)` pelo corpo de f quando f e pequena e nao recursiva
+# (nem indiretamente). Roda na IR que sai do GeradorAssembly, antes da SSA:
+#   - o bloco da chamada e partido em dois: o primeiro guarda os argumentos
+#     nas variaveis dos parametros e salta para a copia do corpo; cada
+#     `retorna` da copia salta para o segundo;
+#   - o valor devolvido chega por um Phi no inicio do segundo bloco
+#     (`retorna` sem valor entra como 0, o mesmo que o $v0 teria);
+#   - as variaveis locais da copia ganham slots novos no quadro de quem
+#     chama; no main, que nao tem quadro, viram globais com nome proprio.
+# Depois disso a SSA promove essas variaveis e as otimizacoes da IR
+# enxergam o corpo junto com os argumentos de cada chamada.
+#
+# Modelo de custo, pelo tamanho em instrucoes de IR da funcao chamada (com
+# as chamadas dela ja expandidas: as folhas do grafo vao primeiro). Uma
+# chamada custa uns 12 instrucoes MIPS (argumentos, jal, prologo, epilogo,
+# $v0), entao corpos desse tamanho nao aumentam o codigo:
+#   - ate LIMITE_PEQUENA: expande em todas as chamadas;
+#   - ate LIMITE_UNICA: expande se ha uma unica chamada no programa;
+#   - quem chama nao passa de LIMITE_CHAMADOR.
+# Funcoes que ficam sem nenhuma chamada saem do modulo.
+
+LIMITE_PEQUENA = 12
+LIMITE_UNICA = 40
+LIMITE_CHAMADOR = 400
+
+
+def grafo_chamadas(modulo):
+    """funcao -> nomes das funcoes do modulo que ela chama."""
+    return {
+        nome: {
+            instrucao.funcao
+            for instrucao in funcao.instrucoes()
+            if instrucao.__class__.__name__ == "Chamada" and instrucao.funcao in modulo.funcoes
+        }
+        for nome, funcao in modulo.funcoes.items()
+    }
+
+
+def recursivas(grafo):
+    """Funcoes que podem chamar a si mesmas, direta ou indiretamente."""
+    resultado = set()
+    for inicio in grafo:
+        pendentes, vistos = list(grafo[inicio]), set()
+        while pendentes:
+            nome = pendentes.pop()
+            if nome == inicio:
+                resultado.add(inicio)
+                break
+            if nome not in vistos:
+                vistos.add(nome)
+                pendentes.extend(grafo[nome])
+    return resultado
+
+
+def tamanho(funcao):
+    """Instrucoes de IR (com terminadores) dos blocos alcancaveis."""
+    alcancaveis = funcao.alcancaveis()
+    return sum(
+        1 + sum(1 for instrucao in bloco.instrucoes if instrucao.__class__.__name__ != "Nota")
+        for bloco in funcao.blocos
+        if bloco.rotulo in alcancaveis
+    )
+
+
+class ExpansaoEmLinha:
+    """
+    Args:
+        limite_pequena: funcoes ate esse tamanho expandem sempre
+        limite_unica: funcoes ate esse tamanho expandem na chamada unica
+        limite_chamador: tamanho maximo de quem recebe o corpo
+    """
+
+    def __init__(self, limite_pequena=LIMITE_PEQUENA, limite_unica=LIMITE_UNICA,
+                 limite_chamador=LIMITE_CHAMADOR):
+        self.limite_pequena = limite_pequena
+        self.limite_unica = limite_unica
+        self.limite_chamador = limite_chamador
+        self.expandidas = 0  # chamadas trocadas pelo corpo
+        self.removidas = []  # funcoes que ficaram sem chamadas
+
+        self._modulo = None
+        self._recursivas = set()
+        self._chamadas = Counter()  # funcao -> chamadas no programa original
+        self._copias = 0
+
+    def otimizar(self, modulo):
+        self._modulo = modulo
+        grafo = grafo_chamadas(modulo)
+        self._recursivas = recursivas(grafo)
+        self._chamadas = Counter(
+            instrucao.funcao
+            for funcao in modulo.funcoes.values()
+            for instrucao in funcao.instrucoes()
+            if instrucao.__class__.__name__ == "Chamada"
+        )
+
+        # Pos-ordem do grafo: quem e chamado e expandido antes de ser copiado.
+        visitadas = set()
+
+        def visitar(nome):
+            if nome in visitadas:
+                return
+            visitadas.add(nome)
+            for chamada in sorted(grafo[nome]):
+                visitar(chamada)
+            self._expandir_em(modulo.funcoes[nome])
+
+        for nome in list(modulo.funcoes):
+            visitar(nome)
+        self._remover_sem_chamadas()
+        return modulo
+
+    def _remover_sem_chamadas(self):
+        """Tira as funcoes cujas chamadas foram todas expandidas."""
+        modulo = self._modulo
+        mudou = True
+        while mudou:
+            mudou = False
+            chamadas = set().union(*grafo_chamadas(modulo).values())
+            for nome in list(modulo.funcoes):
+                if nome != IR.PRINCIPAL and self._chamadas[nome] and nome not in chamadas:
+                    del modulo.funcoes[nome]
+                    self.removidas.append(nome)
+                    mudou = True
+
+    # ------------------------------------------
+    # Decisao
+    # ------------------------------------------
+
+    def _vale_expandir(self, funcao, chamada):
+        alvo = self._modulo.funcoes.get(chamada.funcao)
+        if alvo is None or alvo is funcao or alvo.nome == IR.PRINCIPAL:
+            return False
+        if alvo.nome in self._recursivas or len(chamada.argumentos) != len(alvo.parametros):
+            return False
+        custo = tamanho(alvo)
+        if custo > self.limite_pequena:
+            if custo > self.limite_unica or self._chamadas[alvo.nome] != 1:
+                return False
+        return tamanho(funcao) + custo <= self.limite_chamador
+
+    # ------------------------------------------
+    # Expansao
+    # ------------------------------------------
+
+    def _expandir_em(self, funcao):
+        indice = 0
+        # Os blocos novos entram logo depois do atual e tambem sao visitados.
+        while indice < len(funcao.blocos):
+            bloco = funcao.blocos[indice]
+            for posicao, instrucao in enumerate(bloco.instrucoes):
+                if instrucao.__class__.__name__ == "Chamada" and self._vale_expandir(funcao, instrucao):
+                    self._expandir(funcao, bloco, posicao)
+                    break
+            indice += 1
+
+    def _expandir(self, funcao, bloco, posicao):
+        chamada = bloco.instrucoes[posicao]
+        alvo = self._modulo.funcoes[chamada.funcao]
+        numero = self._copias
+        self._copias += 1
+        self.expandidas += 1
+
+        # Segunda metade do bloco: recebe o valor e segue com o resto.
+        continuacao = IR.Bloco(f"Retorno_{alvo.nome}{numero}")
+        continuacao.instrucoes = bloco.instrucoes[posicao + 1:]
+        continuacao.terminador = bloco.terminador
+        bloco.instrucoes = bloco.instrucoes[:posicao]
+        por_rotulo = {b.rotulo: b for b in funcao.blocos}
+        for sucessor in continuacao.sucessores():
+            for phi in SSA.phis(por_rotulo[sucessor]):
+                if bloco.rotulo in phi.argumentos:
+                    phi.argumentos[continuacao.rotulo] = phi.argumentos.pop(bloco.rotulo)
+
+        if funcao.nome == IR.PRINCIPAL:
+            def variavel(original):
+                if original.global_:
+                    return original
+                return IR.Variavel(f"{alvo.nome}_{original.nome}_{numero}")
+        else:
+            base = funcao.slots
+            funcao.slots += alvo.slots
+
+            def variavel(original):
+                if original.global_:
+                    return original
+                return IR.Variavel(original.nome, original.slot + base)
+
+        novos = {}
+
+        def temp(original):
+            if original.numero not in novos:
+                novos[original.numero] = funcao.novo_temp(original.tipo)
+            return novos[original.numero]
+
+        alcancaveis = alvo.alcancaveis()
+        originais = [b for b in alvo.blocos if b.rotulo in alcancaveis]
+        rotulos = {b.rotulo: f"{b.rotulo}_inl{numero}" for b in originais}
+
+        for parametro, argumento in zip(alvo.parametros, chamada.argumentos):
+            bloco.instrucoes.append(IR.Armazena(variavel(parametro), argumento))
+        bloco.terminador = IR.Salto(rotulos[alvo.entrada.rotulo])
+
+        copias = []
+        valores = {}
+        for original in originais:
+            novo = IR.Bloco(rotulos[original.rotulo])
+            novo.instrucoes = [
+                self._copiar(instrucao, temp, variavel, rotulos) for instrucao in original.instrucoes
+            ]
+            terminador = original.terminador
+            if terminador.__class__.__name__ == "Retorno":
+                if chamada.destino is not None:
+                    if terminador.valor is not None:
+                        valores[novo.rotulo] = temp(terminador.valor)
+                    else:
+                        nada = funcao.novo_temp(chamada.destino.tipo)
+                        novo.instrucoes.append(IR.Const(nada, 0))
+                        valores[novo.rotulo] = nada
+                novo.terminador = IR.Salto(continuacao.rotulo)
+            else:
+                novo.terminador = self._copiar(terminador, temp, variavel, rotulos)
+            copias.append(novo)
+
+        if chamada.destino is not None:
+            continuacao.instrucoes.insert(0, IR.Phi(chamada.destino, valores))
+        indice = funcao.blocos.index(bloco) + 1
+        funcao.blocos[indice:indice] = copias + [continuacao]
+
+    def _copiar(self, instrucao, temp, variavel, rotulos):
+        copia = copy.copy(instrucao)
+        if copia.destino is not None:
+            copia.destino = temp(copia.destino)
+        copia.substituir({usado: temp(usado) for usado in instrucao.usados()})
+        classe = copia.__class__.__name__
+        if classe in ("Carrega", "Armazena"):
+            copia.variavel = variavel(copia.variavel)
+        elif classe == "Phi":
+            copia.argumentos = {
+                rotulos[rotulo]: valor for rotulo, valor in copia.argumentos.items() if rotulo in rotulos
+            }
+        elif copia.terminador:
+            copia.redirecionar(rotulos)
+        return copia
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main():
+    import os
+    import sys
+
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    try:
+        from .VisitorSemantico import _criar_parser
+        from .InferenciaTipos import InferenciaTipos
+        from .GeradorAssembly import GeradorAssembly
+    except ImportError:
+        from VisitorSemantico import _criar_parser
+        from InferenciaTipos import InferenciaTipos
+        from GeradorAssembly import GeradorAssembly
+
+    codigo = """
+    function soma(a, b)
+        return a + b
+    end
+    function maior(a, b)
+        if a > b then
+            return a
+        end
+        return b
+    end
+    function fat(n)
+        if n < 2 then
+            return 1
+        end
+        return n * fat(n - 1)
+    end
+    local x = soma(1, 2)
+    print(maior(x, soma(x, 4)))
+    print(fat(5))
+    """
+    arvore = _criar_parser().parse(codigo)
+    gerador = GeradorAssembly(tipos=InferenciaTipos(arvore))
+    arvore.accept(gerador)
+    modulo = gerador.finalizar()
+    expansao = ExpansaoEmLinha()
+    expansao.otimizar(modulo)
+    print(modulo)
+    print(f"chamadas expandidas: {expansao.expandidas}, "
+          f"funcoes removidas: {', '.join(expansao.removidas) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
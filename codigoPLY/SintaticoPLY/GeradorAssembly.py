@@ -6,46 +6,212 @@ import ply.yacc as yacc
 try:
     from . import SintaxeAbstrata as a
     from . import AbstractVisitor
+    from . import IR
+    from . import SSA
+    from .InferenciaTipos import InferenciaTipos
+    from .QuadrosPilha import QuadrosPilha
+    from .EmissorMIPS import EmissorMIPS
+    from .NumeracaoValores import _chave
 except ImportError:
     import SintaxeAbstrata as a
     import AbstractVisitor
+    import IR
+    import SSA
+    from InferenciaTipos import InferenciaTipos
+    from QuadrosPilha import QuadrosPilha
+    from EmissorMIPS import EmissorMIPS
+    from NumeracaoValores import _chave
+
+
+_TIPOS_IR = {"number": IR.INT, "boolean": IR.BOOL, "string": IR.STR, "nil": IR.NIL}
+
+_OPERADORES_IR = {
+    "+": "add",
+    "-": "sub",
+    "*": "mul",
+    "/": "div",
+    "%": "mod",
+    "^": "pow",
+    "==": "eq",
+    "~=": "ne",
+    "<": "lt",
+    "<=": "le",
+    ">": "gt",
+    ">=": "ge",
+}
+
+# Cadeias if/elseif com menos casos que isso continuam como desvios.
+MINIMO_CASOS = 4
+
+
+def _inteiro_constante(node):
+    """
+    Valor de um literal inteiro, ou de +/- entre literais (o parser escreve
+    `-1` como `0 - 1`); None se depender da execucao.
+    """
+    classe = node.__class__.__name__
+    op = node.op.strip() if isinstance(getattr(node, "op", None), str) else None
+    if classe == "Number":
+        return node.value if type(node.value) is int else None
+    if classe == "UnOp" and op == "-":
+        valor = _inteiro_constante(node.operand)
+        return -valor if valor is not None else None
+    if classe == "BinOp" and op in ("+", "-"):
+        esquerda, direita = _inteiro_constante(node.left), _inteiro_constante(node.right)
+        if esquerda is None or direita is None:
+            return None
+        return esquerda + direita if op == "+" else esquerda - direita
+    return None
+
+
+def _comparacao_constante(node):
+    """
+    (Var, k) para `x == k` ou `k == x` com k inteiro constante de 32 bits;
+    None para qualquer outra condicao.
+    """
+    op = node.op.strip() if isinstance(getattr(node, "op", None), str) else None
+    if node.__class__.__name__ != "BinOp" or op != "==":
+        return None
+    for variavel, constante in ((node.left, node.right), (node.right, node.left)):
+        if variavel.__class__.__name__ == "Var":
+            valor = _inteiro_constante(constante)
+            if valor is not None and -(2 ** 31) <= valor < 2 ** 31:
+                return variavel, valor
+    return None
 
 
 class GeradorAssembly(AbstractVisitor.AbstractVisitor):
-    def __init__(self):
+    """
+    Traduz a AST para a IR de tres enderecos (self.modulo); gerar_codigo()
+    passa a IR pelo EmissorMIPS.
+
+    `and`/`or` sao de curto-circuito: o lado direito so e avaliado quando
+    o esquerdo nao decide. Como valor, o resultado e um IR.Phi no bloco de
+    juncao (o proprio lado esquerdo ou o direito, como no Lua); como
+    condicao de If/elseif/While, cada lado desvia direto para o destino.
+
+    Com `cse` ligada, cada bloco guarda uma tabela de valores ja calculados
+    (numeracao de valores local, com as chaves da NumeracaoValores): uma
+    expressao com o mesmo operador e os mesmos temporarios, a mesma
+    constante ou a leitura de uma variavel sem escrita no meio reaproveita
+    o temporario e nao gera instrucao. Uma atribuicao troca o valor
+    conhecido da variavel pelo atribuido; uma chamada esquece tudo (a funcao
+    pode escrever as globais, e um valor vivo depois do jal ocuparia um $s,
+    salvo e restaurado a cada chamada, para economizar um lw). O bloco com
+    um unico predecessor herda a tabela dele, entao o lado direito de
+    `x*y > 0 and x*y < 100` reaproveita o `x*y` do esquerdo; cabecalhos de
+    laco comecam vazios (o salto de volta chega depois).
+
+    Com `escolha` ligada, um if/elseif cujos primeiros ramos (pelo menos
+    MINIMO_CASOS) comparam a mesma variavel com constantes inteiras
+    distintas le a variavel uma vez e termina o bloco com um IR.Escolha;
+    os ramos que sobram seguem como desvios a partir do `senao`. O
+    EmissorMIPS escolhe entre tabela de saltos e busca binaria.
+
+    Args:
+        tipos: InferenciaTipos opcional; da o tipo dos temporarios (usado,
+            por exemplo, para especializar o print)
+        quadros: QuadrosPilha; montado a partir da raiz se None
+        cse: elimina subexpressoes comuns durante a geracao
+        escolha: cadeias `x == k` de if/elseif viram IR.Escolha
+    """
+
+    def __init__(self, tipos=None, quadros=None, cse=False, escolha=False):
         super().__init__()
+        self.tipos = tipos
+        self.quadros = quadros
+        self.cse = cse
+        self.escolha = escolha
+        self.reaproveitadas = 0  # valores que nao foram recalculados
+        self.escolhas = 0  # cadeias if/elseif trocadas por IR.Escolha
 
-        self.data_section = [".data\n"]
-        self.main_section = []
-        self.function_section = []
-        self._active_section = self.main_section
+        self.modulo = IR.Modulo()
+        self.funcao = self.modulo.adicionar(IR.Funcao(IR.PRINCIPAL))
+        self.bloco = self.funcao.novo_bloco("main_inicio")
 
-        self.reg_count = 0
         self.label_count = 0
-        self.str_count = 0
+        self.spills = 0
+        self._codigo = None
 
-        self.variaveis_declaradas = set()
-        self.strings_declaradas = {}
         self.function_signatures = {}
         self.generated_functions = set()
-
         self.current_function = None
-        self.current_function_end_label = None
+
+        self._tabelas = {}  # rotulo do bloco -> chave -> Temp com o valor
+        self._cabecalhos = set()  # rotulos de cabecalho de laco
+        self._predecessores = {}  # rotulo -> rotulos dos blocos que saltam para ele
 
     # ------------------------------------------
     # Helpers
     # ------------------------------------------
 
-    def _emit(self, instruction):
-        self._active_section.append(f"    {instruction}\n")
-
-    def _emit_label(self, label):
-        self._active_section.append(f"{label}:\n")
-
-    def _get_reg(self):
-        reg = f"$t{self.reg_count}"
-        self.reg_count = (self.reg_count + 1) % 10
-        return reg
+    def _emit(self, instrucao):
+        self._bloco_atual().instrucoes.append(instrucao)
+        if self.cse:
+            classe = instrucao.__class__.__name__
+            valores = self._valores()
+            if classe == "Armazena":
+                valores[("carrega", instrucao.variavel)] = instrucao.origem
+            elif classe == "Chamada":
+                valores.clear()
+
+    def _bloco_atual(self):
+        if self.bloco is None:
+            # Codigo depois de um return: bloco novo, sem predecessores.
+            self.bloco = self.funcao.novo_bloco(self._get_label("L"))
+        return self.bloco
+
+    def _valores(self):
+        return self._tabelas.setdefault(self._bloco_atual().rotulo, {})
+
+    def _valor(self, instrucao):
+        """
+        Emite `instrucao` (que define um temporario novo) e devolve o
+        temporario com o resultado; com `cse`, um valor igual ja calculado
+        e devolvido no lugar e a instrucao nao sai.
+        """
+        if not self.cse:
+            self._emit(instrucao)
+            return instrucao.destino
+        classe = instrucao.__class__.__name__
+        if classe == "Carrega":
+            chave = ("carrega", instrucao.variavel)
+        else:
+            chave = _chave(None, instrucao, classe)
+        anterior = self._valores().get(chave)
+        if anterior is not None:
+            self.reaproveitadas += 1
+            if anterior.tipo == instrucao.destino.tipo:
+                return anterior
+            # Mesma memoria lida com outro tipo inferido: so a copia.
+            instrucao = IR.Copia(instrucao.destino, anterior)
+        self._emit(instrucao)
+        if chave is not None:
+            self._valores()[chave] = instrucao.destino
+        return instrucao.destino
+
+    def _fechar(self, terminador):
+        """Poe o terminador no bloco atual e anota as arestas (para o cse)."""
+        self.bloco.terminador = terminador
+        for alvo in dict.fromkeys(terminador.sucessores()):
+            self._predecessores.setdefault(alvo, []).append(self.bloco.rotulo)
+
+    def _terminar(self, terminador):
+        if self.bloco is not None:
+            self._fechar(terminador)
+            self.bloco = None
+
+    def _iniciar_bloco(self, rotulo):
+        if self.bloco is not None:
+            self._fechar(IR.Salto(rotulo))
+        self.bloco = self.funcao.novo_bloco(rotulo)
+        if self.cse and rotulo not in self._cabecalhos:
+            predecessores = self._predecessores.get(rotulo, ())
+            if len(predecessores) == 1:
+                self._tabelas[rotulo] = dict(self._tabelas.get(predecessores[0], {}))
+
+    def _temp(self, tipo=IR.QUALQUER):
+        return self.funcao.novo_temp(tipo)
 
     def _get_label(self, prefix="L"):
         label = f"{prefix}{self.label_count}"
@@ -55,31 +221,14 @@ class GeradorAssembly(AbstractVisitor.AbstractVisitor):
     def _node_name(self, node):
         return node.value if hasattr(node, "value") else str(node)
 
-    def _escape_string(self, value):
-        return value.replace("\\", "\\\\").replace('"', '\\"')
-
-    def _ensure_variable(self, name):
-        if name not in self.variaveis_declaradas:
-            self.variaveis_declaradas.add(name)
-            self.data_section.append(f"{name}: .word 0\n")
-
-    def _declare_string(self, value):
-        if value not in self.strings_declaradas:
-            label = f"str_{self.str_count}"
-            self.str_count += 1
-            self.strings_declaradas[value] = label
-            escaped = self._escape_string(value)
-            self.data_section.append(f'{label}: .asciiz "{escaped}"\n')
-        return self.strings_declaradas[value]
-
-    def _ensure_newline_label(self):
-        if "\n" not in self.strings_declaradas:
-            self.strings_declaradas["\n"] = "newline"
-            self.data_section.append('newline: .asciiz "\\n"\n')
-        return self.strings_declaradas["\n"]
+    def _tipo(self, node):
+        """Tipo de IR a partir do tipo unico inferido (QUALQUER se indefinido)."""
+        if self.tipos is None:
+            return IR.QUALQUER
+        return _TIPOS_IR.get(self.tipos.tipo_unico(node), IR.QUALQUER)
 
-    def _is_string_literal(self, node):
-        return node.__class__.__name__ == "String"
+    def _const(self, valor, tipo):
+        return self._valor(IR.Const(self._temp(tipo), valor))
 
     def _iter_elseif(self, elseif_list):
         for item in elseif_list or []:
@@ -103,128 +252,113 @@ class GeradorAssembly(AbstractVisitor.AbstractVisitor):
     # ------------------------------------------
 
     def visitNumber(self, node):
-        reg = self._get_reg()
-        self._emit(f"li {reg}, {node.value}")
-        return reg
+        return self._const(node.value, IR.INT)
 
     def visitString(self, node):
-        label = self._declare_string(node.value)
-        reg = self._get_reg()
-        self._emit(f"la {reg}, {label}")
-        return reg
+        return self._valor(IR.EnderecoString(self._temp(IR.STR), node.value))
 
     def visitBoolean(self, node):
-        reg = self._get_reg()
-        self._emit(f"li {reg}, {1 if node.value else 0}")
-        return reg
+        return self._const(1 if node.value else 0, IR.BOOL)
 
     def visitNil(self, node):
-        reg = self._get_reg()
-        self._emit(f"li {reg}, 0")
-        return reg
+        return self._const(0, IR.NIL)
 
     def visitVar(self, node):
-        nome = self._node_name(node.name)
-        self._ensure_variable(nome)
-        reg = self._get_reg()
-        self._emit(f"lw {reg}, {nome}")
-        return reg
+        return self._valor(IR.Carrega(self._temp(self._tipo(node)), self.quadros.variavel(node)))
 
     def visitUnOp(self, node):
-        reg_op = node.operand.accept(self)
-        reg_res = self._get_reg()
+        origem = node.operand.accept(self)
         op = node.op.strip() if isinstance(node.op, str) else node.op
 
         if op == "-":
-            self._emit(f"neg {reg_res}, {reg_op}")
-        elif op == "not":
-            self._emit(f"seq {reg_res}, {reg_op}, $zero")
-        else:
-            self._emit(f"move {reg_res}, {reg_op}")
-        return reg_res
+            return self._valor(IR.Unaria(self._temp(IR.INT), "neg", origem))
+        if op == "not":
+            return self._valor(IR.Unaria(self._temp(IR.BOOL), "not", origem))
+        return self._valor(IR.Copia(self._temp(origem.tipo), origem))
 
     def visitBinOp(self, node):
-        reg_esq = node.left.accept(self)
-        reg_dir = node.right.accept(self)
-        reg_res = self._get_reg()
         op = node.op.strip() if isinstance(node.op, str) else node.op
-
-        if op == "+":
-            self._emit(f"add {reg_res}, {reg_esq}, {reg_dir}")
-        elif op == "-":
-            self._emit(f"sub {reg_res}, {reg_esq}, {reg_dir}")
-        elif op == "*":
-            self._emit(f"mul {reg_res}, {reg_esq}, {reg_dir}")
-        elif op == "/":
-            self._emit(f"div {reg_esq}, {reg_dir}")
-            self._emit(f"mflo {reg_res}")
-        elif op == "==":
-            self._emit(f"seq {reg_res}, {reg_esq}, {reg_dir}")
-        elif op == "~=":
-            self._emit(f"sne {reg_res}, {reg_esq}, {reg_dir}")
-        elif op == ">":
-            self._emit(f"sgt {reg_res}, {reg_esq}, {reg_dir}")
-        elif op == "<":
-            self._emit(f"slt {reg_res}, {reg_esq}, {reg_dir}")
-        elif op == ">=":
-            self._emit(f"sge {reg_res}, {reg_esq}, {reg_dir}")
-        elif op == "<=":
-            self._emit(f"sle {reg_res}, {reg_esq}, {reg_dir}")
-        elif op == "and":
-            self._emit(f"and {reg_res}, {reg_esq}, {reg_dir}")
-        elif op == "or":
-            self._emit(f"or {reg_res}, {reg_esq}, {reg_dir}")
+        if op in ("and", "or"):
+            return self._logico(node, op)
+        esquerda = node.left.accept(self)
+        direita = node.right.accept(self)
+        op_ir = _OPERADORES_IR.get(op)
+
+        if op_ir is None:
+            self._emit(IR.Nota(f"operador nao suportado: {op}"))
+            return self._const(0, IR.QUALQUER)
+        if op_ir in IR.OPERACOES_COMPARACAO:
+            tipo = IR.BOOL
+        elif op_ir in IR.OPERACOES_ARITMETICAS:
+            tipo = IR.INT
         else:
-            self._emit(f"li {reg_res}, 0  # operador nao suportado: {op}")
-
-        return reg_res
+            tipo = self._tipo(node)
+        return self._valor(IR.Binaria(self._temp(tipo), op_ir, esquerda, direita))
+
+    def _logico(self, node, op):
+        """Valor de `a and b` / `a or b` sem avaliar b quando a ja decide."""
+        direita_label = self._get_label("AndRight" if op == "and" else "OrRight")
+        fim_label = self._get_label("AndEnd" if op == "and" else "OrEnd")
+
+        esquerda = node.left.accept(self)
+        origem_esquerda = self.bloco.rotulo
+        if op == "and":
+            self._terminar(IR.Desvio(esquerda, direita_label, fim_label))
+        else:
+            self._terminar(IR.Desvio(esquerda, fim_label, direita_label))
+        self._iniciar_bloco(direita_label)
+        direita = node.right.accept(self)
+        origem_direita = self.bloco.rotulo
+        self._iniciar_bloco(fim_label)
+
+        tipo = esquerda.tipo if esquerda.tipo == direita.tipo else IR.QUALQUER
+        temp = self._temp(tipo)
+        self._emit(IR.Phi(temp, {origem_esquerda: esquerda, origem_direita: direita}))
+        return temp
+
+    def _desviar(self, condicao, verdadeiro, falso):
+        """Termina o bloco atual desviando conforme `condicao` (com curto-circuito)."""
+        classe = condicao.__class__.__name__
+        op = getattr(condicao, "op", None)
+        op = op.strip() if isinstance(op, str) else op
+        if classe == "BinOp" and op in ("and", "or"):
+            direita_label = self._get_label("AndRight" if op == "and" else "OrRight")
+            if op == "and":
+                self._desviar(condicao.left, direita_label, falso)
+            else:
+                self._desviar(condicao.left, verdadeiro, direita_label)
+            self._iniciar_bloco(direita_label)
+            self._desviar(condicao.right, verdadeiro, falso)
+        elif classe == "UnOp" and op == "not":
+            self._desviar(condicao.operand, falso, verdadeiro)
+        else:
+            self._terminar(IR.Desvio(condicao.accept(self), verdadeiro, falso))
 
     def visitFunctionCall(self, node):
         nome_func = self._node_name(node.name)
 
         if nome_func == "print":
             if node.args:
-                arg_node = node.args[0]
-                reg_val = arg_node.accept(self)
-                self._emit(f"move $a0, {reg_val}")
-                if self._is_string_literal(arg_node):
-                    self._emit("li $v0, 4  # print_string")
-                else:
-                    self._emit("li $v0, 1  # print_int")
-                self._emit("syscall")
-
-                newline_label = self._ensure_newline_label()
-                self._emit(f"la $a0, {newline_label}")
-                self._emit("li $v0, 4")
-                self._emit("syscall")
-            reg_out = self._get_reg()
-            self._emit(f"li {reg_out}, 0")
-            return reg_out
-
-        assinatura = self.function_signatures.get(nome_func)
-        if not assinatura:
-            self._emit(f"# [ERRO] Funcao '{nome_func}' nao declarada")
-            reg_out = self._get_reg()
-            self._emit(f"li {reg_out}, 0")
-            return reg_out
-
-        for idx, arg_node in enumerate(node.args):
-            reg_arg = arg_node.accept(self)
-            if idx < 4:
-                self._emit(f"move $a{idx}, {reg_arg}")
-            else:
-                self._emit("# [AVISO] Mais de 4 argumentos nao suportados")
+                self._emit(IR.Imprime(node.args[0].accept(self)))
+            return self._const(0, IR.NIL)
+
+        if nome_func not in self.function_signatures:
+            self._emit(IR.Nota(f"[ERRO] Funcao '{nome_func}' nao declarada"))
+            return self._const(0, IR.QUALQUER)
 
-        self._emit(f"jal {assinatura['label']}")
-        reg_out = self._get_reg()
-        self._emit(f"move {reg_out}, $v0")
-        return reg_out
+        argumentos = [arg_node.accept(self) for arg_node in node.args]
+        temp = self._temp(self._tipo(node))
+        self._emit(IR.Chamada(temp, nome_func, argumentos))
+        return temp
 
     # ------------------------------------------
     # Statements
     # ------------------------------------------
 
     def visitBlock(self, node):
+        if self.quadros is None:
+            # Primeiro bloco visitado: a raiz do programa.
+            self.quadros = QuadrosPilha(node)
         statements = node.statements or []
         for stmt in statements:
             if stmt.__class__.__name__ == "FunctionDecl":
@@ -233,138 +367,186 @@ class GeradorAssembly(AbstractVisitor.AbstractVisitor):
             stmt.accept(self)
 
     def visitAssign(self, node):
-        nome = self._node_name(node.name)
-        self._ensure_variable(nome)
-        reg_val = node.exp.accept(self)
-        self._emit(f"sw {reg_val}, {nome}")
+        variavel = self.quadros.variavel(node)
+        valor = node.exp.accept(self)
+        self._emit(IR.Armazena(variavel, valor))
 
     def visitIf(self, node):
         end_label = self._get_label("IfEnd")
-        next_label = self._get_label("IfNext")
-
-        reg_cond = node.condition.accept(self)
-        self._emit(f"beq {reg_cond}, $zero, {next_label}")
-        node.then_body.accept(self)
-        self._emit(f"j {end_label}")
-        self._emit_label(next_label)
-
-        for elseif_cond, elseif_body in self._iter_elseif(node.elseif_list):
-            elseif_next = self._get_label("IfNext")
-            reg_elseif = elseif_cond.accept(self)
-            self._emit(f"beq {reg_elseif}, $zero, {elseif_next}")
-            elseif_body.accept(self)
-            self._emit(f"j {end_label}")
-            self._emit_label(elseif_next)
+        ramos = [(node.condition, node.then_body)] + list(self._iter_elseif(node.elseif_list))
+        if self.escolha:
+            ramos = self._escolher(ramos, end_label)
+
+        for condicao, corpo in ramos:
+            then_label = self._get_label("IfThen")
+            next_label = self._get_label("IfNext")
+            self._desviar(condicao, then_label, next_label)
+            self._iniciar_bloco(then_label)
+            corpo.accept(self)
+            self._terminar(IR.Salto(end_label))
+            self._iniciar_bloco(next_label)
 
         if node.else_body:
             node.else_body.accept(self)
 
-        self._emit_label(end_label)
+        self._iniciar_bloco(end_label)
+
+    def _escolher(self, ramos, end_label):
+        """
+        Emite o prefixo de `ramos` que compara uma mesma variavel com
+        constantes distintas como um IR.Escolha; devolve os ramos restantes.
+        """
+        casos = []
+        variavel = None
+        for condicao, corpo in ramos:
+            comparacao = _comparacao_constante(condicao)
+            if comparacao is None:
+                break
+            node, valor = comparacao
+            if variavel is None:
+                variavel = self.quadros.variavel(node)
+                primeiro = node
+            elif self.quadros.variavel(node) != variavel:
+                break
+            if any(valor == anterior for anterior, _ in casos):
+                break
+            casos.append((valor, corpo))
+        if len(casos) < MINIMO_CASOS:
+            return ramos
+
+        self.escolhas += 1
+        valor = self.visitVar(primeiro)
+        rotulos = [self._get_label("IfThen") for _ in casos]
+        padrao = self._get_label("IfNext")
+        self._terminar(IR.Escolha(valor, [(k, r) for (k, _), r in zip(casos, rotulos)], padrao))
+        for (_, corpo), rotulo in zip(casos, rotulos):
+            self._iniciar_bloco(rotulo)
+            corpo.accept(self)
+            self._terminar(IR.Salto(end_label))
+        self._iniciar_bloco(padrao)
+        return ramos[len(casos):]
 
     def visitFor(self, node):
-        nome_var = self._node_name(node.var)
-        self._ensure_variable(nome_var)
+        variavel = self.quadros.variavel(node)
 
         loop_start = self._get_label("ForStart")
+        loop_body = self._get_label("ForBody")
         loop_end = self._get_label("ForEnd")
 
-        reg_start = node.start.accept(self)
-        self._emit(f"sw {reg_start}, {nome_var}")
-        self._emit_label(loop_start)
-
-        reg_var = self._get_reg()
-        self._emit(f"lw {reg_var}, {nome_var}")
-        reg_end = node.end.accept(self)
-        self._emit(f"bgt {reg_var}, {reg_end}, {loop_end}")
+        # Como no Lua, inicio, limite e passo sao avaliados uma vez so. O
+        # contador e um temporario (Phi no cabecalho) e a variavel do laco
+        # recebe uma copia dele a cada volta: o limite e o passo ficam em
+        # registradores e atribuir a variavel no corpo nao muda as voltas.
+        inicio = node.start.accept(self)
+        fim = node.end.accept(self)
+        passo = node.step.accept(self) if node.step else self.visitNumber(a.Number(1))
+        sinal = _inteiro_constante(node.step) if node.step else 1
+        if sinal is None:
+            sobe = self._temp(IR.BOOL)
+            self._emit(IR.Binaria(sobe, "gt", passo, self._const(0, IR.INT)))
+        entrada = self.bloco.rotulo
+
+        self._cabecalhos.add(loop_start)
+        self._iniciar_bloco(loop_start)
+        contador = self._temp(IR.INT)
+        phi = IR.Phi(contador, {entrada: inicio})
+        self._emit(phi)
+        if sinal is None:
+            # Passo so conhecido na execucao: o teste depende do sinal.
+            sobe_label = self._get_label("ForUp")
+            desce_label = self._get_label("ForDown")
+            self._terminar(IR.Desvio(sobe, sobe_label, desce_label))
+            self._iniciar_bloco(sobe_label)
+            self._testar_limite("gt", contador, fim, loop_end, loop_body)
+            self._iniciar_bloco(desce_label)
+            self._testar_limite("lt", contador, fim, loop_end, loop_body)
+        else:
+            self._testar_limite("lt" if sinal < 0 else "gt", contador, fim, loop_end, loop_body)
 
+        self._iniciar_bloco(loop_body)
+        self._emit(IR.Armazena(variavel, contador))
         node.body.accept(self)
-
-        reg_step = node.step.accept(self) if node.step else self.visitNumber(a.Number(1))
-        self._emit(f"lw {reg_var}, {nome_var}")
-        self._emit(f"add {reg_var}, {reg_var}, {reg_step}")
-        self._emit(f"sw {reg_var}, {nome_var}")
-        self._emit(f"j {loop_start}")
-        self._emit_label(loop_end)
+        if self.bloco is not None:
+            proximo = self._temp(IR.INT)
+            self._emit(IR.Binaria(proximo, "add", contador, passo))
+            phi.argumentos[self.bloco.rotulo] = proximo
+            self._terminar(IR.Salto(loop_start))
+        self._iniciar_bloco(loop_end)
+
+    def _testar_limite(self, op, contador, fim, saida, corpo):
+        passou = self._temp(IR.BOOL)
+        self._emit(IR.Binaria(passou, op, contador, fim))
+        self._terminar(IR.Desvio(passou, saida, corpo))
 
     def visitWhile(self, node):
         loop_start = self._get_label("WhileStart")
+        loop_body = self._get_label("WhileBody")
         loop_end = self._get_label("WhileEnd")
 
-        self._emit_label(loop_start)
-        reg_cond = node.condition.accept(self)
-        self._emit(f"beq {reg_cond}, $zero, {loop_end}")
+        self._cabecalhos.add(loop_start)
+        self._iniciar_bloco(loop_start)
+        self._desviar(node.condition, loop_body, loop_end)
+        self._iniciar_bloco(loop_body)
         node.body.accept(self)
-        self._emit(f"j {loop_start}")
-        self._emit_label(loop_end)
+        self._terminar(IR.Salto(loop_start))
+        self._iniciar_bloco(loop_end)
 
     def visitFunctionDecl(self, node):
-        assinatura = self._register_function_signature(node)
+        self._register_function_signature(node)
         nome = self._node_name(node.name)
         if nome in self.generated_functions:
             return
 
         self.generated_functions.add(nome)
-        old_section = self._active_section
+        old_funcao, old_bloco = self.funcao, self.bloco
         old_function = self.current_function
-        old_end_label = self.current_function_end_label
 
-        self._active_section = self.function_section
+        self.funcao = self.modulo.adicionar(
+            IR.Funcao(nome, self.quadros.parametros(node), self.quadros.slots.get(nome, 0))
+        )
+        self.bloco = self.funcao.novo_bloco(f"func_{nome}_inicio")
         self.current_function = nome
-        self.current_function_end_label = self._get_label(f"{assinatura['label']}_end")
-
-        self._emit_label(assinatura["label"])
-        self._emit("addiu $sp, $sp, -4")
-        self._emit("sw $ra, 0($sp)")
-
-        for idx, param_name in enumerate(assinatura["params"]):
-            self._ensure_variable(param_name)
-            if idx < 4:
-                self._emit(f"sw $a{idx}, {param_name}")
-            else:
-                self._emit("# [AVISO] Mais de 4 parametros nao suportados")
 
         node.body.accept(self)
-        self._emit("li $v0, 0")
-        self._emit(f"j {self.current_function_end_label}")
-
-        self._emit_label(self.current_function_end_label)
-        self._emit("lw $ra, 0($sp)")
-        self._emit("addiu $sp, $sp, 4")
-        self._emit("jr $ra")
+        self._terminar(IR.Retorno())
 
-        self._active_section = old_section
+        self.funcao, self.bloco = old_funcao, old_bloco
         self.current_function = old_function
-        self.current_function_end_label = old_end_label
 
     def visitReturn(self, node):
-        if self.current_function_end_label is None:
-            self._emit("# [AVISO] return fora de funcao foi ignorado")
+        if self.current_function is None:
+            self._emit(IR.Nota("[AVISO] return fora de funcao foi ignorado"))
             return
 
-        if node.exp is not None:
-            reg_val = node.exp.accept(self)
-            self._emit(f"move $v0, {reg_val}")
-        else:
-            self._emit("li $v0, 0")
-        self._emit(f"j {self.current_function_end_label}")
+        valor = node.exp.accept(self) if node.exp is not None else None
+        self._terminar(IR.Retorno(valor))
 
     # ------------------------------------------
     # Saida
     # ------------------------------------------
 
-    def exportar(self, filename="programa.asm"):
-        text_header = ".text\n.globl main\nmain:\n"
-        main_tail = "    li $v0, 10\n    syscall\n"
-
-        codigo = (
-            "".join(self.data_section)
-            + "\n"
-            + text_header
-            + "".join(self.main_section)
-            + main_tail
-            + "".join(self.function_section)
-        )
+    def finalizar(self):
+        """Fecha o main (fim do programa) e devolve o modulo de IR."""
+        principal = self.modulo.principal
+        for bloco in principal.blocos:
+            if bloco.terminador is None:
+                bloco.terminador = IR.Retorno()
+        if self.funcao is principal:
+            self.bloco = None
+        return self.modulo
+
+    def gerar_codigo(self):
+        if self._codigo is None:
+            modulo = self.finalizar()
+            for funcao in modulo.funcoes.values():
+                SSA.sair_da_ssa(funcao)
+            emissor = EmissorMIPS(modulo)
+            self._codigo = emissor.emitir()
+            self.spills = emissor.spills
+        return self._codigo
 
+    def exportar(self, filename="programa.asm"):
+        codigo = self.gerar_codigo()
         with open(filename, "w", encoding="utf-8") as file:
             file.write(codigo)
         print(f"Assembly gerado com sucesso: {filename}")
@@ -398,7 +580,7 @@ if __name__ == "__main__":
 
     if arvore:
         print("\n[OK] Parsing bem-sucedido! Gerando Assembly...")
-        gerador = GeradorAssembly()
+        gerador = GeradorAssembly(tipos=InferenciaTipos(arvore))
         arvore.accept(gerador)
         pasta_atual = os.path.dirname(os.path.abspath(__file__))
         caminho_completo = os.path.join(pasta_atual, "meu_codigo.asm")
@@ -0,0 +1,437 @@
+import argparse
+import os
+import sys
+
+try:
+    from . import AbstractVisitor
+    from . import SymbolTable as st
+    from .AuxiliarAST import nome_no, ramos_elseif
+except ImportError:
+    import AbstractVisitor
+    import SymbolTable as st
+    from AuxiliarAST import nome_no, ramos_elseif
+
+
+# ==============================================
+#   GRAFO DE CHAMADAS E ANALISE DE PUREZA
+# ==============================================
+#
+# Vertices: funcoes declaradas (por nome, como no GeradorAssembly) e o
+# nivel superior do programa. Arestas: chamadas e referencias a funcoes
+# como valor (`local f = g` conta, porque g pode ser chamada depois).
+#
+# Classificacao de efeitos de cada funcao (contando as que ela chama):
+#   PURA      - resultado depende so dos argumentos: nao le nem escreve
+#               globais, nao imprime e so chama funcoes puras;
+#   LEITURA   - le globais, mas nao altera nada;
+#   EFEITOS   - imprime, escreve globais ou chama algo desconhecido.
+# Folha: nao chama nenhuma funcao do programa (print vira syscall, nao jal).
+# As componentes fortemente conexas (Tarjan) mostram a recursao e dao a
+# ordem em que os efeitos sao propagados: chamadas antes de chamadores.
+
+PURA = "pura"
+LEITURA = "leitura"
+EFEITOS = "efeitos"
+_NIVEIS = (PURA, LEITURA, EFEITOS)
+
+# Pre-definidas sem efeitos colaterais.
+BUILTINS_PUROS = frozenset(["type", "tostring", "tonumber", "select", "rawget"])
+
+PROGRAMA = "<programa>"
+
+
+class InfoFuncao:
+    def __init__(self, nome):
+        self.nome = nome
+        self.declaracoes = []  # FunctionDecl (pode haver redeclaracao)
+        self.chamadas = set()  # funcoes do programa chamadas
+        self.referencias = set()  # funcoes do programa usadas como valor
+        self.builtins = set()  # pre-definidas chamadas (print incluido)
+        self.desconhecidas = set()  # chamadas a nomes que nao sao funcoes
+        self.le_globais = set()
+        self.escreve_globais = set()
+        self.efeito_local = PURA
+        self.efeito = PURA
+        self.componente = None  # indice em GrafoChamadas.componentes
+
+    @property
+    def folha(self):
+        return not self.chamadas
+
+    @property
+    def pura(self):
+        return self.efeito == PURA
+
+    def __repr__(self):
+        return f"InfoFuncao({self.nome}, {self.efeito}, chama={sorted(self.chamadas)})"
+
+
+class _ColetorChamadas(AbstractVisitor.AbstractVisitor):
+    """Percorre o programa preenchendo um InfoFuncao por funcao."""
+
+    def __init__(self, grafo):
+        super().__init__()
+        self.grafo = grafo
+        self.atual = grafo.programa
+        self.escopos = [set()]
+
+    def _eh_local(self, nome):
+        for escopo in reversed(self.escopos):
+            if nome in escopo:
+                return True
+        return False
+
+    def _em_escopo(self, bloco, nomes=()):
+        self.escopos.append(set(nomes))
+        bloco.accept(self)
+        self.escopos.pop()
+
+    def visitNumber(self, node):
+        pass
+
+    def visitString(self, node):
+        pass
+
+    def visitBoolean(self, node):
+        pass
+
+    def visitNil(self, node):
+        pass
+
+    def visitVar(self, node):
+        nome = nome_no(node.name)
+        if self._eh_local(nome):
+            return
+        if nome in self.grafo.declaradas:
+            self.atual.referencias.add(nome)
+        else:
+            self.atual.le_globais.add(nome)
+
+    def visitUnOp(self, node):
+        node.operand.accept(self)
+
+    def visitBinOp(self, node):
+        node.left.accept(self)
+        node.right.accept(self)
+
+    def visitFunctionCall(self, node):
+        nome = nome_no(node.name)
+        if self._eh_local(nome):
+            self.atual.desconhecidas.add(nome)
+        elif nome in self.grafo.declaradas:
+            self.atual.chamadas.add(nome)
+        elif nome == "print" or nome in self.grafo.builtins:
+            self.atual.builtins.add(nome)
+        else:
+            self.atual.desconhecidas.add(nome)
+        for arg in node.args:
+            arg.accept(self)
+
+    def visitAssign(self, node):
+        node.exp.accept(self)
+        nome = nome_no(node.name)
+        if getattr(node, "is_local", False):
+            self.escopos[-1].add(nome)
+        elif not self._eh_local(nome):
+            self.atual.escreve_globais.add(nome)
+
+    def visitFunctionDecl(self, node):
+        nome = nome_no(node.name)
+        if self.atual is not self.grafo.programa and not self._eh_local(nome):
+            # Declarar funcao dentro de funcao atribui uma global.
+            self.atual.escreve_globais.add(nome)
+
+        info = self.grafo.funcoes[nome]
+        info.declaracoes.append(node)
+        anterior, escopos = self.atual, self.escopos
+        self.atual = info
+        self.escopos = [set(nome_no(p) for p in node.params)]
+        node.body.accept(self)
+        self.atual, self.escopos = anterior, escopos
+
+    def visitFor(self, node):
+        node.start.accept(self)
+        node.end.accept(self)
+        if node.step is not None:
+            node.step.accept(self)
+        self._em_escopo(node.body, [nome_no(node.var)])
+
+    def visitWhile(self, node):
+        node.condition.accept(self)
+        self._em_escopo(node.body)
+
+    def visitReturn(self, node):
+        if node.exp is not None:
+            node.exp.accept(self)
+
+    def visitIf(self, node):
+        node.condition.accept(self)
+        self._em_escopo(node.then_body)
+        for condicao, corpo in ramos_elseif(node.elseif_list):
+            condicao.accept(self)
+            self._em_escopo(corpo)
+        if node.else_body:
+            self._em_escopo(node.else_body)
+
+    def visitBlock(self, node):
+        for stmt in node.statements or []:
+            stmt.accept(self)
+
+
+class GrafoChamadas:
+    """
+    Uso:
+        grafo = GrafoChamadas(arvore)
+        grafo.funcoes["f"].pura / .folha / .efeito
+        grafo.recursiva("f"), grafo.chamadores("f"), grafo.alcancaveis()
+    """
+
+    def __init__(self, arvore, builtins=None):
+        self.builtins = st.DEFAULT_BUILTINS if builtins is None else builtins
+        self.declaradas = set(_nomes_declarados(arvore))
+        self.funcoes = {nome: InfoFuncao(nome) for nome in self.declaradas}
+        self.programa = InfoFuncao(PROGRAMA)
+        arvore.accept(_ColetorChamadas(self))
+
+        self.componentes = self._tarjan()
+        self._propagar_efeitos()
+
+    # ------------------------------------------
+    # Consultas
+    # ------------------------------------------
+
+    def sucessores(self, nome):
+        """Funcoes chamadas ou referenciadas por `nome` (ou PROGRAMA)."""
+        info = self.programa if nome == PROGRAMA else self.funcoes[nome]
+        return info.chamadas | info.referencias
+
+    def chamadores(self, nome):
+        chamadores = {
+            outro for outro, info in self.funcoes.items() if nome in info.chamadas
+        }
+        if nome in self.programa.chamadas:
+            chamadores.add(PROGRAMA)
+        return chamadores
+
+    def alcancaveis(self):
+        """Funcoes alcancaveis a partir do nivel superior do programa."""
+        vistos = set()
+        pendentes = list(self.sucessores(PROGRAMA))
+        while pendentes:
+            nome = pendentes.pop()
+            if nome in vistos:
+                continue
+            vistos.add(nome)
+            pendentes.extend(self.sucessores(nome))
+        return vistos
+
+    def recursiva(self, nome):
+        info = self.funcoes[nome]
+        return len(self.componentes[info.componente]) > 1 or nome in info.chamadas
+
+    def folhas(self):
+        return sorted(nome for nome, info in self.funcoes.items() if info.folha)
+
+    def puras(self):
+        return sorted(nome for nome, info in self.funcoes.items() if info.pura)
+
+    # ------------------------------------------
+    # Algoritmos
+    # ------------------------------------------
+
+    def _tarjan(self):
+        """Componentes fortemente conexas (iterativo), chamadas antes de chamadores."""
+        indice = {}
+        menor = {}
+        na_pilha = set()
+        pilha = []
+        componentes = []
+        contador = 0
+
+        for raiz in sorted(self.funcoes):
+            if raiz in indice:
+                continue
+            trabalho = [(raiz, iter(sorted(self.sucessores(raiz))))]
+            indice[raiz] = menor[raiz] = contador
+            contador += 1
+            pilha.append(raiz)
+            na_pilha.add(raiz)
+
+            while trabalho:
+                nome, filhos = trabalho[-1]
+                avancou = False
+                for filho in filhos:
+                    if filho not in indice:
+                        indice[filho] = menor[filho] = contador
+                        contador += 1
+                        pilha.append(filho)
+                        na_pilha.add(filho)
+                        trabalho.append((filho, iter(sorted(self.sucessores(filho)))))
+                        avancou = True
+                        break
+                    if filho in na_pilha:
+                        menor[nome] = min(menor[nome], indice[filho])
+                if avancou:
+                    continue
+
+                trabalho.pop()
+                if trabalho:
+                    pai = trabalho[-1][0]
+                    menor[pai] = min(menor[pai], menor[nome])
+                if menor[nome] == indice[nome]:
+                    componente = []
+                    while True:
+                        membro = pilha.pop()
+                        na_pilha.discard(membro)
+                        componente.append(membro)
+                        if membro == nome:
+                            break
+                    for membro in componente:
+                        self.funcoes[membro].componente = len(componentes)
+                    componentes.append(sorted(componente))
+        return componentes
+
+    def _propagar_efeitos(self):
+        for info in list(self.funcoes.values()) + [self.programa]:
+            info.efeito_local = _efeito_local(info)
+
+        # Tarjan entrega as componentes com as chamadas primeiro.
+        for componente in self.componentes:
+            nivel = 0
+            for nome in componente:
+                info = self.funcoes[nome]
+                nivel = max(nivel, _NIVEIS.index(info.efeito_local))
+                for chamada in info.chamadas:
+                    if chamada not in componente:
+                        nivel = max(nivel, _NIVEIS.index(self.funcoes[chamada].efeito))
+            for nome in componente:
+                self.funcoes[nome].efeito = _NIVEIS[nivel]
+
+        nivel = _NIVEIS.index(self.programa.efeito_local)
+        for chamada in self.programa.chamadas:
+            nivel = max(nivel, _NIVEIS.index(self.funcoes[chamada].efeito))
+        self.programa.efeito = _NIVEIS[nivel]
+
+    # ------------------------------------------
+    # Relatorio
+    # ------------------------------------------
+
+    def relatorio(self):
+        print("\n" + "=" * 70)
+        print("           GRAFO DE CHAMADAS")
+        print("=" * 70)
+        alcancaveis = self.alcancaveis()
+        for nome in sorted(self.funcoes):
+            info = self.funcoes[nome]
+            marcas = [info.efeito]
+            if info.folha:
+                marcas.append("folha")
+            if self.recursiva(nome):
+                marcas.append("recursiva")
+            if nome not in alcancaveis:
+                marcas.append("inalcancavel")
+            chama = ", ".join(sorted(info.chamadas | info.builtins)) or "-"
+            print(f"  {nome:20} [{', '.join(marcas)}]")
+            print(f"      chama: {chama}")
+            if info.escreve_globais:
+                print(f"      escreve: {', '.join(sorted(info.escreve_globais))}")
+            if info.le_globais:
+                print(f"      le: {', '.join(sorted(info.le_globais))}")
+        chama = ", ".join(sorted(self.programa.chamadas)) or "-"
+        print(f"\n  {PROGRAMA} chama: {chama}")
+        ciclos = [c for c in self.componentes if len(c) > 1]
+        for ciclo in ciclos:
+            print(f"  recursao mutua: {' <-> '.join(ciclo)}")
+        print("=" * 70 + "\n")
+
+
+def _efeito_local(info):
+    if (
+        info.escreve_globais
+        or info.desconhecidas
+        or any(nome not in BUILTINS_PUROS for nome in info.builtins)
+    ):
+        return EFEITOS
+    if info.le_globais:
+        return LEITURA
+    return PURA
+
+
+def _nomes_declarados(no):
+    classe = no.__class__.__name__
+    if classe == "FunctionDecl":
+        yield nome_no(no.name)
+        yield from _nomes_declarados(no.body)
+    elif classe == "Block":
+        for stmt in no.statements or []:
+            yield from _nomes_declarados(stmt)
+    elif classe in ("For", "While"):
+        yield from _nomes_declarados(no.body)
+    elif classe == "If":
+        yield from _nomes_declarados(no.then_body)
+        for _, corpo in ramos_elseif(no.elseif_list):
+            yield from _nomes_declarados(corpo)
+        if no.else_body:
+            yield from _nomes_declarados(no.else_body)
+
+
+# ==============================================
+#              LINHA DE COMANDO
+# ==============================================
+
+_EXEMPLO = """
+local contador = 0
+function quadrado(n)
+    return n * n
+end
+function soma_quadrados(a, b)
+    return quadrado(a) + quadrado(b)
+end
+function par(n)
+    if n == 0 then
+        return true
+    end
+    return impar(n - 1)
+end
+function impar(n)
+    if n == 0 then
+        return false
+    end
+    return par(n - 1)
+end
+function conta()
+    contador = contador + 1
+    print(contador)
+end
+function escalado(n)
+    return n * contador
+end
+print(soma_quadrados(3, 4))
+print(par(10))
+conta()
+"""
+
+
+def main(argv=None):
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    try:
+        from .VisitorSemantico import _criar_parser
+    except ImportError:
+        from VisitorSemantico import _criar_parser
+
+    argumentos = argparse.ArgumentParser(description="Mostra o grafo de chamadas de um programa")
+    argumentos.add_argument("arquivo", nargs="?", help="arquivo .lua (padrao: exemplo embutido)")
+    opcoes = argumentos.parse_args(argv)
+
+    codigo = _EXEMPLO
+    if opcoes.arquivo:
+        with open(opcoes.arquivo, encoding="utf-8") as arquivo:
+            codigo = arquivo.read()
+    GrafoChamadas(_criar_parser().parse(codigo)).relatorio()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
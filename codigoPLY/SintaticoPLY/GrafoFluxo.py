@@ -0,0 +1,542 @@
+import time
+
+try:
+    from .InstrucoesMIPS import DESVIOS_CONDICIONAIS, SALTOS, Instrucao, Rotulo
+except ImportError:
+    from InstrucoesMIPS import DESVIOS_CONDICIONAIS, SALTOS, Instrucao, Rotulo
+
+
+# ==============================================
+#   GRAFO DE FLUXO DE CONTROLE (CODIGO MIPS)
+# ==============================================
+#
+# Blocos basicos sobre a lista de Instrucao/Rotulo/Comentario de uma
+# funcao (a que o EmissorMIPS monta, com registradores virtuais ou ja
+# fisicos). Um bloco comeca em um rotulo ou logo depois de um desvio ou
+# salto e termina antes do proximo comeco. Arestas:
+#   - desvio condicional: o alvo e o bloco seguinte;
+#   - `j`: so o alvo; `jr` de tabela de saltos: os rotulos da tabela
+#     (Instrucao.alvos); `jr $ra`: nenhuma;
+#   - o resto segue para o bloco seguinte.
+# Desvios para rotulos fora da lista (o epilogo, outra funcao) nao geram
+# aresta.
+#
+# Analises, calculadas sob demanda e guardadas:
+#   dominadores - dominador imediato (Cooper, Harvey e Kennedy), como a
+#                 SSA faz na IR;
+#   lacos       - lacos naturais (arestas de volta b -> h com h dominando
+#                 b, juntando as do mesmo cabecalho), aninhados pelo
+#                 tamanho, com a profundidade de cada bloco;
+#   vivacidade  - registradores vivos na entrada/saida de cada bloco
+#                 (e depois de cada item). Os conjuntos sao vetores de bits
+#                 (int do Python, um bit por registrador): uniao e
+#                 diferenca viram | e & ~, sem laco em Python por
+#                 registrador. A iteracao usa uma lista de trabalho em
+#                 pos-ordem, entao cada bloco so e refeito quando a
+#                 entrada de um sucessor muda.
+#
+# para_dot() desenha o grafo (Graphviz) com as instrucoes de cada bloco;
+# arestas de volta saem tracejadas.
+
+
+class BlocoBasico:
+    """Itens[inicio:fim] da lista; sucessores/predecessores sao numeros de bloco."""
+
+    __slots__ = ("numero", "inicio", "fim", "rotulo", "sucessores", "predecessores")
+
+    def __init__(self, numero, inicio, fim, rotulo):
+        self.numero = numero
+        self.inicio = inicio
+        self.fim = fim
+        self.rotulo = rotulo  # nome do Rotulo que abre o bloco, ou None
+        self.sucessores = []
+        self.predecessores = []
+
+    def __repr__(self):
+        nome = self.rotulo or f"b{self.numero}"
+        return f"{nome}[{self.inicio}, {self.fim}) -> {self.sucessores}"
+
+
+class Laco:
+    __slots__ = ("cabecalho", "blocos", "pai", "profundidade")
+
+    def __init__(self, cabecalho, blocos):
+        self.cabecalho = cabecalho  # numero do bloco
+        self.blocos = blocos  # numeros dos blocos, cabecalho incluido
+        self.pai = None  # laco que contem este, ou None
+        self.profundidade = 1
+
+    def __repr__(self):
+        return f"Laco(cabecalho={self.cabecalho}, blocos={sorted(self.blocos)}, profundidade={self.profundidade})"
+
+
+class GrafoFluxo:
+    """
+    Uso:
+        grafo = GrafoFluxo(itens)
+        grafo.blocos[n].sucessores / .predecessores
+        grafo.dominadores(), grafo.domina(a, b)
+        grafo.lacos(), grafo.profundidade(n)
+        vivacidade = grafo.vivacidade(lidos, escritos)
+        vivacidade.saida(n), vivacidade.depois()
+    """
+
+    def __init__(self, itens):
+        self.itens = itens
+        self.blocos = []
+        self.por_rotulo = {}  # nome do rotulo -> numero do bloco
+        self._dominadores = None
+        self._numeracao = None  # (pre, pos) na arvore de dominadores
+        self._lacos = None
+        self._profundidades = None
+        self._montar()
+
+    def _montar(self):
+        itens = self.itens
+        inicios = {0}
+        for indice, item in enumerate(itens):
+            if isinstance(item, Rotulo):
+                inicios.add(indice)
+            elif isinstance(item, Instrucao) and (item.op in DESVIOS_CONDICIONAIS or item.op in SALTOS):
+                inicios.add(indice + 1)
+        inicios = sorted(i for i in inicios if i < len(itens))
+        for numero, inicio in enumerate(inicios):
+            fim = inicios[numero + 1] if numero + 1 < len(inicios) else len(itens)
+            rotulo = itens[inicio].nome if isinstance(itens[inicio], Rotulo) else None
+            self.blocos.append(BlocoBasico(numero, inicio, fim, rotulo))
+            if rotulo is not None:
+                self.por_rotulo[rotulo] = numero
+
+        for bloco in self.blocos:
+            ultimo = self.ultima_instrucao(bloco)
+            segue = True
+            if ultimo is not None:
+                if ultimo.op in SALTOS:
+                    segue = False
+                if ultimo.op == "j" or ultimo.op in DESVIOS_CONDICIONAIS:
+                    destino = self.por_rotulo.get(ultimo.alvo())
+                    if destino is not None:
+                        bloco.sucessores.append(destino)
+                elif ultimo.alvos:
+                    # jr de tabela de saltos: uma aresta por rotulo da tabela.
+                    for rotulo in dict.fromkeys(ultimo.alvos):
+                        bloco.sucessores.append(self.por_rotulo[rotulo])
+            if segue and bloco.numero + 1 < len(self.blocos):
+                bloco.sucessores.append(bloco.numero + 1)
+            bloco.sucessores = list(dict.fromkeys(bloco.sucessores))
+            for sucessor in bloco.sucessores:
+                self.blocos[sucessor].predecessores.append(bloco.numero)
+
+    def ultima_instrucao(self, bloco):
+        for indice in range(bloco.fim - 1, bloco.inicio - 1, -1):
+            if isinstance(self.itens[indice], Instrucao):
+                return self.itens[indice]
+        return None
+
+    # ------------------------------------------
+    # Ordem e dominadores
+    # ------------------------------------------
+
+    def pos_ordem(self):
+        """Numeros dos blocos alcancaveis a partir do primeiro, em pos-ordem."""
+        if not self.blocos:
+            return []
+        vistos = {0}
+        saida = []
+        pilha = [(0, iter(self.blocos[0].sucessores))]
+        while pilha:
+            numero, pendentes = pilha[-1]
+            for sucessor in pendentes:
+                if sucessor not in vistos:
+                    vistos.add(sucessor)
+                    pilha.append((sucessor, iter(self.blocos[sucessor].sucessores)))
+                    break
+            else:
+                pilha.pop()
+                saida.append(numero)
+        return saida
+
+    def dominadores(self):
+        """
+        Lista com o dominador imediato de cada bloco: None para o primeiro
+        e para os inalcancaveis.
+        """
+        if self._dominadores is not None:
+            return self._dominadores
+        ordem = self.pos_ordem()[::-1]
+        indice = {numero: i for i, numero in enumerate(ordem)}
+        idom = [None] * len(self.blocos)
+        if not ordem:
+            self._dominadores = idom
+            return idom
+        idom[0] = 0
+
+        def intersecao(a, b):
+            while a != b:
+                while indice[a] > indice[b]:
+                    a = idom[a]
+                while indice[b] > indice[a]:
+                    b = idom[b]
+            return a
+
+        mudou = True
+        while mudou:
+            mudou = False
+            for numero in ordem[1:]:
+                novo = None
+                for pred in self.blocos[numero].predecessores:
+                    if idom[pred] is not None:
+                        novo = pred if novo is None else intersecao(pred, novo)
+                if idom[numero] != novo:
+                    idom[numero] = novo
+                    mudou = True
+        idom[0] = None
+        self._dominadores = idom
+        return idom
+
+    def domina(self, a, b):
+        """O bloco `a` domina o bloco `b` (False se algum for inalcancavel)."""
+        if self._numeracao is None:
+            self._numerar_dominancia()
+        pre, pos = self._numeracao
+        if pre[a] is None or pre[b] is None:
+            return False
+        return pre[a] <= pre[b] and pos[b] <= pos[a]
+
+    def _numerar_dominancia(self):
+        """
+        Pre e pos-ordem da arvore de dominadores: `a` domina `b` quando o
+        intervalo de b esta dentro do de a (consulta em tempo constante,
+        mesmo com a arvore funda de uma funcao longa).
+        """
+        idom = self.dominadores()
+        filhos = [[] for _ in self.blocos]
+        for numero, pai in enumerate(idom):
+            if pai is not None:
+                filhos[pai].append(numero)
+        pre, pos = [None] * len(self.blocos), [None] * len(self.blocos)
+        contador = 0
+        pilha = [(0, iter(filhos[0]))] if self.blocos else []
+        if pilha:
+            pre[0] = contador
+            contador += 1
+        while pilha:
+            numero, pendentes = pilha[-1]
+            filho = next(pendentes, None)
+            if filho is None:
+                pilha.pop()
+                pos[numero] = contador
+                contador += 1
+            else:
+                pre[filho] = contador
+                contador += 1
+                pilha.append((filho, iter(filhos[filho])))
+        self._numeracao = (pre, pos)
+
+    # ------------------------------------------
+    # Lacos
+    # ------------------------------------------
+
+    def arestas_de_volta(self):
+        """(origem, cabecalho) com o cabecalho dominando a origem."""
+        return [
+            (bloco.numero, sucessor)
+            for bloco in self.blocos
+            for sucessor in bloco.sucessores
+            if self.domina(sucessor, bloco.numero)
+        ]
+
+    def lacos(self):
+        """Lacos naturais, de fora para dentro (pai antes dos filhos)."""
+        if self._lacos is not None:
+            return self._lacos
+        corpos = {}
+        for origem, cabecalho in self.arestas_de_volta():
+            corpo = corpos.setdefault(cabecalho, {cabecalho})
+            pilha = [origem]
+            while pilha:
+                atual = pilha.pop()
+                if atual not in corpo:
+                    corpo.add(atual)
+                    pilha.extend(self.blocos[atual].predecessores)
+        # Lacos naturais com cabecalhos diferentes sao disjuntos ou um
+        # contem o outro: o pai e o menor laco maior que contem o cabecalho.
+        lacos = sorted((Laco(c, b) for c, b in corpos.items()), key=lambda l: -len(l.blocos))
+        self._profundidades = [0] * len(self.blocos)
+        mais_interno = [None] * len(self.blocos)
+        for laco in lacos:
+            laco.pai = mais_interno[laco.cabecalho]
+            if laco.pai is not None:
+                laco.profundidade = laco.pai.profundidade + 1
+            for numero in laco.blocos:
+                mais_interno[numero] = laco
+                self._profundidades[numero] = laco.profundidade
+        self._lacos = lacos
+        return lacos
+
+    def profundidade(self, numero):
+        """Quantos lacos contem o bloco (0 fora de lacos)."""
+        self.lacos()
+        return self._profundidades[numero]
+
+    # ------------------------------------------
+    # Vivacidade
+    # ------------------------------------------
+
+    def vivacidade(self, lidos=None, escritos=None):
+        """
+        Vivacidade por bloco. `lidos` e `escritos` (item -> registradores)
+        escolhem o que conta; por padrao, todos os registradores que as
+        instrucoes usam e definem.
+        """
+        vivacidade = Vivacidade(self, lidos, escritos)
+        geracao, morte = [], []
+        for bloco in self.blocos:
+            usados = definidos = 0
+            for indice in range(bloco.inicio, bloco.fim):
+                item = self.itens[indice]
+                usados |= vivacidade.vetor(vivacidade.lidos(item)) & ~definidos
+                definidos |= vivacidade.vetor(vivacidade.escritos(item))
+            geracao.append(usados)
+            morte.append(definidos)
+
+        n = len(self.blocos)
+        entrada, saida = vivacidade.entradas, vivacidade.saidas
+        # Pos-ordem primeiro (sucessores antes), depois os inalcancaveis.
+        ordem = self.pos_ordem()
+        vistos = set(ordem)
+        ordem += [numero for numero in range(n - 1, -1, -1) if numero not in vistos]
+        pendentes = ordem[::-1]  # pilha: o topo e o primeiro da pos-ordem
+        na_lista = [True] * n
+        while pendentes:
+            numero = pendentes.pop()
+            na_lista[numero] = False
+            bloco = self.blocos[numero]
+            vivos = 0
+            for sucessor in bloco.sucessores:
+                vivos |= entrada[sucessor]
+            saida[numero] = vivos
+            nova = geracao[numero] | (vivos & ~morte[numero])
+            if nova != entrada[numero]:
+                entrada[numero] = nova
+                for pred in bloco.predecessores:
+                    if not na_lista[pred]:
+                        na_lista[pred] = True
+                        pendentes.append(pred)
+        return vivacidade
+
+    # ------------------------------------------
+    # Graphviz
+    # ------------------------------------------
+
+    def para_dot(self, nome="funcao"):
+        """Texto DOT: um no por bloco com as instrucoes, voltas tracejadas."""
+        voltas = set(self.arestas_de_volta())
+        cabecalhos = {laco.cabecalho for laco in self.lacos()}
+        linhas = [f"digraph {_aspas(nome)} {{", '    node [shape=box, fontname="monospace"];']
+        for bloco in self.blocos:
+            texto = "".join(
+                str(self.itens[indice]).strip() + "\\l" for indice in range(bloco.inicio, bloco.fim)
+            )
+            estilo = ", penwidth=2" if bloco.numero in cabecalhos else ""
+            linhas.append(f"    b{bloco.numero} [label={_aspas(texto, escapar_nova_linha=False)}{estilo}];")
+        for bloco in self.blocos:
+            for sucessor in bloco.sucessores:
+                estilo = " [style=dashed]" if (bloco.numero, sucessor) in voltas else ""
+                linhas.append(f"    b{bloco.numero} -> b{sucessor}{estilo};")
+        linhas.append("}")
+        return "\n".join(linhas) + "\n"
+
+
+class Vivacidade:
+    """
+    Resultado de GrafoFluxo.vivacidade. Os conjuntos sao vetores de bits,
+    um bit por registrador (`bit`): `entradas[n]`/`saidas[n]` sao os vivos
+    na entrada/saida do bloco n. entrada(n)/saida(n)/conjunto(vetor) dao
+    frozensets, decodificados uma vez por vetor distinto.
+    """
+
+    def __init__(self, grafo, lidos=None, escritos=None):
+        self.grafo = grafo
+        self.lidos = lidos or (lambda item: item.usados())
+        self.escritos = escritos or (lambda item: item.definidos())
+        self.bits = {}  # registrador -> bit
+        self.entradas = [0] * len(grafo.blocos)
+        self.saidas = [0] * len(grafo.blocos)
+        self._nomes = []
+        self._conjuntos = {}
+
+    def bit(self, registrador):
+        """Bit do registrador (0 se ele nunca aparece)."""
+        return self.bits.get(registrador, 0)
+
+    def vetor(self, registradores):
+        vetor = 0
+        for registrador in registradores:
+            bit = self.bits.get(registrador)
+            if bit is None:
+                bit = self.bits[registrador] = 1 << len(self._nomes)
+                self._nomes.append(registrador)
+            vetor |= bit
+        return vetor
+
+    def conjunto(self, vetor):
+        if vetor not in self._conjuntos:
+            self._conjuntos[vetor] = _decodificar(vetor, self._nomes)
+        return self._conjuntos[vetor]
+
+    def entrada(self, numero):
+        return self.conjunto(self.entradas[numero])
+
+    def saida(self, numero):
+        return self.conjunto(self.saidas[numero])
+
+    def depois(self):
+        """Vetor dos vivos depois de cada item da lista."""
+        itens = self.grafo.itens
+        depois = [0] * len(itens)
+        for bloco in self.grafo.blocos:
+            vivos = self.saidas[bloco.numero]
+            for indice in range(bloco.fim - 1, bloco.inicio - 1, -1):
+                depois[indice] = vivos
+                item = itens[indice]
+                vivos = (vivos & ~self.vetor(self.escritos(item))) | self.vetor(self.lidos(item))
+        return depois
+
+
+def _decodificar(vetor, nomes):
+    """frozenset com os nomes dos bits ligados em `vetor`."""
+    # Os digitos binarios do bit 0 em diante; o find pula os zeros em C.
+    digitos = bin(vetor)[:1:-1]
+    conjunto = []
+    posicao = digitos.find("1")
+    while posicao >= 0:
+        conjunto.append(nomes[posicao])
+        posicao = digitos.find("1", posicao + 1)
+    return frozenset(conjunto)
+
+
+def _aspas(texto, escapar_nova_linha=True):
+    texto = texto.replace('"', '\\"')
+    if escapar_nova_linha:
+        texto = texto.replace("\n", "\\n")
+    return f'"{texto}"'
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def _funcao_sintetica(n_instrucoes):
+    """
+    Corpo no formato do EmissorMIPS (registradores virtuais) com lacos
+    aninhados, if/else e chamadas, ate ~`n_instrucoes` instrucoes. Alguns
+    virtuais ficam vivos do inicio ao fim, como acumuladores.
+    """
+    try:
+        from .InstrucoesMIPS import analisar_instrucao
+    except ImportError:
+        from InstrucoesMIPS import analisar_instrucao
+
+    linhas = [f"li %{i}, {i}" for i in range(8)]
+    proximo = 8
+    trecho = 0
+    # 17 instrucoes e 6 rotulos por trecho.
+    while len(linhas) - 6 * trecho < n_instrucoes:
+        a, b, c, d = (f"%{proximo + i}" for i in range(4))
+        proximo += 4
+        acumulador = f"%{trecho % 8}"
+        linhas += [
+            f"Externo{trecho}:",
+            f"lw {a}, -{12 + 4 * (trecho % 16)}($fp)",
+            f"bge {a}, 100, FimExterno{trecho}",
+            f"li {b}, 0",
+            f"Interno{trecho}:",
+            f"slt {c}, {b}, {a}",
+            f"beq {c}, $zero, FimInterno{trecho}",
+            f"andi {d}, {b}, 1",
+            f"beq {d}, $zero, Senao{trecho}",
+            f"addu {acumulador}, {acumulador}, {b}",
+            f"j FimSe{trecho}",
+            f"Senao{trecho}:",
+            f"subu {acumulador}, {acumulador}, {a}",
+            f"FimSe{trecho}:",
+            f"addiu {b}, {b}, 1",
+            f"j Interno{trecho}",
+            f"FimInterno{trecho}:",
+            f"move $a0, {acumulador}",
+            "jal func_f",
+            f"addu {a}, {a}, $v0",
+            f"sw {a}, -{12 + 4 * (trecho % 16)}($fp)",
+            f"j Externo{trecho}",
+            f"FimExterno{trecho}:",
+        ]
+        trecho += 1
+    linhas += [f"addu %0, %0, %{i}" for i in range(1, 8)] + ["move $v0, %0"]
+    return [analisar_instrucao(linha) for linha in linhas]
+
+
+def main(n_instrucoes=100_000):
+    try:
+        from .InstrucoesMIPS import analisar_instrucao, eh_virtual
+        from .AlocadorRegistradores import calcular_intervalos
+    except ImportError:
+        from InstrucoesMIPS import analisar_instrucao, eh_virtual
+        from AlocadorRegistradores import calcular_intervalos
+
+    codigo = """
+    li %0, 0
+    li %1, 1
+    Laco:
+    bgt %1, 10, Fim
+    andi %2, %1, 1
+    beq %2, $zero, Par
+    addu %0, %0, %1
+    Par:
+    addiu %1, %1, 1
+    j Laco
+    Fim:
+    move $v0, %0
+    """
+    itens = [analisar_instrucao(linha) for linha in codigo.strip().splitlines()]
+    grafo = GrafoFluxo(itens)
+    vivacidade = grafo.vivacidade()
+    for bloco in grafo.blocos:
+        print(f"{bloco!r}  profundidade {grafo.profundidade(bloco.numero)}, "
+              f"vivos na entrada: {sorted(vivacidade.entrada(bloco.numero))}")
+    print()
+    print(grafo.para_dot("exemplo"))
+
+    itens = _funcao_sintetica(n_instrucoes)
+    instrucoes = sum(1 for item in itens if isinstance(item, Instrucao))
+
+    def virtuais(registradores):
+        return [r for r in registradores if eh_virtual(r)]
+
+    tempos = {}
+    inicio = time.perf_counter()
+    grafo = GrafoFluxo(itens)
+    tempos["blocos"] = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    grafo.dominadores()
+    tempos["dominadores"] = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    lacos = grafo.lacos()
+    tempos["lacos"] = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    grafo.vivacidade(
+        lambda item: virtuais(item.usados()), lambda item: virtuais(item.definidos())
+    )
+    tempos["vivacidade"] = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    calcular_intervalos(itens)
+    tempos["intervalos do alocador"] = time.perf_counter() - inicio
+
+    print(f"Funcao sintetica: {instrucoes} instrucoes, {len(grafo.blocos)} blocos, "
+          f"{len(lacos)} lacos (profundidade maxima {max(l.profundidade for l in lacos)})")
+    for nome, tempo in tempos.items():
+        print(f"  {nome}: {tempo * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,649 @@
+# ==============================================
+#   REPRESENTACAO INTERMEDIARIA (TRES ENDERECOS)
+# ==============================================
+#
+# O GeradorAssembly traduz a AST para esta IR e o EmissorMIPS traduz a IR
+# para MIPS. Otimizacoes que dependem de fluxo de controle trabalham aqui.
+#
+#   Modulo  -> Funcao (uma por funcao Lua, mais "main" para o nivel superior)
+#   Funcao  -> Bloco (o primeiro e a entrada)
+#   Bloco   -> instrucoes de tres enderecos + exatamente um terminador
+#
+# Valores intermediarios ficam em temporarios (%N) com um tipo; variaveis
+# do programa so sao acessadas por Carrega/Armazena. Na entrada de uma
+# funcao os parametros ja estao nas suas variaveis.
+#
+# Saida do GeradorAssembly: cada temporario e definido uma unica vez. O
+# modulo SSA promove variaveis para temporarios (com Phi nas juncoes) e,
+# ao sair da SSA, troca os Phi por copias: a partir dai um temporario pode
+# ter mais de uma definicao (verificar(modulo, ssa=False)).
+
+INT = "int"
+BOOL = "bool"
+STR = "str"
+NIL = "nil"
+QUALQUER = "any"
+TIPOS = (INT, BOOL, STR, NIL, QUALQUER)
+
+OPERACOES_ARITMETICAS = ("add", "sub", "mul", "div", "mod", "pow")
+OPERACOES_COMPARACAO = ("eq", "ne", "lt", "le", "gt", "ge")
+OPERACOES_LOGICAS = ("and", "or")
+OPERACOES_BINARIAS = OPERACOES_ARITMETICAS + OPERACOES_COMPARACAO + OPERACOES_LOGICAS
+OPERACOES_UNARIAS = ("neg", "not")
+
+PRINCIPAL = "main"
+
+
+class Temp:
+    __slots__ = ("numero", "tipo")
+
+    def __init__(self, numero, tipo=QUALQUER):
+        self.numero = numero
+        self.tipo = tipo
+
+    def __str__(self):
+        return f"%{self.numero}"
+
+    def __repr__(self):
+        return f"%{self.numero}:{self.tipo}"
+
+
+class Variavel:
+    """Variavel do programa: global (rotulo em .data) ou slot no quadro."""
+
+    __slots__ = ("nome", "slot")
+
+    def __init__(self, nome, slot=None):
+        self.nome = nome
+        self.slot = slot
+
+    @property
+    def global_(self):
+        return self.slot is None
+
+    def __eq__(self, outra):
+        return outra.__class__.__name__ == "Variavel" and (self.nome, self.slot) == (outra.nome, outra.slot)
+
+    def __hash__(self):
+        return hash((self.nome, self.slot))
+
+    def __str__(self):
+        return f"@{self.nome}" if self.global_ else f"{self.nome}#{self.slot}"
+
+    __repr__ = __str__
+
+
+# ------------------------------------------
+# Instrucoes
+# ------------------------------------------
+
+class Instrucao:
+    """Base: `destino` e o Temp escrito (ou None); `usados()` os lidos."""
+
+    __slots__ = ("destino",)
+    terminador = False
+
+    def usados(self):
+        return []
+
+    def substituir(self, mapa):
+        """Troca temporarios lidos segundo `mapa` (Temp -> Temp)."""
+
+
+class Const(Instrucao):
+    __slots__ = ("valor",)
+
+    def __init__(self, destino, valor):
+        self.destino = destino
+        self.valor = valor
+
+    def __str__(self):
+        return f"{self.destino!r} = const {self.valor}"
+
+
+class EnderecoString(Instrucao):
+    __slots__ = ("texto",)
+
+    def __init__(self, destino, texto):
+        self.destino = destino
+        self.texto = texto
+
+    def __str__(self):
+        return f"{self.destino!r} = str {self.texto!r}"
+
+
+class Copia(Instrucao):
+    __slots__ = ("origem",)
+
+    def __init__(self, destino, origem):
+        self.destino = destino
+        self.origem = origem
+
+    def usados(self):
+        return [self.origem]
+
+    def substituir(self, mapa):
+        self.origem = mapa.get(self.origem, self.origem)
+
+    def __str__(self):
+        return f"{self.destino!r} = {self.origem}"
+
+
+class Unaria(Instrucao):
+    __slots__ = ("op", "origem")
+
+    def __init__(self, destino, op, origem):
+        self.destino = destino
+        self.op = op
+        self.origem = origem
+
+    def usados(self):
+        return [self.origem]
+
+    def substituir(self, mapa):
+        self.origem = mapa.get(self.origem, self.origem)
+
+    def __str__(self):
+        return f"{self.destino!r} = {self.op} {self.origem}"
+
+
+class Binaria(Instrucao):
+    __slots__ = ("op", "esquerda", "direita")
+
+    def __init__(self, destino, op, esquerda, direita):
+        self.destino = destino
+        self.op = op
+        self.esquerda = esquerda
+        self.direita = direita
+
+    def usados(self):
+        return [self.esquerda, self.direita]
+
+    def substituir(self, mapa):
+        self.esquerda = mapa.get(self.esquerda, self.esquerda)
+        self.direita = mapa.get(self.direita, self.direita)
+
+    def __str__(self):
+        return f"{self.destino!r} = {self.op} {self.esquerda}, {self.direita}"
+
+
+class Carrega(Instrucao):
+    __slots__ = ("variavel",)
+
+    def __init__(self, destino, variavel):
+        self.destino = destino
+        self.variavel = variavel
+
+    def __str__(self):
+        return f"{self.destino!r} = carrega {self.variavel}"
+
+
+class Armazena(Instrucao):
+    __slots__ = ("variavel", "origem")
+
+    def __init__(self, variavel, origem):
+        self.destino = None
+        self.variavel = variavel
+        self.origem = origem
+
+    def usados(self):
+        return [self.origem]
+
+    def substituir(self, mapa):
+        self.origem = mapa.get(self.origem, self.origem)
+
+    def __str__(self):
+        return f"armazena {self.variavel}, {self.origem}"
+
+
+class Chamada(Instrucao):
+    __slots__ = ("funcao", "argumentos")
+
+    def __init__(self, destino, funcao, argumentos):
+        self.destino = destino
+        self.funcao = funcao
+        self.argumentos = list(argumentos)
+
+    def usados(self):
+        return list(self.argumentos)
+
+    def substituir(self, mapa):
+        self.argumentos = [mapa.get(arg, arg) for arg in self.argumentos]
+
+    def __str__(self):
+        args = ", ".join(str(arg) for arg in self.argumentos)
+        prefixo = f"{self.destino!r} = " if self.destino is not None else ""
+        return f"{prefixo}chama {self.funcao}({args})"
+
+
+class Phi(Instrucao):
+    """Valor que depende do predecessor: `argumentos` e rotulo -> Temp."""
+
+    __slots__ = ("argumentos",)
+
+    def __init__(self, destino, argumentos=None):
+        self.destino = destino
+        self.argumentos = dict(argumentos or {})
+
+    def usados(self):
+        return list(self.argumentos.values())
+
+    def substituir(self, mapa):
+        self.argumentos = {rotulo: mapa.get(t, t) for rotulo, t in self.argumentos.items()}
+
+    def __str__(self):
+        args = ", ".join(f"[{rotulo}: {t}]" for rotulo, t in self.argumentos.items())
+        return f"{self.destino!r} = phi {args}"
+
+
+class Parametro(Instrucao):
+    """Valor recebido no argumento `indice` ($aN); so no inicio da entrada."""
+
+    __slots__ = ("indice",)
+
+    def __init__(self, destino, indice):
+        self.destino = destino
+        self.indice = indice
+
+    def __str__(self):
+        return f"{self.destino!r} = parametro {self.indice}"
+
+
+class Imprime(Instrucao):
+    """print(valor) seguido de quebra de linha; o formato vem do tipo do Temp."""
+
+    __slots__ = ("valor",)
+
+    def __init__(self, valor):
+        self.destino = None
+        self.valor = valor
+
+    def usados(self):
+        return [self.valor]
+
+    def substituir(self, mapa):
+        self.valor = mapa.get(self.valor, self.valor)
+
+    def __str__(self):
+        return f"imprime {self.valor!r}"
+
+
+class Nota(Instrucao):
+    """Comentario levado ate o assembly (avisos do gerador)."""
+
+    __slots__ = ("texto",)
+
+    def __init__(self, texto):
+        self.destino = None
+        self.texto = texto
+
+    def __str__(self):
+        return f"; {self.texto}"
+
+
+# ------------------------------------------
+# Terminadores
+# ------------------------------------------
+
+class Salto(Instrucao):
+    __slots__ = ("alvo",)
+    terminador = True
+
+    def __init__(self, alvo):
+        self.destino = None
+        self.alvo = alvo
+
+    def sucessores(self):
+        return [self.alvo]
+
+    def redirecionar(self, mapa):
+        """Troca rotulos de destino segundo `mapa` (rotulo -> rotulo)."""
+        self.alvo = mapa.get(self.alvo, self.alvo)
+
+    def __str__(self):
+        return f"salta {self.alvo}"
+
+
+class Desvio(Instrucao):
+    __slots__ = ("condicao", "verdadeiro", "falso")
+    terminador = True
+
+    def __init__(self, condicao, verdadeiro, falso):
+        self.destino = None
+        self.condicao = condicao
+        self.verdadeiro = verdadeiro
+        self.falso = falso
+
+    def usados(self):
+        return [self.condicao]
+
+    def substituir(self, mapa):
+        self.condicao = mapa.get(self.condicao, self.condicao)
+
+    def sucessores(self):
+        return [self.verdadeiro, self.falso]
+
+    def redirecionar(self, mapa):
+        self.verdadeiro = mapa.get(self.verdadeiro, self.verdadeiro)
+        self.falso = mapa.get(self.falso, self.falso)
+
+    def __str__(self):
+        return f"desvia {self.condicao}, {self.verdadeiro}, {self.falso}"
+
+
+class Escolha(Instrucao):
+    """
+    Desvio multiplo: vai para o rotulo do caso cuja constante e igual ao
+    valor, ou para `padrao`. `casos` e uma lista de (constante, rotulo) com
+    constantes distintas.
+    """
+
+    __slots__ = ("valor", "casos", "padrao")
+    terminador = True
+
+    def __init__(self, valor, casos, padrao):
+        self.destino = None
+        self.valor = valor
+        self.casos = list(casos)
+        self.padrao = padrao
+
+    def usados(self):
+        return [self.valor]
+
+    def substituir(self, mapa):
+        self.valor = mapa.get(self.valor, self.valor)
+
+    def sucessores(self):
+        return [rotulo for _, rotulo in self.casos] + [self.padrao]
+
+    def redirecionar(self, mapa):
+        # Lista nova: copias rasas (copy.copy) nao podem dividir os casos.
+        self.casos = [(constante, mapa.get(rotulo, rotulo)) for constante, rotulo in self.casos]
+        self.padrao = mapa.get(self.padrao, self.padrao)
+
+    def __str__(self):
+        casos = ", ".join(f"{constante}: {rotulo}" for constante, rotulo in self.casos)
+        return f"escolhe {self.valor} [{casos}], senao {self.padrao}"
+
+
+class Retorno(Instrucao):
+    """Em "main", encerra o programa."""
+
+    __slots__ = ("valor",)
+    terminador = True
+
+    def __init__(self, valor=None):
+        self.destino = None
+        self.valor = valor
+
+    def usados(self):
+        return [self.valor] if self.valor is not None else []
+
+    def substituir(self, mapa):
+        if self.valor is not None:
+            self.valor = mapa.get(self.valor, self.valor)
+
+    def sucessores(self):
+        return []
+
+    def redirecionar(self, mapa):
+        pass
+
+    def __str__(self):
+        return "retorna" if self.valor is None else f"retorna {self.valor}"
+
+
+# ------------------------------------------
+# Blocos, funcoes e modulo
+# ------------------------------------------
+
+class Bloco:
+    __slots__ = ("rotulo", "instrucoes", "terminador")
+
+    def __init__(self, rotulo):
+        self.rotulo = rotulo
+        self.instrucoes = []
+        self.terminador = None
+
+    def sucessores(self):
+        return self.terminador.sucessores() if self.terminador is not None else []
+
+    def __str__(self):
+        linhas = [f"  {self.rotulo}:"]
+        linhas += [f"    {instrucao}" for instrucao in self.instrucoes]
+        linhas.append(f"    {self.terminador}" if self.terminador else "    <sem terminador>")
+        return "\n".join(linhas)
+
+
+class Funcao:
+    """
+    Args:
+        nome: nome Lua da funcao (PRINCIPAL para o nivel superior)
+        parametros: Variaveis que recebem os argumentos, na ordem
+        slots: slots de variaveis locais no quadro
+    """
+
+    def __init__(self, nome, parametros=(), slots=0):
+        self.nome = nome
+        self.parametros = list(parametros)
+        self.slots = slots
+        self.blocos = []
+        self._temps = 0
+
+    @property
+    def entrada(self):
+        return self.blocos[0]
+
+    def novo_temp(self, tipo=QUALQUER):
+        temp = Temp(self._temps, tipo)
+        self._temps += 1
+        return temp
+
+    def novo_bloco(self, rotulo):
+        bloco = Bloco(rotulo)
+        self.blocos.append(bloco)
+        return bloco
+
+    def bloco(self, rotulo):
+        for bloco in self.blocos:
+            if bloco.rotulo == rotulo:
+                return bloco
+        return None
+
+    def alcancaveis(self):
+        """Rotulos dos blocos alcancaveis a partir da entrada."""
+        if not self.blocos:
+            return set()
+        por_rotulo = {bloco.rotulo: bloco for bloco in self.blocos}
+        vistos = {self.entrada.rotulo}
+        pendentes = [self.entrada]
+        while pendentes:
+            for rotulo in pendentes.pop().sucessores():
+                if rotulo not in vistos and rotulo in por_rotulo:
+                    vistos.add(rotulo)
+                    pendentes.append(por_rotulo[rotulo])
+        return vistos
+
+    def instrucoes(self):
+        for bloco in self.blocos:
+            yield from bloco.instrucoes
+            if bloco.terminador is not None:
+                yield bloco.terminador
+
+    def __str__(self):
+        params = ", ".join(str(p) for p in self.parametros)
+        cabecalho = f"funcao {self.nome}({params})  [slots: {self.slots}]"
+        return "\n".join([cabecalho] + [str(bloco) for bloco in self.blocos])
+
+
+class Modulo:
+    def __init__(self):
+        self.funcoes = {}  # nome -> Funcao, na ordem de geracao; inclui PRINCIPAL
+
+    @property
+    def principal(self):
+        return self.funcoes[PRINCIPAL]
+
+    def adicionar(self, funcao):
+        self.funcoes[funcao.nome] = funcao
+        return funcao
+
+    def __str__(self):
+        return formatar(self)
+
+
+def formatar(modulo):
+    """Texto legivel da IR (uma funcao por paragrafo, main primeiro)."""
+    ordem = [modulo.funcoes[PRINCIPAL]] if PRINCIPAL in modulo.funcoes else []
+    ordem += [f for nome, f in modulo.funcoes.items() if nome != PRINCIPAL]
+    return "\n\n".join(str(funcao) for funcao in ordem) + "\n"
+
+
+# ==============================================
+#   VERIFICADOR
+# ==============================================
+
+def verificar(modulo, ssa=True):
+    """
+    Confere invariantes da IR e devolve a lista de problemas (vazia se ok):
+    terminadores, rotulos, definicao unica de temporarios (so com `ssa`),
+    uso apos a definicao, Phi no inicio do bloco e com um argumento por
+    predecessor, chamadas a funcoes existentes e tipos dos resultados.
+    """
+    problemas = []
+    for funcao in modulo.funcoes.values():
+        problemas += [f"{funcao.nome}: {p}" for p in _verificar_funcao(funcao, modulo, ssa)]
+    return problemas
+
+
+def _verificar_funcao(funcao, modulo, ssa):
+    problemas = []
+    if not funcao.blocos:
+        return ["funcao sem blocos"]
+
+    rotulos = set()
+    for bloco in funcao.blocos:
+        if bloco.rotulo in rotulos:
+            problemas.append(f"rotulo repetido: {bloco.rotulo}")
+        rotulos.add(bloco.rotulo)
+
+    predecessores = {rotulo: set() for rotulo in rotulos}
+    definicoes = {}  # numero do temp -> (bloco, posicao) da primeira definicao
+    for bloco in funcao.blocos:
+        if bloco.terminador is None:
+            problemas.append(f"{bloco.rotulo}: bloco sem terminador")
+        elif not bloco.terminador.terminador:
+            problemas.append(f"{bloco.rotulo}: terminador invalido: {bloco.terminador}")
+        for posicao, instrucao in enumerate(bloco.instrucoes):
+            if instrucao.terminador:
+                problemas.append(f"{bloco.rotulo}: terminador no meio do bloco: {instrucao}")
+            if instrucao.destino is not None:
+                numero = instrucao.destino.numero
+                if numero in definicoes:
+                    if ssa:
+                        problemas.append(f"{bloco.rotulo}: {instrucao.destino} definido mais de uma vez")
+                    continue
+                definicoes[numero] = (bloco.rotulo, posicao)
+        for alvo in bloco.sucessores():
+            if alvo not in rotulos:
+                problemas.append(f"{bloco.rotulo}: desvio para rotulo inexistente {alvo}")
+            else:
+                predecessores[alvo].add(bloco.rotulo)
+
+    alcancaveis = funcao.alcancaveis()
+    for bloco in funcao.blocos:
+        instrucoes = bloco.instrucoes + ([bloco.terminador] if bloco.terminador else [])
+        depois_dos_phi = False
+        for posicao, instrucao in enumerate(instrucoes):
+            classe = instrucao.__class__.__name__
+            if classe == "Phi":
+                if depois_dos_phi:
+                    problemas.append(f"{bloco.rotulo}: phi depois de outra instrucao: {instrucao}")
+                if bloco.rotulo in alcancaveis and set(instrucao.argumentos) != predecessores[bloco.rotulo]:
+                    problemas.append(f"{bloco.rotulo}: phi sem um argumento por predecessor: {instrucao}")
+            else:
+                depois_dos_phi = True
+            for temp in instrucao.usados():
+                if temp.__class__.__name__ != "Temp":
+                    problemas.append(f"{bloco.rotulo}: operando nao e temporario em '{instrucao}'")
+                    continue
+                origem = definicoes.get(temp.numero)
+                if origem is None:
+                    problemas.append(f"{bloco.rotulo}: {temp} usado sem definicao")
+                elif classe != "Phi" and ssa and origem[0] == bloco.rotulo and origem[1] >= posicao:
+                    problemas.append(f"{bloco.rotulo}: {temp} usado antes da definicao")
+            problemas += [f"{bloco.rotulo}: {p}" for p in _verificar_tipos(instrucao)]
+            if classe == "Chamada" and instrucao.funcao not in modulo.funcoes:
+                problemas.append(f"{bloco.rotulo}: chamada a funcao inexistente {instrucao.funcao}")
+    return problemas
+
+
+def _verificar_tipos(instrucao):
+    destino = instrucao.destino
+    if destino is not None and destino.tipo not in TIPOS:
+        return [f"tipo desconhecido em {destino!r}"]
+    classe = instrucao.__class__.__name__
+    esperado = None
+    if classe == "Binaria":
+        if instrucao.op not in OPERACOES_BINARIAS:
+            return [f"operacao binaria desconhecida: {instrucao.op}"]
+        if instrucao.op in OPERACOES_COMPARACAO:
+            esperado = BOOL
+        elif instrucao.op in OPERACOES_ARITMETICAS:
+            esperado = INT
+    elif classe == "Unaria":
+        if instrucao.op not in OPERACOES_UNARIAS:
+            return [f"operacao unaria desconhecida: {instrucao.op}"]
+        esperado = BOOL if instrucao.op == "not" else INT
+    elif classe == "EnderecoString":
+        esperado = STR
+    elif classe == "Copia" and QUALQUER not in (instrucao.origem.tipo, destino.tipo):
+        # Copias vindas da SSA podem refinar (ou esquecer) o tipo da origem.
+        esperado = instrucao.origem.tipo
+    if esperado is not None and destino.tipo != esperado:
+        return [f"{destino!r} deveria ser {esperado} em '{instrucao}'"]
+    return []
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main():
+    import os
+    import sys
+
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    try:
+        from .VisitorSemantico import _criar_parser
+        from .InferenciaTipos import InferenciaTipos
+        from .GeradorAssembly import GeradorAssembly
+    except ImportError:
+        from VisitorSemantico import _criar_parser
+        from InferenciaTipos import InferenciaTipos
+        from GeradorAssembly import GeradorAssembly
+
+    codigo = """
+    function fatorial(n)
+        if n <= 1 then
+            return 1
+        end
+        return n * fatorial(n - 1)
+    end
+    for i = 1, 5 do
+        print(fatorial(i))
+    end
+    """
+    arvore = _criar_parser().parse(codigo)
+    gerador = GeradorAssembly(tipos=InferenciaTipos(arvore))
+    arvore.accept(gerador)
+    modulo = gerador.finalizar()
+    print(formatar(modulo))
+    problemas = verificar(modulo)
+    print("IR valida" if not problemas else "\n".join(problemas))
+
+
+if __name__ == "__main__":
+    main()
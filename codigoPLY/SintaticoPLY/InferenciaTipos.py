@@ -0,0 +1,543 @@
+import os
+import sys
+from collections import deque
+
+try:
+    from . import AbstractVisitor
+    from . import SymbolTable as st
+    from .AuxiliarAST import nome_no, ramos_elseif
+except ImportError:
+    import AbstractVisitor
+    import SymbolTable as st
+    from AuxiliarAST import nome_no, ramos_elseif
+
+
+# ==============================================
+#   INFERENCIA DE TIPOS (SENSIVEL AO FLUXO)
+# ==============================================
+#
+# Reticulado: conjuntos de tipos basicos (frozenset). VAZIO e o "ainda nao
+# sei" (nenhum valor chegou) e QUALQUER e o "pode ser qualquer coisa".
+# A juncao e a uniao, entao a analise sempre termina.
+#
+# Unidades: o programa (nivel superior) e cada FunctionDecl. Dentro de uma
+# unidade o ambiente (nome -> tipos) segue o fluxo: cada ramo de if/elseif
+# parte de uma copia e os resultados sao unidos; lacos repetem o corpo ate
+# o ambiente de entrada estabilizar.
+# Entre unidades, resumos insensiveis ao fluxo:
+#   - retornos[f]: uniao dos Return de f (mais nil se o fim e alcancavel);
+#   - parametros[f]: uniao dos argumentos de todas as chamadas de f;
+#   - globais[g]: uniao de tudo que foi atribuido a g (inclusive por uma
+#     funcao aninhada que escreve num local de fora: para ela, e global);
+#   - capturaveis[x]: uniao de tudo que foi atribuido a locais/parametros
+#     chamados x, para funcoes aninhadas que leem locais de fora (upvalues).
+# Quando um resumo cresce, as unidades que o leram voltam para a lista de
+# trabalho.
+
+VAZIO = frozenset()
+QUALQUER = frozenset([st.NUMBER, st.STRING, st.BOOLEAN, st.NIL, st.TABLE, st.FUNCTION])
+_NUMERO = frozenset([st.NUMBER])
+_TEXTO = frozenset([st.STRING])
+_LOGICO = frozenset([st.BOOLEAN])
+_NULO = frozenset([st.NIL])
+_FUNCAO = frozenset([st.FUNCTION])
+
+_ARITMETICOS = ("+", "-", "*", "/", "%", "^")
+_COMPARACOES = ("==", "~=", "<", ">", "<=", ">=")
+
+
+def _falsos(tipos):
+    """Parte do conjunto que pode ser falsa em Lua (nil e false)."""
+    return tipos & (_NULO | _LOGICO)
+
+
+def _verdadeiros(tipos):
+    """Parte do conjunto que pode ser verdadeira (tudo menos nil)."""
+    return tipos - _NULO
+
+
+def formatar_tipos(tipos):
+    if not tipos:
+        return "?"
+    if tipos == QUALQUER:
+        return "any"
+    return "|".join(sorted(tipos))
+
+
+class _Unidade:
+    def __init__(self, nome, decl):
+        self.nome = nome  # None para o programa
+        self.decl = decl
+
+    def __repr__(self):
+        return f"_Unidade({self.nome or '<programa>'})"
+
+
+class InferenciaTipos(AbstractVisitor.AbstractVisitor):
+    """
+    Anota cada expressao com o conjunto de tipos que ela pode ter.
+
+    Uso:
+        tipos = InferenciaTipos(arvore)
+        tipos.tipo(no)        # frozenset de tipos (VAZIO se nao alcancado)
+        tipos.tipo_unico(no)  # 'number', 'string'... ou None se nao for exato
+    """
+
+    def __init__(self, arvore, builtins=None):
+        super().__init__()
+        self.arvore = arvore
+        self.builtins = st.DEFAULT_BUILTINS if builtins is None else builtins
+
+        self.tipos = {}  # id(no) -> frozenset
+        self.retornos = {}  # funcao -> frozenset
+        self.parametros = {}  # funcao -> [frozenset por parametro]
+        self.globais = {}  # global -> frozenset
+        self.capturaveis = {}  # local -> frozenset
+        self.analises = 0  # unidades analisadas (com repeticoes)
+
+        # Quem leu cada resumo, para reagendar quando ele crescer.
+        self._leitores_retorno = {}
+        self._leitores_global = {}
+        self._escritas_em_funcoes = set()
+        self._chamadores = set()  # unidades que chamam funcoes do programa
+
+        self._unidades = {}  # nome da funcao -> [_Unidade]
+        self._programa = _Unidade(None, None)
+        self._coletar_funcoes(arvore)
+        self._resolver()
+
+    # ------------------------------------------
+    # Consulta
+    # ------------------------------------------
+
+    def tipo(self, no):
+        return self.tipos.get(id(no), VAZIO)
+
+    def tipo_unico(self, no):
+        tipos = self.tipos.get(id(no), VAZIO)
+        if len(tipos) == 1:
+            return next(iter(tipos))
+        return None
+
+    def relatorio(self):
+        print("\n" + "=" * 70)
+        print("           TIPOS INFERIDOS")
+        print("=" * 70)
+        for nome in self._unidades:
+            params = self.parametros.get(nome, [])
+            decl = self._unidades[nome][0].decl
+            assinatura = ", ".join(
+                f"{nome_no(p)}: {formatar_tipos(t)}" for p, t in zip(decl.params, params)
+            )
+            print(f"  function {nome}({assinatura}) -> "
+                  f"{formatar_tipos(self.retornos.get(nome, VAZIO))}")
+        for nome in sorted(self.globais):
+            print(f"  global {nome}: {formatar_tipos(self.globais[nome])}")
+        print(f"\n  Unidades analisadas: {self.analises}")
+        print("=" * 70 + "\n")
+
+    # ------------------------------------------
+    # Lista de trabalho
+    # ------------------------------------------
+
+    def _coletar_funcoes(self, no):
+        for stmt in _filhos_comando(no):
+            if stmt.__class__.__name__ == "FunctionDecl":
+                nome = nome_no(stmt.name)
+                self._unidades.setdefault(nome, []).append(_Unidade(nome, stmt))
+                self.parametros.setdefault(nome, [VAZIO] * len(stmt.params))
+                self.retornos.setdefault(nome, VAZIO)
+                self._coletar_funcoes(stmt.body)
+            else:
+                self._coletar_funcoes(stmt)
+
+    def _resolver(self):
+        # Funcoes antes do programa: os resumos ja chegam mais completos.
+        self._pendentes = deque()
+        self._na_fila = set()
+        for unidades in self._unidades.values():
+            for unidade in unidades:
+                self._agendar(unidade)
+        self._agendar(self._programa)
+
+        while self._pendentes:
+            unidade = self._pendentes.popleft()
+            self._na_fila.discard(unidade)
+            self._analisar(unidade)
+
+    def _agendar(self, unidade):
+        if unidade not in self._na_fila:
+            self._na_fila.add(unidade)
+            self._pendentes.append(unidade)
+
+    def _analisar(self, unidade):
+        self.analises += 1
+        self._unidade = unidade
+        self.env = {}
+        self.escopos = [set()]
+        self.alcancavel = True
+        self._retorno = VAZIO
+
+        if unidade.decl is None:
+            self.arvore.accept(self)
+            return
+
+        decl = unidade.decl
+        for param, tipos in zip(decl.params, self.parametros[unidade.nome]):
+            nome = nome_no(param)
+            self.escopos[-1].add(nome)
+            self.env[nome] = tipos
+            self._escrever_resumo(self.capturaveis, nome, tipos)
+        decl.body.accept(self)
+        if self.alcancavel:
+            self._retorno |= _NULO  # cair no fim da funcao retorna nil
+
+        nome = unidade.nome
+        novo = self.retornos[nome] | self._retorno
+        if novo != self.retornos[nome]:
+            self.retornos[nome] = novo
+            for leitor in self._leitores_retorno.get(nome, ()):
+                self._agendar(leitor)
+
+    # ------------------------------------------
+    # Ambiente
+    # ------------------------------------------
+
+    def _eh_local(self, nome):
+        for escopo in reversed(self.escopos):
+            if nome in escopo:
+                return True
+        return False
+
+    def _global_base(self, nome):
+        """Tipo de um global ainda nao atribuido nesta unidade."""
+        self._leitores_global.setdefault(nome, set()).add(self._unidade)
+        capturado = self.capturaveis.get(nome, VAZIO)
+        if nome in self.globais:
+            return self.globais[nome] | capturado
+        if nome in self.builtins:
+            return _FUNCAO | capturado
+        return capturado or _NULO
+
+    def _ler(self, nome):
+        tipos = self.env.get(nome)
+        if tipos is not None:
+            return tipos
+        if self._eh_local(nome):
+            return VAZIO
+        return self._global_base(nome)
+
+    def _escrever_global(self, nome, tipos):
+        if self._unidade.decl is not None and nome not in self._escritas_em_funcoes:
+            # Chamadas ja analisadas nao sabiam que esta global muda.
+            self._escritas_em_funcoes.add(nome)
+            for chamador in self._chamadores:
+                self._agendar(chamador)
+        self._escrever_resumo(self.globais, nome, tipos)
+
+    def _escrever_resumo(self, resumo, nome, tipos):
+        atual = resumo.get(nome, VAZIO)
+        novo = atual | tipos
+        if novo != atual:
+            resumo[nome] = novo
+            for leitor in self._leitores_global.get(nome, ()):
+                self._agendar(leitor)
+
+    def _unir(self, env_a, env_b):
+        unido = {}
+        for nome in env_a.keys() | env_b.keys():
+            tipos_a = env_a.get(nome)
+            tipos_b = env_b.get(nome)
+            if tipos_a is None or tipos_b is None:
+                # So um dos lados atribuiu: o outro ainda tem o valor anterior.
+                base = VAZIO if self._eh_local(nome) else self._global_base(nome)
+                tipos_a = base if tipos_a is None else tipos_a
+                tipos_b = base if tipos_b is None else tipos_b
+            unido[nome] = tipos_a | tipos_b
+        return unido
+
+    def _em_escopo(self, bloco, locais=()):
+        """Visita um bloco num escopo novo; locais dele somem na saida."""
+        anteriores = {nome: self.env.get(nome) for nome in locais}
+        self.escopos.append(set(locais))
+        bloco.accept(self)
+        declarados = self.escopos.pop()
+        for nome in declarados:
+            anteriores.setdefault(nome, None)
+        for nome, tipos in anteriores.items():
+            if tipos is None:
+                self.env.pop(nome, None)
+            else:
+                self.env[nome] = tipos
+
+    def _ramo(self, bloco, env):
+        """Visita um ramo a partir de `env`; devolve (env final, alcancavel)."""
+        self.env = dict(env)
+        self.alcancavel = True
+        self._em_escopo(bloco)
+        return self.env, self.alcancavel
+
+    def _laco(self, corpo, locais=(), condicao=None):
+        # Repete o corpo ate o ambiente da entrada do laco estabilizar.
+        entrada = self.env
+        while True:
+            self.env = dict(entrada)
+            if condicao is not None:
+                condicao.accept(self)
+            self.alcancavel = True
+            self._em_escopo(corpo, locais)
+            nova = self._unir(entrada, self.env)
+            if nova == entrada:
+                break
+            entrada = nova
+        self.env = entrada
+        self.alcancavel = True  # o laco pode nao executar nenhuma vez
+
+    def _anotar(self, no, tipos):
+        self.tipos[id(no)] = tipos
+        return tipos
+
+    # ------------------------------------------
+    # Expressoes
+    # ------------------------------------------
+
+    def visitNumber(self, node):
+        return self._anotar(node, _NUMERO)
+
+    def visitString(self, node):
+        return self._anotar(node, _TEXTO)
+
+    def visitBoolean(self, node):
+        return self._anotar(node, _LOGICO)
+
+    def visitNil(self, node):
+        return self._anotar(node, _NULO)
+
+    def visitVar(self, node):
+        return self._anotar(node, self._ler(nome_no(node.name)))
+
+    def visitUnOp(self, node):
+        node.operand.accept(self)
+        op = node.op.strip() if isinstance(node.op, str) else node.op
+        if op == "not":
+            return self._anotar(node, _LOGICO)
+        return self._anotar(node, _NUMERO)
+
+    def visitBinOp(self, node):
+        esq = node.left.accept(self)
+        dir_ = node.right.accept(self)
+        op = node.op.strip() if isinstance(node.op, str) else node.op
+
+        if op in _ARITMETICOS:
+            return self._anotar(node, _NUMERO)
+        if op in _COMPARACOES:
+            return self._anotar(node, _LOGICO)
+        if op == "and":
+            # a and b: a se a for falso, senao b
+            if not _verdadeiros(esq):
+                return self._anotar(node, esq)
+            return self._anotar(node, _falsos(esq) | dir_)
+        if op == "or":
+            # a or b: a se a for verdadeiro, senao b
+            if not _falsos(esq):
+                return self._anotar(node, esq)
+            return self._anotar(node, _verdadeiros(esq) | dir_)
+        return self._anotar(node, QUALQUER)
+
+    def visitFunctionCall(self, node):
+        nome = nome_no(node.name)
+        args = [arg.accept(self) for arg in node.args]
+
+        if nome in self._unidades and not self._eh_local(nome):
+            parametros = self.parametros[nome]
+            mudou = False
+            for indice, tipos in enumerate(args[: len(parametros)]):
+                novo = parametros[indice] | tipos
+                if novo != parametros[indice]:
+                    parametros[indice] = novo
+                    mudou = True
+            # parametros sem argumento recebem nil
+            for indice in range(len(args), len(parametros)):
+                if st.NIL not in parametros[indice]:
+                    parametros[indice] = parametros[indice] | _NULO
+                    mudou = True
+            if mudou:
+                for unidade in self._unidades[nome]:
+                    self._agendar(unidade)
+
+            self._leitores_retorno.setdefault(nome, set()).add(self._unidade)
+            self._chamadores.add(self._unidade)
+            # A funcao chamada pode ter escrito em globais, ou em locais
+            # daqui que ela captura (para ela, esses nomes sao globais).
+            for nome_escrito in self._escritas_em_funcoes:
+                if nome_escrito not in self.env:
+                    continue
+                if self._eh_local(nome_escrito):
+                    self._leitores_global.setdefault(nome_escrito, set()).add(self._unidade)
+                    escritos = self.globais.get(nome_escrito, VAZIO)
+                else:
+                    escritos = self._global_base(nome_escrito)
+                self.env[nome_escrito] = self.env[nome_escrito] | escritos
+            return self._anotar(node, self.retornos[nome])
+
+        simbolo = self.builtins.get(nome)
+        if simbolo is not None and not self._eh_local(nome):
+            retorno = simbolo[st.TYPE]
+            return self._anotar(node, frozenset([retorno]) if retorno else QUALQUER)
+        return self._anotar(node, QUALQUER)
+
+    # ------------------------------------------
+    # Comandos
+    # ------------------------------------------
+
+    def visitAssign(self, node):
+        nome = nome_no(node.name)
+        tipos = node.exp.accept(self)
+        if getattr(node, "is_local", False):
+            self.escopos[-1].add(nome)
+            self.env[nome] = tipos
+            self._escrever_resumo(self.capturaveis, nome, tipos)
+            return
+        self.env[nome] = tipos
+        if self._eh_local(nome):
+            self._escrever_resumo(self.capturaveis, nome, tipos)
+        else:
+            self._escrever_global(nome, tipos)
+
+    def visitFunctionDecl(self, node):
+        # O corpo e outra unidade; aqui so o nome passa a valer uma funcao.
+        nome = nome_no(node.name)
+        self.env[nome] = _FUNCAO
+        if not self._eh_local(nome):
+            self._escrever_global(nome, _FUNCAO)
+
+    def visitFor(self, node):
+        node.start.accept(self)
+        node.end.accept(self)
+        if node.step is not None:
+            node.step.accept(self)
+        var = nome_no(node.var)
+        self._anotar(node.var, _NUMERO)
+
+        entrada = self.env
+        self.env = dict(entrada)
+        self.env[var] = _NUMERO
+        self._laco(node.body, [var])
+        self.env.pop(var, None)
+        if var in entrada:
+            self.env[var] = entrada[var]
+
+    def visitWhile(self, node):
+        node.condition.accept(self)
+        self._laco(node.body, condicao=node.condition)
+
+    def visitReturn(self, node):
+        if node.exp is not None:
+            self._retorno |= node.exp.accept(self)
+        else:
+            self._retorno |= _NULO
+        self.alcancavel = False
+
+    def visitIf(self, node):
+        node.condition.accept(self)
+        entrada = self.env
+
+        saidas = [self._ramo(node.then_body, entrada)]
+        for condicao, corpo in ramos_elseif(node.elseif_list):
+            self.env = dict(entrada)
+            condicao.accept(self)
+            entrada = self.env
+            saidas.append(self._ramo(corpo, entrada))
+        if node.else_body:
+            saidas.append(self._ramo(node.else_body, entrada))
+        else:
+            saidas.append((entrada, True))
+
+        # So os ramos que chegam ao fim do if contribuem para o ambiente.
+        vivos = [env for env, alcancavel in saidas if alcancavel]
+        self.alcancavel = bool(vivos)
+        if not vivos:
+            self.env = entrada
+            return
+        resultado = vivos[0]
+        for env in vivos[1:]:
+            resultado = self._unir(resultado, env)
+        self.env = resultado
+
+    def visitBlock(self, node):
+        for stmt in node.statements or []:
+            stmt.accept(self)
+
+
+def _filhos_comando(no):
+    """Comandos diretamente aninhados em `no` (bloco, laco, if...)."""
+    classe = no.__class__.__name__
+    if classe == "Block":
+        return no.statements or []
+    if classe in ("For", "While"):
+        return [no.body]
+    if classe == "If":
+        blocos = [no.then_body] + [corpo for _, corpo in ramos_elseif(no.elseif_list)]
+        if no.else_body:
+            blocos.append(no.else_body)
+        return blocos
+    return []
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main():
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    try:
+        from .VisitorSemantico import _criar_parser
+    except ImportError:
+        from VisitorSemantico import _criar_parser
+
+    codigo = """
+    function dobro(n)
+        return n * 2
+    end
+
+    function rotulo(n)
+        if n > 10 then
+            return "grande"
+        elseif n > 5 then
+            return "medio"
+        end
+        return "pequeno"
+    end
+
+    function talvez(n)
+        if n > 0 then
+            return n
+        end
+    end
+
+    local x = 1
+    local s = "oi"
+    while x < 100 do
+        x = dobro(x)
+    end
+    if x > 50 then
+        s = rotulo(x)
+    else
+        s = 3
+    end
+    print(rotulo(x))
+    print(s)
+    print(talvez(x))
+    """
+    arvore = _criar_parser().parse(codigo)
+    tipos = InferenciaTipos(arvore)
+    tipos.relatorio()
+    for stmt in arvore.statements[-3:]:
+        arg = stmt.args[0]
+        print(f"  print({arg}) -> {formatar_tipos(tipos.tipo(arg))}")
+
+
+if __name__ == "__main__":
+    main()
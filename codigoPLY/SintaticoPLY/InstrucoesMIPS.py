@@ -0,0 +1,205 @@
+# ==============================================
+#   INSTRUCOES MIPS ESTRUTURADAS
+# ==============================================
+#
+# O gerador monta listas de Instrucao/Rotulo/Comentario em vez de texto,
+# para que passes posteriores (alocacao de registradores, peephole...)
+# saibam quais registradores cada instrucao le e escreve.
+#
+# Registradores virtuais sao escritos "%N"; os fisicos, "$nome".
+
+REGISTRADORES_ARGUMENTO = ("$a0", "$a1", "$a2", "$a3")
+
+# Registradores que uma chamada (jal) pode destruir (convencao do MIPS).
+REGISTRADORES_CHAMADOR = (
+    ("$v0", "$v1") + REGISTRADORES_ARGUMENTO
+    + tuple(f"$t{i}" for i in range(10)) + ("$ra",)
+)
+
+# Papel de cada operando: d = registrador escrito, u = registrador lido,
+# m = memoria "desloc(reg)" ou rotulo, i = imediato, l = rotulo.
+FORMATOS = {
+    "li": "di",
+    "la": "dl",
+    "lw": "dm",
+    "sw": "um",
+    "move": "du",
+    "neg": "du",
+    "not": "du",
+    "abs": "du",
+    "mflo": "d",
+    "mfhi": "d",
+    "div": "uu",
+    "divu": "uu",
+    "mult": "uu",
+    "j": "l",
+    "jal": "l",
+    "jr": "u",
+    "jalr": "u",
+    "syscall": "",
+    "nop": "",
+    "beqz": "ul",
+    "bnez": "ul",
+    "bgtz": "ul",
+    "bltz": "ul",
+    "blez": "ul",
+    "bgez": "ul",
+}
+for _op in (
+    "add", "addu", "sub", "subu", "mul", "and", "or", "xor", "nor",
+    "slt", "sltu", "seq", "sne", "sgt", "sge", "sle", "rem",
+    "addi", "addiu", "andi", "ori", "xori", "slti", "sltiu",
+    "sll", "srl", "sra", "sllv", "srlv", "srav",
+):
+    FORMATOS[_op] = "duu"
+for _op in ("beq", "bne", "bgt", "blt", "bge", "ble"):
+    FORMATOS[_op] = "uul"
+
+DESVIOS_CONDICIONAIS = frozenset(
+    ["beq", "bne", "bgt", "blt", "bge", "ble", "beqz", "bnez", "bgtz", "bltz", "blez", "bgez"]
+)
+SALTOS = frozenset(["j", "jr"])  # nunca seguem para a proxima instrucao
+CHAMADAS = frozenset(["jal", "jalr"])
+
+
+def eh_registrador(operando):
+    return isinstance(operando, str) and operando[:1] in ("$", "%")
+
+
+def eh_virtual(operando):
+    return isinstance(operando, str) and operando[:1] == "%"
+
+
+def base_memoria(operando):
+    """Registrador base de "desloc(reg)", ou None para rotulos."""
+    if isinstance(operando, str) and operando.endswith(")") and "(" in operando:
+        return operando[operando.index("(") + 1:-1]
+    return None
+
+
+class Instrucao:
+    """
+    `alvos`: rotulos para onde um `jr` de tabela de saltos pode ir (None no
+    `jr $ra`); a vivacidade e o peephole seguem essas arestas.
+    """
+
+    __slots__ = ("op", "operandos", "comentario", "alvos")
+
+    def __init__(self, op, *operandos, comentario=None, alvos=None):
+        self.op = op
+        self.operandos = list(operandos)
+        self.comentario = comentario
+        self.alvos = alvos
+
+    def definidos(self):
+        formato = FORMATOS.get(self.op, "")
+        return [
+            operando
+            for papel, operando in zip(formato, self.operandos)
+            if papel == "d" and eh_registrador(operando)
+        ]
+
+    def usados(self):
+        formato = FORMATOS.get(self.op, "")
+        usados = []
+        for papel, operando in zip(formato, self.operandos):
+            if papel == "u" and eh_registrador(operando):
+                usados.append(operando)
+            elif papel == "m":
+                base = base_memoria(operando)
+                if base is not None:
+                    usados.append(base)
+        return usados
+
+    def alvo(self):
+        """Rotulo de destino de um desvio/salto, se houver."""
+        formato = FORMATOS.get(self.op, "")
+        if formato.endswith("l") and self.op not in ("la",):
+            return self.operandos[-1]
+        return None
+
+    def substituir(self, mapa):
+        """Troca registradores segundo `mapa` (inclusive a base de memoria)."""
+        novos = []
+        for operando in self.operandos:
+            if operando in mapa:
+                novos.append(mapa[operando])
+                continue
+            base = base_memoria(operando)
+            if base is not None and base in mapa:
+                novos.append(operando[: operando.index("(") + 1] + mapa[base] + ")")
+                continue
+            novos.append(operando)
+        self.operandos = novos
+
+    def __str__(self):
+        texto = self.op
+        if self.operandos:
+            texto += " " + ", ".join(str(operando) for operando in self.operandos)
+        if self.comentario:
+            texto += f"  # {self.comentario}"
+        return f"    {texto}"
+
+    def __repr__(self):
+        return f"Instrucao({str(self).strip()!r})"
+
+
+class Rotulo:
+    __slots__ = ("nome",)
+
+    def __init__(self, nome):
+        self.nome = nome
+
+    def definidos(self):
+        return []
+
+    def usados(self):
+        return []
+
+    def __str__(self):
+        return f"{self.nome}:"
+
+    def __repr__(self):
+        return f"Rotulo({self.nome})"
+
+
+class Comentario:
+    __slots__ = ("texto",)
+
+    def __init__(self, texto):
+        self.texto = texto
+
+    def definidos(self):
+        return []
+
+    def usados(self):
+        return []
+
+    def __str__(self):
+        return f"    # {self.texto}"
+
+    def __repr__(self):
+        return f"Comentario({self.texto!r})"
+
+
+def analisar_instrucao(texto):
+    """Converte uma linha de assembly ("op a, b  # coment.") em registro."""
+    texto = texto.strip()
+    if texto.startswith("#"):
+        return Comentario(texto[1:].strip())
+    comentario = None
+    if "#" in texto:
+        texto, comentario = texto.split("#", 1)
+        texto = texto.strip()
+        comentario = comentario.strip()
+    if texto.endswith(":") and " " not in texto:
+        return Rotulo(texto[:-1])
+    partes = texto.split(None, 1)
+    operandos = []
+    if len(partes) > 1:
+        operandos = [operando.strip() for operando in partes[1].split(",")]
+    return Instrucao(partes[0], *operandos, comentario=comentario)
+
+
+def renderizar(itens):
+    return "".join(f"{item}\n" for item in itens)
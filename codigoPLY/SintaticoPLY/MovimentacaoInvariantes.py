@@ -0,0 +1,192 @@
+try:
+    from . import IR
+    from . import SSA
+except ImportError:
+    import IR
+    import SSA
+
+
+# ==============================================
+#   MOVIMENTACAO DE INVARIANTES DE LACO (LICM)
+# ==============================================
+#
+# Sobre uma Funcao em SSA, acha os lacos naturais (SSA.lacos_naturais) e
+# move para o pre-cabecalho as instrucoes cujo valor nao muda dentro do
+# laco: operandos definidos fora dele (ou por instrucoes ja movidas).
+# Os lacos internos sao tratados primeiro, entao uma expressao pode subir
+# mais de um nivel.
+#
+# So instrucoes sem efeito e que nao falham sobem (elas podem nao executar
+# em toda volta, e agora executam uma vez antes do laco):
+#   - div e mod (ambos viram `div` no MIPS) so com divisor constante
+#     diferente de zero;
+#   - Carrega so se nada no laco escreve a variavel: nenhum Armazena nela
+#     e, para globais, nenhuma Chamada a funcao que pode escrever nela
+#     (SSA.efeitos_globais);
+#   - Const fica no lugar quando o laco tem chamadas fora do main: do
+#     contrario ela atravessaria um jal num $s (ver NumeracaoValores).
+#
+# O pre-cabecalho e o unico predecessor do cabecalho fora do laco; se ele
+# tambem desvia para outro lugar, um bloco novo entra no meio da aresta.
+
+_MOVIVEIS = ("Const", "EnderecoString", "Copia", "Unaria", "Binaria", "Carrega")
+
+
+class MovimentacaoInvariantes:
+    """
+    Args:
+        efeitos: resultado de SSA.efeitos_globais; sem ele toda chamada
+            pode escrever em todas as globais
+    """
+
+    def __init__(self, efeitos=None):
+        self.efeitos = efeitos or {}
+        self.movidas = 0  # instrucoes levadas para fora de algum laco
+        self.lacos = 0
+
+    def otimizar(self, funcao):
+        preds = SSA.predecessores(funcao)
+        idom = SSA.dominadores(funcao, preds)
+        lacos = SSA.lacos_naturais(idom, preds)
+        self.lacos += len(lacos)
+        # Internos (menores) primeiro.
+        for cabecalho, corpo in sorted(lacos.items(), key=lambda item: len(item[1])):
+            pre = self._pre_cabecalho(funcao, cabecalho, corpo, preds, lacos)
+            if pre is not None:
+                self._mover(funcao, corpo, pre)
+        return funcao
+
+    def _pre_cabecalho(self, funcao, cabecalho, corpo, preds, lacos):
+        """Bloco onde as invariantes entram, ou None (mais de uma entrada)."""
+        de_fora = [pred for pred in preds[cabecalho] if pred not in corpo]
+        if len(de_fora) != 1:
+            return None
+        (pred,) = de_fora
+        por_rotulo = {bloco.rotulo: bloco for bloco in funcao.blocos}
+        anterior = por_rotulo[pred]
+        if SSA.sucessores(anterior) == [cabecalho]:
+            return anterior
+
+        novo = IR.Bloco(f"{pred}_{cabecalho}")
+        novo.terminador = IR.Salto(cabecalho)
+        anterior.terminador.redirecionar({cabecalho: novo.rotulo})
+        for phi in SSA.phis(por_rotulo[cabecalho]):
+            phi.argumentos[novo.rotulo] = phi.argumentos.pop(pred)
+        funcao.blocos.insert(funcao.blocos.index(por_rotulo[cabecalho]), novo)
+        # O bloco novo fica fora deste laco, mas dentro dos que contem pred.
+        preds[novo.rotulo] = [pred]
+        preds[cabecalho] = [novo.rotulo if p == pred else p for p in preds[cabecalho]]
+        for outro in lacos.values():
+            if pred in outro:
+                outro.add(novo.rotulo)
+        return novo
+
+    def _mover(self, funcao, corpo, pre):
+        blocos = [bloco for bloco in funcao.blocos if bloco.rotulo in corpo]
+        definidos = set()
+        escritas = set()
+        globais_escritas = set()
+        todas_globais = False
+        chamadas = False
+        for bloco in blocos:
+            for instrucao in bloco.instrucoes:
+                classe = instrucao.__class__.__name__
+                if instrucao.destino is not None:
+                    definidos.add(instrucao.destino.numero)
+                if classe == "Armazena":
+                    escritas.add(instrucao.variavel)
+                elif classe == "Chamada":
+                    chamadas = True
+                    if instrucao.funcao in self.efeitos:
+                        globais_escritas |= self.efeitos[instrucao.funcao][1]
+                    else:
+                        todas_globais = True
+        constantes = {
+            instrucao.destino.numero: instrucao.valor
+            for instrucao in funcao.instrucoes()
+            if instrucao.__class__.__name__ == "Const"
+        }
+
+        def invariante(instrucao):
+            classe = instrucao.__class__.__name__
+            if classe not in _MOVIVEIS:
+                return False
+            if any(temp.numero in definidos for temp in instrucao.usados()):
+                return False
+            if classe == "Const":
+                return not chamadas or funcao.nome == IR.PRINCIPAL
+            if classe == "Binaria" and instrucao.op in ("div", "mod"):
+                return constantes.get(instrucao.direita.numero, 0) != 0
+            if classe == "Carrega":
+                variavel = instrucao.variavel
+                if variavel in escritas:
+                    return False
+                return not variavel.global_ or not (todas_globais or variavel.nome in globais_escritas)
+            return True
+
+        mudou = True
+        while mudou:
+            mudou = False
+            for bloco in blocos:
+                mantidas = []
+                for instrucao in bloco.instrucoes:
+                    if invariante(instrucao):
+                        pre.instrucoes.append(instrucao)
+                        definidos.discard(instrucao.destino.numero)
+                        self.movidas += 1
+                        mudou = True
+                    else:
+                        mantidas.append(instrucao)
+                bloco.instrucoes = mantidas
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main():
+    import os
+    import sys
+
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    try:
+        from .VisitorSemantico import _criar_parser
+        from .InferenciaTipos import InferenciaTipos
+        from .GeradorAssembly import GeradorAssembly
+    except ImportError:
+        from VisitorSemantico import _criar_parser
+        from InferenciaTipos import InferenciaTipos
+        from GeradorAssembly import GeradorAssembly
+
+    codigo = """
+    limite = 4
+    function soma(n)
+        local total = 0
+        for i = n, 1, -1 do
+            for j = 1, limite do
+                total = total + n * limite + j
+            end
+        end
+        return total
+    end
+    print(soma(3))
+    """
+    arvore = _criar_parser().parse(codigo)
+    gerador = GeradorAssembly(tipos=InferenciaTipos(arvore))
+    arvore.accept(gerador)
+    modulo = gerador.finalizar()
+    efeitos = SSA.efeitos_globais(modulo)
+    funcao = modulo.funcoes["soma"]
+    SSA.construir_ssa(funcao, SSA.promoviveis(funcao, efeitos))
+    SSA.propagar_copias(funcao)
+    licm = MovimentacaoInvariantes(efeitos)
+    licm.otimizar(funcao)
+    SSA.remover_mortas(funcao)
+    print(funcao)
+    print(f"\nlacos: {licm.lacos}, instrucoes movidas: {licm.movidas}")
+
+
+if __name__ == "__main__":
+    main()
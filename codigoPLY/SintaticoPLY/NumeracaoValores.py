@@ -0,0 +1,295 @@
+try:
+    from . import IR
+    from . import SSA
+except ImportError:
+    import IR
+    import SSA
+
+
+# ==============================================
+#   NUMERACAO GLOBAL DE VALORES (GVN)
+# ==============================================
+#
+# Sobre uma Funcao em SSA, percorre a arvore de dominadores com uma tabela
+# de expressoes em escopo: uma expressao (op + numeros dos operandos +
+# tipo) ja calculada num dominador e reaproveitada e a instrucao repetida
+# sai. Operacoes comutativas tem os operandos ordenados e gt/ge viram
+# lt/le invertidos, entao `a + b` e `b + a` (ou `a > b` e `b < a`) batem.
+#
+# Memoria (variaveis que nao viraram temporarios): o valor conhecido de
+# cada variavel segue de um bloco para o filho na arvore quando o filho
+# tem o pai como unico predecessor (nenhum outro caminho escreve no meio).
+#   - Carrega de valor conhecido vira o proprio valor (ou uma Copia, se o
+#     tipo inferido for diferente);
+#   - Armazena do valor que a memoria ja tem sai;
+#   - Chamada esquece as globais que a funcao chamada pode escrever
+#     (SSA.efeitos_globais); slots do quadro nao mudam em chamadas.
+#
+# Reaproveitar uma Const do dominador e bom dentro de lacos, mas se ela
+# atravessa um jal vai para um $s, que a funcao salva e restaura. Fora do
+# main (que nunca retorna) essas constantes voltam a ser carregadas junto
+# de cada uso.
+
+_COMUTATIVAS = ("add", "mul", "eq", "ne", "and", "or")
+_ESPELHADAS = {"gt": "lt", "ge": "le"}
+
+
+class NumeracaoValores:
+    """
+    Args:
+        efeitos: resultado de SSA.efeitos_globais; sem ele toda chamada
+            esquece todas as globais
+    """
+
+    def __init__(self, efeitos=None):
+        self.efeitos = efeitos or {}
+        self.redundantes = 0  # expressoes reaproveitadas
+        self.acessos_removidos = 0  # Carrega/Armazena sem efeito
+
+    def otimizar(self, funcao):
+        preds = SSA.predecessores(funcao)
+        idom = SSA.dominadores(funcao, preds)
+        filhos = SSA.filhos_dominancia(funcao, idom)
+        por_rotulo = {bloco.rotulo: bloco for bloco in funcao.blocos}
+        self._tabela = {}
+        self._mapa = {}  # Temp removido -> Temp que fica
+        memoria_saida = {}
+
+        trabalho = [(funcao.entrada.rotulo, None)]
+        while trabalho:
+            rotulo, inseridas = trabalho.pop()
+            if inseridas is not None:
+                for chave in inseridas:
+                    del self._tabela[chave]
+                continue
+            pai = idom[rotulo]
+            if pai is not None and preds[rotulo] == [pai]:
+                memoria = dict(memoria_saida[pai])
+            else:
+                memoria = {}
+            inseridas = []
+            bloco = por_rotulo[rotulo]
+            bloco.instrucoes = self._numerar(rotulo, bloco.instrucoes, memoria, inseridas)
+            bloco.terminador.substituir(self._mapa)
+            memoria_saida[rotulo] = memoria
+            trabalho.append((rotulo, inseridas))
+            for filho in reversed(filhos[rotulo]):
+                trabalho.append((filho, None))
+
+        # Argumentos de Phi vindos de arestas de volta ainda apontam para
+        # temporarios removidos depois que o Phi foi visto.
+        for instrucao in funcao.instrucoes():
+            instrucao.substituir(self._mapa)
+        if funcao.nome != IR.PRINCIPAL:
+            self._rematerializar(funcao, preds)
+        return funcao
+
+    def _rematerializar(self, funcao, preds):
+        valores = {}
+        for instrucao in funcao.instrucoes():
+            if instrucao.__class__.__name__ == "Const":
+                valores[instrucao.destino.numero] = instrucao.valor
+        cruzam = {numero for numero in vivos_em_chamadas(funcao, preds) if numero in valores}
+        if not cruzam:
+            return
+
+        def copia_local(temp, destino):
+            novo = funcao.novo_temp(temp.tipo)
+            destino.append(IR.Const(novo, valores[temp.numero]))
+            return novo
+
+        por_rotulo = {bloco.rotulo: bloco for bloco in funcao.blocos}
+        for bloco in funcao.blocos:
+            instrucoes = []
+            for instrucao in bloco.instrucoes:
+                if instrucao.__class__.__name__ == "Phi":
+                    for pred, temp in list(instrucao.argumentos.items()):
+                        if temp.numero in cruzam:
+                            anterior = por_rotulo[pred]
+                            instrucao.argumentos[pred] = copia_local(temp, anterior.instrucoes)
+                else:
+                    mapa = {t: copia_local(t, instrucoes) for t in instrucao.usados() if t.numero in cruzam}
+                    instrucao.substituir(mapa)
+                instrucoes.append(instrucao)
+            mapa = {t: copia_local(t, instrucoes) for t in bloco.terminador.usados() if t.numero in cruzam}
+            bloco.terminador.substituir(mapa)
+            bloco.instrucoes = instrucoes
+
+    def _numerar(self, rotulo, instrucoes, memoria, inseridas):
+        mantidas = []
+        for instrucao in instrucoes:
+            instrucao.substituir(self._mapa)
+            classe = instrucao.__class__.__name__
+            unico = self._phi_trivial(instrucao) if classe == "Phi" else None
+
+            if classe == "Carrega":
+                conhecido = memoria.get(instrucao.variavel)
+                if conhecido is None:
+                    memoria[instrucao.variavel] = instrucao.destino
+                else:
+                    self.acessos_removidos += 1
+                    if conhecido.tipo == instrucao.destino.tipo:
+                        self._mapa[instrucao.destino] = conhecido
+                        continue
+                    instrucao = IR.Copia(instrucao.destino, conhecido)
+            elif classe == "Armazena":
+                if memoria.get(instrucao.variavel) is instrucao.origem:
+                    self.acessos_removidos += 1
+                    continue
+                memoria[instrucao.variavel] = instrucao.origem
+            elif classe == "Chamada":
+                escritas = self.efeitos[instrucao.funcao][1] if instrucao.funcao in self.efeitos else None
+                for variavel in list(memoria):
+                    if variavel.global_ and (escritas is None or variavel.nome in escritas):
+                        del memoria[variavel]
+            elif classe == "Copia" and instrucao.origem.tipo == instrucao.destino.tipo:
+                self._mapa[instrucao.destino] = instrucao.origem
+                continue
+            elif unico is not None:
+                self._mapa[instrucao.destino] = unico
+                self.redundantes += 1
+                continue
+            else:
+                chave = _chave(rotulo, instrucao, classe)
+                if chave is not None:
+                    existente = self._tabela.get(chave)
+                    if existente is not None:
+                        self._mapa[instrucao.destino] = existente
+                        self.redundantes += 1
+                        continue
+                    self._tabela[chave] = instrucao.destino
+                    inseridas.append(chave)
+            mantidas.append(instrucao)
+        return mantidas
+
+    @staticmethod
+    def _phi_trivial(phi):
+        """O unico valor que o Phi pode ter (fora ele mesmo), se o tipo bate."""
+        valores = {id(t): t for t in phi.argumentos.values() if t is not phi.destino}
+        if len(valores) != 1:
+            return None
+        (valor,) = valores.values()
+        return valor if valor.tipo == phi.destino.tipo else None
+
+
+def vivos_em_chamadas(funcao, preds=None):
+    """Numeros dos temporarios vivos depois de alguma Chamada (que nao a define)."""
+    preds = SSA.predecessores(funcao) if preds is None else preds
+    geracao, morte, saida_phi = {}, {}, {}
+    for bloco in funcao.blocos:
+        usados, definidos = set(), set()
+        for instrucao in bloco.instrucoes + [bloco.terminador]:
+            if instrucao.__class__.__name__ == "Phi":
+                # Argumento de Phi esta vivo na saida do predecessor.
+                for pred, temp in instrucao.argumentos.items():
+                    saida_phi.setdefault(pred, set()).add(temp.numero)
+            else:
+                usados |= {t.numero for t in instrucao.usados()} - definidos
+            if instrucao.destino is not None:
+                definidos.add(instrucao.destino.numero)
+        geracao[bloco.rotulo], morte[bloco.rotulo] = usados, definidos
+
+    entrada = {rotulo: set() for rotulo in geracao}
+    saida = {rotulo: set() for rotulo in geracao}
+    mudou = True
+    while mudou:
+        mudou = False
+        for bloco in reversed(funcao.blocos):
+            rotulo = bloco.rotulo
+            nova_saida = set(saida_phi.get(rotulo, ()))
+            for alvo in SSA.sucessores(bloco):
+                nova_saida |= entrada[alvo]
+            nova_entrada = geracao[rotulo] | (nova_saida - morte[rotulo])
+            if nova_saida != saida[rotulo] or nova_entrada != entrada[rotulo]:
+                saida[rotulo], entrada[rotulo] = nova_saida, nova_entrada
+                mudou = True
+
+    cruzam = set()
+    for bloco in funcao.blocos:
+        vivos = set(saida[bloco.rotulo])
+        for instrucao in reversed(bloco.instrucoes + [bloco.terminador]):
+            if instrucao.destino is not None:
+                vivos.discard(instrucao.destino.numero)
+            if instrucao.__class__.__name__ == "Chamada":
+                cruzam |= vivos
+            if instrucao.__class__.__name__ != "Phi":
+                vivos |= {t.numero for t in instrucao.usados()}
+    return cruzam
+
+
+def _chave(rotulo, instrucao, classe):
+    """Chave da expressao na tabela (None se a instrucao nao e numerada)."""
+    tipo = instrucao.destino.tipo if instrucao.destino is not None else None
+    if classe == "Const":
+        return ("const", instrucao.valor, tipo)
+    if classe == "EnderecoString":
+        return ("str", instrucao.texto)
+    if classe == "Parametro":
+        return ("parametro", instrucao.indice)
+    if classe == "Copia":
+        # So sobram copias que mudam o tipo (as outras ja foram propagadas).
+        return ("copia", instrucao.origem.numero, tipo)
+    if classe == "Unaria":
+        return ("unaria", instrucao.op, instrucao.origem.numero, tipo)
+    if classe == "Binaria":
+        op = instrucao.op
+        esquerda, direita = instrucao.esquerda.numero, instrucao.direita.numero
+        if op in _ESPELHADAS:
+            op, esquerda, direita = _ESPELHADAS[op], direita, esquerda
+        elif op in _COMUTATIVAS and direita < esquerda:
+            esquerda, direita = direita, esquerda
+        return ("binaria", op, esquerda, direita, tipo)
+    if classe == "Phi":
+        # Phi iguais no mesmo bloco calculam o mesmo valor.
+        argumentos = tuple(sorted((pred, t.numero) for pred, t in instrucao.argumentos.items()))
+        return ("phi", rotulo, argumentos, tipo)
+    return None
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main():
+    import os
+    import sys
+
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    try:
+        from .VisitorSemantico import _criar_parser
+        from .InferenciaTipos import InferenciaTipos
+        from .GeradorAssembly import GeradorAssembly
+    except ImportError:
+        from VisitorSemantico import _criar_parser
+        from InferenciaTipos import InferenciaTipos
+        from GeradorAssembly import GeradorAssembly
+
+    codigo = """
+    limite = 10
+    function conta(n)
+        local total = 0
+        for i = 1, limite do
+            total = total + n * 2 + limite
+        end
+        return total + n * 2
+    end
+    print(conta(3))
+    """
+    arvore = _criar_parser().parse(codigo)
+    gerador = GeradorAssembly(tipos=InferenciaTipos(arvore))
+    arvore.accept(gerador)
+    modulo = gerador.finalizar()
+    efeitos = SSA.efeitos_globais(modulo)
+    funcao = modulo.funcoes["conta"]
+    SSA.construir_ssa(funcao, SSA.promoviveis(funcao, efeitos))
+    gvn = NumeracaoValores(efeitos)
+    gvn.otimizar(funcao)
+    SSA.remover_mortas(funcao)
+    print(funcao)
+    print(f"\nredundantes: {gvn.redundantes}, acessos removidos: {gvn.acessos_removidos}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+try:
+    from . import SintaxeAbstrata as a
+    from . import AbstractVisitor
+    from .AuxiliarAST import nome_no, ramos_elseif
+except ImportError:
+    import SintaxeAbstrata as a
+    import AbstractVisitor
+    from AuxiliarAST import nome_no, ramos_elseif
+
+
+# ==============================================
+#   DOBRA E PROPAGACAO DE CONSTANTES
+# ==============================================
+#
+# Roda entre o VisitorSemantico e o GeradorAssembly, alterando a AST.
+#
+# 1a passada (_Resolvedor): liga cada Var/Assign a declaracao `local` que
+#    ele enxerga, respeitando os escopos, e marca as locais reatribuidas.
+# 2a passada (OtimizadorConstantes): dobra expressoes cujos operandos sao
+#    literais e troca a leitura de uma local nunca reatribuida, inicializada
+#    com literal, pelo proprio literal.
+#
+# A dobra segue a semantica do codigo gerado: inteiros de 32 bits e divisao
+# inteira. Por isso so dobramos inteiros (nada de float), divisao so quando
+# e exata (mesmo resultado em Lua e no MIPS) e nunca quando o resultado
+# nao cabe em 32 bits ou ha divisao por zero: esses casos ficam para a
+# execucao, como antes.
+
+_MIN_INT = -(2 ** 31)
+_MAX_INT = 2 ** 31 - 1
+
+
+class _Ligacao:
+    """Uma declaracao `local` (ou parametro/variavel de for)."""
+
+    __slots__ = ("nome", "reatribuida")
+
+    def __init__(self, nome, reatribuida=False):
+        self.nome = nome
+        self.reatribuida = reatribuida
+
+
+class _Resolvedor(AbstractVisitor.AbstractVisitor):
+    def __init__(self):
+        super().__init__()
+        self.escopos = [{}]
+        self.por_declaracao = {}  # id(Assign local) -> _Ligacao
+        self.por_leitura = {}  # id(Var) -> _Ligacao
+
+    def _resolver(self, nome):
+        for escopo in reversed(self.escopos):
+            ligacao = escopo.get(nome)
+            if ligacao is not None:
+                return ligacao
+        return None
+
+    def _em_escopo(self, bloco, ligacoes=()):
+        self.escopos.append({ligacao.nome: ligacao for ligacao in ligacoes})
+        bloco.accept(self)
+        self.escopos.pop()
+
+    def visitNumber(self, node):
+        pass
+
+    def visitString(self, node):
+        pass
+
+    def visitBoolean(self, node):
+        pass
+
+    def visitNil(self, node):
+        pass
+
+    def visitVar(self, node):
+        ligacao = self._resolver(nome_no(node.name))
+        if ligacao is not None:
+            self.por_leitura[id(node)] = ligacao
+
+    def visitUnOp(self, node):
+        node.operand.accept(self)
+
+    def visitBinOp(self, node):
+        node.left.accept(self)
+        node.right.accept(self)
+
+    def visitFunctionCall(self, node):
+        for arg in node.args:
+            arg.accept(self)
+
+    def visitAssign(self, node):
+        node.exp.accept(self)
+        nome = nome_no(node.name)
+        if getattr(node, "is_local", False):
+            ligacao = _Ligacao(nome)
+            self.escopos[-1][nome] = ligacao
+            self.por_declaracao[id(node)] = ligacao
+            return
+        ligacao = self._resolver(nome)
+        if ligacao is not None:
+            ligacao.reatribuida = True
+
+    def visitFunctionDecl(self, node):
+        ligacao = self._resolver(nome_no(node.name))
+        if ligacao is not None:
+            ligacao.reatribuida = True
+        params = [_Ligacao(nome_no(p), reatribuida=True) for p in node.params]
+        self._em_escopo(node.body, params)
+
+    def visitFor(self, node):
+        node.start.accept(self)
+        node.end.accept(self)
+        if node.step is not None:
+            node.step.accept(self)
+        self._em_escopo(node.body, [_Ligacao(nome_no(node.var), reatribuida=True)])
+
+    def visitWhile(self, node):
+        node.condition.accept(self)
+        self._em_escopo(node.body)
+
+    def visitReturn(self, node):
+        if node.exp is not None:
+            node.exp.accept(self)
+
+    def visitIf(self, node):
+        node.condition.accept(self)
+        self._em_escopo(node.then_body)
+        for condicao, corpo in ramos_elseif(node.elseif_list):
+            condicao.accept(self)
+            self._em_escopo(corpo)
+        if node.else_body:
+            self._em_escopo(node.else_body)
+
+    def visitBlock(self, node):
+        for stmt in node.statements or []:
+            stmt.accept(self)
+
+
+class OtimizadorConstantes(AbstractVisitor.AbstractVisitor):
+    """
+    Dobra e propaga constantes na AST (alteracao no lugar).
+
+    Os visit* de expressao devolvem o no que deve ocupar o lugar do
+    original; os de comando alteram os filhos e devolvem o proprio no.
+
+    Args:
+        spans: TabelaSpans opcional; nos criados herdam o trecho do original
+    """
+
+    def __init__(self, spans=None):
+        super().__init__()
+        self.spans = spans
+        self.dobradas = 0
+        self.propagadas = 0
+        self._constantes = {}  # _Ligacao -> literal
+        self._herdeiros = []  # (original, novo) para os spans, no fim do passe
+
+    def otimizar(self, arvore):
+        resolvedor = _Resolvedor()
+        arvore.accept(resolvedor)
+        self._por_declaracao = resolvedor.por_declaracao
+        self._por_leitura = resolvedor.por_leitura
+        arvore.accept(self)
+        # Os trechos sao copiados de uma vez: o original e sempre um no do
+        # parse, e a lista o mantem vivo (o id nao e reaproveitado) ate aqui.
+        if self.spans is not None:
+            for original, novo in self._herdeiros:
+                self.spans.copiar(original, novo)
+        self._herdeiros = []
+        return arvore
+
+    def _novo(self, original, novo):
+        if self.spans is not None:
+            self._herdeiros.append((original, novo))
+        return novo
+
+    # ------------------------------------------
+    # Expressoes
+    # ------------------------------------------
+
+    def visitNumber(self, node):
+        return node
+
+    def visitString(self, node):
+        return node
+
+    def visitBoolean(self, node):
+        return node
+
+    def visitNil(self, node):
+        return node
+
+    def visitVar(self, node):
+        ligacao = self._por_leitura.get(id(node))
+        literal = self._constantes.get(ligacao) if ligacao is not None else None
+        if literal is None:
+            return node
+        self.propagadas += 1
+        return self._novo(node, _copiar_literal(literal))
+
+    def visitUnOp(self, node):
+        node.operand = node.operand.accept(self)
+        op = node.op.strip() if isinstance(node.op, str) else node.op
+        valor = _valor_logico(node.operand)
+        if op == "not" and valor is not _INDEFINIDO:
+            self.dobradas += 1
+            return self._novo(node, a.Boolean(not valor))
+        return node
+
+    def visitBinOp(self, node):
+        node.left = node.left.accept(self)
+        node.right = node.right.accept(self)
+        op = node.op.strip() if isinstance(node.op, str) else node.op
+
+        resultado = _dobrar(op, node.left, node.right)
+        if resultado is None:
+            return node
+        self.dobradas += 1
+        return self._novo(node, resultado)
+
+    def visitFunctionCall(self, node):
+        node.args = [arg.accept(self) for arg in node.args]
+        return node
+
+    # ------------------------------------------
+    # Comandos
+    # ------------------------------------------
+
+    def visitAssign(self, node):
+        node.exp = node.exp.accept(self)
+        ligacao = self._por_declaracao.get(id(node))
+        if ligacao is not None and not ligacao.reatribuida and _eh_literal(node.exp):
+            self._constantes[ligacao] = node.exp
+        return node
+
+    def visitFunctionDecl(self, node):
+        node.body.accept(self)
+        return node
+
+    def visitFor(self, node):
+        node.start = node.start.accept(self)
+        node.end = node.end.accept(self)
+        if node.step is not None:
+            node.step = node.step.accept(self)
+        node.body.accept(self)
+        return node
+
+    def visitWhile(self, node):
+        node.condition = node.condition.accept(self)
+        node.body.accept(self)
+        return node
+
+    def visitReturn(self, node):
+        if node.exp is not None:
+            node.exp = node.exp.accept(self)
+        return node
+
+    def visitIf(self, node):
+        node.condition = node.condition.accept(self)
+        node.then_body.accept(self)
+        elseifs = []
+        for condicao, corpo in ramos_elseif(node.elseif_list):
+            elseifs.append((condicao.accept(self), corpo))
+            corpo.accept(self)
+        node.elseif_list = elseifs
+        if node.else_body:
+            node.else_body.accept(self)
+        return node
+
+    def visitBlock(self, node):
+        for stmt in node.statements or []:
+            stmt.accept(self)
+        return node
+
+
+# ==============================================
+#   Regras de dobra
+# ==============================================
+
+_INDEFINIDO = object()
+
+
+def _eh_literal(no):
+    classe = no.__class__.__name__
+    if classe == "Number":
+        return _eh_inteiro(no.value)
+    return classe in ("String", "Boolean", "Nil")
+
+
+def _copiar_literal(no):
+    classe = no.__class__.__name__
+    if classe == "Number":
+        return a.Number(no.value)
+    if classe == "String":
+        return a.String(no.value)
+    if classe == "Boolean":
+        return a.Boolean(no.value)
+    return a.Nil()
+
+
+def _eh_inteiro(valor):
+    return type(valor) is int and _MIN_INT <= valor <= _MAX_INT
+
+
+def _inteiro(no):
+    if no.__class__.__name__ == "Number" and _eh_inteiro(no.value):
+        return no.value
+    return None
+
+
+def _valor_logico(no):
+    """Valor de verdade de um literal boolean/nil (numeros ficam de fora:
+    o codigo gerado trata 0 como falso, o Lua nao)."""
+    classe = no.__class__.__name__
+    if classe == "Boolean":
+        return bool(no.value)
+    if classe == "Nil":
+        return False
+    return _INDEFINIDO
+
+
+def _dobrar(op, esq, dir_):
+    """Literal equivalente a `esq op dir_`, ou None se nao da para dobrar."""
+    x = _inteiro(esq)
+    y = _inteiro(dir_)
+    if x is not None and y is not None:
+        if op == "+":
+            return _numero(x + y)
+        if op == "-":
+            return _numero(x - y)
+        if op == "*":
+            return _numero(x * y)
+        if op == "/":
+            if y == 0 or x % y != 0:
+                return None
+            return _numero(x // y)
+        if op == "%":
+            # % do Lua: o resto tem o sinal do divisor (igual ao do Python)
+            return _numero(x % y) if y != 0 else None
+        if op == "^":
+            # Com expoente natural o valor do Lua e inteiro (ex.: 2^10 = 1024.0)
+            return _numero(x ** y) if 0 <= y <= 31 else None
+        if op == "==":
+            return a.Boolean(x == y)
+        if op == "~=":
+            return a.Boolean(x != y)
+        if op == "<":
+            return a.Boolean(x < y)
+        if op == ">":
+            return a.Boolean(x > y)
+        if op == "<=":
+            return a.Boolean(x <= y)
+        if op == ">=":
+            return a.Boolean(x >= y)
+        return None
+
+    if op in ("==", "~="):
+        classe = esq.__class__.__name__
+        if classe == dir_.__class__.__name__ and classe in ("String", "Boolean", "Nil"):
+            iguais = getattr(esq, "value", None) == getattr(dir_, "value", None)
+            return a.Boolean(iguais if op == "==" else not iguais)
+        return None
+
+    valor_esq = _valor_logico(esq)
+    if valor_esq is _INDEFINIDO:
+        return None
+    if op == "and":
+        # false/nil and e -> o proprio lado esquerdo (e nem e avaliado)
+        if not valor_esq:
+            return _copiar_literal(esq)
+        if _valor_logico(dir_) is not _INDEFINIDO:
+            return _copiar_literal(dir_)
+    elif op == "or":
+        if valor_esq:
+            return _copiar_literal(esq)
+        if _valor_logico(dir_) is not _INDEFINIDO:
+            return _copiar_literal(dir_)
+    return None
+
+
+def _numero(valor):
+    return a.Number(valor) if _eh_inteiro(valor) else None
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main():
+    import os
+    import sys
+
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    try:
+        from .VisitorSemantico import _criar_parser
+        from .VisitorPrettyPrinter import VisitorPrettyPrinter
+    except ImportError:
+        from VisitorSemantico import _criar_parser
+        from VisitorPrettyPrinter import VisitorPrettyPrinter
+
+    codigo = """
+    local x = 10
+    local y = x * 2 + 3
+    local z = -x
+    local limite = 2 * 8 - 1
+    function escala(n)
+        return n * x + 1
+    end
+    for i = 1, limite do
+        print(escala(i) + y)
+    end
+    print(x > 5 and true)
+    """
+    arvore = _criar_parser().parse(codigo)
+    otimizador = OtimizadorConstantes()
+    otimizador.otimizar(arvore)
+    print(f"Expressoes dobradas: {otimizador.dobradas}, "
+          f"leituras propagadas: {otimizador.propagadas}\n")
+    print(arvore.accept(VisitorPrettyPrinter()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,437 @@
+try:
+    from .InstrucoesMIPS import (
+        CHAMADAS,
+        DESVIOS_CONDICIONAIS,
+        FORMATOS,
+        REGISTRADORES_ARGUMENTO,
+        REGISTRADORES_CHAMADOR,
+        SALTOS,
+        Instrucao,
+        base_memoria,
+    )
+    from .AlocadorRegistradores import REGISTRADORES_SALVOS
+    from .GrafoFluxo import GrafoFluxo
+except ImportError:
+    from InstrucoesMIPS import (
+        CHAMADAS,
+        DESVIOS_CONDICIONAIS,
+        FORMATOS,
+        REGISTRADORES_ARGUMENTO,
+        REGISTRADORES_CHAMADOR,
+        SALTOS,
+        Instrucao,
+        base_memoria,
+    )
+    from AlocadorRegistradores import REGISTRADORES_SALVOS
+    from GrafoFluxo import GrafoFluxo
+
+
+# ==============================================
+#   OTIMIZADOR PEEPHOLE
+# ==============================================
+#
+# Roda sobre a lista final de Instrucao/Rotulo/Comentario de cada funcao
+# (registradores fisicos, depois da alocacao e do prologo/epilogo). Cada
+# regra olha uma janela pequena a partir de uma posicao e devolve quantos
+# itens consome e o que entra no lugar. As varreduras se repetem ate
+# nenhuma regra disparar.
+#
+# Regras que removem escritas usam a vivacidade dos registradores fisicos
+# com os efeitos implicitos da convencao de chamada: jal le $a0-$a3 e
+# destroi os registradores do chamador; syscall le $v0 e $a0; jr devolve
+# $v0/$v1 e os $s para quem chamou. Um `j` para fora da funcao e chamada
+# de cauda: le $a0-$a3 e, como o jr, deixa o resto para quem chamou. O jr
+# de uma tabela de saltos (com `alvos`) so le o registrador e segue para
+# os rotulos da tabela, que nunca sao removidos.
+# $sp, $fp, $ra e $zero nunca morrem.
+
+_SEMPRE_VIVOS = frozenset(["$sp", "$fp", "$ra", "$zero"])
+_RETORNO = ("$v0", "$v1") + REGISTRADORES_SALVOS + ("$sp", "$fp", "$ra")
+
+# Operacoes sem efeito alem de escrever o destino (div/mult mexem em HI/LO).
+_PURAS = frozenset([
+    "li", "la", "lw", "move", "neg", "not", "abs", "mflo", "mfhi",
+    "add", "addu", "sub", "subu", "mul", "and", "or", "xor", "nor",
+    "slt", "sltu", "seq", "sne", "sgt", "sge", "sle",
+    "addi", "addiu", "andi", "ori", "xori", "slti", "sltiu",
+    "sll", "srl", "sra", "sllv", "srlv", "srav",
+])
+
+_INVERSOS = {
+    "beq": "bne", "bne": "beq",
+    "blt": "bge", "bge": "blt",
+    "bgt": "ble", "ble": "bgt",
+    "beqz": "bnez", "bnez": "beqz",
+    "bltz": "bgez", "bgez": "bltz",
+    "bgtz": "blez", "blez": "bgtz",
+}
+
+
+def lidos(item, rotulos=None):
+    """
+    Registradores lidos, inclusive os implicitos de jal/syscall/jr. Com
+    `rotulos` (os da funcao), tambem os de um `j` para fora dela.
+    """
+    if not isinstance(item, Instrucao):
+        return []
+    usados = item.usados()
+    if item.op in CHAMADAS:
+        usados += REGISTRADORES_ARGUMENTO
+    elif item.op == "syscall":
+        usados += ["$v0", "$a0"]
+    elif item.op == "jr" and not item.alvos:
+        usados += _RETORNO
+    elif item.op == "j" and rotulos is not None and item.alvo() not in rotulos:
+        usados += REGISTRADORES_ARGUMENTO + _RETORNO
+    return usados
+
+
+def escritos(item):
+    if not isinstance(item, Instrucao):
+        return []
+    if item.op in CHAMADAS:
+        return item.definidos() + list(REGISTRADORES_CHAMADOR)
+    return item.definidos()
+
+
+class _Contexto:
+    """Lista sendo varrida + vivacidade depois de cada item e rotulos."""
+
+    def __init__(self, itens):
+        self.itens = itens
+        self.rotulos = {}
+        self.referenciados = set()
+        for indice, item in enumerate(itens):
+            if _eh_rotulo(item):
+                self.rotulos[item.nome] = indice
+            elif isinstance(item, Instrucao) and item.alvo() is not None:
+                self.referenciados.add(item.alvo())
+            elif isinstance(item, Instrucao) and item.alvos:
+                self.referenciados.update(item.alvos)
+
+        def lidos_aqui(item):
+            return lidos(item, self.rotulos)
+
+        self._vivacidade = GrafoFluxo(itens).vivacidade(lidos_aqui, escritos)
+        self._depois = self._vivacidade.depois()
+
+    def instrucao(self, indice, *ops):
+        """O item em `indice`, se for Instrucao (e de uma das `ops`)."""
+        if 0 <= indice < len(self.itens):
+            item = self.itens[indice]
+            if isinstance(item, Instrucao) and (not ops or item.op in ops):
+                return item
+        return None
+
+    def morto(self, registrador, indice):
+        """`registrador` nao e lido depois do item `indice`."""
+        return registrador not in _SEMPRE_VIVOS and not self._vivacidade.bit(registrador) & self._depois[indice]
+
+    def rotulos_seguintes(self, indice):
+        """Rotulos logo depois de `indice` (pulando comentarios)."""
+        nomes = set()
+        for item in self.itens[indice + 1:]:
+            if _eh_rotulo(item):
+                nomes.add(item.nome)
+            elif isinstance(item, Instrucao):
+                break
+        return nomes
+
+    def primeira_instrucao(self, rotulo):
+        indice = self.rotulos.get(rotulo)
+        if indice is None:
+            return None
+        for item in self.itens[indice + 1:]:
+            if isinstance(item, Instrucao):
+                return item
+        return None
+
+
+def _eh_rotulo(item):
+    return item.__class__.__name__ == "Rotulo"
+
+
+def _copiar(instrucao, *operandos):
+    return Instrucao(
+        instrucao.op, *(operandos or instrucao.operandos), comentario=instrucao.comentario, alvos=instrucao.alvos
+    )
+
+
+def _trocar_lidos(instrucao, antigo, novo):
+    """Copia de `instrucao` lendo `novo` onde lia `antigo` (escritas ficam)."""
+    formato = FORMATOS.get(instrucao.op, "")
+    operandos = []
+    for papel, operando in zip(formato, instrucao.operandos):
+        if papel == "u" and operando == antigo:
+            operando = novo
+        elif papel == "m" and base_memoria(operando) == antigo:
+            operando = operando[: operando.index("(") + 1] + novo + ")"
+        operandos.append(operando)
+    return _copiar(instrucao, *operandos)
+
+
+# ------------------------------------------
+# Regras: (contexto, indice) -> (itens consumidos, substitutos) ou None
+# ------------------------------------------
+
+def _move_inutil(ctx, i):
+    """move $x, $x"""
+    item = ctx.instrucao(i, "move")
+    if item is not None and item.operandos[0] == item.operandos[1]:
+        return 1, []
+    return None
+
+
+def _escrita_morta(ctx, i):
+    """Resultado que ninguem le (ex.: o nil de um print descartado)."""
+    item = ctx.instrucao(i)
+    if item is None or item.op not in _PURAS:
+        return None
+    destinos = item.definidos()
+    if destinos and all(ctx.morto(r, i) for r in destinos):
+        return 1, []
+    return None
+
+
+def _copia_encadeada(ctx, i):
+    """
+    op $t, ... ; ... ; move $x, $t  ->  op $x, ... ; ...   ($t morto depois)
+    As instrucoes do meio (sem rotulos nem desvios) nao podem tocar $t nem $x.
+    """
+    item = ctx.instrucao(i)
+    if item is None or item.op not in _PURAS:
+        return None
+    destinos = item.definidos()
+    if len(destinos) != 1:
+        return None
+    (temporario,) = destinos
+    meio = []
+    for j in range(i + 1, len(ctx.itens)):
+        seguinte = ctx.itens[j]
+        if _eh_rotulo(seguinte):
+            return None
+        if not isinstance(seguinte, Instrucao):
+            meio.append(seguinte)
+            continue
+        if seguinte.op == "move" and seguinte.operandos[1] == temporario:
+            destino = seguinte.operandos[0]
+            if destino == temporario or not ctx.morto(temporario, j):
+                return None
+            if any(destino in lidos(m) or destino in escritos(m) for m in meio):
+                return None
+            return j - i + 1, [_copiar(item, destino, *item.operandos[1:])] + meio
+        if (
+            seguinte.alvo() is not None
+            or seguinte.op in SALTOS
+            or temporario in lidos(seguinte)
+            or temporario in escritos(seguinte)
+        ):
+            return None
+        meio.append(seguinte)
+    return None
+
+
+def _propaga_copia(ctx, i):
+    """move $t, $s ; op ..., $t  ->  op ..., $s   ($t morto depois)"""
+    copia = ctx.instrucao(i, "move")
+    seguinte = ctx.instrucao(i + 1)
+    if copia is None or seguinte is None:
+        return None
+    destino, origem = copia.operandos
+    if destino == origem or destino not in seguinte.usados():
+        return None
+    if destino in _SEMPRE_VIVOS or not (ctx.morto(destino, i + 1) or destino in seguinte.definidos()):
+        return None
+    return 2, [_trocar_lidos(seguinte, destino, origem)]
+
+
+def _sw_lw(ctx, i):
+    """sw $r, M ; lw $x, M  ->  sw $r, M ; move $x, $r"""
+    escrita = ctx.instrucao(i, "sw")
+    leitura = ctx.instrucao(i + 1, "lw")
+    if escrita is None or leitura is None or escrita.operandos[1] != leitura.operandos[1]:
+        return None
+    origem, destino = escrita.operandos[0], leitura.operandos[0]
+    if destino == origem:
+        return 2, [escrita]
+    return 2, [escrita, Instrucao("move", destino, origem)]
+
+
+def _lw_sw(ctx, i):
+    """lw $r, M ; sw $r, M  ->  lw $r, M"""
+    leitura = ctx.instrucao(i, "lw")
+    escrita = ctx.instrucao(i + 1, "sw")
+    if leitura is None or escrita is None:
+        return None
+    registrador, memoria = leitura.operandos
+    if escrita.operandos != [registrador, memoria] or base_memoria(memoria) == registrador:
+        return None
+    return 2, [leitura]
+
+
+def _salto_proximo(ctx, i):
+    """j L ; L:   (ou um desvio condicional para L: os dois lados coincidem)"""
+    salto = ctx.instrucao(i, "j", *DESVIOS_CONDICIONAIS)
+    if salto is not None and salto.alvo() in ctx.rotulos_seguintes(i):
+        return 1, []
+    return None
+
+
+def _codigo_inalcancavel(ctx, i):
+    """Instrucoes entre um j/jr e o proximo rotulo."""
+    if ctx.instrucao(i) is None:
+        return None
+    for anterior in range(i - 1, -1, -1):
+        item = ctx.itens[anterior]
+        if _eh_rotulo(item):
+            return None
+        if isinstance(item, Instrucao):
+            return (1, []) if item.op in SALTOS else None
+    return None
+
+
+def _salto_encadeado(ctx, i):
+    """Desvio/salto para um rotulo cuja primeira instrucao e `j L2`."""
+    item = ctx.instrucao(i)
+    if item is None or (item.op != "j" and item.op not in DESVIOS_CONDICIONAIS):
+        return None
+    alvo = item.alvo()
+    vistos = {alvo}
+    while True:
+        primeira = ctx.primeira_instrucao(alvo)
+        if primeira is None or primeira.op != "j" or primeira.alvo() in vistos:
+            break
+        alvo = primeira.alvo()
+        vistos.add(alvo)
+    if alvo == item.alvo():
+        return None
+    return 1, [_copiar(item, *item.operandos[:-1], alvo)]
+
+
+def _desvio_invertido(ctx, i):
+    """b L1 ; j L2 ; L1:  ->  b_inverso L2 ; L1:"""
+    desvio = ctx.instrucao(i, *_INVERSOS)
+    salto = ctx.instrucao(i + 1, "j")
+    if desvio is None or salto is None or desvio.alvo() not in ctx.rotulos_seguintes(i + 1):
+        return None
+    invertido = Instrucao(_INVERSOS[desvio.op], *desvio.operandos[:-1], salto.alvo(), comentario=desvio.comentario)
+    return 2, [invertido]
+
+
+def _rotulo_sem_uso(ctx, i):
+    """Rotulo que nenhum desvio usa (junta blocos para as outras regras)."""
+    item = ctx.itens[i]
+    if not _eh_rotulo(item) or item.nome in ctx.referenciados:
+        return None
+    if item.nome == "main" or item.nome.startswith("func_"):
+        return None
+    return 1, []
+
+
+REGRAS = {
+    "codigo_inalcancavel": _codigo_inalcancavel,
+    "salto_proximo": _salto_proximo,
+    "salto_encadeado": _salto_encadeado,
+    "desvio_invertido": _desvio_invertido,
+    "rotulo_sem_uso": _rotulo_sem_uso,
+    "move_inutil": _move_inutil,
+    "sw_lw": _sw_lw,
+    "lw_sw": _lw_sw,
+    "copia_encadeada": _copia_encadeada,
+    "propaga_copia": _propaga_copia,
+    "escrita_morta": _escrita_morta,
+}
+
+
+class Peephole:
+    """
+    Args:
+        regras: nomes de REGRAS a aplicar, nessa ordem de prioridade
+            (padrao: todas)
+
+    `removidas` conta, por regra, quantos itens sairam (instrucoes ou,
+    em rotulo_sem_uso, rotulos); `aplicacoes`, quantas vezes disparou.
+    """
+
+    def __init__(self, regras=None):
+        nomes = tuple(REGRAS if regras is None else regras)
+        desconhecidas = set(nomes) - set(REGRAS)
+        if desconhecidas:
+            raise ValueError(f"Regras de peephole desconhecidas: {', '.join(sorted(desconhecidas))}")
+        self.regras = [(nome, REGRAS[nome]) for nome in nomes]
+        self.removidas = {nome: 0 for nome in nomes}
+        self.aplicacoes = {nome: 0 for nome in nomes}
+
+    @property
+    def total(self):
+        return sum(self.removidas.values())
+
+    def otimizar(self, itens):
+        itens = list(itens)
+        mudou = True
+        while mudou:
+            itens, mudou = self._varrer(itens)
+        return itens
+
+    def _varrer(self, itens):
+        ctx = _Contexto(itens)
+        saida = []
+        mudou = False
+        indice = 0
+        while indice < len(itens):
+            for nome, regra in self.regras:
+                resultado = regra(ctx, indice)
+                if resultado is not None:
+                    consumidos, substitutos = resultado
+                    self.aplicacoes[nome] += 1
+                    self.removidas[nome] += consumidos - len(substitutos)
+                    saida.extend(substitutos)
+                    indice += consumidos
+                    mudou = True
+                    break
+            else:
+                saida.append(itens[indice])
+                indice += 1
+        return saida, mudou
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main():
+    try:
+        from .InstrucoesMIPS import analisar_instrucao, renderizar
+    except ImportError:
+        from InstrucoesMIPS import analisar_instrucao, renderizar
+
+    codigo = """
+    li $t0, 7
+    move $a0, $t0
+    jal func_f
+    move $t1, $v0
+    move $a0, $t1
+    li $v0, 1
+    syscall
+    li $t2, 0
+    sw $t1, x
+    lw $t3, x
+    beq $t3, $zero, Fim
+    j Meio
+    li $v0, 0
+Meio:
+    j Fim
+Fim:
+    li $v0, 10
+    syscall
+    """
+    itens = [analisar_instrucao(linha) for linha in codigo.strip().splitlines()]
+    peephole = Peephole()
+    print(renderizar(peephole.otimizar(itens)))
+    for nome, total in peephole.removidas.items():
+        if peephole.aplicacoes[nome]:
+            print(f"{nome}: {peephole.aplicacoes[nome]} aplicacoes, {total} removidas")
+
+
+if __name__ == "__main__":
+    main()
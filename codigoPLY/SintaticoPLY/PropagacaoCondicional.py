@@ -0,0 +1,284 @@
+try:
+    from . import IR
+    from . import SSA
+except ImportError:
+    import IR
+    import SSA
+
+
+# ==============================================
+#   PROPAGACAO CONDICIONAL DE CONSTANTES (SCCP)
+# ==============================================
+#
+# Wegman & Zadeck sobre uma Funcao em SSA. Cada temporario tem um valor no
+# reticulado INDEFINIDO > constante > VARIAVEL e so blocos alcancados por
+# arestas executaveis contam: um Phi ignora argumentos de arestas que nunca
+# executam e um Desvio (ou Escolha) com valor constante so libera um dos
+# lados.
+#
+# Depois do ponto fixo:
+#   - temporario constante passa a ser definido por Const (os usos ficam
+#     iguais; NumeracaoValores/remover_mortas limpam o resto);
+#   - Desvio/Escolha com valor constante vira Salto;
+#   - blocos que nunca executam saem da funcao.
+#
+# A dobra segue o codigo gerado (e nao o Lua): inteiros de 32 bits com
+# estouro, divisao truncada, resto com o sinal do divisor, potencia com
+# expoente negativo valendo 0, booleanos como 0/1, and/or bit a bit e o
+# Desvio testando "diferente de zero". Divisao por zero fica para a execucao.
+
+_MIN_INT = -(2 ** 31)
+_MAX_INT = 2 ** 31 - 1
+
+_INDEFINIDO = object()
+_VARIAVEL = object()
+
+
+class PropagacaoCondicional:
+    def __init__(self):
+        self.constantes = 0  # definicoes trocadas por Const
+        self.desvios = 0  # Desvio/Escolha -> Salto
+        self.blocos_removidos = 0
+
+    def otimizar(self, funcao):
+        self._funcao = funcao
+        self._por_rotulo = {bloco.rotulo: bloco for bloco in funcao.blocos}
+        self._valores = {}  # numero do temp -> valor no reticulado
+        self._arestas = set()  # (origem, destino) executaveis
+        self._executaveis = set()
+        self._fluxo = [(None, funcao.entrada.rotulo)]
+        self._ssa = []
+
+        usos = {}
+        for bloco in funcao.blocos:
+            for instrucao in bloco.instrucoes + [bloco.terminador]:
+                for temp in instrucao.usados():
+                    usos.setdefault(temp.numero, []).append((bloco.rotulo, instrucao))
+
+        while self._fluxo or self._ssa:
+            while self._fluxo:
+                origem, destino = self._fluxo.pop()
+                if (origem, destino) in self._arestas:
+                    continue
+                self._arestas.add((origem, destino))
+                bloco = self._por_rotulo[destino]
+                if destino in self._executaveis:
+                    for phi in SSA.phis(bloco):
+                        self._avaliar(destino, phi)
+                    continue
+                self._executaveis.add(destino)
+                for instrucao in bloco.instrucoes + [bloco.terminador]:
+                    self._avaliar(destino, instrucao)
+            while self._ssa:
+                for rotulo, instrucao in usos.get(self._ssa.pop(), []):
+                    if rotulo in self._executaveis:
+                        self._avaliar(rotulo, instrucao)
+
+        self._reescrever()
+        return funcao
+
+    # ------------------------------------------
+    # Avaliacao
+    # ------------------------------------------
+
+    def _valor(self, temp):
+        return self._valores.get(temp.numero, _INDEFINIDO)
+
+    def _avaliar(self, rotulo, instrucao):
+        classe = instrucao.__class__.__name__
+        if classe == "Salto":
+            self._fluxo.append((rotulo, instrucao.alvo))
+        elif classe == "Desvio":
+            condicao = self._valor(instrucao.condicao)
+            if condicao is _VARIAVEL:
+                self._fluxo.append((rotulo, instrucao.verdadeiro))
+                self._fluxo.append((rotulo, instrucao.falso))
+            elif condicao is not _INDEFINIDO:
+                self._fluxo.append((rotulo, instrucao.verdadeiro if condicao else instrucao.falso))
+        elif classe == "Escolha":
+            valor = self._valor(instrucao.valor)
+            if valor is _VARIAVEL:
+                self._fluxo.extend((rotulo, alvo) for alvo in instrucao.sucessores())
+            elif valor is not _INDEFINIDO:
+                self._fluxo.append((rotulo, _caso(instrucao, valor)))
+        elif instrucao.destino is not None:
+            novo = self._calcular(rotulo, instrucao, classe)
+            if novo != self._valores.get(instrucao.destino.numero, _INDEFINIDO):
+                self._valores[instrucao.destino.numero] = novo
+                self._ssa.append(instrucao.destino.numero)
+
+    def _calcular(self, rotulo, instrucao, classe):
+        if classe == "Const":
+            return instrucao.valor if _eh_inteiro(instrucao.valor) else _VARIAVEL
+        if classe == "Copia":
+            return self._valor(instrucao.origem)
+        if classe == "Phi":
+            valor = _INDEFINIDO
+            for pred, argumento in instrucao.argumentos.items():
+                if (pred, rotulo) in self._arestas:
+                    valor = _encontro(valor, self._valor(argumento))
+            return valor
+        if classe in ("Unaria", "Binaria"):
+            operandos = [self._valor(temp) for temp in instrucao.usados()]
+            if any(valor is _VARIAVEL for valor in operandos):
+                return _VARIAVEL
+            if any(valor is _INDEFINIDO for valor in operandos):
+                return _INDEFINIDO
+            resultado = dobrar(instrucao.op, *operandos)
+            return _VARIAVEL if resultado is None else resultado
+        return _VARIAVEL  # Carrega, Chamada, Parametro, EnderecoString
+
+    # ------------------------------------------
+    # Reescrita
+    # ------------------------------------------
+
+    def _reescrever(self):
+        funcao = self._funcao
+        mantidos = []
+        for bloco in funcao.blocos:
+            if bloco.rotulo not in self._executaveis:
+                self.blocos_removidos += 1
+                continue
+            mantidos.append(bloco)
+            lista, resto, dobrados = [], [], []
+            for instrucao in bloco.instrucoes:
+                classe = instrucao.__class__.__name__
+                valor = self._valores.get(instrucao.destino.numero) if instrucao.destino is not None else None
+                if classe != "Const" and valor is not None and _eh_inteiro(valor):
+                    self.constantes += 1
+                    instrucao = IR.Const(instrucao.destino, valor)
+                    # Um Phi trocado por Const sai do grupo de Phi do inicio.
+                    (dobrados if classe == "Phi" else resto).append(instrucao)
+                elif classe == "Phi":
+                    instrucao.argumentos = {
+                        pred: temp for pred, temp in instrucao.argumentos.items()
+                        if (pred, bloco.rotulo) in self._arestas
+                    }
+                    lista.append(instrucao)
+                else:
+                    resto.append(instrucao)
+            bloco.instrucoes = lista + dobrados + resto
+
+            terminador = bloco.terminador
+            if terminador.__class__.__name__ == "Desvio":
+                condicao = self._valor(terminador.condicao)
+                if condicao is not _VARIAVEL and condicao is not _INDEFINIDO:
+                    self.desvios += 1
+                    bloco.terminador = IR.Salto(terminador.verdadeiro if condicao else terminador.falso)
+            elif terminador.__class__.__name__ == "Escolha":
+                valor = self._valor(terminador.valor)
+                if valor is not _VARIAVEL and valor is not _INDEFINIDO:
+                    self.desvios += 1
+                    bloco.terminador = IR.Salto(_caso(terminador, valor))
+        funcao.blocos = mantidos
+
+
+def _caso(escolha, valor):
+    """Rotulo para onde a Escolha vai com `valor`."""
+    for constante, rotulo in escolha.casos:
+        if constante == valor:
+            return rotulo
+    return escolha.padrao
+
+
+def _eh_inteiro(valor):
+    return type(valor) is int and _MIN_INT <= valor <= _MAX_INT
+
+
+def _encontro(a, b):
+    if a is _INDEFINIDO:
+        return b
+    if b is _INDEFINIDO:
+        return a
+    if a is _VARIAVEL or b is _VARIAVEL or a != b:
+        return _VARIAVEL
+    return a
+
+
+def _s32(valor):
+    return ((valor + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+
+
+def dobrar(op, x, y=None):
+    """Resultado de `op` sobre inteiros como no MIPS gerado, ou None."""
+    if op == "neg":
+        return _s32(-x)
+    if op == "not":
+        return int(x == 0)
+    if op == "add":
+        return _s32(x + y)
+    if op == "sub":
+        return _s32(x - y)
+    if op == "mul":
+        return _s32(x * y)
+    if op == "div":
+        if y == 0:
+            return None
+        quociente = abs(x) // abs(y)
+        return _s32(-quociente if (x < 0) != (y < 0) else quociente)
+    if op == "mod":
+        return x % y if y != 0 else None
+    if op == "pow":
+        return _s32(pow(x, y, 1 << 32)) if y >= 0 else 0
+    if op == "and":
+        return x & y
+    if op == "or":
+        return x | y
+    comparacoes = {
+        "eq": x == y,
+        "ne": x != y,
+        "lt": x < y,
+        "le": x <= y,
+        "gt": x > y,
+        "ge": x >= y,
+    }
+    if op in comparacoes:
+        return int(comparacoes[op])
+    return None
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main():
+    import os
+    import sys
+
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    try:
+        from .VisitorSemantico import _criar_parser
+        from .InferenciaTipos import InferenciaTipos
+        from .GeradorAssembly import GeradorAssembly
+    except ImportError:
+        from VisitorSemantico import _criar_parser
+        from InferenciaTipos import InferenciaTipos
+        from GeradorAssembly import GeradorAssembly
+
+    codigo = """
+    local depurar = false
+    local x = 10
+    if depurar then
+        x = 20
+    end
+    print(x * 2)
+    """
+    arvore = _criar_parser().parse(codigo)
+    gerador = GeradorAssembly(tipos=InferenciaTipos(arvore))
+    arvore.accept(gerador)
+    modulo = gerador.finalizar()
+    funcao = modulo.principal
+    SSA.construir_ssa(funcao, SSA.promoviveis(funcao, SSA.efeitos_globais(modulo)))
+    sccp = PropagacaoCondicional()
+    sccp.otimizar(funcao)
+    SSA.propagar_copias(funcao)
+    SSA.remover_mortas(funcao)
+    print(funcao)
+    print(f"\nconstantes: {sccp.constantes}, desvios: {sccp.desvios}, "
+          f"blocos removidos: {sccp.blocos_removidos}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+try:
+    from . import AbstractVisitor
+    from . import IR
+    from . import SymbolTable as st
+    from .AuxiliarAST import nome_no, ramos_elseif
+except ImportError:
+    import AbstractVisitor
+    import IR
+    import SymbolTable as st
+    from AuxiliarAST import nome_no, ramos_elseif
+
+
+# ==============================================
+#   QUADROS DE PILHA (LAYOUT DAS VARIAVEIS)
+# ==============================================
+#
+# Passada anterior ao GeradorAssembly: refaz a resolucao de nomes com a
+# SymbolTable (os mesmos escopos do VisitorSemantico) e decide onde cada
+# variavel mora:
+#   - locais e parametros de uma funcao: slot no quadro da funcao, no
+#     offset que a SymbolTable deu ao simbolo (enter_function recomeca a
+#     contagem em 0);
+#   - globais, locais do nivel superior e locais lidas por funcoes
+#     aninhadas (upvalues, sem suporte a closures): `.word` em .data.
+#
+# Quadro de uma funcao, relativo a $fp (= $sp de quem chamou):
+#   4*(i-4)($fp)  parametro i alem de $a3 (area de saida de quem chamou)
+#   -4($fp)  $ra
+#   -8($fp)  $fp anterior
+#   -12($fp) - 4*offset   locais/parametros
+#   abaixo:  $s salvos, slots de spill e $t guardados (AlocadorRegistradores)
+#   0($sp)   area de saida: argumentos alem do quarto das chamadas feitas
+
+CABECALHO_QUADRO = 8  # $ra + $fp
+
+
+class QuadrosPilha(AbstractVisitor.AbstractVisitor):
+    """
+    Args:
+        arvore: AST ja validada pelo VisitorSemantico
+        builtins: escopo pre-definido (padrao: st.DEFAULT_BUILTINS)
+    """
+
+    def __init__(self, arvore, builtins=None):
+        super().__init__()
+        self.slots = {}  # nome da funcao -> slots de locais no quadro
+        self._simbolos = {}  # id(no) -> simbolo (ou lista, para parametros)
+        self._dono = {}  # id(simbolo) -> funcao que o declarou (None = nivel superior)
+        self._capturados = set()  # id(simbolo) lido/escrito por funcao aninhada
+        self._rotulos = {}  # id(simbolo) ou ("global", nome) -> rotulo em .data
+        self._usados = set()
+        self._funcao = None
+
+        st.reset_table(builtins=st.DEFAULT_BUILTINS if builtins is None else builtins)
+        arvore.accept(self)
+
+    # ------------------------------------------
+    # Consulta
+    # ------------------------------------------
+
+    def variavel(self, node):
+        """IR.Variavel de um Var/Assign/For: slot no quadro ou global."""
+        return self._variavel(self._simbolos.get(id(node)), _nome_variavel(node))
+
+    def parametros(self, node):
+        """IR.Variavel de cada parametro de um FunctionDecl, na ordem."""
+        simbolos = self._simbolos.get(id(node), [])
+        return [self._variavel(simbolo, nome_no(p)) for simbolo, p in zip(simbolos, node.params)]
+
+    def _no_quadro(self, simbolo):
+        return (
+            simbolo is not None
+            and simbolo.get(st.IS_LOCAL)
+            and self._dono.get(id(simbolo)) is not None
+            and id(simbolo) not in self._capturados
+        )
+
+    def _variavel(self, simbolo, nome):
+        if self._no_quadro(simbolo):
+            return IR.Variavel(nome, simbolo[st.OFFSET])
+        return IR.Variavel(self._rotulo(simbolo, nome))
+
+    def _rotulo(self, simbolo, nome):
+        if simbolo is None or not simbolo.get(st.IS_LOCAL):
+            chave = ("global", nome)
+        else:
+            chave = id(simbolo)
+        if chave not in self._rotulos:
+            # Locais do nivel superior podem sombrear outra variavel de mesmo nome.
+            rotulo = nome
+            sufixo = 1
+            while rotulo in self._usados:
+                sufixo += 1
+                rotulo = f"{nome}_{sufixo}"
+            self._usados.add(rotulo)
+            self._rotulos[chave] = rotulo
+        return self._rotulos[chave]
+
+    # ------------------------------------------
+    # Resolucao (mesmos escopos do VisitorSemantico)
+    # ------------------------------------------
+
+    def _declarar(self, node, nome, is_local):
+        try:
+            st.add_variable(nome, is_local=is_local)
+        except Exception:
+            pass  # redeclaracao ja reportada pelo VisitorSemantico
+        simbolo = st.lookup_symbol(nome, current_scope_only=True)
+        self._dono.setdefault(id(simbolo), self._funcao)
+        if node is not None:
+            self._simbolos[id(node)] = simbolo
+        return simbolo
+
+    def _usar(self, node, nome):
+        simbolo = st.lookup_symbol(nome)
+        if simbolo is None or simbolo[st.SCOPE] == st.BUILTIN_SCOPE:
+            return
+        self._simbolos[id(node)] = simbolo
+        dono = self._dono.get(id(simbolo))
+        if simbolo.get(st.IS_LOCAL) and dono is not None and dono != self._funcao:
+            self._capturados.add(id(simbolo))
+
+    def visitNumber(self, node):
+        pass
+
+    def visitString(self, node):
+        pass
+
+    def visitBoolean(self, node):
+        pass
+
+    def visitNil(self, node):
+        pass
+
+    def visitVar(self, node):
+        self._usar(node, nome_no(node.name))
+
+    def visitUnOp(self, node):
+        node.operand.accept(self)
+
+    def visitBinOp(self, node):
+        node.left.accept(self)
+        node.right.accept(self)
+
+    def visitFunctionCall(self, node):
+        for arg in node.args:
+            arg.accept(self)
+
+    def visitAssign(self, node):
+        node.exp.accept(self)
+        nome = nome_no(node.name)
+        if getattr(node, "is_local", False):
+            self._declarar(node, nome, is_local=True)
+            return
+        if st.lookup_symbol(nome) is None:
+            self._declarar(None, nome, is_local=False)
+        self._usar(node, nome)
+
+    def visitFunctionDecl(self, node):
+        nome = nome_no(node.name)
+        try:
+            # Mesmo registro do VisitorSemantico, para os offsets coincidirem.
+            st.add_function(nome, params=[nome_no(p) for p in node.params])
+        except Exception:
+            pass
+        funcao = self._funcao
+        self._funcao = nome
+        st.enter_function()
+        self._simbolos[id(node)] = [
+            self._declarar(None, nome_no(param), is_local=True) for param in node.params
+        ]
+        node.body.accept(self)
+        self.slots[nome] = st.exit_function()
+        self._funcao = funcao
+
+    def visitFor(self, node):
+        node.start.accept(self)
+        node.end.accept(self)
+        if node.step is not None:
+            node.step.accept(self)
+        st.enter_scope()
+        self._declarar(node, nome_no(node.var), is_local=True)
+        node.body.accept(self)
+        st.exit_scope()
+
+    def visitWhile(self, node):
+        node.condition.accept(self)
+        self._em_escopo(node.body)
+
+    def visitReturn(self, node):
+        if node.exp is not None:
+            node.exp.accept(self)
+
+    def visitIf(self, node):
+        node.condition.accept(self)
+        self._em_escopo(node.then_body)
+        for condicao, corpo in ramos_elseif(node.elseif_list):
+            condicao.accept(self)
+            self._em_escopo(corpo)
+        if node.else_body:
+            self._em_escopo(node.else_body)
+
+    def visitBlock(self, node):
+        for stmt in node.statements or []:
+            stmt.accept(self)
+
+    def _em_escopo(self, bloco):
+        st.enter_scope()
+        bloco.accept(self)
+        st.exit_scope()
+
+
+def _nome_variavel(node):
+    if node.__class__.__name__ == "For":
+        return nome_no(node.var)
+    return nome_no(node.name)
@@ -0,0 +1,124 @@
+from collections import Counter
+
+try:
+    from . import IR
+except ImportError:
+    import IR
+
+
+# ==============================================
+#   RECURSAO DE CAUDA -> LACO
+# ==============================================
+#
+# `return f(...)` dentro da propria f vira laco: os argumentos (ja
+# calculados em temporarios) sao guardados nas variaveis dos parametros e
+# o bloco salta de volta para o inicio do corpo. Uma entrada nova, vazia,
+# passa a ser o primeiro bloco, para o inicio do corpo poder ser alvo de
+# saltos (e receber os Phi quando a SSA promover os parametros).
+#
+# Roda na IR que sai do GeradorAssembly, antes da SSA e da expansao em
+# linha: a funcao deixa de ser recursiva e pode ate ser expandida. As
+# chamadas de cauda para outras funcoes ficam para o EmissorMIPS (que
+# desmonta o quadro e usa `j` no lugar de `jal`).
+
+
+def chamada_de_cauda(bloco, usos):
+    """A Chamada cujo resultado o bloco devolve direto, ou None."""
+    terminador = bloco.terminador
+    if terminador.__class__.__name__ != "Retorno" or terminador.valor is None or not bloco.instrucoes:
+        return None
+    chamada = bloco.instrucoes[-1]
+    if chamada.__class__.__name__ != "Chamada" or chamada.destino is None:
+        return None
+    if chamada.destino.numero != terminador.valor.numero or usos[chamada.destino.numero] != 1:
+        return None
+    return chamada
+
+
+class RecursaoCauda:
+    def __init__(self):
+        self.funcoes = 0  # funcoes que viraram laco
+        self.chamadas = 0  # chamadas recursivas trocadas por salto
+
+    def otimizar(self, funcao):
+        if funcao.nome == IR.PRINCIPAL or not funcao.blocos:
+            return funcao
+        usos = Counter(temp.numero for instrucao in funcao.instrucoes() for temp in instrucao.usados())
+        caudas = []
+        for bloco in funcao.blocos:
+            chamada = chamada_de_cauda(bloco, usos)
+            if (
+                chamada is not None
+                and chamada.funcao == funcao.nome
+                and len(chamada.argumentos) == len(funcao.parametros)
+            ):
+                caudas.append(bloco)
+        if not caudas:
+            return funcao
+
+        corpo = funcao.entrada
+        entrada = IR.Bloco(f"func_{funcao.nome}_entrada")
+        entrada.terminador = IR.Salto(corpo.rotulo)
+        funcao.blocos.insert(0, entrada)
+        for bloco in caudas:
+            chamada = bloco.instrucoes.pop()
+            for parametro, argumento in zip(funcao.parametros, chamada.argumentos):
+                bloco.instrucoes.append(IR.Armazena(parametro, argumento))
+            bloco.terminador = IR.Salto(corpo.rotulo)
+        self.funcoes += 1
+        self.chamadas += len(caudas)
+        return funcao
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main():
+    import os
+    import sys
+
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    try:
+        from .Compilador import Compilador
+        from .SimuladorMIPS import simular
+    except ImportError:
+        from Compilador import Compilador
+        from SimuladorMIPS import simular
+
+    # Sem a otimizacao cada volta de `conta` empilharia um quadro (o
+    # Benchmarks.py verifica a mesma funcao com 10 milhoes de voltas).
+    # `digitos` chama `conta` em cauda (vira `j`).
+    codigo = """
+    function conta(n, total)
+        if n == 0 then
+            return total
+        end
+        return conta(n - 1, total + n % 7)
+    end
+    function digitos(n, base)
+        if n < base then
+            return 1
+        end
+        local resto = n / base
+        print(resto)
+        return conta(resto, 1)
+    end
+    print(conta(100000, 0))
+    print(digitos(12345, 10))
+    print(digitos(99, 10))
+    """
+    resultado = Compilador().compilar(codigo)
+    print(IR.formatar(resultado.ir))
+    estatisticas = resultado.estatisticas
+    print(f"recursoes em laco: {estatisticas['recursoes_em_laco']}, "
+          f"chamadas de cauda com j: {estatisticas['chamadas_de_cauda']}")
+    execucao = simular(resultado.assembly)
+    print(execucao.saida, end="")
+    print(f"{execucao.instrucoes} instrucoes, {execucao.pilha} bytes de pilha no pico")
+
+
+if __name__ == "__main__":
+    main()
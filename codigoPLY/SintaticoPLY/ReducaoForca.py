@@ -0,0 +1,227 @@
+try:
+    from .InstrucoesMIPS import Instrucao
+except ImportError:
+    from InstrucoesMIPS import Instrucao
+
+
+# ==============================================
+#   REDUCAO DE FORCA (OPERACOES COM CONSTANTE)
+# ==============================================
+#
+# Sequencias MIPS que trocam mul/div por deslocamentos e somas quando um
+# operando e constante. Cada funcao recebe o registrador de destino, o da
+# origem, a constante e `novo` (devolve um registrador virtual livre) e
+# devolve a lista de Instrucao, ou None quando nao compensa.
+#
+# Nas contas, mul custa ~12 ciclos e div ~35 (ver SimuladorMIPS); as
+# sequencias podem ter mais instrucoes e ainda assim sair mais baratas.
+#
+#   multiplicar: 0, +-1, +-2^k, 2^a + 1, 2^a - 1 e 1 - 2^a (ate duas
+#                instrucoes);
+#   dividir:     divisao truncada (como div); potencias de 2 com correcao
+#                do arredondamento de negativos e as outras constantes
+#                com o numero magico de Hacker's Delight (cap. 10);
+#   resto:       `%` do Lua (o resultado tem o sinal do divisor) por
+#                potencia de 2 positiva vira uma mascara;
+#   potencia:    expoente constante por quadrados sucessivos
+#                (expoente negativo da 0: o backend so tem inteiros).
+
+_MIN_INT = -(2 ** 31)
+_LIMITE_ANDI = 0xFFFF
+
+
+def _s32(valor):
+    return ((valor + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+
+
+def _log2(valor):
+    """k se valor == 2^k (valor > 0), senao None."""
+    if valor > 0 and valor & (valor - 1) == 0:
+        return valor.bit_length() - 1
+    return None
+
+
+def multiplicar(destino, origem, constante, novo):
+    if constante == 0:
+        return [Instrucao("move", destino, "$zero")]
+    if constante == 1:
+        return [Instrucao("move", destino, origem)]
+    if constante == -1:
+        return [Instrucao("subu", destino, "$zero", origem)]
+    k = _log2(abs(constante))
+    if k is not None and constante != _MIN_INT:
+        if constante > 0:
+            return [Instrucao("sll", destino, origem, str(k))]
+        parcial = novo()
+        return [
+            Instrucao("sll", parcial, origem, str(k)),
+            Instrucao("subu", destino, "$zero", parcial),
+        ]
+    for k, op, primeiro in (
+        (_log2(constante - 1), "addu", None),  # 2^k + 1: (x << k) + x
+        (_log2(constante + 1), "subu", None),  # 2^k - 1: (x << k) - x
+        (_log2(1 - constante), "subu", origem),  # 1 - 2^k: x - (x << k)
+    ):
+        if k is not None and 0 < k < 31:
+            parcial = novo()
+            if primeiro is None:
+                operandos = (parcial, origem)
+            else:
+                operandos = (origem, parcial)
+            return [
+                Instrucao("sll", parcial, origem, str(k)),
+                Instrucao(op, destino, *operandos),
+            ]
+    return None
+
+
+def magica(divisor):
+    """
+    (M, s) para a divisao truncada por `divisor` (2 <= |divisor| < 2^31):
+    q = ((x * M) >> 32 [+- x]) >> s, mais 1 se o resultado for negativo.
+    """
+    absoluto = abs(divisor)
+    dois_31 = 1 << 31
+    t = dois_31 + (1 if divisor < 0 else 0)
+    anc = t - 1 - t % absoluto
+    p = 31
+    q1, r1 = divmod(dois_31, anc)
+    q2, r2 = divmod(dois_31, absoluto)
+    while True:
+        p += 1
+        q1, r1 = 2 * q1, 2 * r1
+        if r1 >= anc:
+            q1, r1 = q1 + 1, r1 - anc
+        q2, r2 = 2 * q2, 2 * r2
+        if r2 >= absoluto:
+            q2, r2 = q2 + 1, r2 - absoluto
+        delta = absoluto - r2
+        if not (q1 < delta or (q1 == delta and r1 == 0)):
+            break
+    multiplicador = _s32(q2 + 1)
+    if divisor < 0:
+        multiplicador = _s32(-multiplicador)
+    return multiplicador, p - 32
+
+
+def dividir(destino, origem, constante, novo):
+    if constante == 0 or constante == _MIN_INT:
+        return None
+    if constante == 1:
+        return [Instrucao("move", destino, origem)]
+    if constante == -1:
+        return [Instrucao("subu", destino, "$zero", origem)]
+
+    k = _log2(abs(constante))
+    if k is not None:
+        # Soma 2^k - 1 aos negativos para o deslocamento truncar para zero.
+        sinal, ajustado = novo(), novo()
+        if k == 1:
+            itens = [Instrucao("srl", sinal, origem, "31")]
+        else:
+            itens = [
+                Instrucao("sra", sinal, origem, "31"),
+                Instrucao("srl", sinal, sinal, str(32 - k)),
+            ]
+        itens += [Instrucao("addu", ajustado, origem, sinal)]
+        if constante > 0:
+            return itens + [Instrucao("sra", destino, ajustado, str(k))]
+        quociente = novo()
+        return itens + [
+            Instrucao("sra", quociente, ajustado, str(k)),
+            Instrucao("subu", destino, "$zero", quociente),
+        ]
+
+    multiplicador, deslocamento = magica(constante)
+    fator, alto, correcao = novo(), novo(), novo()
+    itens = [
+        Instrucao("li", fator, str(multiplicador)),
+        Instrucao("mult", origem, fator),
+        Instrucao("mfhi", alto),
+    ]
+    if constante > 0 and multiplicador < 0:
+        itens.append(Instrucao("addu", alto, alto, origem))
+    elif constante < 0 and multiplicador > 0:
+        itens.append(Instrucao("subu", alto, alto, origem))
+    if deslocamento:
+        itens.append(Instrucao("sra", alto, alto, str(deslocamento)))
+    # +1 quando o quociente e negativo (o deslocamento arredondou para baixo).
+    negativo = origem if constante > 0 else alto
+    itens += [
+        Instrucao("srl", correcao, negativo, "31"),
+        Instrucao("addu", destino, alto, correcao),
+    ]
+    return itens
+
+
+def resto(destino, origem, constante, novo):
+    k = _log2(constante)
+    if k is None:
+        return None
+    if constante == 1:
+        return [Instrucao("move", destino, "$zero")]
+    mascara = constante - 1
+    if mascara <= _LIMITE_ANDI:
+        return [Instrucao("andi", destino, origem, str(mascara))]
+    registrador = novo()
+    return [
+        Instrucao("li", registrador, str(mascara)),
+        Instrucao("and", destino, origem, registrador),
+    ]
+
+
+def potencia(destino, base, expoente, novo):
+    if expoente < 0:
+        return [Instrucao("move", destino, "$zero")]
+    if expoente == 0:
+        return [Instrucao("li", destino, "1")]
+    # Bits do expoente do mais alto para o mais baixo: eleva ao quadrado e,
+    # se o bit e 1, multiplica pela base.
+    itens = []
+    atual = base
+    for bit in bin(expoente)[3:]:
+        quadrado = novo()
+        itens.append(Instrucao("mul", quadrado, atual, atual))
+        atual = quadrado
+        if bit == "1":
+            produto = novo()
+            itens.append(Instrucao("mul", produto, atual, base))
+            atual = produto
+    if not itens:
+        return [Instrucao("move", destino, base)]
+    itens[-1].operandos[0] = destino
+    return itens
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main():
+    try:
+        from .InstrucoesMIPS import renderizar
+    except ImportError:
+        from InstrucoesMIPS import renderizar
+
+    contador = iter(range(1000))
+
+    def novo():
+        return f"%{next(contador)}"
+
+    exemplos = [
+        ("x * 8", multiplicar, 8),
+        ("x * 9", multiplicar, 9),
+        ("x * -7", multiplicar, -7),
+        ("x / 4", dividir, 4),
+        ("x / -2", dividir, -2),
+        ("x / 7", dividir, 7),
+        ("x % 16", resto, 16),
+        ("x ^ 5", potencia, 5),
+    ]
+    for titulo, funcao, constante in exemplos:
+        print(f"# {titulo}")
+        print(renderizar(funcao("$v0", "$a0", constante, novo)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,528 @@
+try:
+    from . import IR
+except ImportError:
+    import IR
+
+
+# ==============================================
+#   FORMA SSA (CONSTRUCAO E SAIDA)
+# ==============================================
+#
+# Roda sobre cada Funcao da IR, entre o GeradorAssembly e o EmissorMIPS:
+#
+#   construir_ssa: promove variaveis para temporarios (Cytron et al.):
+#     Phi nas fronteiras de dominancia iteradas de cada Armazena e
+#     renomeacao pela arvore de dominadores. Carrega vira Copia do valor
+#     atual e Armazena some.
+#   propagar_copias: usos de `a = b` passam a ler b direto.
+#   remover_mortas: tira instrucoes sem efeito cujo resultado ninguem usa
+#     (marca e varre, entao ciclos de Phi mortos tambem saem).
+#   sair_da_ssa: quebra arestas criticas e troca cada Phi por copias no
+#     fim dos predecessores (copias paralelas sequencializadas).
+#
+# Variaveis promoviveis (ver promoviveis):
+#   - slots do quadro: so a propria funcao enxerga (upvalues ja moram em
+#     .data, ver QuadrosPilha);
+#   - globais no main, desde que nenhuma funcao chamada pelo main (direta
+#     ou indiretamente) leia ou escreva a variavel. Nas outras funcoes as
+#     globais continuam na memoria: quem chamou pode ler depois.
+
+_SEM_EFEITO = ("Const", "EnderecoString", "Copia", "Unaria", "Binaria", "Carrega", "Phi", "Parametro")
+
+
+# ------------------------------------------
+# Grafo de fluxo
+# ------------------------------------------
+
+def sucessores(bloco):
+    """Sucessores sem repeticao (um Desvio pode ter os dois lados iguais)."""
+    return list(dict.fromkeys(bloco.sucessores()))
+
+
+def predecessores(funcao):
+    """rotulo -> rotulos dos predecessores, so entre blocos alcancaveis."""
+    alcancaveis = funcao.alcancaveis()
+    preds = {bloco.rotulo: [] for bloco in funcao.blocos if bloco.rotulo in alcancaveis}
+    for bloco in funcao.blocos:
+        if bloco.rotulo in alcancaveis:
+            for alvo in sucessores(bloco):
+                preds[alvo].append(bloco.rotulo)
+    return preds
+
+
+def phis(bloco):
+    """Phi do inicio do bloco."""
+    saida = []
+    for instrucao in bloco.instrucoes:
+        if instrucao.__class__.__name__ != "Phi":
+            break
+        saida.append(instrucao)
+    return saida
+
+
+def remover_inalcancaveis(funcao):
+    """Tira blocos inalcancaveis (e os argumentos de Phi vindos deles)."""
+    alcancaveis = funcao.alcancaveis()
+    removidos = len(funcao.blocos) - len(alcancaveis)
+    if removidos:
+        funcao.blocos = [bloco for bloco in funcao.blocos if bloco.rotulo in alcancaveis]
+        preds = predecessores(funcao)
+        for bloco in funcao.blocos:
+            for phi in phis(bloco):
+                phi.argumentos = {
+                    rotulo: t for rotulo, t in phi.argumentos.items() if rotulo in preds[bloco.rotulo]
+                }
+    return removidos
+
+
+def ordem_reversa(funcao):
+    """Blocos alcancaveis em pos-ordem reversa (a entrada primeiro)."""
+    por_rotulo = {bloco.rotulo: bloco for bloco in funcao.blocos}
+    vistos = {funcao.entrada.rotulo}
+    pos_ordem = []
+    pilha = [(funcao.entrada, iter(sucessores(funcao.entrada)))]
+    while pilha:
+        bloco, pendentes = pilha[-1]
+        for rotulo in pendentes:
+            if rotulo not in vistos and rotulo in por_rotulo:
+                vistos.add(rotulo)
+                filho = por_rotulo[rotulo]
+                pilha.append((filho, iter(sucessores(filho))))
+                break
+        else:
+            pilha.pop()
+            pos_ordem.append(bloco)
+    return pos_ordem[::-1]
+
+
+def dominadores(funcao, preds=None):
+    """
+    rotulo -> dominador imediato (None para a entrada), pelo algoritmo
+    iterativo de Cooper, Harvey e Kennedy.
+    """
+    preds = predecessores(funcao) if preds is None else preds
+    ordem = [bloco.rotulo for bloco in ordem_reversa(funcao)]
+    indice = {rotulo: i for i, rotulo in enumerate(ordem)}
+    entrada = ordem[0]
+    idom = {entrada: entrada}
+
+    def intersecao(a, b):
+        while a != b:
+            while indice[a] > indice[b]:
+                a = idom[a]
+            while indice[b] > indice[a]:
+                b = idom[b]
+        return a
+
+    mudou = True
+    while mudou:
+        mudou = False
+        for rotulo in ordem[1:]:
+            processados = [p for p in preds[rotulo] if p in idom]
+            novo = processados[0]
+            for pred in processados[1:]:
+                novo = intersecao(pred, novo)
+            if idom.get(rotulo) != novo:
+                idom[rotulo] = novo
+                mudou = True
+    idom[entrada] = None
+    return idom
+
+
+def filhos_dominancia(funcao, idom):
+    """rotulo -> filhos na arvore de dominadores, na ordem dos blocos."""
+    filhos = {rotulo: [] for rotulo in idom}
+    for bloco in funcao.blocos:
+        pai = idom.get(bloco.rotulo)
+        if pai is not None:
+            filhos[pai].append(bloco.rotulo)
+    return filhos
+
+
+def fronteiras_dominancia(idom, preds):
+    fronteiras = {rotulo: set() for rotulo in idom}
+    for rotulo, anteriores in preds.items():
+        if len(anteriores) < 2:
+            continue
+        for pred in anteriores:
+            corredor = pred
+            while corredor != idom[rotulo]:
+                fronteiras[corredor].add(rotulo)
+                corredor = idom[corredor]
+    return fronteiras
+
+
+def domina(idom, a, b):
+    """O bloco `a` domina o bloco `b`."""
+    while b is not None:
+        if b == a:
+            return True
+        b = idom[b]
+    return False
+
+
+def lacos_naturais(idom, preds):
+    """
+    Cabecalho -> blocos do laco natural, juntando as arestas de volta
+    (b -> h com h dominando b) que chegam no mesmo cabecalho.
+    """
+    lacos = {}
+    for rotulo, anteriores in preds.items():
+        for pred in anteriores:
+            if not domina(idom, rotulo, pred):
+                continue
+            corpo = lacos.setdefault(rotulo, {rotulo})
+            pilha = [pred]
+            while pilha:
+                atual = pilha.pop()
+                if atual not in corpo:
+                    corpo.add(atual)
+                    pilha.extend(preds[atual])
+    return lacos
+
+
+# ------------------------------------------
+# Efeitos das chamadas
+# ------------------------------------------
+
+def efeitos_globais(modulo):
+    """
+    funcao -> (globais lidas, globais escritas), incluindo o que as funcoes
+    chamadas (direta ou indiretamente) fazem.
+    """
+    lidas, escritas, chamadas = {}, {}, {}
+    for nome, funcao in modulo.funcoes.items():
+        lidas[nome], escritas[nome], chamadas[nome] = set(), set(), set()
+        for instrucao in funcao.instrucoes():
+            classe = instrucao.__class__.__name__
+            if classe == "Carrega" and instrucao.variavel.global_:
+                lidas[nome].add(instrucao.variavel.nome)
+            elif classe == "Armazena" and instrucao.variavel.global_:
+                escritas[nome].add(instrucao.variavel.nome)
+            elif classe == "Chamada" and instrucao.funcao in modulo.funcoes:
+                chamadas[nome].add(instrucao.funcao)
+
+    mudou = True
+    while mudou:
+        mudou = False
+        for nome in modulo.funcoes:
+            for chamada in chamadas[nome]:
+                novas_lidas = lidas[chamada] - lidas[nome]
+                novas_escritas = escritas[chamada] - escritas[nome]
+                if novas_lidas or novas_escritas:
+                    lidas[nome] |= novas_lidas
+                    escritas[nome] |= novas_escritas
+                    mudou = True
+    return {nome: (lidas[nome], escritas[nome]) for nome in modulo.funcoes}
+
+
+def promoviveis(funcao, efeitos):
+    """Variaveis de `funcao` que podem virar temporarios (ver cabecalho)."""
+    acessadas = {
+        instrucao.variavel
+        for instrucao in funcao.instrucoes()
+        if instrucao.__class__.__name__ in ("Carrega", "Armazena")
+    }
+    tocadas = set()
+    if funcao.nome == IR.PRINCIPAL:
+        for instrucao in funcao.instrucoes():
+            if instrucao.__class__.__name__ == "Chamada" and instrucao.funcao in efeitos:
+                lidas, escritas = efeitos[instrucao.funcao]
+                tocadas |= lidas | escritas
+    promover = set()
+    for variavel in acessadas:
+        if variavel.global_:
+            if funcao.nome == IR.PRINCIPAL and variavel.nome not in tocadas:
+                promover.add(variavel)
+        else:
+            promover.add(variavel)
+    return promover
+
+
+# ------------------------------------------
+# Construcao
+# ------------------------------------------
+
+def construir_ssa(funcao, variaveis):
+    """Promove `variaveis` para temporarios; devolve quantas foram promovidas."""
+    if not variaveis:
+        return 0
+    remover_inalcancaveis(funcao)
+    variaveis = sorted(variaveis, key=str)
+    preds = predecessores(funcao)
+    idom = dominadores(funcao, preds)
+    fronteiras = fronteiras_dominancia(idom, preds)
+    por_rotulo = {bloco.rotulo: bloco for bloco in funcao.blocos}
+    entrada = funcao.entrada
+
+    # Valor na entrada: o argumento (parametros) ou 0 (.word 0 / nil).
+    iniciais = {}
+    for variavel in variaveis:
+        temp = funcao.novo_temp(IR.QUALQUER)
+        if variavel in funcao.parametros:
+            iniciais[variavel] = IR.Parametro(temp, funcao.parametros.index(variavel))
+        else:
+            iniciais[variavel] = IR.Const(temp, 0)
+    entrada.instrucoes[0:0] = [iniciais[variavel] for variavel in variaveis]
+
+    # Phi nas fronteiras de dominancia iteradas das definicoes.
+    novos_phi = {rotulo: [] for rotulo in por_rotulo}
+    for variavel in variaveis:
+        definicoes = {entrada.rotulo}
+        for bloco in funcao.blocos:
+            if any(
+                instrucao.__class__.__name__ == "Armazena" and instrucao.variavel == variavel
+                for instrucao in bloco.instrucoes
+            ):
+                definicoes.add(bloco.rotulo)
+        pendentes = list(definicoes)
+        com_phi = set()
+        while pendentes:
+            for rotulo in fronteiras[pendentes.pop()]:
+                if rotulo in com_phi:
+                    continue
+                com_phi.add(rotulo)
+                novos_phi[rotulo].append((variavel, IR.Phi(funcao.novo_temp(IR.QUALQUER))))
+                if rotulo not in definicoes:
+                    definicoes.add(rotulo)
+                    pendentes.append(rotulo)
+
+    # Renomeacao: pilha do valor atual de cada variavel, descendo a arvore.
+    atuais = {variavel: [iniciais[variavel].destino] for variavel in variaveis}
+    promovidas = set(variaveis)
+    filhos = filhos_dominancia(funcao, idom)
+    trabalho = [(entrada.rotulo, None)]
+    while trabalho:
+        rotulo, empilhadas = trabalho.pop()
+        if empilhadas is not None:
+            for variavel in empilhadas:
+                atuais[variavel].pop()
+            continue
+        bloco = por_rotulo[rotulo]
+        empilhadas = []
+        for variavel, phi in novos_phi[rotulo]:
+            atuais[variavel].append(phi.destino)
+            empilhadas.append(variavel)
+        instrucoes = [phi for _, phi in novos_phi[rotulo]]
+        for instrucao in bloco.instrucoes:
+            classe = instrucao.__class__.__name__
+            if classe == "Carrega" and instrucao.variavel in promovidas:
+                # O destino guarda o tipo inferido naquele ponto (usado pelo print).
+                instrucoes.append(IR.Copia(instrucao.destino, atuais[instrucao.variavel][-1]))
+            elif classe == "Armazena" and instrucao.variavel in promovidas:
+                atuais[instrucao.variavel].append(instrucao.origem)
+                empilhadas.append(instrucao.variavel)
+            else:
+                instrucoes.append(instrucao)
+        bloco.instrucoes = instrucoes
+        for alvo in sucessores(bloco):
+            for variavel, phi in novos_phi[alvo]:
+                phi.argumentos[rotulo] = atuais[variavel][-1]
+        trabalho.append((rotulo, empilhadas))
+        for filho in reversed(filhos[rotulo]):
+            trabalho.append((filho, None))
+
+    _tipar_phis([phi for lista in novos_phi.values() for _, phi in lista])
+    return len(variaveis)
+
+
+def _tipar_phis(lista):
+    """Tipo de cada Phi: o tipo comum dos argumentos, ou QUALQUER."""
+    tipos = {phi.destino.numero: None for phi in lista}  # None = ainda sem tipo
+    mudou = True
+    while mudou:
+        mudou = False
+        for phi in lista:
+            tipo = None
+            for argumento in phi.argumentos.values():
+                tipo_arg = tipos[argumento.numero] if argumento.numero in tipos else argumento.tipo
+                if tipo_arg is not None:
+                    tipo = tipo_arg if tipo in (None, tipo_arg) else IR.QUALQUER
+            if tipo != tipos[phi.destino.numero]:
+                tipos[phi.destino.numero] = tipo
+                mudou = True
+    for phi in lista:
+        phi.destino.tipo = tipos[phi.destino.numero] or IR.QUALQUER
+
+
+# ------------------------------------------
+# Limpeza
+# ------------------------------------------
+
+def propagar_copias(funcao):
+    """
+    Em SSA, troca os usos do destino de cada Copia pela origem; devolve
+    quantos usos mudaram. O print depende do tipo do temporario, entao um
+    Imprime so passa a ler uma origem de mesmo tipo.
+    """
+    origens = {}
+    for instrucao in funcao.instrucoes():
+        if instrucao.__class__.__name__ == "Copia":
+            origens[instrucao.destino.numero] = instrucao.origem
+
+    def resolver(temp, mesmo_tipo):
+        atual = temp
+        while atual.numero in origens:
+            proximo = origens[atual.numero]
+            if mesmo_tipo and proximo.tipo != temp.tipo:
+                break
+            atual = proximo
+        return atual
+
+    trocas = 0
+    for instrucao in funcao.instrucoes():
+        if instrucao.__class__.__name__ == "Copia":
+            continue
+        imprime = instrucao.__class__.__name__ == "Imprime"
+        mapa = {}
+        for temp in instrucao.usados():
+            novo = resolver(temp, imprime)
+            if novo is not temp:
+                mapa[temp] = novo
+        if mapa:
+            instrucao.substituir(mapa)
+            trocas += len(mapa)
+    return trocas
+
+
+def remover_mortas(funcao):
+    """Remove instrucoes sem efeito cujo resultado nao e usado; devolve quantas."""
+    definicoes = {}
+    pendentes = []
+    for bloco in funcao.blocos:
+        for instrucao in bloco.instrucoes + [bloco.terminador]:
+            if instrucao.__class__.__name__ in _SEM_EFEITO:
+                definicoes.setdefault(instrucao.destino.numero, []).append(instrucao)
+            else:
+                pendentes += instrucao.usados()
+    vivos = set()
+    while pendentes:
+        temp = pendentes.pop()
+        if temp.numero in vivos:
+            continue
+        vivos.add(temp.numero)
+        for instrucao in definicoes.get(temp.numero, []):
+            pendentes += instrucao.usados()
+
+    removidas = 0
+    for bloco in funcao.blocos:
+        mantidas = [
+            instrucao for instrucao in bloco.instrucoes
+            if instrucao.__class__.__name__ not in _SEM_EFEITO or instrucao.destino.numero in vivos
+        ]
+        removidas += len(bloco.instrucoes) - len(mantidas)
+        bloco.instrucoes = mantidas
+    return removidas
+
+
+# ------------------------------------------
+# Saida
+# ------------------------------------------
+
+def sair_da_ssa(funcao):
+    """Troca os Phi por copias nos predecessores; devolve quantas copias."""
+    remover_inalcancaveis(funcao)
+    por_rotulo = {bloco.rotulo: bloco for bloco in funcao.blocos}
+
+    # Aresta critica (predecessor com dois ou mais sucessores -> bloco com Phi):
+    # as copias vao num bloco novo no meio da aresta.
+    for bloco in list(funcao.blocos):
+        lista = phis(bloco)
+        if not lista:
+            continue
+        for pred in list(lista[0].argumentos):
+            anterior = por_rotulo[pred]
+            if len(sucessores(anterior)) < 2:
+                continue
+            meio = IR.Bloco(f"{pred}_{bloco.rotulo}")
+            meio.terminador = IR.Salto(bloco.rotulo)
+            anterior.terminador.redirecionar({bloco.rotulo: meio.rotulo})
+            funcao.blocos.insert(funcao.blocos.index(bloco), meio)
+            por_rotulo[meio.rotulo] = meio
+            for phi in lista:
+                phi.argumentos[meio.rotulo] = phi.argumentos.pop(pred)
+
+    copias = 0
+    for bloco in funcao.blocos:
+        lista = phis(bloco)
+        if not lista:
+            continue
+        for pred in lista[0].argumentos:
+            paralelas = [(phi.destino, phi.argumentos[pred]) for phi in lista]
+            sequencia = sequencializar(paralelas, funcao)
+            por_rotulo[pred].instrucoes.extend(sequencia)
+            copias += len(sequencia)
+        bloco.instrucoes = bloco.instrucoes[len(lista):]
+    return copias
+
+
+def sequencializar(paralelas, funcao):
+    """
+    Copias [(destino, origem)] feitas "ao mesmo tempo" viram uma sequencia
+    de IR.Copia; ciclos (a <- b, b <- a) passam por um temporario novo.
+    """
+    pendentes = [(d, o) for d, o in paralelas if d.numero != o.numero]
+    sequencia = []
+    while pendentes:
+        for indice, (destino, origem) in enumerate(pendentes):
+            if all(o.numero != destino.numero for _, o in pendentes):
+                sequencia.append(IR.Copia(destino, origem))
+                del pendentes[indice]
+                break
+        else:
+            destino = pendentes[0][0]
+            salvo = funcao.novo_temp(destino.tipo)
+            sequencia.append(IR.Copia(salvo, destino))
+            pendentes = [(d, salvo if o.numero == destino.numero else o) for d, o in pendentes]
+    return sequencia
+
+
+# ==============================================
+#              DEMONSTRACAO
+# ==============================================
+
+def main():
+    import os
+    import sys
+
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    try:
+        from .VisitorSemantico import _criar_parser
+        from .InferenciaTipos import InferenciaTipos
+        from .GeradorAssembly import GeradorAssembly
+    except ImportError:
+        from VisitorSemantico import _criar_parser
+        from InferenciaTipos import InferenciaTipos
+        from GeradorAssembly import GeradorAssembly
+
+    codigo = """
+    function soma_ate(n)
+        local total = 0
+        for i = 1, n do
+            total = total + i
+        end
+        return total
+    end
+    print(soma_ate(10))
+    """
+    arvore = _criar_parser().parse(codigo)
+    gerador = GeradorAssembly(tipos=InferenciaTipos(arvore))
+    arvore.accept(gerador)
+    modulo = gerador.finalizar()
+    efeitos = efeitos_globais(modulo)
+    funcao = modulo.funcoes["soma_ate"]
+    construir_ssa(funcao, promoviveis(funcao, efeitos))
+    remover_mortas(funcao)
+    print("--- SSA ---")
+    print(funcao)
+    print("problemas:", IR.verificar(modulo) or "nenhum")
+    sair_da_ssa(funcao)
+    print("\n--- Depois de sair da SSA ---")
+    print(funcao)
+    print("problemas:", IR.verificar(modulo, ssa=False) or "nenhum")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,515 @@
+import sys
+
+try:
+    from .InstrucoesMIPS import FORMATOS, Instrucao, Rotulo, analisar_instrucao, base_memoria, eh_registrador
+except ImportError:
+    from InstrucoesMIPS import FORMATOS, Instrucao, Rotulo, analisar_instrucao, base_memoria, eh_registrador
+
+
+# ==============================================
+#   SIMULADOR MIPS
+# ==============================================
+#
+# Executa o assembly produzido pelo GeradorAssembly (o subconjunto do MARS
+# que ele usa, com as pseudo-instrucoes) e conta instrucoes executadas e
+# acessos a memoria (lw/sw). Cada pseudo-instrucao conta como uma: o
+# objetivo e comparar versoes do mesmo programa, nao prever ciclos.
+#
+# `ciclos` e uma estimativa do pipeline de 5 estagios do R3000: cada
+# instrucao conta 1 ciclo, menos mul/div (CUSTO_CICLOS), mais:
+#   - bolhas: uma por instrucao que le o registrador carregado pelo `lw`
+#     executado logo antes (load-use);
+#   - atrasos: o nop que o montador poe no delay slot de cada desvio,
+#     salto, jal e jr executado. Com `.set noreorder` no .text nao ha nop
+#     implicito: a instrucao seguinte ao desvio executa sempre (antes do
+#     alvo; o jal guarda em $ra o endereco depois dela) e os nops que
+#     houver ja contam como instrucoes. Um desvio no delay slot de outro e
+#     erro.
+# Serve para ver o ganho de trocar mul/div por deslocamentos, que no
+# numero de instrucoes pode ate aparecer como perda, e o do Escalonador.
+#
+# Enderecos de codigo sao indices de instrucao: e o que o jal guarda em
+# $ra e o que um `.word rotulo` (tabela de saltos) vale na memoria; o `jr`
+# segue qualquer um dos dois. `lw r, rotulo(base)` soma o endereco do
+# rotulo de dados ao registrador, como a pseudo-instrucao do MARS.
+#
+# Aritmetica em 32 bits com complemento de dois (sem trap de overflow);
+# syscalls suportadas: 1 (print_int), 4 (print_string), 10 (exit) e
+# 11 (print_char).
+
+INICIO_DADOS = 0x10010000
+TOPO_PILHA = 0x7FFFEFFC
+LIMITE_PADRAO = 100_000_000
+CUSTO_CICLOS = {"mul": 12, "mult": 12, "div": 35, "divu": 35, "rem": 35}
+
+_NOMES_REGISTRADORES = (
+    ["$zero", "$at", "$v0", "$v1", "$a0", "$a1", "$a2", "$a3"]
+    + [f"$t{i}" for i in range(8)]
+    + [f"$s{i}" for i in range(8)]
+    + ["$t8", "$t9", "$k0", "$k1", "$gp", "$sp", "$fp", "$ra"]
+)
+_INDICES = {nome: indice for indice, nome in enumerate(_NOMES_REGISTRADORES)}
+_INDICES.update({f"${indice}": indice for indice in range(32)})
+_INDICES["$s8"] = 30
+
+# Posicoes extras no banco de registradores do simulador.
+_DESCARTE = 32  # escritas em $zero
+_HI = 33
+_LO = 34
+_PRIMEIRA_CONSTANTE = 35  # imediatos em posicao de registrador lido
+
+_SP = _INDICES["$sp"]
+
+_ARITMETICAS = {
+    "add": lambda x, y: x + y,
+    "addu": lambda x, y: x + y,
+    "addi": lambda x, y: x + y,
+    "addiu": lambda x, y: x + y,
+    "sub": lambda x, y: x - y,
+    "subu": lambda x, y: x - y,
+    "mul": lambda x, y: x * y,
+    "and": lambda x, y: x & y,
+    "andi": lambda x, y: x & y,
+    "or": lambda x, y: x | y,
+    "ori": lambda x, y: x | y,
+    "xor": lambda x, y: x ^ y,
+    "xori": lambda x, y: x ^ y,
+    "nor": lambda x, y: ~(x | y),
+    "slt": lambda x, y: int(x < y),
+    "slti": lambda x, y: int(x < y),
+    "sltu": lambda x, y: int((x & 0xFFFFFFFF) < (y & 0xFFFFFFFF)),
+    "sltiu": lambda x, y: int((x & 0xFFFFFFFF) < (y & 0xFFFFFFFF)),
+    "seq": lambda x, y: int(x == y),
+    "sne": lambda x, y: int(x != y),
+    "sgt": lambda x, y: int(x > y),
+    "sge": lambda x, y: int(x >= y),
+    "sle": lambda x, y: int(x <= y),
+    "sll": lambda x, y: x << (y & 31),
+    "sllv": lambda x, y: x << (y & 31),
+    "srl": lambda x, y: (x & 0xFFFFFFFF) >> (y & 31),
+    "srlv": lambda x, y: (x & 0xFFFFFFFF) >> (y & 31),
+    "sra": lambda x, y: x >> (y & 31),
+    "srav": lambda x, y: x >> (y & 31),
+    "rem": lambda x, y: _resto(x, y),
+}
+
+_DESVIOS = {
+    "beq": lambda x, y: x == y,
+    "bne": lambda x, y: x != y,
+    "bgt": lambda x, y: x > y,
+    "blt": lambda x, y: x < y,
+    "bge": lambda x, y: x >= y,
+    "ble": lambda x, y: x <= y,
+    "beqz": lambda x: x == 0,
+    "bnez": lambda x: x != 0,
+    "bgtz": lambda x: x > 0,
+    "bltz": lambda x: x < 0,
+    "blez": lambda x: x <= 0,
+    "bgez": lambda x: x >= 0,
+}
+
+# Codigos internos de despacho
+(_ARIT, _LI, _LW, _SW, _MOVE, _DESVIO2, _DESVIO1, _J, _JAL, _JR, _JALR,
+ _SYSCALL, _DIV, _MULT, _MFLO, _MFHI, _NEG, _NOT, _ABS, _NOP) = range(20)
+
+# Instrucoes com delay slot.
+_ATRASADAS = frozenset(_DESVIOS) | {"j", "jal", "jr", "jalr"}
+
+
+class ErroSimulacao(Exception):
+    pass
+
+
+class ResultadoSimulacao:
+    def __init__(self, saida, instrucoes, leituras, escritas, perfil, bolhas=0, atrasos=0, pilha=0):
+        self.saida = saida
+        self.instrucoes = instrucoes
+        self.leituras = leituras  # lw executados
+        self.escritas = escritas  # sw executados
+        self.perfil = perfil  # operacao -> vezes executada
+        self.bolhas = bolhas  # esperas de load-use
+        self.atrasos = atrasos  # nops implicitos nos delay slots
+        self.pilha = pilha  # bytes de pilha no pico (TOPO_PILHA - menor $sp)
+
+    @property
+    def acessos_memoria(self):
+        return self.leituras + self.escritas
+
+    @property
+    def ciclos(self):
+        executadas = sum(CUSTO_CICLOS.get(op, 1) * vezes for op, vezes in self.perfil.items())
+        return executadas + self.bolhas + self.atrasos
+
+
+def _s32(valor):
+    return ((valor + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+
+
+def _divisao(x, y):
+    if y == 0:
+        raise ErroSimulacao("Divisao por zero")
+    quociente = abs(x) // abs(y)
+    if (x < 0) != (y < 0):
+        quociente = -quociente
+    # MIN_INT / -1 nao cabe em 32 bits: o LO fica com MIN_INT.
+    return _s32(quociente), x - quociente * y
+
+
+def _resto(x, y):
+    return _divisao(x, y)[1]
+
+
+def _decodificar_string(texto):
+    saida = []
+    indice = 0
+    escapes = {"n": "\n", "t": "\t", "0": "\0", "\\": "\\", '"': '"'}
+    while indice < len(texto):
+        caractere = texto[indice]
+        if caractere == "\\" and indice + 1 < len(texto):
+            indice += 1
+            caractere = escapes.get(texto[indice], texto[indice])
+        saida.append(caractere)
+        indice += 1
+    return "".join(saida)
+
+
+class SimuladorMIPS:
+    """
+    Args:
+        assembly: texto .asm (secoes .data e .text)
+        limite: numero maximo de instrucoes antes de abortar
+    """
+
+    def __init__(self, assembly, limite=LIMITE_PADRAO):
+        self.limite = limite
+        self.memoria = {}  # endereco -> palavra de 32 bits
+        self.strings = {}  # endereco -> texto de .asciiz
+        self.enderecos = {}  # rotulo de dados -> endereco
+        self.rotulos = {}  # rotulo de codigo -> indice da instrucao
+        self.instrucoes = []
+        self._pendentes = []  # (endereco, rotulo de codigo) de .word
+        self.noreorder = False  # `.set noreorder`: delay slots explicitos
+        self._carregar(assembly)
+        self._constantes = []
+        self._programa = [self._decodificar(instrucao) for instrucao in self.instrucoes]
+        self._lidos = [self._lidos_por(instrucao) for instrucao in self.instrucoes]
+        if self.noreorder:
+            self._verificar_atrasos()
+
+    # ------------------------------------------
+    # Montagem
+    # ------------------------------------------
+
+    def _carregar(self, assembly):
+        secao = ".text"
+        proximo = INICIO_DADOS
+        for linha in assembly.splitlines():
+            texto = linha.strip()
+            if not texto or texto.startswith("#"):
+                continue
+            if texto.startswith("."):
+                if texto.split()[0] in (".data", ".text"):
+                    secao = texto.split()[0]
+                elif texto.split()[:2] in ([".set", "noreorder"], [".set", "reorder"]):
+                    self.noreorder = texto.split()[1] == "noreorder"
+                continue
+            if secao == ".data":
+                proximo = self._carregar_dado(texto, proximo)
+                continue
+            item = analisar_instrucao(texto)
+            if isinstance(item, Rotulo):
+                self.rotulos[item.nome] = len(self.instrucoes)
+            elif isinstance(item, Instrucao):
+                self.instrucoes.append(item)
+        for endereco, rotulo in self._pendentes:
+            self.memoria[endereco] = self._alvo(rotulo)
+
+    def _carregar_dado(self, texto, endereco):
+        rotulo, _, resto = texto.partition(":")
+        diretiva, _, valor = resto.strip().partition(" ")
+        valor = valor.strip()
+        endereco = (endereco + 3) & ~3
+        self.enderecos[rotulo.strip()] = endereco
+        if diretiva == ".word":
+            valores = [v.strip() for v in valor.split(",")] if valor else ["0"]
+            for deslocamento, palavra in enumerate(valores):
+                if palavra[:1].isalpha() or palavra[:1] == "_":
+                    # Rotulo de codigo: so existe depois de ler o .text.
+                    self._pendentes.append((endereco + 4 * deslocamento, palavra))
+                else:
+                    self.memoria[endereco + 4 * deslocamento] = int(palavra, 0)
+            return endereco + 4 * len(valores)
+        if diretiva == ".asciiz":
+            conteudo = _decodificar_string(valor[1:-1])
+            self.strings[endereco] = conteudo
+            return endereco + len(conteudo.encode("utf-8")) + 1
+        if diretiva == ".space":
+            return endereco + int(valor, 0)
+        raise ErroSimulacao(f"Diretiva nao suportada: {diretiva}")
+
+    def _registrador(self, nome, escrita=False):
+        if nome not in _INDICES:
+            raise ErroSimulacao(f"Registrador invalido: {nome}")
+        indice = _INDICES[nome]
+        return _DESCARTE if escrita and indice == 0 else indice
+
+    def _fonte(self, operando):
+        """Indice de leitura: registrador ou constante anexada ao banco."""
+        if eh_registrador(operando):
+            return self._registrador(operando)
+        if operando in self.enderecos:
+            valor = self.enderecos[operando]
+        else:
+            valor = self._imediato(operando)
+        self._constantes.append(valor)
+        return _PRIMEIRA_CONSTANTE + len(self._constantes) - 1
+
+    def _memoria(self, operando):
+        base = base_memoria(operando)
+        if base is None:
+            if operando not in self.enderecos:
+                raise ErroSimulacao(f"Rotulo de dados desconhecido: {operando}")
+            return self.enderecos[operando], 0
+        deslocamento = operando[: operando.index("(")] or "0"
+        if deslocamento in self.enderecos:
+            return self.enderecos[deslocamento], self._registrador(base)
+        return int(deslocamento, 0), self._registrador(base)
+
+    def _endereco(self, rotulo):
+        if rotulo not in self.enderecos:
+            raise ErroSimulacao(f"Rotulo de dados desconhecido: {rotulo}")
+        return self.enderecos[rotulo]
+
+    def _imediato(self, texto):
+        try:
+            return _s32(int(texto, 0))
+        except ValueError:
+            raise ErroSimulacao(f"Imediato invalido: {texto}") from None
+
+    def _alvo(self, rotulo):
+        if rotulo not in self.rotulos:
+            raise ErroSimulacao(f"Rotulo de codigo desconhecido: {rotulo}")
+        return self.rotulos[rotulo]
+
+    def _lidos_por(self, instrucao):
+        """Indices dos registradores lidos (para as bolhas de load-use)."""
+        if instrucao.op == "syscall":
+            return (_INDICES["$v0"], _INDICES["$a0"])
+        return tuple(_INDICES[nome] for nome in instrucao.usados() if nome in _INDICES)
+
+    def _verificar_atrasos(self):
+        for indice, instrucao in enumerate(self.instrucoes):
+            if instrucao.op not in _ATRASADAS:
+                continue
+            if indice + 1 >= len(self.instrucoes):
+                raise ErroSimulacao(f"Delay slot faltando depois de: {instrucao}")
+            if self.instrucoes[indice + 1].op in _ATRASADAS:
+                raise ErroSimulacao(f"Desvio no delay slot de outro: {self.instrucoes[indice + 1]}")
+
+    def _decodificar(self, instrucao):
+        op = instrucao.op
+        ops = instrucao.operandos
+        if op not in FORMATOS:
+            raise ErroSimulacao(f"Instrucao nao suportada: {instrucao}")
+        if op in _ARITMETICAS:
+            return (_ARIT, self._registrador(ops[0], True), self._fonte(ops[1]),
+                    self._fonte(ops[2]), _ARITMETICAS[op])
+        if op == "li":
+            return (_LI, self._registrador(ops[0], True), self._imediato(ops[1]), None, None)
+        if op == "la":
+            return (_LI, self._registrador(ops[0], True), self._endereco(ops[1]), None, None)
+        if op == "lw":
+            deslocamento, base = self._memoria(ops[1])
+            return (_LW, self._registrador(ops[0], True), base, deslocamento, None)
+        if op == "sw":
+            deslocamento, base = self._memoria(ops[1])
+            return (_SW, self._registrador(ops[0]), base, deslocamento, None)
+        if op == "move":
+            return (_MOVE, self._registrador(ops[0], True), self._registrador(ops[1]), None, None)
+        if op in ("neg", "not", "abs"):
+            codigo = {"neg": _NEG, "not": _NOT, "abs": _ABS}[op]
+            return (codigo, self._registrador(ops[0], True), self._registrador(ops[1]), None, None)
+        if op in _DESVIOS:
+            if len(ops) == 3:
+                return (_DESVIO2, self._fonte(ops[0]), self._fonte(ops[1]),
+                        self._alvo(ops[2]), _DESVIOS[op])
+            return (_DESVIO1, self._fonte(ops[0]), None, self._alvo(ops[1]), _DESVIOS[op])
+        if op == "j":
+            return (_J, None, None, self._alvo(ops[0]), None)
+        if op == "jal":
+            return (_JAL, None, None, self._alvo(ops[0]), None)
+        if op in ("jr", "jalr"):
+            return (_JR if op == "jr" else _JALR, self._registrador(ops[0]), None, None, None)
+        if op in ("div", "divu", "mult"):
+            return (_MULT if op == "mult" else _DIV, self._fonte(ops[0]), self._fonte(ops[1]), None, None)
+        if op in ("mflo", "mfhi"):
+            return (_MFLO if op == "mflo" else _MFHI, self._registrador(ops[0], True), None, None, None)
+        if op == "syscall":
+            return (_SYSCALL, None, None, None, None)
+        return (_NOP, None, None, None, None)
+
+    # ------------------------------------------
+    # Execucao
+    # ------------------------------------------
+
+    def executar(self, saida=None):
+        """
+        Roda a partir de `main`. A saida do programa vai para `saida`
+        (um arquivo) se informado e sempre para ResultadoSimulacao.saida.
+        """
+        r = [0] * _PRIMEIRA_CONSTANTE + self._constantes
+        r[_INDICES["$sp"]] = TOPO_PILHA
+        r[_INDICES["$gp"]] = 0x10008000
+        memoria = dict(self.memoria)
+        programa = self._programa
+        lidos = self._lidos
+        execucoes = [0] * len(programa)
+        texto = []
+        leituras = escritas = bolhas = 0
+        menor_sp = TOPO_PILHA
+        carregado = 0  # registrador escrito pelo lw anterior ($zero: nenhum)
+        atraso = int(self.noreorder)
+        pendente = -1  # alvo de um desvio tomado, depois do delay slot
+        pc = self.rotulos.get("main", 0)
+        fim = len(programa)
+        restante = self.limite
+
+        while pc < fim:
+            restante -= 1
+            if restante < 0:
+                raise ErroSimulacao(f"Limite de {self.limite} instrucoes excedido")
+            codigo, x, y, z, funcao = programa[pc]
+            execucoes[pc] += 1
+            if carregado:
+                if carregado in lidos[pc]:
+                    bolhas += 1
+                carregado = 0
+            if pendente < 0:
+                pc += 1
+            else:
+                pc, pendente = pendente, -1
+
+            if codigo == _ARIT:
+                r[x] = _s32(funcao(r[y], r[z]))
+                if x == _SP and r[x] < menor_sp:
+                    menor_sp = r[x]
+            elif codigo == _LW:
+                leituras += 1
+                r[x] = memoria.get(r[y] + z, 0)
+                carregado = x
+            elif codigo == _SW:
+                escritas += 1
+                memoria[r[y] + z] = r[x]
+            elif codigo == _LI:
+                r[x] = y
+            elif codigo == _MOVE:
+                r[x] = r[y]
+                if x == _SP and r[x] < menor_sp:
+                    menor_sp = r[x]
+            elif codigo == _DESVIO2:
+                if funcao(r[x], r[y]):
+                    if atraso:
+                        pendente = z
+                    else:
+                        pc = z
+            elif codigo == _DESVIO1:
+                if funcao(r[x]):
+                    if atraso:
+                        pendente = z
+                    else:
+                        pc = z
+            elif codigo == _J:
+                if atraso:
+                    pendente = z
+                else:
+                    pc = z
+            elif codigo == _JAL:
+                r[31] = pc + atraso
+                if atraso:
+                    pendente = z
+                else:
+                    pc = z
+            elif codigo == _JR:
+                if atraso:
+                    pendente = r[x]
+                else:
+                    pc = r[x]
+            elif codigo == _JALR:
+                r[31], alvo = pc + atraso, r[x]
+                if atraso:
+                    pendente = alvo
+                else:
+                    pc = alvo
+            elif codigo == _SYSCALL:
+                servico = r[2]
+                if servico == 1:
+                    texto.append(str(r[4]))
+                elif servico == 4:
+                    if r[4] not in self.strings:
+                        raise ErroSimulacao(f"print_string em endereco invalido: {r[4]:#x}")
+                    texto.append(self.strings[r[4]])
+                elif servico == 11:
+                    texto.append(chr(r[4] & 0xFF))
+                elif servico == 10:
+                    break
+                else:
+                    raise ErroSimulacao(f"Syscall nao suportada: {servico}")
+            elif codigo == _DIV:
+                r[_LO], r[_HI] = _divisao(r[x], r[y])
+            elif codigo == _MULT:
+                produto = r[x] * r[y]
+                r[_LO], r[_HI] = _s32(produto), _s32(produto >> 32)
+            elif codigo == _MFLO:
+                r[x] = r[_LO]
+            elif codigo == _MFHI:
+                r[x] = r[_HI]
+            elif codigo == _NEG:
+                r[x] = _s32(-r[y])
+            elif codigo == _NOT:
+                r[x] = _s32(~r[y])
+            elif codigo == _ABS:
+                r[x] = _s32(abs(r[y]))
+
+        saida_programa = "".join(texto)
+        if saida is not None:
+            saida.write(saida_programa)
+        perfil = {}
+        for instrucao, vezes in zip(self.instrucoes, execucoes):
+            if vezes:
+                perfil[instrucao.op] = perfil.get(instrucao.op, 0) + vezes
+        atrasos = 0 if self.noreorder else sum(perfil.get(op, 0) for op in _ATRASADAS)
+        return ResultadoSimulacao(
+            saida_programa, sum(execucoes), leituras, escritas, perfil, bolhas, atrasos,
+            TOPO_PILHA - menor_sp,
+        )
+
+
+def simular(assembly, limite=LIMITE_PADRAO):
+    return SimuladorMIPS(assembly, limite).executar()
+
+
+# ==============================================
+#              LINHA DE COMANDO
+# ==============================================
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Uso: python SimuladorMIPS.py programa.asm")
+        return 1
+    with open(argv[0], encoding="utf-8") as arquivo:
+        assembly = arquivo.read()
+    try:
+        resultado = SimuladorMIPS(assembly).executar(saida=sys.stdout)
+    except ErroSimulacao as exc:
+        print(f"[ERRO] {exc}")
+        return 1
+    print(f"\n--- {resultado.instrucoes} instrucoes (~{resultado.ciclos} ciclos: "
+          f"{resultado.bolhas} bolhas de load-use, {resultado.atrasos} nops em delay slots), "
+          f"{resultado.leituras} lw, {resultado.escritas} sw, "
+          f"{resultado.pilha} bytes de pilha ---")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 NUMBER = 'number'
 STRING = 'string'
 BOOLEAN = 'boolean'
@@ -16,8 +18,12 @@ CATEGORY = 'category'
 PARAMS = 'params'
 SCOPE = 'scope'
 IS_LOCAL = 'is_local'
-OFFSET = 'offset'
+OFFSET = 'offset'  # posição no quadro da função que declara (ou na área global)
 VALUE = 'value'
+ARITY = 'arity'   # (mínimo, máximo) de argumentos; máximo None = variádica
+
+# Escopo dos símbolos pré-definidos (fica "fora" da pilha de escopos)
+BUILTIN_SCOPE = -1
 
 
 DEBUG = 0
@@ -27,17 +33,80 @@ symbolTable = []
 scopeStack = [0]  
 currentScope = 0  
 curOffset = 0     
+offsetStack = []  # curOffset de cada função envolvente (ver enter_function)
+scopeIndex = {}   # (nome, escopo) -> símbolo
+builtinScope = MappingProxyType({})  # nome -> símbolo (somente leitura)
+
+
+# ===== ESCOPO PRÉ-DEFINIDO =====
+
+def create_builtin_scope(specs):
+    """
+    Monta um escopo imutável de funções pré-definidas.
+
+    O escopo é construído uma vez e pode ser compartilhado por qualquer
+    número de análises: reset_table(builtins=...) só guarda a referência.
+
+    Args:
+        specs: dicionário nome -> (aridade mínima, aridade máxima, tipo de retorno);
+            aridade máxima None indica função variádica
+    """
+    scope = {}
+    for name, (min_args, max_args, return_type) in specs.items():
+        scope[name] = MappingProxyType({
+            NAME: name,
+            CATEGORY: FUNC,
+            TYPE: return_type,
+            SCOPE: BUILTIN_SCOPE,
+            IS_LOCAL: False,
+            OFFSET: None,
+            VALUE: None,
+            PARAMS: (),
+            ARITY: (min_args, max_args),
+        })
+    return MappingProxyType(scope)
+
+
+# Biblioteca básica do Lua: nome -> (mín. de argumentos, máx., tipo de retorno)
+DEFAULT_BUILTIN_SPECS = {
+    "print": (0, None, NIL),
+    "type": (1, 1, STRING),
+    "tostring": (1, 1, STRING),
+    "tonumber": (1, 2, None),  # number ou nil
+    "pairs": (1, 1, FUNCTION),
+    "ipairs": (1, 1, FUNCTION),
+    "pcall": (1, None, BOOLEAN),
+    "error": (1, 2, None),
+    "assert": (1, None, None),
+    "require": (1, 1, None),
+    "unpack": (1, 3, None),
+    "select": (1, None, None),
+    "rawget": (2, 2, None),
+    "rawset": (3, 3, TABLE),
+    "setmetatable": (2, 2, TABLE),
+    "getmetatable": (1, 1, None),
+}
+
+DEFAULT_BUILTINS = create_builtin_scope(DEFAULT_BUILTIN_SPECS)
 
 
 # ===== FUNÇÕES AUXILIARES =====
 
-def reset_table():
-    """Reseta a tabela de símbolos para o estado inicial."""
-    global symbolTable, scopeStack, currentScope, curOffset
+def reset_table(builtins=DEFAULT_BUILTINS):
+    """Reseta a tabela de símbolos para o estado inicial.
+
+    Args:
+        builtins: escopo pré-definido (ver create_builtin_scope); é apenas
+            referenciado, nunca copiado
+    """
+    global symbolTable, scopeStack, currentScope, curOffset, offsetStack, scopeIndex, builtinScope
     symbolTable = []
     scopeStack = [0]
     currentScope = 0
     curOffset = 0
+    offsetStack = []
+    scopeIndex = {}
+    builtinScope = builtins if builtins is not None else MappingProxyType({})
 
 
 def enter_scope():
@@ -60,6 +129,23 @@ def exit_scope():
         print(f"[DEBUG] Saindo do escopo, voltando para {scopeStack[-1]}")
 
 
+def enter_function():
+    """Entra no escopo de uma função: os offsets recomeçam em 0 (novo quadro)."""
+    global curOffset
+    offsetStack.append(curOffset)
+    curOffset = 0
+    return enter_scope()
+
+
+def exit_function():
+    """Sai do escopo da função e devolve quantos slots o quadro dela usa."""
+    global curOffset
+    exit_scope()
+    slots = curOffset
+    curOffset = offsetStack.pop()
+    return slots
+
+
 def get_current_scope():
     """Retorna o escopo atual."""
     return scopeStack[-1]
@@ -81,9 +167,8 @@ def add_symbol(name, category, symbol_type=None, params=None, is_local=False, va
     
     # Verifica se o símbolo já existe no escopo atual
     scope = get_current_scope()
-    for sym in symbolTable:
-        if sym[NAME] == name and sym[SCOPE] == scope:
-            raise Exception(f"Erro: símbolo '{name}' já declarado no escopo {scope}")
+    if (name, scope) in scopeIndex or (scope == 0 and name in builtinScope):
+        raise Exception(f"Erro: símbolo '{name}' já declarado no escopo {scope}")
     
     # Cria o dicionário do símbolo
     symbol = {
@@ -100,6 +185,7 @@ def add_symbol(name, category, symbol_type=None, params=None, is_local=False, va
         symbol[PARAMS] = params if params else []
     
     symbolTable.append(symbol)
+    scopeIndex[(name, scope)] = symbol
     curOffset += 1
     
     if DEBUG > 0:
@@ -118,19 +204,22 @@ def lookup_symbol(name, current_scope_only=False):
     Returns:
         Dicionário do símbolo ou None se não encontrado
     """
+    # O índice (nome, escopo) evita percorrer a tabela inteira a cada consulta.
     if current_scope_only:
-        # Procura apenas no escopo atual
+        # Procura apenas no escopo atual (as pré-definidas contam como globais)
         scope = get_current_scope()
-        for sym in reversed(symbolTable):
-            if sym[NAME] == name and sym[SCOPE] == scope:
-                return sym
+        sym = scopeIndex.get((name, scope))
+        if sym is None and scope == 0:
+            return builtinScope.get(name)
+        return sym
     else:
         # Procura no escopo atual e nos escopos pais (escopo léxico)
-        for sym in reversed(symbolTable):
-            if sym[NAME] == name and sym[SCOPE] in scopeStack:
+        for scope in reversed(scopeStack):
+            sym = scopeIndex.get((name, scope))
+            if sym is not None:
                 return sym
-    
-    return None
+        # Por último, as funções pré-definidas
+        return builtinScope.get(name)
 
 
 def symbol_exists(name, current_scope_only=False):
@@ -175,6 +264,8 @@ def print_table():
             if sym[CATEGORY] == FUNC and sym.get(PARAMS):
                 print(f"     Params: {sym[PARAMS]}")
     print("="*70)
+    if builtinScope:
+        print(f"Pré-definidas ({len(builtinScope)}): {', '.join(builtinScope)}")
     print(f"Escopo atual: {get_current_scope()}")
     print(f"Pilha de escopos: {scopeStack}")
     print("="*70 + "\n")
@@ -196,7 +287,7 @@ def main():
     
     # Teste 2: Entrando em escopo de função
     print("\n2. Entrando em escopo de função 'soma':")
-    enter_scope()
+    enter_function()
     add_function("soma", params=["a", "b"], return_type=NUMBER)
     add_variable("a", var_type=NUMBER, is_local=True)
     add_variable("b", var_type=NUMBER, is_local=True)
@@ -220,7 +311,7 @@ def main():
     print_table()
     
     print("\n6. Saindo da função:")
-    exit_scope()
+    print(f"  Slots no quadro de 'soma': {exit_function()}")
     print_table()
     
     # Teste 7: Testando erro de redeclaração
@@ -0,0 +1,173 @@
+from array import array
+from bisect import bisect_right
+
+
+class TabelaSpans:
+    """
+    Tabela lateral com o trecho do fonte de cada no da AST.
+
+    Os nos sao identificados por id(no), entao a tabela so vale enquanto a
+    arvore estiver viva. Durante o parse cada registro e so um append em tres
+    vetores compactos (id, inicio, inicio do ultimo token); a ordenacao por id
+    para a busca binaria e feita na primeira consulta. Registros depois dela
+    (nos criados por otimizacoes, via `copiar`) vao para um dicionario que a
+    busca olha primeiro, sem reordenar os vetores. O fim exato do trecho
+    (fim do ultimo token) e calculado sob demanda por `medir_token`.
+    O indice de inicio de linhas converte offset -> (linha, coluna) com busca
+    binaria.
+    """
+
+    def __init__(self, fonte="", medir_token=None):
+        self.fonte = fonte
+        self.medir_token = medir_token  # (fonte, pos) -> offset apos o token
+        self._ids = array("Q")
+        self._inicios = array("i")
+        self._ultimos = array("i")  # inicio do ultimo token do no
+        self._ordenada = True
+        self._consultada = False  # ja houve busca: registros vao para _avulsos
+        self._avulsos = {}  # id -> (inicio, ultimo)
+
+        self.inicios_linha = array("i", [0])
+        pos = fonte.find("\n")
+        while pos != -1:
+            self.inicios_linha.append(pos + 1)
+            pos = fonte.find("\n", pos + 1)
+
+    def __len__(self):
+        return len(self._ids) + len(self._avulsos)
+
+    def registrar(self, no, inicio, ultimo):
+        if self._consultada:
+            self._avulsos[id(no)] = (inicio, ultimo)
+            return
+        self._ids.append(id(no))
+        self._inicios.append(inicio)
+        self._ultimos.append(ultimo)
+        self._ordenada = False
+
+    def copiar(self, origem, destino):
+        """Da ao no `destino` (ex.: criado por uma otimizacao) o trecho de `origem`."""
+        encontrado = self._buscar(id(origem))
+        if encontrado is not None:
+            self.registrar(destino, *encontrado)
+
+    def _ordenar(self):
+        # sort estavel: para ids repetidos vale o ultimo registro
+        ordem = sorted(range(len(self._ids)), key=self._ids.__getitem__)
+        self._ids = array("Q", [self._ids[i] for i in ordem])
+        self._inicios = array("i", [self._inicios[i] for i in ordem])
+        self._ultimos = array("i", [self._ultimos[i] for i in ordem])
+        self._ordenada = True
+
+    def _buscar(self, no_id):
+        """(inicio, ultimo) do no, ou None."""
+        if no_id in self._avulsos:
+            return self._avulsos[no_id]
+        if not self._ordenada:
+            self._ordenar()
+        self._consultada = True
+        indice = bisect_right(self._ids, no_id) - 1
+        if indice < 0 or self._ids[indice] != no_id:
+            return None
+        return self._inicios[indice], self._ultimos[indice]
+
+    def inicio_por_id(self, no_id):
+        encontrado = self._buscar(no_id)
+        return None if encontrado is None else encontrado[0]
+
+    def span_por_id(self, no_id):
+        """(inicio, fim) do no, com fim exclusivo."""
+        encontrado = self._buscar(no_id)
+        if encontrado is None:
+            return None
+        inicio, ultimo = encontrado
+        fim = self.medir_token(self.fonte, ultimo) if self.medir_token else ultimo
+        return inicio, fim
+
+    def span(self, no):
+        return self.span_por_id(id(no))
+
+    def linha_coluna(self, offset):
+        """Converte um offset em (linha, coluna), ambos a partir de 1."""
+        linha = bisect_right(self.inicios_linha, offset)
+        return linha, offset - self.inicios_linha[linha - 1] + 1
+
+    def localizar_id(self, no_id):
+        inicio = self.inicio_por_id(no_id)
+        return None if inicio is None else self.linha_coluna(inicio)
+
+    def localizar(self, no):
+        return self.localizar_id(id(no))
+
+    def trecho(self, no):
+        intervalo = self.span(no)
+        if intervalo is None:
+            return None
+        return self.fonte[intervalo[0]:intervalo[1]]
+
+
+# ==============================================
+#              DEMONSTRACAO / MEDICAO
+# ==============================================
+
+def main(n_funcoes=2000, repeticoes=3):
+    import os
+    import sys
+    import time
+    import tracemalloc
+
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    from VisitorSemantico import _criar_parser
+    from ExpressionLanguageParser import parse_com_posicoes
+
+    linhas = []
+    for i in range(n_funcoes):
+        linhas += [
+            f"function f{i}(a, b)",
+            "    local s = a * 2 + b",
+            "    if s > 10 then print(s) else s = s - 1 end",
+            "    return s",
+            "end",
+        ]
+    fonte = "\n".join(linhas)
+    parser = _criar_parser()
+
+    def medir(funcao):
+        melhor = None
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            resultado = funcao()
+            tempo = time.perf_counter() - inicio
+            melhor = tempo if melhor is None else min(melhor, tempo)
+        return melhor, resultado
+
+    t_sem, _ = medir(lambda: parser.parse(fonte))
+    t_com, (arvore, tabela) = medir(lambda: parse_com_posicoes(parser, fonte))
+    kb = len(fonte) / 1024
+    print(f"Fonte: {kb:.0f} KB, {len(tabela.inicios_linha)} linhas, {len(tabela)} nos")
+    print(f"  parse sem posicoes: {t_sem * 1000:.0f} ms ({kb / t_sem:.0f} KB/s)")
+    print(f"  parse com posicoes: {t_com * 1000:.0f} ms ({kb / t_com:.0f} KB/s, "
+          f"+{(t_com / t_sem - 1) * 100:.0f}%)")
+
+    tracemalloc.start()
+    arvore = parser.parse(fonte)
+    mem_arvore = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del arvore
+    tracemalloc.start()
+    arvore, tabela = parse_com_posicoes(parser, fonte)
+    mem_total = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"  memoria da AST: {mem_arvore / 1024:.0f} KB; com tabela: "
+          f"{mem_total / 1024:.0f} KB (+{(mem_total / mem_arvore - 1) * 100:.0f}%, "
+          f"{(mem_total - mem_arvore) / len(tabela):.0f} bytes/no)")
+
+    ultima = arvore.statements[-1]
+    print(f"  ultima funcao comeca em {tabela.localizar(ultima)}: "
+          f"{tabela.trecho(ultima).splitlines()[0]!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,65 +27,62 @@ try:
     from . import SintaxeAbstrata as a
     from . import AbstractVisitor
     from . import SymbolTable as st
+    from .Diagnosticos import ColetorDiagnosticos, escrever_jsonl
 except ImportError:
     import SintaxeAbstrata as a
     import AbstractVisitor
     import SymbolTable as st
+    from Diagnosticos import ColetorDiagnosticos, escrever_jsonl
 
 from ExpressionLanguageParser import *  # noqa: F401,F403
 
 
 class VisitorSemantico(AbstractVisitor.AbstractVisitor):
-    def __init__(self):
+    def __init__(
+        self,
+        limite_por_codigo=None,
+        limite_total=None,
+        deduplicar=False,
+        spans=None,
+        builtins=None,
+    ):
         super().__init__()
-        self.erros = []
-        self.avisos = []
-        st.reset_table()
-        self._registrar_builtins()
-
-    def _registrar_builtins(self):
-        for nome in [
-            "print",
-            "type",
-            "tostring",
-            "tonumber",
-            "pairs",
-            "ipairs",
-            "pcall",
-            "error",
-            "assert",
-            "require",
-            "unpack",
-            "select",
-            "rawget",
-            "rawset",
-            "setmetatable",
-            "getmetatable",
-        ]:
-            try:
-                st.add_function(nome, params=None, return_type=None)
-            except Exception:
-                pass
-
-    def _erro(self, mensagem):
-        self.erros.append(f"[ERRO] {mensagem}")
-
-    def _aviso(self, mensagem):
-        self.avisos.append(f"[AVISO] {mensagem}")
+        self.spans = spans  # TabelaSpans do parse, para localizar os diagnosticos
+        self.diagnosticos = ColetorDiagnosticos(
+            limite_por_codigo=limite_por_codigo,
+            limite_total=limite_total,
+            deduplicar=deduplicar,
+        )
+        self.erros = self.diagnosticos.erros
+        self.avisos = self.diagnosticos.avisos
+        # O escopo pre-definido e imutavel e compartilhado: anexar e O(1).
+        st.reset_table(builtins=st.DEFAULT_BUILTINS if builtins is None else builtins)
+
+    # Os diagnosticos guardam codigo + argumentos (na ordem dos campos do
+    # modelo em Diagnosticos.CATALOGO); o texto em portugues so e montado
+    # quando alguem pede (relatorio, JSON, str()).
+    def _erro(self, codigo, no, *valores):
+        self.diagnosticos.registrar(codigo, no, valores)
+
+    def _aviso(self, codigo, no, *valores):
+        self.diagnosticos.registrar(codigo, no, valores)
+
+    def _buscar(self, nome):
+        # Ponto unico de consulta a tabela; a analise incremental sobrescreve
+        # este metodo para registrar de quais simbolos cada funcao depende.
+        return st.lookup_symbol(nome)
 
     def _extrair_nome(self, node):
         if hasattr(node, "value"):
             return node.value
         return str(node)
 
-    def _validar_condicao_booleana(self, tipo, contexto):
+    def _validar_condicao_booleana(self, tipo, contexto, no=None):
         # Se nao conseguimos inferir o tipo, nao acusa erro.
         if tipo is None:
             return
         if tipo != st.BOOLEAN:
-            self._erro(
-                f"Condicao de {contexto} deve ser boolean, mas recebeu '{tipo}'"
-            )
+            self._erro("E005", no, contexto, tipo)
 
     # ==============================================
     #          EXPRESSOES
@@ -104,11 +101,13 @@ class VisitorSemantico(AbstractVisitor.AbstractVisitor):
         return st.NIL
 
     def visitVar(self, node):
-        if not st.symbol_exists(node.name):
-            self._erro(f"Variavel '{node.name}' usada sem ter sido declarada")
+        simbolo = self._buscar(node.name)
+        if simbolo is None:
+            self._erro("E001", node, node.name)
             return None
-        simbolo = st.lookup_symbol(node.name)
-        return simbolo[st.TYPE] if simbolo else None
+        if simbolo[st.SCOPE] == st.BUILTIN_SCOPE:
+            return st.FUNCTION  # TYPE de uma pre-definida e o tipo de retorno
+        return simbolo[st.TYPE]
 
     def visitUnOp(self, node):
         tipo = node.operand.accept(self)
@@ -116,9 +115,7 @@ class VisitorSemantico(AbstractVisitor.AbstractVisitor):
 
         if op == "-":
             if tipo and tipo != st.NUMBER:
-                self._aviso(
-                    f"Operador '-' aplicado a tipo '{tipo}' (esperado: number)"
-                )
+                self._aviso("W001", node, tipo)
             return st.NUMBER
 
         if op == "not":
@@ -131,15 +128,11 @@ class VisitorSemantico(AbstractVisitor.AbstractVisitor):
         tipo_dir = node.right.accept(self)
         op = node.op
 
-        if op in ["+", "-", "*", "/"]:
+        if op in ["+", "-", "*", "/", "%", "^"]:
             if tipo_esq and tipo_esq not in [st.NUMBER, st.NIL]:
-                self._aviso(
-                    f"Operador '{op}': lado esquerdo e '{tipo_esq}', esperado 'number'"
-                )
+                self._aviso("W002", node.left, op, "esquerdo", tipo_esq)
             if tipo_dir and tipo_dir not in [st.NUMBER, st.NIL]:
-                self._aviso(
-                    f"Operador '{op}': lado direito e '{tipo_dir}', esperado 'number'"
-                )
+                self._aviso("W002", node.right, op, "direito", tipo_dir)
             return st.NUMBER
 
         if op in ["==", "~=", "<", ">", "<=", ">="]:
@@ -155,24 +148,30 @@ class VisitorSemantico(AbstractVisitor.AbstractVisitor):
     def visitFunctionCall(self, node):
         nome = self._extrair_nome(node.name)
 
-        if not st.symbol_exists(nome):
-            self._erro(f"Funcao '{nome}' chamada sem ter sido declarada")
+        simbolo = self._buscar(nome)
+        if simbolo is None:
+            self._erro("E002", node, nome)
         else:
-            simbolo = st.lookup_symbol(nome)
-            if simbolo and simbolo[st.CATEGORY] != st.FUNC:
-                self._erro(f"'{nome}' nao e uma funcao, mas foi chamada como uma")
-
-            if simbolo and simbolo.get(st.PARAMS):
+            if simbolo[st.CATEGORY] != st.FUNC:
+                self._erro("E003", node, nome)
+
+            recebidos = len(node.args)
+            aridade = simbolo.get(st.ARITY)
+            if aridade is not None:
+                minimo, maximo = aridade
+                if recebidos < minimo or (maximo is not None and recebidos > maximo):
+                    self._erro("E004", node, nome, _faixa(minimo, maximo), recebidos)
+            elif simbolo.get(st.PARAMS):
                 esperados = len(simbolo[st.PARAMS])
-                recebidos = len(node.args)
                 if recebidos != esperados:
-                    self._erro(
-                        f"Funcao '{nome}' espera {esperados} argumento(s), recebeu {recebidos}"
-                    )
+                    self._erro("E004", node, nome, esperados, recebidos)
 
         for arg in node.args:
             arg.accept(self)
 
+        # So as pre-definidas declaram tipo de retorno.
+        if simbolo is not None and simbolo[st.SCOPE] == st.BUILTIN_SCOPE:
+            return simbolo[st.TYPE]
         return None
 
     # ==============================================
@@ -188,19 +187,20 @@ class VisitorSemantico(AbstractVisitor.AbstractVisitor):
             try:
                 st.add_variable(nome, var_type=tipo_exp, is_local=True)
             except Exception as exc:
-                self._erro(str(exc))
+                self._erro("E009", node, str(exc))
             return
 
         # Atribuicao sem local: atualiza se existir, senao cria global implicita.
-        if st.symbol_exists(nome):
-            simbolo = st.lookup_symbol(nome)
-            if simbolo:
+        simbolo = self._buscar(nome)
+        if simbolo is not None:
+            # O escopo pre-definido e compartilhado: nao e alterado.
+            if simbolo[st.SCOPE] != st.BUILTIN_SCOPE:
                 simbolo[st.TYPE] = tipo_exp
         else:
             try:
                 st.add_variable(nome, var_type=tipo_exp, is_local=False)
             except Exception as exc:
-                self._erro(str(exc))
+                self._erro("E009", node, str(exc))
 
     def visitFunctionDecl(self, node):
         nome = self._extrair_nome(node.name)
@@ -209,17 +209,17 @@ class VisitorSemantico(AbstractVisitor.AbstractVisitor):
         try:
             st.add_function(nome, params=nomes_params, return_type=None)
         except Exception as exc:
-            self._erro(str(exc))
+            self._erro("E009", node, str(exc))
 
-        st.enter_scope()
+        st.enter_function()
         for param in nomes_params:
             try:
                 st.add_variable(param, var_type=None, is_local=True)
             except Exception as exc:
-                self._erro(str(exc))
+                self._erro("E009", node, str(exc))
 
         node.body.accept(self)
-        st.exit_scope()
+        st.exit_function()
 
     def visitFor(self, node):
         st.enter_scope()
@@ -227,29 +227,27 @@ class VisitorSemantico(AbstractVisitor.AbstractVisitor):
         try:
             st.add_variable(nome_var, var_type=st.NUMBER, is_local=True)
         except Exception as exc:
-            self._erro(str(exc))
+            self._erro("E009", node, str(exc))
 
         tipo_ini = node.start.accept(self)
         if tipo_ini and tipo_ini != st.NUMBER:
-            self._erro(
-                f"For: valor inicial deve ser numero, recebeu '{tipo_ini}'"
-            )
+            self._erro("E006", node.start, tipo_ini)
 
         tipo_fim = node.end.accept(self)
         if tipo_fim and tipo_fim != st.NUMBER:
-            self._erro(f"For: valor final deve ser numero, recebeu '{tipo_fim}'")
+            self._erro("E007", node.end, tipo_fim)
 
         if node.step:
             tipo_passo = node.step.accept(self)
             if tipo_passo and tipo_passo != st.NUMBER:
-                self._erro(f"For: passo deve ser numero, recebeu '{tipo_passo}'")
+                self._erro("E008", node.step, tipo_passo)
 
         node.body.accept(self)
         st.exit_scope()
 
     def visitWhile(self, node):
         tipo_cond = node.condition.accept(self)
-        self._validar_condicao_booleana(tipo_cond, "while")
+        self._validar_condicao_booleana(tipo_cond, "while", node.condition)
 
         st.enter_scope()
         node.body.accept(self)
@@ -262,7 +260,7 @@ class VisitorSemantico(AbstractVisitor.AbstractVisitor):
 
     def visitIf(self, node):
         tipo_cond = node.condition.accept(self)
-        self._validar_condicao_booleana(tipo_cond, "if")
+        self._validar_condicao_booleana(tipo_cond, "if", node.condition)
 
         st.enter_scope()
         node.then_body.accept(self)
@@ -277,7 +275,7 @@ class VisitorSemantico(AbstractVisitor.AbstractVisitor):
             if cond is None or body is None:
                 continue
             tipo_elseif = cond.accept(self)
-            self._validar_condicao_booleana(tipo_elseif, "elseif")
+            self._validar_condicao_booleana(tipo_elseif, "elseif", cond)
             st.enter_scope()
             body.accept(self)
             st.exit_scope()
@@ -295,7 +293,11 @@ class VisitorSemantico(AbstractVisitor.AbstractVisitor):
     #              RELATORIO FINAL
     # ==============================================
 
-    def relatorio(self):
+    def exportar_jsonl(self, destino=None):
+        """Escreve erros e avisos, um JSON por linha."""
+        return escrever_jsonl(self.erros + self.avisos, destino, self.spans)
+
+    def relatorio(self, mostrar_tabela=True):
         print("\n" + "=" * 70)
         print("           RELATORIO DA ANALISE SEMANTICA")
         print("=" * 70)
@@ -306,16 +308,20 @@ class VisitorSemantico(AbstractVisitor.AbstractVisitor):
         if self.erros:
             print(f"\n  {len(self.erros)} ERRO(S) SEMANTICO(S):\n")
             for i, erro in enumerate(self.erros, 1):
-                print(f"    {i}. {erro}")
+                print(f"    {i}. {erro.formatar(self.spans)}")
 
         if self.avisos:
             print(f"\n  {len(self.avisos)} AVISO(S):\n")
             for i, aviso in enumerate(self.avisos, 1):
-                print(f"    {i}. {aviso}")
+                print(f"    {i}. {aviso.formatar(self.spans)}")
+
+        if self.diagnosticos.suprimidos:
+            print(f"\n  ({self.diagnosticos.suprimidos} diagnostico(s) suprimido(s) pelos limites)")
 
-        print("\n" + "-" * 70)
-        print("TABELA DE SIMBOLOS FINAL:")
-        st.print_table()
+        if mostrar_tabela:
+            print("\n" + "-" * 70)
+            print("TABELA DE SIMBOLOS FINAL:")
+            st.print_table()
 
         sucesso = len(self.erros) == 0
         msg = "APROVADO (sem erros)" if sucesso else "REPROVADO (erros encontrados)"
@@ -324,6 +330,14 @@ class VisitorSemantico(AbstractVisitor.AbstractVisitor):
         return sucesso
 
 
+def _faixa(minimo, maximo):
+    if maximo is None:
+        return f"pelo menos {minimo}"
+    if minimo == maximo:
+        return minimo
+    return f"de {minimo} a {maximo}"
+
+
 def _executar_teste(codigo, titulo, observacoes=None):
     print("\n" + "#" * 70)
     print(f"  {titulo}")
@@ -334,13 +348,13 @@ def _executar_teste(codigo, titulo, observacoes=None):
 
     parser = _criar_parser()
     try:
-        arvore = parser.parse(codigo)
+        arvore, spans = parse_com_posicoes(parser, codigo)
     except SyntaxError:
         print("Erro no parsing!")
         return
 
     if arvore:
-        visitor = VisitorSemantico()
+        visitor = VisitorSemantico(spans=spans)
         arvore.accept(visitor)
         visitor.relatorio()
     else:
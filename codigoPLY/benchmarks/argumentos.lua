@@ -0,0 +1,42 @@
+-- Mais de 4 argumentos (os extras vao pela pilha) e muitos valores vivos
+-- em volta de chamadas (mais que os 8 registradores $s)
+function mistura(n, a, b, c, d, e)
+    if n == 0 then
+        return a + 2 * b + 3 * c + 4 * d + 5 * e
+    end
+    local novo = a + e
+    return mistura(n - 1, b, c, d, e, novo % 1000)
+end
+
+function passo(x)
+    if x < 0 then
+        return passo(0 - x)
+    end
+    local y = x * 7 + 3
+    return y % 101
+end
+
+function cadeia(x)
+    local a = passo(x)
+    local b = passo(a)
+    local c = passo(b)
+    local d = passo(c)
+    local e = passo(d)
+    local f = passo(e)
+    local g = passo(f)
+    local h = passo(g)
+    local i = passo(h)
+    local j = passo(i)
+    return a + b + c + d + e + f + g + h + i + j + x
+end
+
+local total = 0
+for k = 1, 50 do
+    total = total + mistura(k, k, 2, 3, 4, 5) % 97
+end
+print(total)
+local soma = 0
+for k = 1, 100 do
+    soma = soma + cadeia(k)
+end
+print(soma)
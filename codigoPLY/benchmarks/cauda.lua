@@ -0,0 +1,29 @@
+-- Recursao de cauda (vira laco) e chamada de cauda para outra funcao
+-- (vira `j`): sem a otimizacao cada volta empilha um quadro
+function acumula(n, total)
+    if n == 0 then
+        return total
+    end
+    return acumula(n - 1, total + n % 10)
+end
+
+function mdc(a, b)
+    if b == 0 then
+        return a
+    end
+    return mdc(b, a % b)
+end
+
+function normaliza(a, b)
+    if a < b then
+        return mdc(b, a)
+    end
+    return mdc(a, b)
+end
+
+print(acumula(20000, 0))
+local soma = 0
+for i = 1, 300 do
+    soma = soma + normaliza(i * 7, 1001)
+end
+print(soma)
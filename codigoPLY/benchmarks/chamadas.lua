@@ -0,0 +1,48 @@
+-- Funcoes pequenas chamadas dentro de lacos (candidatas a expansao em
+-- linha) e uma funcao folha grande demais para expandir
+function soma(a, b)
+    return a + b
+end
+
+function maximo(a, b)
+    if a > b then
+        return a
+    end
+    return b
+end
+
+function absoluto(x)
+    if x < 0 then
+        return -x
+    end
+    return x
+end
+
+function mistura(x)
+    local h = x * 31 + 7
+    h = h - h / 97 * 97
+    if h < 0 then
+        h = h + 97
+    end
+    local g = h * 13 + x
+    g = g - g / 89 * 89
+    if g > 44 then
+        g = g - 44
+    end
+    return h + g
+end
+
+local total = 0
+local pico = 0
+for i = -50, 50 do
+    total = soma(total, absoluto(i))
+    pico = maximo(pico, mistura(i))
+end
+print(total)
+print(pico)
+
+local acumulado = 0
+for i = 1, 40 do
+    acumulado = acumulado + mistura(i) + mistura(i * 2)
+end
+print(acumulado)
@@ -0,0 +1,32 @@
+-- Configuracao com muitas constantes, codigo de depuracao e funcao nao usada
+local largura = 64
+local altura = 48
+local borda = 2
+local area = largura * altura
+local util = largura * altura - 2 * borda * largura - 2 * borda * altura + 4 * borda * borda
+local depurar = false
+local escala = 1024 / 4
+
+function nunca_chamada(x)
+    print("nunca")
+    return x * 2
+end
+
+function pixels(linhas)
+    return linhas * largura
+end
+
+if depurar then
+    print("area total")
+    print(area)
+end
+
+while depurar and true do
+    print("laco de depuracao")
+end
+
+print(util)
+print(pixels(altura - 2 * borda))
+print(escala * borda)
+print(-largura + 100)
+print(not depurar)
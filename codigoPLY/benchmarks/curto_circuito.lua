@@ -0,0 +1,24 @@
+-- Filtros com and/or em que o lado direito e uma chamada cara: com
+-- curto-circuito ela so roda quando o lado esquerdo nao decide
+function lento(n)
+    local soma = 0
+    for i = 1, n do
+        soma = soma + i
+    end
+    return soma > 100
+end
+
+local aceitos = 0
+local marcados = 0
+for n = 1, 60 do
+    local par = n / 2 * 2 == n
+    if par and lento(n) then
+        aceitos = aceitos + 1
+    end
+    local ok = n < 10 or lento(n)
+    if ok then
+        marcados = marcados + 1
+    end
+end
+print(aceitos)
+print(marcados)
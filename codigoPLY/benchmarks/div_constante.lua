@@ -0,0 +1,15 @@
+-- Divisao truncada por constantes (potencias de 2 ou nao, positivas e
+-- negativas) com dividendos dos dois sinais
+local soma = 0
+for i = -300, 300, 7 do
+    soma = soma + i / 4 + i / 7 - i / -2 + i / 10 + i / -3
+end
+print(soma)
+
+local n = 123456789
+local digitos = 0
+while n > 0 do
+    digitos = digitos + n - n / 10 * 10
+    n = n / 10
+end
+print(digitos)
@@ -0,0 +1,41 @@
+-- Cadeia if/elseif com 10 casos densos sobre a mesma variavel
+-- (vira tabela de saltos com a passada "escolha")
+function valor(x)
+    if x == 0 then
+        return 13
+    elseif x == 1 then
+        return 869
+    elseif x == 2 then
+        return 716
+    elseif x == 3 then
+        return 563
+    elseif x == 4 then
+        return 410
+    elseif x == 5 then
+        return 257
+    elseif x == 6 then
+        return 104
+    elseif x == 7 then
+        return 960
+    elseif x == 8 then
+        return 807
+    elseif x == 9 then
+        return 654
+    end
+    return 0 - 1
+end
+
+local total = 0
+local erros = 0
+for volta = 1, 200 do
+    for i = 0 - 2, 11, 1 do
+        local v = valor(i)
+        if v < 0 then
+            erros = erros + 1
+        else
+            total = total + v
+        end
+    end
+end
+print(total)
+print(erros)
@@ -0,0 +1,221 @@
+-- Cadeia if/elseif com 100 casos: os pares de 0 a 198, fora de ordem
+-- (densidade 1/2: ainda vira tabela de saltos)
+function valor(x)
+    if x == 0 then
+        return 13
+    elseif x == 146 then
+        return 882
+    elseif x == 92 then
+        return 63
+    elseif x == 38 then
+        return 253
+    elseif x == 184 then
+        return 113
+    elseif x == 130 then
+        return 303
+    elseif x == 76 then
+        return 493
+    elseif x == 22 then
+        return 683
+    elseif x == 168 then
+        return 543
+    elseif x == 114 then
+        return 733
+    elseif x == 60 then
+        return 923
+    elseif x == 6 then
+        return 104
+    elseif x == 152 then
+        return 973
+    elseif x == 98 then
+        return 154
+    elseif x == 44 then
+        return 344
+    elseif x == 190 then
+        return 204
+    elseif x == 136 then
+        return 394
+    elseif x == 82 then
+        return 584
+    elseif x == 28 then
+        return 774
+    elseif x == 174 then
+        return 634
+    elseif x == 120 then
+        return 824
+    elseif x == 66 then
+        return 5
+    elseif x == 12 then
+        return 195
+    elseif x == 158 then
+        return 55
+    elseif x == 104 then
+        return 245
+    elseif x == 50 then
+        return 435
+    elseif x == 196 then
+        return 295
+    elseif x == 142 then
+        return 485
+    elseif x == 88 then
+        return 675
+    elseif x == 34 then
+        return 865
+    elseif x == 180 then
+        return 725
+    elseif x == 126 then
+        return 915
+    elseif x == 72 then
+        return 96
+    elseif x == 18 then
+        return 286
+    elseif x == 164 then
+        return 146
+    elseif x == 110 then
+        return 336
+    elseif x == 56 then
+        return 526
+    elseif x == 2 then
+        return 716
+    elseif x == 148 then
+        return 576
+    elseif x == 94 then
+        return 766
+    elseif x == 40 then
+        return 956
+    elseif x == 186 then
+        return 816
+    elseif x == 132 then
+        return 1006
+    elseif x == 78 then
+        return 187
+    elseif x == 24 then
+        return 377
+    elseif x == 170 then
+        return 237
+    elseif x == 116 then
+        return 427
+    elseif x == 62 then
+        return 617
+    elseif x == 8 then
+        return 807
+    elseif x == 154 then
+        return 667
+    elseif x == 100 then
+        return 857
+    elseif x == 46 then
+        return 38
+    elseif x == 192 then
+        return 907
+    elseif x == 138 then
+        return 88
+    elseif x == 84 then
+        return 278
+    elseif x == 30 then
+        return 468
+    elseif x == 176 then
+        return 328
+    elseif x == 122 then
+        return 518
+    elseif x == 68 then
+        return 708
+    elseif x == 14 then
+        return 898
+    elseif x == 160 then
+        return 758
+    elseif x == 106 then
+        return 948
+    elseif x == 52 then
+        return 129
+    elseif x == 198 then
+        return 998
+    elseif x == 144 then
+        return 179
+    elseif x == 90 then
+        return 369
+    elseif x == 36 then
+        return 559
+    elseif x == 182 then
+        return 419
+    elseif x == 128 then
+        return 609
+    elseif x == 74 then
+        return 799
+    elseif x == 20 then
+        return 989
+    elseif x == 166 then
+        return 849
+    elseif x == 112 then
+        return 30
+    elseif x == 58 then
+        return 220
+    elseif x == 4 then
+        return 410
+    elseif x == 150 then
+        return 270
+    elseif x == 96 then
+        return 460
+    elseif x == 42 then
+        return 650
+    elseif x == 188 then
+        return 510
+    elseif x == 134 then
+        return 700
+    elseif x == 80 then
+        return 890
+    elseif x == 26 then
+        return 71
+    elseif x == 172 then
+        return 940
+    elseif x == 118 then
+        return 121
+    elseif x == 64 then
+        return 311
+    elseif x == 10 then
+        return 501
+    elseif x == 156 then
+        return 361
+    elseif x == 102 then
+        return 551
+    elseif x == 48 then
+        return 741
+    elseif x == 194 then
+        return 601
+    elseif x == 140 then
+        return 791
+    elseif x == 86 then
+        return 981
+    elseif x == 32 then
+        return 162
+    elseif x == 178 then
+        return 22
+    elseif x == 124 then
+        return 212
+    elseif x == 70 then
+        return 402
+    elseif x == 16 then
+        return 592
+    elseif x == 162 then
+        return 452
+    elseif x == 108 then
+        return 642
+    elseif x == 54 then
+        return 832
+    end
+    return 0 - 1
+end
+
+local total = 0
+local erros = 0
+for volta = 1, 10 do
+    for i = 0 - 5, 204, 1 do
+        local v = valor(i)
+        if v < 0 then
+            erros = erros + 1
+        else
+            total = total + v
+        end
+    end
+end
+print(total)
+print(erros)
@@ -0,0 +1,2021 @@
+-- Cadeia if/elseif com 1000 casos esparsos (multiplos de 97, de
+-- -48500 a 48403): vira busca binaria
+function valor(x)
+    if x == 0 - 48500 then
+        return 327
+    elseif x == 0 - 48403 then
+        return 621
+    elseif x == 0 - 48306 then
+        return 915
+    elseif x == 0 - 48209 then
+        return 200
+    elseif x == 0 - 48112 then
+        return 494
+    elseif x == 0 - 48015 then
+        return 788
+    elseif x == 0 - 47918 then
+        return 73
+    elseif x == 0 - 47821 then
+        return 367
+    elseif x == 0 - 47724 then
+        return 661
+    elseif x == 0 - 47627 then
+        return 955
+    elseif x == 0 - 47530 then
+        return 240
+    elseif x == 0 - 47433 then
+        return 534
+    elseif x == 0 - 47336 then
+        return 828
+    elseif x == 0 - 47239 then
+        return 113
+    elseif x == 0 - 47142 then
+        return 407
+    elseif x == 0 - 47045 then
+        return 701
+    elseif x == 0 - 46948 then
+        return 995
+    elseif x == 0 - 46851 then
+        return 280
+    elseif x == 0 - 46754 then
+        return 574
+    elseif x == 0 - 46657 then
+        return 868
+    elseif x == 0 - 46560 then
+        return 153
+    elseif x == 0 - 46463 then
+        return 447
+    elseif x == 0 - 46366 then
+        return 741
+    elseif x == 0 - 46269 then
+        return 26
+    elseif x == 0 - 46172 then
+        return 320
+    elseif x == 0 - 46075 then
+        return 614
+    elseif x == 0 - 45978 then
+        return 908
+    elseif x == 0 - 45881 then
+        return 193
+    elseif x == 0 - 45784 then
+        return 487
+    elseif x == 0 - 45687 then
+        return 781
+    elseif x == 0 - 45590 then
+        return 66
+    elseif x == 0 - 45493 then
+        return 360
+    elseif x == 0 - 45396 then
+        return 654
+    elseif x == 0 - 45299 then
+        return 948
+    elseif x == 0 - 45202 then
+        return 233
+    elseif x == 0 - 45105 then
+        return 527
+    elseif x == 0 - 45008 then
+        return 821
+    elseif x == 0 - 44911 then
+        return 106
+    elseif x == 0 - 44814 then
+        return 400
+    elseif x == 0 - 44717 then
+        return 694
+    elseif x == 0 - 44620 then
+        return 988
+    elseif x == 0 - 44523 then
+        return 273
+    elseif x == 0 - 44426 then
+        return 567
+    elseif x == 0 - 44329 then
+        return 861
+    elseif x == 0 - 44232 then
+        return 146
+    elseif x == 0 - 44135 then
+        return 440
+    elseif x == 0 - 44038 then
+        return 734
+    elseif x == 0 - 43941 then
+        return 19
+    elseif x == 0 - 43844 then
+        return 313
+    elseif x == 0 - 43747 then
+        return 607
+    elseif x == 0 - 43650 then
+        return 901
+    elseif x == 0 - 43553 then
+        return 186
+    elseif x == 0 - 43456 then
+        return 480
+    elseif x == 0 - 43359 then
+        return 774
+    elseif x == 0 - 43262 then
+        return 59
+    elseif x == 0 - 43165 then
+        return 353
+    elseif x == 0 - 43068 then
+        return 647
+    elseif x == 0 - 42971 then
+        return 941
+    elseif x == 0 - 42874 then
+        return 226
+    elseif x == 0 - 42777 then
+        return 520
+    elseif x == 0 - 42680 then
+        return 814
+    elseif x == 0 - 42583 then
+        return 99
+    elseif x == 0 - 42486 then
+        return 393
+    elseif x == 0 - 42389 then
+        return 687
+    elseif x == 0 - 42292 then
+        return 981
+    elseif x == 0 - 42195 then
+        return 266
+    elseif x == 0 - 42098 then
+        return 560
+    elseif x == 0 - 42001 then
+        return 854
+    elseif x == 0 - 41904 then
+        return 139
+    elseif x == 0 - 41807 then
+        return 433
+    elseif x == 0 - 41710 then
+        return 727
+    elseif x == 0 - 41613 then
+        return 12
+    elseif x == 0 - 41516 then
+        return 306
+    elseif x == 0 - 41419 then
+        return 600
+    elseif x == 0 - 41322 then
+        return 894
+    elseif x == 0 - 41225 then
+        return 179
+    elseif x == 0 - 41128 then
+        return 473
+    elseif x == 0 - 41031 then
+        return 767
+    elseif x == 0 - 40934 then
+        return 52
+    elseif x == 0 - 40837 then
+        return 346
+    elseif x == 0 - 40740 then
+        return 640
+    elseif x == 0 - 40643 then
+        return 934
+    elseif x == 0 - 40546 then
+        return 219
+    elseif x == 0 - 40449 then
+        return 513
+    elseif x == 0 - 40352 then
+        return 807
+    elseif x == 0 - 40255 then
+        return 92
+    elseif x == 0 - 40158 then
+        return 386
+    elseif x == 0 - 40061 then
+        return 680
+    elseif x == 0 - 39964 then
+        return 974
+    elseif x == 0 - 39867 then
+        return 259
+    elseif x == 0 - 39770 then
+        return 553
+    elseif x == 0 - 39673 then
+        return 847
+    elseif x == 0 - 39576 then
+        return 132
+    elseif x == 0 - 39479 then
+        return 426
+    elseif x == 0 - 39382 then
+        return 720
+    elseif x == 0 - 39285 then
+        return 5
+    elseif x == 0 - 39188 then
+        return 299
+    elseif x == 0 - 39091 then
+        return 593
+    elseif x == 0 - 38994 then
+        return 887
+    elseif x == 0 - 38897 then
+        return 172
+    elseif x == 0 - 38800 then
+        return 466
+    elseif x == 0 - 38703 then
+        return 760
+    elseif x == 0 - 38606 then
+        return 45
+    elseif x == 0 - 38509 then
+        return 339
+    elseif x == 0 - 38412 then
+        return 633
+    elseif x == 0 - 38315 then
+        return 927
+    elseif x == 0 - 38218 then
+        return 212
+    elseif x == 0 - 38121 then
+        return 506
+    elseif x == 0 - 38024 then
+        return 800
+    elseif x == 0 - 37927 then
+        return 85
+    elseif x == 0 - 37830 then
+        return 379
+    elseif x == 0 - 37733 then
+        return 673
+    elseif x == 0 - 37636 then
+        return 967
+    elseif x == 0 - 37539 then
+        return 252
+    elseif x == 0 - 37442 then
+        return 546
+    elseif x == 0 - 37345 then
+        return 840
+    elseif x == 0 - 37248 then
+        return 125
+    elseif x == 0 - 37151 then
+        return 419
+    elseif x == 0 - 37054 then
+        return 713
+    elseif x == 0 - 36957 then
+        return 1007
+    elseif x == 0 - 36860 then
+        return 292
+    elseif x == 0 - 36763 then
+        return 586
+    elseif x == 0 - 36666 then
+        return 880
+    elseif x == 0 - 36569 then
+        return 165
+    elseif x == 0 - 36472 then
+        return 459
+    elseif x == 0 - 36375 then
+        return 753
+    elseif x == 0 - 36278 then
+        return 38
+    elseif x == 0 - 36181 then
+        return 332
+    elseif x == 0 - 36084 then
+        return 626
+    elseif x == 0 - 35987 then
+        return 920
+    elseif x == 0 - 35890 then
+        return 205
+    elseif x == 0 - 35793 then
+        return 499
+    elseif x == 0 - 35696 then
+        return 793
+    elseif x == 0 - 35599 then
+        return 78
+    elseif x == 0 - 35502 then
+        return 372
+    elseif x == 0 - 35405 then
+        return 666
+    elseif x == 0 - 35308 then
+        return 960
+    elseif x == 0 - 35211 then
+        return 245
+    elseif x == 0 - 35114 then
+        return 539
+    elseif x == 0 - 35017 then
+        return 833
+    elseif x == 0 - 34920 then
+        return 118
+    elseif x == 0 - 34823 then
+        return 412
+    elseif x == 0 - 34726 then
+        return 706
+    elseif x == 0 - 34629 then
+        return 1000
+    elseif x == 0 - 34532 then
+        return 285
+    elseif x == 0 - 34435 then
+        return 579
+    elseif x == 0 - 34338 then
+        return 873
+    elseif x == 0 - 34241 then
+        return 158
+    elseif x == 0 - 34144 then
+        return 452
+    elseif x == 0 - 34047 then
+        return 746
+    elseif x == 0 - 33950 then
+        return 31
+    elseif x == 0 - 33853 then
+        return 325
+    elseif x == 0 - 33756 then
+        return 619
+    elseif x == 0 - 33659 then
+        return 913
+    elseif x == 0 - 33562 then
+        return 198
+    elseif x == 0 - 33465 then
+        return 492
+    elseif x == 0 - 33368 then
+        return 786
+    elseif x == 0 - 33271 then
+        return 71
+    elseif x == 0 - 33174 then
+        return 365
+    elseif x == 0 - 33077 then
+        return 659
+    elseif x == 0 - 32980 then
+        return 953
+    elseif x == 0 - 32883 then
+        return 238
+    elseif x == 0 - 32786 then
+        return 532
+    elseif x == 0 - 32689 then
+        return 826
+    elseif x == 0 - 32592 then
+        return 111
+    elseif x == 0 - 32495 then
+        return 405
+    elseif x == 0 - 32398 then
+        return 699
+    elseif x == 0 - 32301 then
+        return 993
+    elseif x == 0 - 32204 then
+        return 278
+    elseif x == 0 - 32107 then
+        return 572
+    elseif x == 0 - 32010 then
+        return 866
+    elseif x == 0 - 31913 then
+        return 151
+    elseif x == 0 - 31816 then
+        return 445
+    elseif x == 0 - 31719 then
+        return 739
+    elseif x == 0 - 31622 then
+        return 24
+    elseif x == 0 - 31525 then
+        return 318
+    elseif x == 0 - 31428 then
+        return 612
+    elseif x == 0 - 31331 then
+        return 906
+    elseif x == 0 - 31234 then
+        return 191
+    elseif x == 0 - 31137 then
+        return 485
+    elseif x == 0 - 31040 then
+        return 779
+    elseif x == 0 - 30943 then
+        return 64
+    elseif x == 0 - 30846 then
+        return 358
+    elseif x == 0 - 30749 then
+        return 652
+    elseif x == 0 - 30652 then
+        return 946
+    elseif x == 0 - 30555 then
+        return 231
+    elseif x == 0 - 30458 then
+        return 525
+    elseif x == 0 - 30361 then
+        return 819
+    elseif x == 0 - 30264 then
+        return 104
+    elseif x == 0 - 30167 then
+        return 398
+    elseif x == 0 - 30070 then
+        return 692
+    elseif x == 0 - 29973 then
+        return 986
+    elseif x == 0 - 29876 then
+        return 271
+    elseif x == 0 - 29779 then
+        return 565
+    elseif x == 0 - 29682 then
+        return 859
+    elseif x == 0 - 29585 then
+        return 144
+    elseif x == 0 - 29488 then
+        return 438
+    elseif x == 0 - 29391 then
+        return 732
+    elseif x == 0 - 29294 then
+        return 17
+    elseif x == 0 - 29197 then
+        return 311
+    elseif x == 0 - 29100 then
+        return 605
+    elseif x == 0 - 29003 then
+        return 899
+    elseif x == 0 - 28906 then
+        return 184
+    elseif x == 0 - 28809 then
+        return 478
+    elseif x == 0 - 28712 then
+        return 772
+    elseif x == 0 - 28615 then
+        return 57
+    elseif x == 0 - 28518 then
+        return 351
+    elseif x == 0 - 28421 then
+        return 645
+    elseif x == 0 - 28324 then
+        return 939
+    elseif x == 0 - 28227 then
+        return 224
+    elseif x == 0 - 28130 then
+        return 518
+    elseif x == 0 - 28033 then
+        return 812
+    elseif x == 0 - 27936 then
+        return 97
+    elseif x == 0 - 27839 then
+        return 391
+    elseif x == 0 - 27742 then
+        return 685
+    elseif x == 0 - 27645 then
+        return 979
+    elseif x == 0 - 27548 then
+        return 264
+    elseif x == 0 - 27451 then
+        return 558
+    elseif x == 0 - 27354 then
+        return 852
+    elseif x == 0 - 27257 then
+        return 137
+    elseif x == 0 - 27160 then
+        return 431
+    elseif x == 0 - 27063 then
+        return 725
+    elseif x == 0 - 26966 then
+        return 10
+    elseif x == 0 - 26869 then
+        return 304
+    elseif x == 0 - 26772 then
+        return 598
+    elseif x == 0 - 26675 then
+        return 892
+    elseif x == 0 - 26578 then
+        return 177
+    elseif x == 0 - 26481 then
+        return 471
+    elseif x == 0 - 26384 then
+        return 765
+    elseif x == 0 - 26287 then
+        return 50
+    elseif x == 0 - 26190 then
+        return 344
+    elseif x == 0 - 26093 then
+        return 638
+    elseif x == 0 - 25996 then
+        return 932
+    elseif x == 0 - 25899 then
+        return 217
+    elseif x == 0 - 25802 then
+        return 511
+    elseif x == 0 - 25705 then
+        return 805
+    elseif x == 0 - 25608 then
+        return 90
+    elseif x == 0 - 25511 then
+        return 384
+    elseif x == 0 - 25414 then
+        return 678
+    elseif x == 0 - 25317 then
+        return 972
+    elseif x == 0 - 25220 then
+        return 257
+    elseif x == 0 - 25123 then
+        return 551
+    elseif x == 0 - 25026 then
+        return 845
+    elseif x == 0 - 24929 then
+        return 130
+    elseif x == 0 - 24832 then
+        return 424
+    elseif x == 0 - 24735 then
+        return 718
+    elseif x == 0 - 24638 then
+        return 3
+    elseif x == 0 - 24541 then
+        return 297
+    elseif x == 0 - 24444 then
+        return 591
+    elseif x == 0 - 24347 then
+        return 885
+    elseif x == 0 - 24250 then
+        return 170
+    elseif x == 0 - 24153 then
+        return 464
+    elseif x == 0 - 24056 then
+        return 758
+    elseif x == 0 - 23959 then
+        return 43
+    elseif x == 0 - 23862 then
+        return 337
+    elseif x == 0 - 23765 then
+        return 631
+    elseif x == 0 - 23668 then
+        return 925
+    elseif x == 0 - 23571 then
+        return 210
+    elseif x == 0 - 23474 then
+        return 504
+    elseif x == 0 - 23377 then
+        return 798
+    elseif x == 0 - 23280 then
+        return 83
+    elseif x == 0 - 23183 then
+        return 377
+    elseif x == 0 - 23086 then
+        return 671
+    elseif x == 0 - 22989 then
+        return 965
+    elseif x == 0 - 22892 then
+        return 250
+    elseif x == 0 - 22795 then
+        return 544
+    elseif x == 0 - 22698 then
+        return 838
+    elseif x == 0 - 22601 then
+        return 123
+    elseif x == 0 - 22504 then
+        return 417
+    elseif x == 0 - 22407 then
+        return 711
+    elseif x == 0 - 22310 then
+        return 1005
+    elseif x == 0 - 22213 then
+        return 290
+    elseif x == 0 - 22116 then
+        return 584
+    elseif x == 0 - 22019 then
+        return 878
+    elseif x == 0 - 21922 then
+        return 163
+    elseif x == 0 - 21825 then
+        return 457
+    elseif x == 0 - 21728 then
+        return 751
+    elseif x == 0 - 21631 then
+        return 36
+    elseif x == 0 - 21534 then
+        return 330
+    elseif x == 0 - 21437 then
+        return 624
+    elseif x == 0 - 21340 then
+        return 918
+    elseif x == 0 - 21243 then
+        return 203
+    elseif x == 0 - 21146 then
+        return 497
+    elseif x == 0 - 21049 then
+        return 791
+    elseif x == 0 - 20952 then
+        return 76
+    elseif x == 0 - 20855 then
+        return 370
+    elseif x == 0 - 20758 then
+        return 664
+    elseif x == 0 - 20661 then
+        return 958
+    elseif x == 0 - 20564 then
+        return 243
+    elseif x == 0 - 20467 then
+        return 537
+    elseif x == 0 - 20370 then
+        return 831
+    elseif x == 0 - 20273 then
+        return 116
+    elseif x == 0 - 20176 then
+        return 410
+    elseif x == 0 - 20079 then
+        return 704
+    elseif x == 0 - 19982 then
+        return 998
+    elseif x == 0 - 19885 then
+        return 283
+    elseif x == 0 - 19788 then
+        return 577
+    elseif x == 0 - 19691 then
+        return 871
+    elseif x == 0 - 19594 then
+        return 156
+    elseif x == 0 - 19497 then
+        return 450
+    elseif x == 0 - 19400 then
+        return 744
+    elseif x == 0 - 19303 then
+        return 29
+    elseif x == 0 - 19206 then
+        return 323
+    elseif x == 0 - 19109 then
+        return 617
+    elseif x == 0 - 19012 then
+        return 911
+    elseif x == 0 - 18915 then
+        return 196
+    elseif x == 0 - 18818 then
+        return 490
+    elseif x == 0 - 18721 then
+        return 784
+    elseif x == 0 - 18624 then
+        return 69
+    elseif x == 0 - 18527 then
+        return 363
+    elseif x == 0 - 18430 then
+        return 657
+    elseif x == 0 - 18333 then
+        return 951
+    elseif x == 0 - 18236 then
+        return 236
+    elseif x == 0 - 18139 then
+        return 530
+    elseif x == 0 - 18042 then
+        return 824
+    elseif x == 0 - 17945 then
+        return 109
+    elseif x == 0 - 17848 then
+        return 403
+    elseif x == 0 - 17751 then
+        return 697
+    elseif x == 0 - 17654 then
+        return 991
+    elseif x == 0 - 17557 then
+        return 276
+    elseif x == 0 - 17460 then
+        return 570
+    elseif x == 0 - 17363 then
+        return 864
+    elseif x == 0 - 17266 then
+        return 149
+    elseif x == 0 - 17169 then
+        return 443
+    elseif x == 0 - 17072 then
+        return 737
+    elseif x == 0 - 16975 then
+        return 22
+    elseif x == 0 - 16878 then
+        return 316
+    elseif x == 0 - 16781 then
+        return 610
+    elseif x == 0 - 16684 then
+        return 904
+    elseif x == 0 - 16587 then
+        return 189
+    elseif x == 0 - 16490 then
+        return 483
+    elseif x == 0 - 16393 then
+        return 777
+    elseif x == 0 - 16296 then
+        return 62
+    elseif x == 0 - 16199 then
+        return 356
+    elseif x == 0 - 16102 then
+        return 650
+    elseif x == 0 - 16005 then
+        return 944
+    elseif x == 0 - 15908 then
+        return 229
+    elseif x == 0 - 15811 then
+        return 523
+    elseif x == 0 - 15714 then
+        return 817
+    elseif x == 0 - 15617 then
+        return 102
+    elseif x == 0 - 15520 then
+        return 396
+    elseif x == 0 - 15423 then
+        return 690
+    elseif x == 0 - 15326 then
+        return 984
+    elseif x == 0 - 15229 then
+        return 269
+    elseif x == 0 - 15132 then
+        return 563
+    elseif x == 0 - 15035 then
+        return 857
+    elseif x == 0 - 14938 then
+        return 142
+    elseif x == 0 - 14841 then
+        return 436
+    elseif x == 0 - 14744 then
+        return 730
+    elseif x == 0 - 14647 then
+        return 15
+    elseif x == 0 - 14550 then
+        return 309
+    elseif x == 0 - 14453 then
+        return 603
+    elseif x == 0 - 14356 then
+        return 897
+    elseif x == 0 - 14259 then
+        return 182
+    elseif x == 0 - 14162 then
+        return 476
+    elseif x == 0 - 14065 then
+        return 770
+    elseif x == 0 - 13968 then
+        return 55
+    elseif x == 0 - 13871 then
+        return 349
+    elseif x == 0 - 13774 then
+        return 643
+    elseif x == 0 - 13677 then
+        return 937
+    elseif x == 0 - 13580 then
+        return 222
+    elseif x == 0 - 13483 then
+        return 516
+    elseif x == 0 - 13386 then
+        return 810
+    elseif x == 0 - 13289 then
+        return 95
+    elseif x == 0 - 13192 then
+        return 389
+    elseif x == 0 - 13095 then
+        return 683
+    elseif x == 0 - 12998 then
+        return 977
+    elseif x == 0 - 12901 then
+        return 262
+    elseif x == 0 - 12804 then
+        return 556
+    elseif x == 0 - 12707 then
+        return 850
+    elseif x == 0 - 12610 then
+        return 135
+    elseif x == 0 - 12513 then
+        return 429
+    elseif x == 0 - 12416 then
+        return 723
+    elseif x == 0 - 12319 then
+        return 8
+    elseif x == 0 - 12222 then
+        return 302
+    elseif x == 0 - 12125 then
+        return 596
+    elseif x == 0 - 12028 then
+        return 890
+    elseif x == 0 - 11931 then
+        return 175
+    elseif x == 0 - 11834 then
+        return 469
+    elseif x == 0 - 11737 then
+        return 763
+    elseif x == 0 - 11640 then
+        return 48
+    elseif x == 0 - 11543 then
+        return 342
+    elseif x == 0 - 11446 then
+        return 636
+    elseif x == 0 - 11349 then
+        return 930
+    elseif x == 0 - 11252 then
+        return 215
+    elseif x == 0 - 11155 then
+        return 509
+    elseif x == 0 - 11058 then
+        return 803
+    elseif x == 0 - 10961 then
+        return 88
+    elseif x == 0 - 10864 then
+        return 382
+    elseif x == 0 - 10767 then
+        return 676
+    elseif x == 0 - 10670 then
+        return 970
+    elseif x == 0 - 10573 then
+        return 255
+    elseif x == 0 - 10476 then
+        return 549
+    elseif x == 0 - 10379 then
+        return 843
+    elseif x == 0 - 10282 then
+        return 128
+    elseif x == 0 - 10185 then
+        return 422
+    elseif x == 0 - 10088 then
+        return 716
+    elseif x == 0 - 9991 then
+        return 1
+    elseif x == 0 - 9894 then
+        return 295
+    elseif x == 0 - 9797 then
+        return 589
+    elseif x == 0 - 9700 then
+        return 883
+    elseif x == 0 - 9603 then
+        return 168
+    elseif x == 0 - 9506 then
+        return 462
+    elseif x == 0 - 9409 then
+        return 756
+    elseif x == 0 - 9312 then
+        return 41
+    elseif x == 0 - 9215 then
+        return 335
+    elseif x == 0 - 9118 then
+        return 629
+    elseif x == 0 - 9021 then
+        return 923
+    elseif x == 0 - 8924 then
+        return 208
+    elseif x == 0 - 8827 then
+        return 502
+    elseif x == 0 - 8730 then
+        return 796
+    elseif x == 0 - 8633 then
+        return 81
+    elseif x == 0 - 8536 then
+        return 375
+    elseif x == 0 - 8439 then
+        return 669
+    elseif x == 0 - 8342 then
+        return 963
+    elseif x == 0 - 8245 then
+        return 248
+    elseif x == 0 - 8148 then
+        return 542
+    elseif x == 0 - 8051 then
+        return 836
+    elseif x == 0 - 7954 then
+        return 121
+    elseif x == 0 - 7857 then
+        return 415
+    elseif x == 0 - 7760 then
+        return 709
+    elseif x == 0 - 7663 then
+        return 1003
+    elseif x == 0 - 7566 then
+        return 288
+    elseif x == 0 - 7469 then
+        return 582
+    elseif x == 0 - 7372 then
+        return 876
+    elseif x == 0 - 7275 then
+        return 161
+    elseif x == 0 - 7178 then
+        return 455
+    elseif x == 0 - 7081 then
+        return 749
+    elseif x == 0 - 6984 then
+        return 34
+    elseif x == 0 - 6887 then
+        return 328
+    elseif x == 0 - 6790 then
+        return 622
+    elseif x == 0 - 6693 then
+        return 916
+    elseif x == 0 - 6596 then
+        return 201
+    elseif x == 0 - 6499 then
+        return 495
+    elseif x == 0 - 6402 then
+        return 789
+    elseif x == 0 - 6305 then
+        return 74
+    elseif x == 0 - 6208 then
+        return 368
+    elseif x == 0 - 6111 then
+        return 662
+    elseif x == 0 - 6014 then
+        return 956
+    elseif x == 0 - 5917 then
+        return 241
+    elseif x == 0 - 5820 then
+        return 535
+    elseif x == 0 - 5723 then
+        return 829
+    elseif x == 0 - 5626 then
+        return 114
+    elseif x == 0 - 5529 then
+        return 408
+    elseif x == 0 - 5432 then
+        return 702
+    elseif x == 0 - 5335 then
+        return 996
+    elseif x == 0 - 5238 then
+        return 281
+    elseif x == 0 - 5141 then
+        return 575
+    elseif x == 0 - 5044 then
+        return 869
+    elseif x == 0 - 4947 then
+        return 154
+    elseif x == 0 - 4850 then
+        return 448
+    elseif x == 0 - 4753 then
+        return 742
+    elseif x == 0 - 4656 then
+        return 27
+    elseif x == 0 - 4559 then
+        return 321
+    elseif x == 0 - 4462 then
+        return 615
+    elseif x == 0 - 4365 then
+        return 909
+    elseif x == 0 - 4268 then
+        return 194
+    elseif x == 0 - 4171 then
+        return 488
+    elseif x == 0 - 4074 then
+        return 782
+    elseif x == 0 - 3977 then
+        return 67
+    elseif x == 0 - 3880 then
+        return 361
+    elseif x == 0 - 3783 then
+        return 655
+    elseif x == 0 - 3686 then
+        return 949
+    elseif x == 0 - 3589 then
+        return 234
+    elseif x == 0 - 3492 then
+        return 528
+    elseif x == 0 - 3395 then
+        return 822
+    elseif x == 0 - 3298 then
+        return 107
+    elseif x == 0 - 3201 then
+        return 401
+    elseif x == 0 - 3104 then
+        return 695
+    elseif x == 0 - 3007 then
+        return 989
+    elseif x == 0 - 2910 then
+        return 274
+    elseif x == 0 - 2813 then
+        return 568
+    elseif x == 0 - 2716 then
+        return 862
+    elseif x == 0 - 2619 then
+        return 147
+    elseif x == 0 - 2522 then
+        return 441
+    elseif x == 0 - 2425 then
+        return 735
+    elseif x == 0 - 2328 then
+        return 20
+    elseif x == 0 - 2231 then
+        return 314
+    elseif x == 0 - 2134 then
+        return 608
+    elseif x == 0 - 2037 then
+        return 902
+    elseif x == 0 - 1940 then
+        return 187
+    elseif x == 0 - 1843 then
+        return 481
+    elseif x == 0 - 1746 then
+        return 775
+    elseif x == 0 - 1649 then
+        return 60
+    elseif x == 0 - 1552 then
+        return 354
+    elseif x == 0 - 1455 then
+        return 648
+    elseif x == 0 - 1358 then
+        return 942
+    elseif x == 0 - 1261 then
+        return 227
+    elseif x == 0 - 1164 then
+        return 521
+    elseif x == 0 - 1067 then
+        return 815
+    elseif x == 0 - 970 then
+        return 100
+    elseif x == 0 - 873 then
+        return 394
+    elseif x == 0 - 776 then
+        return 688
+    elseif x == 0 - 679 then
+        return 982
+    elseif x == 0 - 582 then
+        return 267
+    elseif x == 0 - 485 then
+        return 561
+    elseif x == 0 - 388 then
+        return 855
+    elseif x == 0 - 291 then
+        return 140
+    elseif x == 0 - 194 then
+        return 434
+    elseif x == 0 - 97 then
+        return 728
+    elseif x == 0 then
+        return 13
+    elseif x == 97 then
+        return 307
+    elseif x == 194 then
+        return 601
+    elseif x == 291 then
+        return 895
+    elseif x == 388 then
+        return 180
+    elseif x == 485 then
+        return 474
+    elseif x == 582 then
+        return 768
+    elseif x == 679 then
+        return 53
+    elseif x == 776 then
+        return 347
+    elseif x == 873 then
+        return 641
+    elseif x == 970 then
+        return 935
+    elseif x == 1067 then
+        return 220
+    elseif x == 1164 then
+        return 514
+    elseif x == 1261 then
+        return 808
+    elseif x == 1358 then
+        return 93
+    elseif x == 1455 then
+        return 387
+    elseif x == 1552 then
+        return 681
+    elseif x == 1649 then
+        return 975
+    elseif x == 1746 then
+        return 260
+    elseif x == 1843 then
+        return 554
+    elseif x == 1940 then
+        return 848
+    elseif x == 2037 then
+        return 133
+    elseif x == 2134 then
+        return 427
+    elseif x == 2231 then
+        return 721
+    elseif x == 2328 then
+        return 6
+    elseif x == 2425 then
+        return 300
+    elseif x == 2522 then
+        return 594
+    elseif x == 2619 then
+        return 888
+    elseif x == 2716 then
+        return 173
+    elseif x == 2813 then
+        return 467
+    elseif x == 2910 then
+        return 761
+    elseif x == 3007 then
+        return 46
+    elseif x == 3104 then
+        return 340
+    elseif x == 3201 then
+        return 634
+    elseif x == 3298 then
+        return 928
+    elseif x == 3395 then
+        return 213
+    elseif x == 3492 then
+        return 507
+    elseif x == 3589 then
+        return 801
+    elseif x == 3686 then
+        return 86
+    elseif x == 3783 then
+        return 380
+    elseif x == 3880 then
+        return 674
+    elseif x == 3977 then
+        return 968
+    elseif x == 4074 then
+        return 253
+    elseif x == 4171 then
+        return 547
+    elseif x == 4268 then
+        return 841
+    elseif x == 4365 then
+        return 126
+    elseif x == 4462 then
+        return 420
+    elseif x == 4559 then
+        return 714
+    elseif x == 4656 then
+        return 1008
+    elseif x == 4753 then
+        return 293
+    elseif x == 4850 then
+        return 587
+    elseif x == 4947 then
+        return 881
+    elseif x == 5044 then
+        return 166
+    elseif x == 5141 then
+        return 460
+    elseif x == 5238 then
+        return 754
+    elseif x == 5335 then
+        return 39
+    elseif x == 5432 then
+        return 333
+    elseif x == 5529 then
+        return 627
+    elseif x == 5626 then
+        return 921
+    elseif x == 5723 then
+        return 206
+    elseif x == 5820 then
+        return 500
+    elseif x == 5917 then
+        return 794
+    elseif x == 6014 then
+        return 79
+    elseif x == 6111 then
+        return 373
+    elseif x == 6208 then
+        return 667
+    elseif x == 6305 then
+        return 961
+    elseif x == 6402 then
+        return 246
+    elseif x == 6499 then
+        return 540
+    elseif x == 6596 then
+        return 834
+    elseif x == 6693 then
+        return 119
+    elseif x == 6790 then
+        return 413
+    elseif x == 6887 then
+        return 707
+    elseif x == 6984 then
+        return 1001
+    elseif x == 7081 then
+        return 286
+    elseif x == 7178 then
+        return 580
+    elseif x == 7275 then
+        return 874
+    elseif x == 7372 then
+        return 159
+    elseif x == 7469 then
+        return 453
+    elseif x == 7566 then
+        return 747
+    elseif x == 7663 then
+        return 32
+    elseif x == 7760 then
+        return 326
+    elseif x == 7857 then
+        return 620
+    elseif x == 7954 then
+        return 914
+    elseif x == 8051 then
+        return 199
+    elseif x == 8148 then
+        return 493
+    elseif x == 8245 then
+        return 787
+    elseif x == 8342 then
+        return 72
+    elseif x == 8439 then
+        return 366
+    elseif x == 8536 then
+        return 660
+    elseif x == 8633 then
+        return 954
+    elseif x == 8730 then
+        return 239
+    elseif x == 8827 then
+        return 533
+    elseif x == 8924 then
+        return 827
+    elseif x == 9021 then
+        return 112
+    elseif x == 9118 then
+        return 406
+    elseif x == 9215 then
+        return 700
+    elseif x == 9312 then
+        return 994
+    elseif x == 9409 then
+        return 279
+    elseif x == 9506 then
+        return 573
+    elseif x == 9603 then
+        return 867
+    elseif x == 9700 then
+        return 152
+    elseif x == 9797 then
+        return 446
+    elseif x == 9894 then
+        return 740
+    elseif x == 9991 then
+        return 25
+    elseif x == 10088 then
+        return 319
+    elseif x == 10185 then
+        return 613
+    elseif x == 10282 then
+        return 907
+    elseif x == 10379 then
+        return 192
+    elseif x == 10476 then
+        return 486
+    elseif x == 10573 then
+        return 780
+    elseif x == 10670 then
+        return 65
+    elseif x == 10767 then
+        return 359
+    elseif x == 10864 then
+        return 653
+    elseif x == 10961 then
+        return 947
+    elseif x == 11058 then
+        return 232
+    elseif x == 11155 then
+        return 526
+    elseif x == 11252 then
+        return 820
+    elseif x == 11349 then
+        return 105
+    elseif x == 11446 then
+        return 399
+    elseif x == 11543 then
+        return 693
+    elseif x == 11640 then
+        return 987
+    elseif x == 11737 then
+        return 272
+    elseif x == 11834 then
+        return 566
+    elseif x == 11931 then
+        return 860
+    elseif x == 12028 then
+        return 145
+    elseif x == 12125 then
+        return 439
+    elseif x == 12222 then
+        return 733
+    elseif x == 12319 then
+        return 18
+    elseif x == 12416 then
+        return 312
+    elseif x == 12513 then
+        return 606
+    elseif x == 12610 then
+        return 900
+    elseif x == 12707 then
+        return 185
+    elseif x == 12804 then
+        return 479
+    elseif x == 12901 then
+        return 773
+    elseif x == 12998 then
+        return 58
+    elseif x == 13095 then
+        return 352
+    elseif x == 13192 then
+        return 646
+    elseif x == 13289 then
+        return 940
+    elseif x == 13386 then
+        return 225
+    elseif x == 13483 then
+        return 519
+    elseif x == 13580 then
+        return 813
+    elseif x == 13677 then
+        return 98
+    elseif x == 13774 then
+        return 392
+    elseif x == 13871 then
+        return 686
+    elseif x == 13968 then
+        return 980
+    elseif x == 14065 then
+        return 265
+    elseif x == 14162 then
+        return 559
+    elseif x == 14259 then
+        return 853
+    elseif x == 14356 then
+        return 138
+    elseif x == 14453 then
+        return 432
+    elseif x == 14550 then
+        return 726
+    elseif x == 14647 then
+        return 11
+    elseif x == 14744 then
+        return 305
+    elseif x == 14841 then
+        return 599
+    elseif x == 14938 then
+        return 893
+    elseif x == 15035 then
+        return 178
+    elseif x == 15132 then
+        return 472
+    elseif x == 15229 then
+        return 766
+    elseif x == 15326 then
+        return 51
+    elseif x == 15423 then
+        return 345
+    elseif x == 15520 then
+        return 639
+    elseif x == 15617 then
+        return 933
+    elseif x == 15714 then
+        return 218
+    elseif x == 15811 then
+        return 512
+    elseif x == 15908 then
+        return 806
+    elseif x == 16005 then
+        return 91
+    elseif x == 16102 then
+        return 385
+    elseif x == 16199 then
+        return 679
+    elseif x == 16296 then
+        return 973
+    elseif x == 16393 then
+        return 258
+    elseif x == 16490 then
+        return 552
+    elseif x == 16587 then
+        return 846
+    elseif x == 16684 then
+        return 131
+    elseif x == 16781 then
+        return 425
+    elseif x == 16878 then
+        return 719
+    elseif x == 16975 then
+        return 4
+    elseif x == 17072 then
+        return 298
+    elseif x == 17169 then
+        return 592
+    elseif x == 17266 then
+        return 886
+    elseif x == 17363 then
+        return 171
+    elseif x == 17460 then
+        return 465
+    elseif x == 17557 then
+        return 759
+    elseif x == 17654 then
+        return 44
+    elseif x == 17751 then
+        return 338
+    elseif x == 17848 then
+        return 632
+    elseif x == 17945 then
+        return 926
+    elseif x == 18042 then
+        return 211
+    elseif x == 18139 then
+        return 505
+    elseif x == 18236 then
+        return 799
+    elseif x == 18333 then
+        return 84
+    elseif x == 18430 then
+        return 378
+    elseif x == 18527 then
+        return 672
+    elseif x == 18624 then
+        return 966
+    elseif x == 18721 then
+        return 251
+    elseif x == 18818 then
+        return 545
+    elseif x == 18915 then
+        return 839
+    elseif x == 19012 then
+        return 124
+    elseif x == 19109 then
+        return 418
+    elseif x == 19206 then
+        return 712
+    elseif x == 19303 then
+        return 1006
+    elseif x == 19400 then
+        return 291
+    elseif x == 19497 then
+        return 585
+    elseif x == 19594 then
+        return 879
+    elseif x == 19691 then
+        return 164
+    elseif x == 19788 then
+        return 458
+    elseif x == 19885 then
+        return 752
+    elseif x == 19982 then
+        return 37
+    elseif x == 20079 then
+        return 331
+    elseif x == 20176 then
+        return 625
+    elseif x == 20273 then
+        return 919
+    elseif x == 20370 then
+        return 204
+    elseif x == 20467 then
+        return 498
+    elseif x == 20564 then
+        return 792
+    elseif x == 20661 then
+        return 77
+    elseif x == 20758 then
+        return 371
+    elseif x == 20855 then
+        return 665
+    elseif x == 20952 then
+        return 959
+    elseif x == 21049 then
+        return 244
+    elseif x == 21146 then
+        return 538
+    elseif x == 21243 then
+        return 832
+    elseif x == 21340 then
+        return 117
+    elseif x == 21437 then
+        return 411
+    elseif x == 21534 then
+        return 705
+    elseif x == 21631 then
+        return 999
+    elseif x == 21728 then
+        return 284
+    elseif x == 21825 then
+        return 578
+    elseif x == 21922 then
+        return 872
+    elseif x == 22019 then
+        return 157
+    elseif x == 22116 then
+        return 451
+    elseif x == 22213 then
+        return 745
+    elseif x == 22310 then
+        return 30
+    elseif x == 22407 then
+        return 324
+    elseif x == 22504 then
+        return 618
+    elseif x == 22601 then
+        return 912
+    elseif x == 22698 then
+        return 197
+    elseif x == 22795 then
+        return 491
+    elseif x == 22892 then
+        return 785
+    elseif x == 22989 then
+        return 70
+    elseif x == 23086 then
+        return 364
+    elseif x == 23183 then
+        return 658
+    elseif x == 23280 then
+        return 952
+    elseif x == 23377 then
+        return 237
+    elseif x == 23474 then
+        return 531
+    elseif x == 23571 then
+        return 825
+    elseif x == 23668 then
+        return 110
+    elseif x == 23765 then
+        return 404
+    elseif x == 23862 then
+        return 698
+    elseif x == 23959 then
+        return 992
+    elseif x == 24056 then
+        return 277
+    elseif x == 24153 then
+        return 571
+    elseif x == 24250 then
+        return 865
+    elseif x == 24347 then
+        return 150
+    elseif x == 24444 then
+        return 444
+    elseif x == 24541 then
+        return 738
+    elseif x == 24638 then
+        return 23
+    elseif x == 24735 then
+        return 317
+    elseif x == 24832 then
+        return 611
+    elseif x == 24929 then
+        return 905
+    elseif x == 25026 then
+        return 190
+    elseif x == 25123 then
+        return 484
+    elseif x == 25220 then
+        return 778
+    elseif x == 25317 then
+        return 63
+    elseif x == 25414 then
+        return 357
+    elseif x == 25511 then
+        return 651
+    elseif x == 25608 then
+        return 945
+    elseif x == 25705 then
+        return 230
+    elseif x == 25802 then
+        return 524
+    elseif x == 25899 then
+        return 818
+    elseif x == 25996 then
+        return 103
+    elseif x == 26093 then
+        return 397
+    elseif x == 26190 then
+        return 691
+    elseif x == 26287 then
+        return 985
+    elseif x == 26384 then
+        return 270
+    elseif x == 26481 then
+        return 564
+    elseif x == 26578 then
+        return 858
+    elseif x == 26675 then
+        return 143
+    elseif x == 26772 then
+        return 437
+    elseif x == 26869 then
+        return 731
+    elseif x == 26966 then
+        return 16
+    elseif x == 27063 then
+        return 310
+    elseif x == 27160 then
+        return 604
+    elseif x == 27257 then
+        return 898
+    elseif x == 27354 then
+        return 183
+    elseif x == 27451 then
+        return 477
+    elseif x == 27548 then
+        return 771
+    elseif x == 27645 then
+        return 56
+    elseif x == 27742 then
+        return 350
+    elseif x == 27839 then
+        return 644
+    elseif x == 27936 then
+        return 938
+    elseif x == 28033 then
+        return 223
+    elseif x == 28130 then
+        return 517
+    elseif x == 28227 then
+        return 811
+    elseif x == 28324 then
+        return 96
+    elseif x == 28421 then
+        return 390
+    elseif x == 28518 then
+        return 684
+    elseif x == 28615 then
+        return 978
+    elseif x == 28712 then
+        return 263
+    elseif x == 28809 then
+        return 557
+    elseif x == 28906 then
+        return 851
+    elseif x == 29003 then
+        return 136
+    elseif x == 29100 then
+        return 430
+    elseif x == 29197 then
+        return 724
+    elseif x == 29294 then
+        return 9
+    elseif x == 29391 then
+        return 303
+    elseif x == 29488 then
+        return 597
+    elseif x == 29585 then
+        return 891
+    elseif x == 29682 then
+        return 176
+    elseif x == 29779 then
+        return 470
+    elseif x == 29876 then
+        return 764
+    elseif x == 29973 then
+        return 49
+    elseif x == 30070 then
+        return 343
+    elseif x == 30167 then
+        return 637
+    elseif x == 30264 then
+        return 931
+    elseif x == 30361 then
+        return 216
+    elseif x == 30458 then
+        return 510
+    elseif x == 30555 then
+        return 804
+    elseif x == 30652 then
+        return 89
+    elseif x == 30749 then
+        return 383
+    elseif x == 30846 then
+        return 677
+    elseif x == 30943 then
+        return 971
+    elseif x == 31040 then
+        return 256
+    elseif x == 31137 then
+        return 550
+    elseif x == 31234 then
+        return 844
+    elseif x == 31331 then
+        return 129
+    elseif x == 31428 then
+        return 423
+    elseif x == 31525 then
+        return 717
+    elseif x == 31622 then
+        return 2
+    elseif x == 31719 then
+        return 296
+    elseif x == 31816 then
+        return 590
+    elseif x == 31913 then
+        return 884
+    elseif x == 32010 then
+        return 169
+    elseif x == 32107 then
+        return 463
+    elseif x == 32204 then
+        return 757
+    elseif x == 32301 then
+        return 42
+    elseif x == 32398 then
+        return 336
+    elseif x == 32495 then
+        return 630
+    elseif x == 32592 then
+        return 924
+    elseif x == 32689 then
+        return 209
+    elseif x == 32786 then
+        return 503
+    elseif x == 32883 then
+        return 797
+    elseif x == 32980 then
+        return 82
+    elseif x == 33077 then
+        return 376
+    elseif x == 33174 then
+        return 670
+    elseif x == 33271 then
+        return 964
+    elseif x == 33368 then
+        return 249
+    elseif x == 33465 then
+        return 543
+    elseif x == 33562 then
+        return 837
+    elseif x == 33659 then
+        return 122
+    elseif x == 33756 then
+        return 416
+    elseif x == 33853 then
+        return 710
+    elseif x == 33950 then
+        return 1004
+    elseif x == 34047 then
+        return 289
+    elseif x == 34144 then
+        return 583
+    elseif x == 34241 then
+        return 877
+    elseif x == 34338 then
+        return 162
+    elseif x == 34435 then
+        return 456
+    elseif x == 34532 then
+        return 750
+    elseif x == 34629 then
+        return 35
+    elseif x == 34726 then
+        return 329
+    elseif x == 34823 then
+        return 623
+    elseif x == 34920 then
+        return 917
+    elseif x == 35017 then
+        return 202
+    elseif x == 35114 then
+        return 496
+    elseif x == 35211 then
+        return 790
+    elseif x == 35308 then
+        return 75
+    elseif x == 35405 then
+        return 369
+    elseif x == 35502 then
+        return 663
+    elseif x == 35599 then
+        return 957
+    elseif x == 35696 then
+        return 242
+    elseif x == 35793 then
+        return 536
+    elseif x == 35890 then
+        return 830
+    elseif x == 35987 then
+        return 115
+    elseif x == 36084 then
+        return 409
+    elseif x == 36181 then
+        return 703
+    elseif x == 36278 then
+        return 997
+    elseif x == 36375 then
+        return 282
+    elseif x == 36472 then
+        return 576
+    elseif x == 36569 then
+        return 870
+    elseif x == 36666 then
+        return 155
+    elseif x == 36763 then
+        return 449
+    elseif x == 36860 then
+        return 743
+    elseif x == 36957 then
+        return 28
+    elseif x == 37054 then
+        return 322
+    elseif x == 37151 then
+        return 616
+    elseif x == 37248 then
+        return 910
+    elseif x == 37345 then
+        return 195
+    elseif x == 37442 then
+        return 489
+    elseif x == 37539 then
+        return 783
+    elseif x == 37636 then
+        return 68
+    elseif x == 37733 then
+        return 362
+    elseif x == 37830 then
+        return 656
+    elseif x == 37927 then
+        return 950
+    elseif x == 38024 then
+        return 235
+    elseif x == 38121 then
+        return 529
+    elseif x == 38218 then
+        return 823
+    elseif x == 38315 then
+        return 108
+    elseif x == 38412 then
+        return 402
+    elseif x == 38509 then
+        return 696
+    elseif x == 38606 then
+        return 990
+    elseif x == 38703 then
+        return 275
+    elseif x == 38800 then
+        return 569
+    elseif x == 38897 then
+        return 863
+    elseif x == 38994 then
+        return 148
+    elseif x == 39091 then
+        return 442
+    elseif x == 39188 then
+        return 736
+    elseif x == 39285 then
+        return 21
+    elseif x == 39382 then
+        return 315
+    elseif x == 39479 then
+        return 609
+    elseif x == 39576 then
+        return 903
+    elseif x == 39673 then
+        return 188
+    elseif x == 39770 then
+        return 482
+    elseif x == 39867 then
+        return 776
+    elseif x == 39964 then
+        return 61
+    elseif x == 40061 then
+        return 355
+    elseif x == 40158 then
+        return 649
+    elseif x == 40255 then
+        return 943
+    elseif x == 40352 then
+        return 228
+    elseif x == 40449 then
+        return 522
+    elseif x == 40546 then
+        return 816
+    elseif x == 40643 then
+        return 101
+    elseif x == 40740 then
+        return 395
+    elseif x == 40837 then
+        return 689
+    elseif x == 40934 then
+        return 983
+    elseif x == 41031 then
+        return 268
+    elseif x == 41128 then
+        return 562
+    elseif x == 41225 then
+        return 856
+    elseif x == 41322 then
+        return 141
+    elseif x == 41419 then
+        return 435
+    elseif x == 41516 then
+        return 729
+    elseif x == 41613 then
+        return 14
+    elseif x == 41710 then
+        return 308
+    elseif x == 41807 then
+        return 602
+    elseif x == 41904 then
+        return 896
+    elseif x == 42001 then
+        return 181
+    elseif x == 42098 then
+        return 475
+    elseif x == 42195 then
+        return 769
+    elseif x == 42292 then
+        return 54
+    elseif x == 42389 then
+        return 348
+    elseif x == 42486 then
+        return 642
+    elseif x == 42583 then
+        return 936
+    elseif x == 42680 then
+        return 221
+    elseif x == 42777 then
+        return 515
+    elseif x == 42874 then
+        return 809
+    elseif x == 42971 then
+        return 94
+    elseif x == 43068 then
+        return 388
+    elseif x == 43165 then
+        return 682
+    elseif x == 43262 then
+        return 976
+    elseif x == 43359 then
+        return 261
+    elseif x == 43456 then
+        return 555
+    elseif x == 43553 then
+        return 849
+    elseif x == 43650 then
+        return 134
+    elseif x == 43747 then
+        return 428
+    elseif x == 43844 then
+        return 722
+    elseif x == 43941 then
+        return 7
+    elseif x == 44038 then
+        return 301
+    elseif x == 44135 then
+        return 595
+    elseif x == 44232 then
+        return 889
+    elseif x == 44329 then
+        return 174
+    elseif x == 44426 then
+        return 468
+    elseif x == 44523 then
+        return 762
+    elseif x == 44620 then
+        return 47
+    elseif x == 44717 then
+        return 341
+    elseif x == 44814 then
+        return 635
+    elseif x == 44911 then
+        return 929
+    elseif x == 45008 then
+        return 214
+    elseif x == 45105 then
+        return 508
+    elseif x == 45202 then
+        return 802
+    elseif x == 45299 then
+        return 87
+    elseif x == 45396 then
+        return 381
+    elseif x == 45493 then
+        return 675
+    elseif x == 45590 then
+        return 969
+    elseif x == 45687 then
+        return 254
+    elseif x == 45784 then
+        return 548
+    elseif x == 45881 then
+        return 842
+    elseif x == 45978 then
+        return 127
+    elseif x == 46075 then
+        return 421
+    elseif x == 46172 then
+        return 715
+    elseif x == 46269 then
+        return 0
+    elseif x == 46366 then
+        return 294
+    elseif x == 46463 then
+        return 588
+    elseif x == 46560 then
+        return 882
+    elseif x == 46657 then
+        return 167
+    elseif x == 46754 then
+        return 461
+    elseif x == 46851 then
+        return 755
+    elseif x == 46948 then
+        return 40
+    elseif x == 47045 then
+        return 334
+    elseif x == 47142 then
+        return 628
+    elseif x == 47239 then
+        return 922
+    elseif x == 47336 then
+        return 207
+    elseif x == 47433 then
+        return 501
+    elseif x == 47530 then
+        return 795
+    elseif x == 47627 then
+        return 80
+    elseif x == 47724 then
+        return 374
+    elseif x == 47821 then
+        return 668
+    elseif x == 47918 then
+        return 962
+    elseif x == 48015 then
+        return 247
+    elseif x == 48112 then
+        return 541
+    elseif x == 48209 then
+        return 835
+    elseif x == 48306 then
+        return 120
+    elseif x == 48403 then
+        return 414
+    end
+    return 0 - 1
+end
+
+local total = 0
+local erros = 0
+for volta = 1, 1 do
+    for i = 0 - 48600, 48600, 61 do
+        local v = valor(i)
+        if v < 0 then
+            erros = erros + 1
+        else
+            total = total + v
+        end
+    end
+end
+print(total)
+print(erros)
@@ -0,0 +1,12 @@
+-- Fatorial recursivo de 1 a 10
+function fatorial(n)
+    if n <= 1 then
+        return 1
+    end
+    return n * fatorial(n - 1)
+end
+
+local limite = 10
+for i = 1, limite do
+    print(fatorial(i))
+end
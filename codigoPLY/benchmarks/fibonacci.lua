@@ -0,0 +1,18 @@
+-- Fibonacci iterativo e recursivo
+function fib(n)
+    if n < 2 then
+        return n
+    end
+    return fib(n - 1) + fib(n - 2)
+end
+
+local a = 0
+local b = 1
+local passos = 3 * 10
+for i = 1, passos do
+    local t = a + b
+    a = b
+    b = t
+end
+print(a)
+print(fib(15))
@@ -0,0 +1,28 @@
+-- Lacos numericos aninhados: passo negativo, passo so conhecido na
+-- execucao e expressoes que nao mudam dentro do laco
+largura = 12
+
+function grade(altura, passo)
+    local soma = 0
+    for i = altura, 1, passo do
+        for j = 1, largura do
+            soma = soma + i * largura + j
+        end
+    end
+    return soma
+end
+
+local total = 0
+local n = 20
+for i = n, 1, -1 do
+    for j = 1, n do
+        local k = 0
+        while k < n / 4 do
+            total = total + i * n + j * 2 + k
+            k = k + 1
+        end
+    end
+end
+print(total)
+print(grade(15, 0 - 1))
+print(grade(15, 0 - 2))
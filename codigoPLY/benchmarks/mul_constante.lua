@@ -0,0 +1,13 @@
+-- Multiplicacao por constantes: potencias de 2, 2^k + 1, 2^k - 1,
+-- negativas e uma sem decomposicao barata
+local soma = 0
+for i = -40, 80 do
+    soma = soma + i * 8 + 9 * i - i * 7 + i * -4 + i * 10
+end
+print(soma)
+
+local produto = 1
+for i = 1, 12 do
+    produto = produto * 3 + i * 16
+end
+print(produto)
@@ -0,0 +1,18 @@
+-- Operador ^ com expoente constante (quadrados sucessivos desenrolados)
+-- e com expoente so conhecido na execucao
+local soma = 0
+for i = -10, 10 do
+    soma = soma + i ^ 2 + i ^ 3 + 2 ^ 5 * i
+end
+print(soma)
+
+function pot(b, e)
+    return b ^ e
+end
+for e = 0, 12, 3 do
+    print(pot(3, e))
+end
+print(pot(2, 31))
+print(pot(5, 0 - 1))
+print(2 ^ 3 ^ 2)
+print(-2 ^ 2)
@@ -0,0 +1,27 @@
+-- Conta os primos ate 200 (resto calculado com divisao inteira)
+function divide(n, d)
+    return n - n / d * d == 0
+end
+
+function eh_primo(n)
+    if n < 2 then
+        return false
+    end
+    local d = 2
+    while d * d <= n do
+        if divide(n, d) then
+            return false
+        end
+        d = d + 1
+    end
+    return true
+end
+
+local total = 0
+local maximo = 50 * 4
+for n = 1, maximo do
+    if eh_primo(n) then
+        total = total + 1
+    end
+end
+print(total)
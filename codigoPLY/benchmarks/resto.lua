@@ -0,0 +1,31 @@
+-- Operador % (o resultado tem o sinal do divisor): divisores constantes,
+-- potencias de 2 e divisor so conhecido na execucao
+local soma = 0
+for i = -100, 100 do
+    soma = soma + i % 8 + i % 5 + i % -3
+end
+print(soma)
+
+function resto(a, b)
+    return a % b
+end
+print(resto(0 - 7, 3))
+print(resto(7, 0 - 3))
+print(resto(0 - 7, 0 - 3))
+print(resto(6, 3))
+
+local primos = 0
+for n = 2, 300 do
+    local d = 2
+    local primo = true
+    while primo and d * d <= n do
+        if n % d == 0 then
+            primo = false
+        end
+        d = d + 1
+    end
+    if primo then
+        primos = primos + 1
+    end
+end
+print(primos)
@@ -0,0 +1,25 @@
+-- `x % y` nao muda dentro do laco, mas o divisor e variavel: o LICM nao
+-- pode subir o resto para antes de um laco que talvez nem execute
+-- (divisao por zero)
+function soma_restos(x, y, n)
+    local s = 0
+    for i = 1, n do
+        s = s + x % y
+    end
+    return s
+end
+
+function soma_guardada(x, y, n)
+    local s = 0
+    for i = 1, n do
+        if y > 0 then
+            s = s + x % y
+        end
+    end
+    return s
+end
+
+print(soma_restos(7, 0, 0))
+print(soma_restos(7, 3, 50))
+print(soma_guardada(7, 0, 50))
+print(soma_guardada(7, 2, 50))
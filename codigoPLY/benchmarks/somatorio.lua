@@ -0,0 +1,22 @@
+-- Lacos aninhados e while com decremento
+local n = 100
+local soma = 0
+for i = 1, n do
+    for j = 1, 10 do
+        soma = soma + i * j
+    end
+end
+print(soma)
+
+local k = 20
+while k > 0 do
+    soma = soma - k
+    k = k - 2
+end
+print(soma)
+
+local pares = 0
+for i = 0, 50, 2 do
+    pares = pares + i
+end
+print(pares)
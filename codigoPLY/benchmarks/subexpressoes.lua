@@ -0,0 +1,23 @@
+-- Subexpressoes repetidas: `x * y` nas duas metades da condicao, `a + b`
+-- e `b + a` no mesmo bloco e variaveis lidas varias vezes
+limite = 100
+function faixa(x, y)
+    if x * y > 0 and x * y < limite then
+        return x * y
+    end
+    return 0
+end
+
+function mistura(a, b)
+    local s = a + b - a * b
+    local t = b + a + b * a
+    return s * t + a * b
+end
+
+local total = 0
+for i = 0 - 20, 20 do
+    for j = 1, 10 do
+        total = total + faixa(i, j) + mistura(i, j) % 7
+    end
+end
+print(total)
@@ -0,0 +1,17 @@
+-- Strings, booleanos e escolhas
+function classifica(n)
+    if n > 100 then
+        return "grande"
+    elseif n > 10 then
+        return "medio"
+    end
+    return "pequeno"
+end
+
+local saudacao = "ola"
+print(saudacao)
+print(classifica(5))
+print(classifica(50))
+print(classifica(500))
+print(3 < 4)
+print(10 == 11)
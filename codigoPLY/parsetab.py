@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftORleftANDleftEQUALSLTGTLTEQUALSGTEQUALSleftPLUSMINUSleftTIMESDIVIDErightUMINUSNOTAND ATRIB BRACE BREAK COLCH COLON COMMA CONCAT DIF DIVIDE DO DOT DUALCOLON ELSE ELSEIF END EQUALS EXPO FALSE FOR FUNCTION GT GTEQUALS IF IN LOCAL LPAREN LT LTEQUALS MINUS NAME NIL NOT NUMBER OR PERCENTUAL PLUS PRINT RBRACE RCOLCH RETURN RPAREN SEMICOLON STRING TAG THEN TIMES TRUE UNTIL VARARGSprogram : statements\n               | empty statements : statement statementsstatements : statementstatement : FUNCTION NAME LPAREN parameters RPAREN statements ENDstatement : FOR NAME ATRIB expression COMMA expression DO statements END\n                 | FOR NAME ATRIB expression COMMA expression COMMA expression DO statements ENDstatement : IF expression THEN statements if_tailif_tail : ENDif_tail : ELSE statements ENDif_tail : elseif_list ENDif_tail : elseif_list ELSE statements ENDelseif_list : ELSEIF expression THEN statementselseif_list : elseif_list ELSEIF expression THEN statementsempty :statement : LOCAL NAME ATRIB expressionstatement : NAME ATRIB expressionstatement : PRINT LPAREN expression RPARENstatement : RETURN expressionstatement : function_callparameters : NAME COMMA parametersparameters : NAMEparameters : arguments : expression COMMA argumentsarguments : expressionarguments : expression : MINUS expression %prec UMINUSexpression : NOT expressionexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression TIMES expression\n                  | expression DIVIDE expression\n                  | expression EQUALS expression\n                  | expression LTEQUALS expression\n                  | expression GTEQUALS expression\n                  | expression LT expression\n                  | expression GT expression\n                  | expression AND expression\n                  | expression OR expressionexpression : function_callfunction_call : NAME LPAREN arguments RPARENexpression : NUMBER\n                  | STRING\n                  | NAME\n                  | TRUE\n                  | FALSE\n                  | NIL'
+_lr_signature = 'leftORleftANDleftEQUALSLTGTLTEQUALSGTEQUALSleftPLUSMINUSleftTIMESDIVIDEPERCENTUALrightUMINUSNOTrightEXPOAND ATRIB BRACE BREAK COLCH COLON COMMA CONCAT DIF DIVIDE DO DOT DUALCOLON ELSE ELSEIF END EQUALS EXPO FALSE FOR FUNCTION GT GTEQUALS IF IN LOCAL LPAREN LT LTEQUALS MINUS NAME NIL NOT NUMBER OR PERCENTUAL PLUS PRINT RBRACE RCOLCH RETURN RPAREN SEMICOLON STRING TAG THEN TIMES TRUE UNTIL VARARGS WHILEprogram : statements\n               | empty statements : statement statementsstatements : statementstatement : FUNCTION NAME LPAREN parameters RPAREN statements ENDstatement : FOR NAME ATRIB expression COMMA expression DO statements END\n                 | FOR NAME ATRIB expression COMMA expression COMMA expression DO statements ENDstatement : WHILE expression DO statements ENDstatement : IF expression THEN statements if_tailif_tail : ENDif_tail : ELSE statements ENDif_tail : elseif_list ENDif_tail : elseif_list ELSE statements ENDelseif_list : ELSEIF expression THEN statementselseif_list : elseif_list ELSEIF expression THEN statementsempty :statement : LOCAL NAME ATRIB expressionstatement : NAME ATRIB expressionstatement : PRINT LPAREN expression RPARENstatement : RETURN expressionstatement : function_callparameters : NAME COMMA parametersparameters : NAMEparameters : arguments : expression COMMA argumentsarguments : expressionarguments : expression : MINUS expression %prec UMINUSexpression : NOT expressionexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression TIMES expression\n                  | expression DIVIDE expression\n                  | expression PERCENTUAL expression\n                  | expression EXPO expression\n                  | expression EQUALS expression\n                  | expression LTEQUALS expression\n                  | expression GTEQUALS expression\n                  | expression LT expression\n                  | expression GT expression\n                  | expression AND expression\n                  | expression OR expressionexpression : function_callfunction_call : NAME LPAREN arguments RPARENexpression : NUMBER\n                  | STRING\n                  | NAME\n                  | TRUE\n                  | FALSE\n                  | NIL'
     
-_lr_action_items = {'$end':([0,1,2,3,4,12,13,21,22,23,24,25,26,27,30,32,48,49,54,58,59,60,61,62,63,64,65,66,67,68,69,70,75,76,84,88,91,97,101,104,],[-15,0,-1,-2,-4,-20,-3,-40,-42,-43,-44,-45,-46,-47,-19,-17,-27,-28,-41,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-16,-18,-8,-9,-11,-5,-10,-12,-6,-7,]),'FUNCTION':([0,4,12,21,22,23,24,25,26,27,30,32,36,48,49,54,58,59,60,61,62,63,64,65,66,67,68,69,70,72,75,76,77,84,85,88,90,91,94,97,98,100,101,104,],[5,5,-20,-40,-42,-43,-44,-45,-46,-47,-19,-17,5,-27,-28,-41,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-16,-18,5,-8,-9,5,-11,5,-5,5,-10,5,-12,5,5,-6,-7,]),'FOR':([0,4,12,21,22,23,24,25,26,27,30,32,36,48,49,54,58,59,60,61,62,63,64,65,66,67,68,69,70,72,75,76,77,84,85,88,90,91,94,97,98,100,101,104,],[7,7,-20,-40,-42,-43,-44,-45,-46,-47,-19,-17,7,-27,-28,-41,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-16,-18,7,-8,-9,7,-11,7,-5,7,-10,7,-12,7,7,-6,-7,]),'IF':([0,4,12,21,22,23,24,25,26,27,30,32,36,48,49,54,58,59,60,61,62,63,64,65,66,67,68,69,70,72,75,76,77,84,85,88,90,91,94,97,98,100,101,104,],[8,8,-20,-40,-42,-43,-44,-45,-46,-47,-19,-17,8,-27,-28,-41,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-16,-18,8,-8,-9,8,-11,8,-5,8,-10,8,-12,8,8,-6,-7,]),'LOCAL':([0,4,12,21,22,23,24,25,26,27,30,32,36,48,49,54,58,59,60,61,62,63,64,65,66,67,68,69,70,72,75,76,77,84,85,88,90,91,94,97,98,100,101,104,],[9,9,-20,-40,-42,-43,-44,-45,-46,-47,-19,-17,9,-27,-28,-41,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-16,-18,9,-8,-9,9,-11,9,-5,9,-10,9,-12,9,9,-6,-7,]),'NAME':([0,4,5,7,8,9,11,12,15,16,19,20,21,22,23,24,25,26,27,29,30,31,32,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,55,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,74,75,76,77,79,84,85,86,88,89,90,91,94,97,98,100,101,104,],[6,6,14,17,24,28,24,-20,24,24,24,24,-40,-42,-43,-44,-45,-46,-47,24,-19,52,-17,24,6,24,24,24,24,24,24,24,24,24,24,24,-27,-28,24,-41,24,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-16,-18,52,6,24,-8,-9,6,24,-11,6,24,-5,24,6,-10,6,-12,6,6,-6,-7,]),'PRINT':([0,4,12,21,22,23,24,25,26,27,30,32,36,48,49,54,58,59,60,61,62,63,64,65,66,67,68,69,70,72,75,76,77,84,85,88,90,91,94,97,98,100,101,104,],[10,10,-20,-40,-42,-43,-44,-45,-46,-47,-19,-17,10,-27,-28,-41,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-16,-18,10,-8,-9,10,-11,10,-5,10,-10,10,-12,10,10,-6,-7,]),'RETURN':([0,4,12,21,22,23,24,25,26,27,30,32,36,48,49,54,58,59,60,61,62,63,64,65,66,67,68,69,70,72,75,76,77,84,85,88,90,91,94,97,98,100,101,104,],[11,11,-20,-40,-42,-43,-44,-45,-46,-47,-19,-17,11,-27,-28,-41,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-16,-18,11,-8,-9,11,-11,11,-5,11,-10,11,-12,11,11,-6,-7,]),'END':([4,12,13,21,22,23,24,25,26,27,30,32,48,49,54,57,58,59,60,61,62,63,64,65,66,67,68,69,70,75,76,78,81,83,84,88,91,92,96,97,99,101,102,103,104,],[-4,-20,-3,-40,-42,-43,-44,-45,-46,-47,-19,-17,-27,-28,-41,76,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-16,-18,-8,-9,84,88,91,-11,-5,-10,97,101,-12,-13,-6,-14,104,-7,]),'ELSE':([4,12,13,21,22,23,24,25,26,27,30,32,48,49,54,57,58,59,60,61,62,63,64,65,66,67,68,69,70,75,76,78,84,88,91,97,99,101,102,104,],[-4,-20,-3,-40,-42,-43,-44,-45,-46,-47,-19,-17,-27,-28,-41,77,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-16,-18,-8,-9,85,-11,-5,-10,-12,-13,-6,-14,-7,]),'ELSEIF':([4,12,13,21,22,23,24,25,26,27,30,32,48,49,54,57,58,59,60,61,62,63,64,65,66,67,68,69,70,75,76,78,84,88,91,97,99,101,102,104,],[-4,-20,-3,-40,-42,-43,-44,-45,-46,-47,-19,-17,-27,-28,-41,79,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-16,-18,-8,-9,86,-11,-5,-10,-12,-13,-6,-14,-7,]),'ATRIB':([6,17,28,],[15,35,50,]),'LPAREN':([6,10,14,24,],[16,29,31,16,]),'MINUS':([8,11,15,16,18,19,20,21,22,23,24,25,26,27,29,30,32,34,35,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,54,55,56,58,59,60,61,62,63,64,65,66,67,68,69,74,79,82,86,87,89,93,95,],[19,19,19,19,38,19,19,-40,-42,-43,-44,-45,-46,-47,19,38,38,38,19,19,19,19,19,19,19,19,19,19,19,19,-27,-28,19,38,-41,19,38,-29,-30,-31,-32,38,38,38,38,38,38,38,38,19,19,38,19,38,19,38,38,]),'NOT':([8,11,15,16,19,20,29,35,37,38,39,40,41,42,43,44,45,46,47,50,55,74,79,86,89,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'NUMBER':([8,11,15,16,19,20,29,35,37,38,39,40,41,42,43,44,45,46,47,50,55,74,79,86,89,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'STRING':([8,11,15,16,19,20,29,35,37,38,39,40,41,42,43,44,45,46,47,50,55,74,79,86,89,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'TRUE':([8,11,15,16,19,20,29,35,37,38,39,40,41,42,43,44,45,46,47,50,55,74,79,86,89,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'FALSE':([8,11,15,16,19,20,29,35,37,38,39,40,41,42,43,44,45,46,47,50,55,74,79,86,89,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'NIL':([8,11,15,16,19,20,29,35,37,38,39,40,41,42,43,44,45,46,47,50,55,74,79,86,89,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'RPAREN':([16,21,22,23,24,25,26,27,31,33,34,48,49,51,52,53,54,55,58,59,60,61,62,63,64,65,66,67,68,71,73,80,],[-26,-40,-42,-43,-44,-45,-46,-47,-23,54,-25,-27,-28,70,-22,72,-41,-26,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-23,-24,-21,]),'THEN':([18,21,22,23,24,25,26,27,48,49,54,58,59,60,61,62,63,64,65,66,67,68,87,93,],[36,-40,-42,-43,-44,-45,-46,-47,-27,-28,-41,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,94,98,]),'PLUS':([18,21,22,23,24,25,26,27,30,32,34,48,49,51,54,56,58,59,60,61,62,63,64,65,66,67,68,69,82,87,93,95,],[37,-40,-42,-43,-44,-45,-46,-47,37,37,37,-27,-28,37,-41,37,-29,-30,-31,-32,37,37,37,37,37,37,37,37,37,37,37,37,]),'TIMES':([18,21,22,23,24,25,26,27,30,32,34,48,49,51,54,56,58,59,60,61,62,63,64,65,66,67,68,69,82,87,93,95,],[39,-40,-42,-43,-44,-45,-46,-47,39,39,39,-27,-28,39,-41,39,39,39,-31,-32,39,39,39,39,39,39,39,39,39,39,39,39,]),'DIVIDE':([18,21,22,23,24,25,26,27,30,32,34,48,49,51,54,56,58,59,60,61,62,63,64,65,66,67,68,69,82,87,93,95,],[40,-40,-42,-43,-44,-45,-46,-47,40,40,40,-27,-28,40,-41,40,40,40,-31,-32,40,40,40,40,40,40,40,40,40,40,40,40,]),'EQUALS':([18,21,22,23,24,25,26,27,30,32,34,48,49,51,54,56,58,59,60,61,62,63,64,65,66,67,68,69,82,87,93,95,],[41,-40,-42,-43,-44,-45,-46,-47,41,41,41,-27,-28,41,-41,41,-29,-30,-31,-32,-33,-34,-35,-36,-37,41,41,41,41,41,41,41,]),'LTEQUALS':([18,21,22,23,24,25,26,27,30,32,34,48,49,51,54,56,58,59,60,61,62,63,64,65,66,67,68,69,82,87,93,95,],[42,-40,-42,-43,-44,-45,-46,-47,42,42,42,-27,-28,42,-41,42,-29,-30,-31,-32,-33,-34,-35,-36,-37,42,42,42,42,42,42,42,]),'GTEQUALS':([18,21,22,23,24,25,26,27,30,32,34,48,49,51,54,56,58,59,60,61,62,63,64,65,66,67,68,69,82,87,93,95,],[43,-40,-42,-43,-44,-45,-46,-47,43,43,43,-27,-28,43,-41,43,-29,-30,-31,-32,-33,-34,-35,-36,-37,43,43,43,43,43,43,43,]),'LT':([18,21,22,23,24,25,26,27,30,32,34,48,49,51,54,56,58,59,60,61,62,63,64,65,66,67,68,69,82,87,93,95,],[44,-40,-42,-43,-44,-45,-46,-47,44,44,44,-27,-28,44,-41,44,-29,-30,-31,-32,-33,-34,-35,-36,-37,44,44,44,44,44,44,44,]),'GT':([18,21,22,23,24,25,26,27,30,32,34,48,49,51,54,56,58,59,60,61,62,63,64,65,66,67,68,69,82,87,93,95,],[45,-40,-42,-43,-44,-45,-46,-47,45,45,45,-27,-28,45,-41,45,-29,-30,-31,-32,-33,-34,-35,-36,-37,45,45,45,45,45,45,45,]),'AND':([18,21,22,23,24,25,26,27,30,32,34,48,49,51,54,56,58,59,60,61,62,63,64,65,66,67,68,69,82,87,93,95,],[46,-40,-42,-43,-44,-45,-46,-47,46,46,46,-27,-28,46,-41,46,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,46,46,46,46,46,46,]),'OR':([18,21,22,23,24,25,26,27,30,32,34,48,49,51,54,56,58,59,60,61,62,63,64,65,66,67,68,69,82,87,93,95,],[47,-40,-42,-43,-44,-45,-46,-47,47,47,47,-27,-28,47,-41,47,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,47,47,47,47,47,]),'COMMA':([21,22,23,24,25,26,27,34,48,49,52,54,56,58,59,60,61,62,63,64,65,66,67,68,82,],[-40,-42,-43,-44,-45,-46,-47,55,-27,-28,71,-41,74,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,89,]),'DO':([21,22,23,24,25,26,27,48,49,54,58,59,60,61,62,63,64,65,66,67,68,82,95,],[-40,-42,-43,-44,-45,-46,-47,-27,-28,-41,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,90,100,]),}
+_lr_action_items = {'$end':([0,1,2,3,4,13,14,22,23,24,25,26,27,28,32,34,52,53,59,63,64,65,66,67,68,69,70,71,72,73,74,75,77,78,83,84,85,93,97,100,106,110,113,],[-16,0,-1,-2,-4,-21,-3,-43,-45,-46,-47,-48,-49,-50,-20,-18,-28,-29,-44,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-17,-19,-8,-9,-10,-12,-5,-11,-13,-6,-7,]),'FUNCTION':([0,4,13,22,23,24,25,26,27,28,32,34,38,52,53,54,59,63,64,65,66,67,68,69,70,71,72,73,74,75,77,78,80,83,84,85,86,93,94,97,99,100,103,106,107,109,110,113,],[5,5,-21,-43,-45,-46,-47,-48,-49,-50,-20,-18,5,-28,-29,5,-44,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-17,-19,5,-8,-9,-10,5,-12,5,-5,5,-11,5,-13,5,5,-6,-7,]),'FOR':([0,4,13,22,23,24,25,26,27,28,32,34,38,52,53,54,59,63,64,65,66,67,68,69,70,71,72,73,74,75,77,78,80,83,84,85,86,93,94,97,99,100,103,106,107,109,110,113,],[7,7,-21,-43,-45,-46,-47,-48,-49,-50,-20,-18,7,-28,-29,7,-44,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-17,-19,7,-8,-9,-10,7,-12,7,-5,7,-11,7,-13,7,7,-6,-7,]),'WHILE':([0,4,13,22,23,24,25,26,27,28,32,34,38,52,53,54,59,63,64,65,66,67,68,69,70,71,72,73,74,75,77,78,80,83,84,85,86,93,94,97,99,100,103,106,107,109,110,113,],[8,8,-21,-43,-45,-46,-47,-48,-49,-50,-20,-18,8,-28,-29,8,-44,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-17,-19,8,-8,-9,-10,8,-12,8,-5,8,-11,8,-13,8,8,-6,-7,]),'IF':([0,4,13,22,23,24,25,26,27,28,32,34,38,52,53,54,59,63,64,65,66,67,68,69,70,71,72,73,74,75,77,78,80,83,84,85,86,93,94,97,99,100,103,106,107,109,110,113,],[9,9,-21,-43,-45,-46,-47,-48,-49,-50,-20,-18,9,-28,-29,9,-44,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-17,-19,9,-8,-9,-10,9,-12,9,-5,9,-11,9,-13,9,9,-6,-7,]),'LOCAL':([0,4,13,22,23,24,25,26,27,28,32,34,38,52,53,54,59,63,64,65,66,67,68,69,70,71,72,73,74,75,77,78,80,83,84,85,86,93,94,97,99,100,103,106,107,109,110,113,],[10,10,-21,-43,-45,-46,-47,-48,-49,-50,-20,-18,10,-28,-29,10,-44,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-17,-19,10,-8,-9,-10,10,-12,10,-5,10,-11,10,-13,10,10,-6,-7,]),'NAME':([0,4,5,7,8,9,10,12,13,16,17,20,21,22,23,24,25,26,27,28,31,32,33,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,59,60,63,64,65,66,67,68,69,70,71,72,73,74,75,77,78,79,80,82,83,84,85,86,88,93,94,95,97,98,99,100,103,106,107,109,110,113,],[6,6,15,18,25,25,30,25,-21,25,25,25,25,-43,-45,-46,-47,-48,-49,-50,25,-20,57,-18,25,6,25,25,25,25,25,25,25,25,25,25,25,25,25,-28,-29,6,25,-44,25,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-17,-19,57,6,25,-8,-9,-10,6,25,-12,6,25,-5,25,6,-11,6,-13,6,6,-6,-7,]),'PRINT':([0,4,13,22,23,24,25,26,27,28,32,34,38,52,53,54,59,63,64,65,66,67,68,69,70,71,72,73,74,75,77,78,80,83,84,85,86,93,94,97,99,100,103,106,107,109,110,113,],[11,11,-21,-43,-45,-46,-47,-48,-49,-50,-20,-18,11,-28,-29,11,-44,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-17,-19,11,-8,-9,-10,11,-12,11,-5,11,-11,11,-13,11,11,-6,-7,]),'RETURN':([0,4,13,22,23,24,25,26,27,28,32,34,38,52,53,54,59,63,64,65,66,67,68,69,70,71,72,73,74,75,77,78,80,83,84,85,86,93,94,97,99,100,103,106,107,109,110,113,],[12,12,-21,-43,-45,-46,-47,-48,-49,-50,-20,-18,12,-28,-29,12,-44,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-17,-19,12,-8,-9,-10,12,-12,12,-5,12,-11,12,-13,12,12,-6,-7,]),'END':([4,13,14,22,23,24,25,26,27,28,32,34,52,53,59,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,83,84,85,87,90,92,93,97,100,101,105,106,108,110,111,112,113,],[-4,-21,-3,-43,-45,-46,-47,-48,-49,-50,-20,-18,-28,-29,-44,83,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,85,-17,-19,-8,-9,-10,93,97,100,-12,-5,-11,106,110,-13,-14,-6,-15,113,-7,]),'ELSE':([4,13,14,22,23,24,25,26,27,28,32,34,52,53,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,83,84,85,87,93,97,100,106,108,110,111,113,],[-4,-21,-3,-43,-45,-46,-47,-48,-49,-50,-20,-18,-28,-29,-44,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,86,-17,-19,-8,-9,-10,94,-12,-5,-11,-13,-14,-6,-15,-7,]),'ELSEIF':([4,13,14,22,23,24,25,26,27,28,32,34,52,53,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,83,84,85,87,93,97,100,106,108,110,111,113,],[-4,-21,-3,-43,-45,-46,-47,-48,-49,-50,-20,-18,-28,-29,-44,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,88,-17,-19,-8,-9,-10,95,-12,-5,-11,-13,-14,-6,-15,-7,]),'ATRIB':([6,18,30,],[16,37,55,]),'LPAREN':([6,11,15,25,],[17,31,33,17,]),'MINUS':([8,9,12,16,17,19,20,21,22,23,24,25,26,27,28,29,31,32,34,36,37,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,55,56,59,60,61,63,64,65,66,67,68,69,70,71,72,73,74,75,77,82,88,91,95,96,98,102,104,],[20,20,20,20,20,40,20,20,-43,-45,-46,-47,-48,-49,-50,40,20,40,40,40,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-28,-29,20,40,-44,20,40,-30,-31,-32,-33,-34,-35,40,40,40,40,40,40,40,40,20,20,40,20,40,20,40,40,]),'NOT':([8,9,12,16,17,20,21,31,37,39,40,41,42,43,44,45,46,47,48,49,50,51,55,60,82,88,95,98,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'NUMBER':([8,9,12,16,17,20,21,31,37,39,40,41,42,43,44,45,46,47,48,49,50,51,55,60,82,88,95,98,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'STRING':([8,9,12,16,17,20,21,31,37,39,40,41,42,43,44,45,46,47,48,49,50,51,55,60,82,88,95,98,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'TRUE':([8,9,12,16,17,20,21,31,37,39,40,41,42,43,44,45,46,47,48,49,50,51,55,60,82,88,95,98,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'FALSE':([8,9,12,16,17,20,21,31,37,39,40,41,42,43,44,45,46,47,48,49,50,51,55,60,82,88,95,98,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'NIL':([8,9,12,16,17,20,21,31,37,39,40,41,42,43,44,45,46,47,48,49,50,51,55,60,82,88,95,98,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'RPAREN':([17,22,23,24,25,26,27,28,33,35,36,52,53,56,57,58,59,60,63,64,65,66,67,68,69,70,71,72,73,74,75,79,81,89,],[-27,-43,-45,-46,-47,-48,-49,-50,-24,59,-26,-28,-29,78,-23,80,-44,-27,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-24,-25,-22,]),'DO':([19,22,23,24,25,26,27,28,52,53,59,63,64,65,66,67,68,69,70,71,72,73,74,75,91,104,],[38,-43,-45,-46,-47,-48,-49,-50,-28,-29,-44,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,99,109,]),'PLUS':([19,22,23,24,25,26,27,28,29,32,34,36,52,53,56,59,61,63,64,65,66,67,68,69,70,71,72,73,74,75,77,91,96,102,104,],[39,-43,-45,-46,-47,-48,-49,-50,39,39,39,39,-28,-29,39,-44,39,-30,-31,-32,-33,-34,-35,39,39,39,39,39,39,39,39,39,39,39,39,]),'TIMES':([19,22,23,24,25,26,27,28,29,32,34,36,52,53,56,59,61,63,64,65,66,67,68,69,70,71,72,73,74,75,77,91,96,102,104,],[41,-43,-45,-46,-47,-48,-49,-50,41,41,41,41,-28,-29,41,-44,41,41,41,-32,-33,-34,-35,41,41,41,41,41,41,41,41,41,41,41,41,]),'DIVIDE':([19,22,23,24,25,26,27,28,29,32,34,36,52,53,56,59,61,63,64,65,66,67,68,69,70,71,72,73,74,75,77,91,96,102,104,],[42,-43,-45,-46,-47,-48,-49,-50,42,42,42,42,-28,-29,42,-44,42,42,42,-32,-33,-34,-35,42,42,42,42,42,42,42,42,42,42,42,42,]),'PERCENTUAL':([19,22,23,24,25,26,27,28,29,32,34,36,52,53,56,59,61,63,64,65,66,67,68,69,70,71,72,73,74,75,77,91,96,102,104,],[43,-43,-45,-46,-47,-48,-49,-50,43,43,43,43,-28,-29,43,-44,43,43,43,-32,-33,-34,-35,43,43,43,43,43,43,43,43,43,43,43,43,]),'EXPO':([19,22,23,24,25,26,27,28,29,32,34,36,52,53,56,59,61,63,64,65,66,67,68,69,70,71,72,73,74,75,77,91,96,102,104,],[44,-43,-45,-46,-47,-48,-49,-50,44,44,44,44,44,44,44,-44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'EQUALS':([19,22,23,24,25,26,27,28,29,32,34,36,52,53,56,59,61,63,64,65,66,67,68,69,70,71,72,73,74,75,77,91,96,102,104,],[45,-43,-45,-46,-47,-48,-49,-50,45,45,45,45,-28,-29,45,-44,45,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,45,45,45,45,45,45,45,]),'LTEQUALS':([19,22,23,24,25,26,27,28,29,32,34,36,52,53,56,59,61,63,64,65,66,67,68,69,70,71,72,73,74,75,77,91,96,102,104,],[46,-43,-45,-46,-47,-48,-49,-50,46,46,46,46,-28,-29,46,-44,46,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,46,46,46,46,46,46,46,]),'GTEQUALS':([19,22,23,24,25,26,27,28,29,32,34,36,52,53,56,59,61,63,64,65,66,67,68,69,70,71,72,73,74,75,77,91,96,102,104,],[47,-43,-45,-46,-47,-48,-49,-50,47,47,47,47,-28,-29,47,-44,47,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,47,47,47,47,47,47,47,]),'LT':([19,22,23,24,25,26,27,28,29,32,34,36,52,53,56,59,61,63,64,65,66,67,68,69,70,71,72,73,74,75,77,91,96,102,104,],[48,-43,-45,-46,-47,-48,-49,-50,48,48,48,48,-28,-29,48,-44,48,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,48,48,48,48,48,48,48,]),'GT':([19,22,23,24,25,26,27,28,29,32,34,36,52,53,56,59,61,63,64,65,66,67,68,69,70,71,72,73,74,75,77,91,96,102,104,],[49,-43,-45,-46,-47,-48,-49,-50,49,49,49,49,-28,-29,49,-44,49,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,49,49,49,49,49,49,49,]),'AND':([19,22,23,24,25,26,27,28,29,32,34,36,52,53,56,59,61,63,64,65,66,67,68,69,70,71,72,73,74,75,77,91,96,102,104,],[50,-43,-45,-46,-47,-48,-49,-50,50,50,50,50,-28,-29,50,-44,50,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,50,50,50,50,50,50,]),'OR':([19,22,23,24,25,26,27,28,29,32,34,36,52,53,56,59,61,63,64,65,66,67,68,69,70,71,72,73,74,75,77,91,96,102,104,],[51,-43,-45,-46,-47,-48,-49,-50,51,51,51,51,-28,-29,51,-44,51,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,51,51,51,51,51,]),'THEN':([22,23,24,25,26,27,28,29,52,53,59,63,64,65,66,67,68,69,70,71,72,73,74,75,96,102,],[-43,-45,-46,-47,-48,-49,-50,54,-28,-29,-44,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,103,107,]),'COMMA':([22,23,24,25,26,27,28,36,52,53,57,59,61,63,64,65,66,67,68,69,70,71,72,73,74,75,91,],[-43,-45,-46,-47,-48,-49,-50,60,-28,-29,79,-44,82,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,98,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'statements':([0,4,36,72,77,85,90,94,98,100,],[2,13,57,81,83,92,96,99,102,103,]),'empty':([0,],[3,]),'statement':([0,4,36,72,77,85,90,94,98,100,],[4,4,4,4,4,4,4,4,4,4,]),'function_call':([0,4,8,11,15,16,19,20,29,35,36,37,38,39,40,41,42,43,44,45,46,47,50,55,72,74,77,79,85,86,89,90,94,98,100,],[12,12,21,21,21,21,21,21,21,21,12,21,21,21,21,21,21,21,21,21,21,21,21,21,12,21,12,21,12,21,21,12,12,12,12,]),'expression':([8,11,15,16,19,20,29,35,37,38,39,40,41,42,43,44,45,46,47,50,55,74,79,86,89,],[18,30,32,34,48,49,51,56,58,59,60,61,62,63,64,65,66,67,68,69,34,82,87,93,95,]),'arguments':([16,55,],[33,73,]),'parameters':([31,71,],[53,80,]),'if_tail':([57,],[75,]),'elseif_list':([57,],[78,]),}
+_lr_goto_items = {'program':([0,],[1,]),'statements':([0,4,38,54,80,86,94,99,103,107,109,],[2,14,62,76,90,92,101,105,108,111,112,]),'empty':([0,],[3,]),'statement':([0,4,38,54,80,86,94,99,103,107,109,],[4,4,4,4,4,4,4,4,4,4,4,]),'function_call':([0,4,8,9,12,16,17,20,21,31,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,54,55,60,80,82,86,88,94,95,98,99,103,107,109,],[13,13,22,22,22,22,22,22,22,22,22,13,22,22,22,22,22,22,22,22,22,22,22,22,22,13,22,22,13,22,13,22,13,22,22,13,13,13,13,]),'expression':([8,9,12,16,17,20,21,31,37,39,40,41,42,43,44,45,46,47,48,49,50,51,55,60,82,88,95,98,],[19,29,32,34,36,52,53,56,61,63,64,65,66,67,68,69,70,71,72,73,74,75,77,36,91,96,102,104,]),'arguments':([17,60,],[35,81,]),'parameters':([33,79,],[58,89,]),'if_tail':([76,],[84,]),'elseif_list':([76,],[87,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,51 +27,54 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> statements','program',1,'p_program','ExpressionLanguageParser.py',40),
-  ('program -> empty','program',1,'p_program','ExpressionLanguageParser.py',41),
-  ('statements -> statement statements','statements',2,'p_statements_multiple','ExpressionLanguageParser.py',46),
-  ('statements -> statement','statements',1,'p_statements_single','ExpressionLanguageParser.py',50),
-  ('statement -> FUNCTION NAME LPAREN parameters RPAREN statements END','statement',7,'p_statement_funcdecl','ExpressionLanguageParser.py',55),
-  ('statement -> FOR NAME ATRIB expression COMMA expression DO statements END','statement',9,'p_statement_for','ExpressionLanguageParser.py',59),
-  ('statement -> FOR NAME ATRIB expression COMMA expression COMMA expression DO statements END','statement',11,'p_statement_for','ExpressionLanguageParser.py',60),
-  ('statement -> IF expression THEN statements if_tail','statement',5,'p_statement_if','ExpressionLanguageParser.py',82),
-  ('if_tail -> END','if_tail',1,'p_if_tail_end','ExpressionLanguageParser.py',87),
-  ('if_tail -> ELSE statements END','if_tail',3,'p_if_tail_else','ExpressionLanguageParser.py',91),
-  ('if_tail -> elseif_list END','if_tail',2,'p_if_tail_elseif','ExpressionLanguageParser.py',95),
-  ('if_tail -> elseif_list ELSE statements END','if_tail',4,'p_if_tail_elseif_else','ExpressionLanguageParser.py',99),
-  ('elseif_list -> ELSEIF expression THEN statements','elseif_list',4,'p_elseif_list_single','ExpressionLanguageParser.py',103),
-  ('elseif_list -> elseif_list ELSEIF expression THEN statements','elseif_list',5,'p_elseif_list_multi','ExpressionLanguageParser.py',107),
-  ('empty -> <empty>','empty',0,'p_empty','ExpressionLanguageParser.py',112),
-  ('statement -> LOCAL NAME ATRIB expression','statement',4,'p_statement_assign_local','ExpressionLanguageParser.py',119),
-  ('statement -> NAME ATRIB expression','statement',3,'p_statement_assign','ExpressionLanguageParser.py',124),
-  ('statement -> PRINT LPAREN expression RPAREN','statement',4,'p_statement_print','ExpressionLanguageParser.py',129),
-  ('statement -> RETURN expression','statement',2,'p_statement_return','ExpressionLanguageParser.py',134),
-  ('statement -> function_call','statement',1,'p_statement_call','ExpressionLanguageParser.py',139),
-  ('parameters -> NAME COMMA parameters','parameters',3,'p_parameters_multi','ExpressionLanguageParser.py',146),
-  ('parameters -> NAME','parameters',1,'p_parameters_single','ExpressionLanguageParser.py',150),
-  ('parameters -> <empty>','parameters',0,'p_parameters_empty','ExpressionLanguageParser.py',154),
-  ('arguments -> expression COMMA arguments','arguments',3,'p_arguments_multi','ExpressionLanguageParser.py',159),
-  ('arguments -> expression','arguments',1,'p_arguments_single','ExpressionLanguageParser.py',163),
-  ('arguments -> <empty>','arguments',0,'p_arguments_empty','ExpressionLanguageParser.py',167),
-  ('expression -> MINUS expression','expression',2,'p_expression_uminus','ExpressionLanguageParser.py',173),
-  ('expression -> NOT expression','expression',2,'p_expression_not','ExpressionLanguageParser.py',177),
-  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',181),
-  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',182),
-  ('expression -> expression TIMES expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',183),
-  ('expression -> expression DIVIDE expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',184),
-  ('expression -> expression EQUALS expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',185),
-  ('expression -> expression LTEQUALS expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',186),
-  ('expression -> expression GTEQUALS expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',187),
-  ('expression -> expression LT expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',188),
-  ('expression -> expression GT expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',189),
-  ('expression -> expression AND expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',190),
-  ('expression -> expression OR expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',191),
-  ('expression -> function_call','expression',1,'p_expression_call','ExpressionLanguageParser.py',195),
-  ('function_call -> NAME LPAREN arguments RPAREN','function_call',4,'p_function_call','ExpressionLanguageParser.py',200),
-  ('expression -> NUMBER','expression',1,'p_expression_atom','ExpressionLanguageParser.py',204),
-  ('expression -> STRING','expression',1,'p_expression_atom','ExpressionLanguageParser.py',205),
-  ('expression -> NAME','expression',1,'p_expression_atom','ExpressionLanguageParser.py',206),
-  ('expression -> TRUE','expression',1,'p_expression_atom','ExpressionLanguageParser.py',207),
-  ('expression -> FALSE','expression',1,'p_expression_atom','ExpressionLanguageParser.py',208),
-  ('expression -> NIL','expression',1,'p_expression_atom','ExpressionLanguageParser.py',209),
+  ('program -> statements','program',1,'p_program','ExpressionLanguageParser.py',61),
+  ('program -> empty','program',1,'p_program','ExpressionLanguageParser.py',62),
+  ('statements -> statement statements','statements',2,'p_statements_multiple','ExpressionLanguageParser.py',68),
+  ('statements -> statement','statements',1,'p_statements_single','ExpressionLanguageParser.py',72),
+  ('statement -> FUNCTION NAME LPAREN parameters RPAREN statements END','statement',7,'p_statement_funcdecl','ExpressionLanguageParser.py',77),
+  ('statement -> FOR NAME ATRIB expression COMMA expression DO statements END','statement',9,'p_statement_for','ExpressionLanguageParser.py',81),
+  ('statement -> FOR NAME ATRIB expression COMMA expression COMMA expression DO statements END','statement',11,'p_statement_for','ExpressionLanguageParser.py',82),
+  ('statement -> WHILE expression DO statements END','statement',5,'p_statement_while','ExpressionLanguageParser.py',103),
+  ('statement -> IF expression THEN statements if_tail','statement',5,'p_statement_if','ExpressionLanguageParser.py',109),
+  ('if_tail -> END','if_tail',1,'p_if_tail_end','ExpressionLanguageParser.py',114),
+  ('if_tail -> ELSE statements END','if_tail',3,'p_if_tail_else','ExpressionLanguageParser.py',118),
+  ('if_tail -> elseif_list END','if_tail',2,'p_if_tail_elseif','ExpressionLanguageParser.py',122),
+  ('if_tail -> elseif_list ELSE statements END','if_tail',4,'p_if_tail_elseif_else','ExpressionLanguageParser.py',126),
+  ('elseif_list -> ELSEIF expression THEN statements','elseif_list',4,'p_elseif_list_single','ExpressionLanguageParser.py',130),
+  ('elseif_list -> elseif_list ELSEIF expression THEN statements','elseif_list',5,'p_elseif_list_multi','ExpressionLanguageParser.py',134),
+  ('empty -> <empty>','empty',0,'p_empty','ExpressionLanguageParser.py',139),
+  ('statement -> LOCAL NAME ATRIB expression','statement',4,'p_statement_assign_local','ExpressionLanguageParser.py',146),
+  ('statement -> NAME ATRIB expression','statement',3,'p_statement_assign','ExpressionLanguageParser.py',151),
+  ('statement -> PRINT LPAREN expression RPAREN','statement',4,'p_statement_print','ExpressionLanguageParser.py',156),
+  ('statement -> RETURN expression','statement',2,'p_statement_return','ExpressionLanguageParser.py',161),
+  ('statement -> function_call','statement',1,'p_statement_call','ExpressionLanguageParser.py',166),
+  ('parameters -> NAME COMMA parameters','parameters',3,'p_parameters_multi','ExpressionLanguageParser.py',173),
+  ('parameters -> NAME','parameters',1,'p_parameters_single','ExpressionLanguageParser.py',177),
+  ('parameters -> <empty>','parameters',0,'p_parameters_empty','ExpressionLanguageParser.py',181),
+  ('arguments -> expression COMMA arguments','arguments',3,'p_arguments_multi','ExpressionLanguageParser.py',186),
+  ('arguments -> expression','arguments',1,'p_arguments_single','ExpressionLanguageParser.py',190),
+  ('arguments -> <empty>','arguments',0,'p_arguments_empty','ExpressionLanguageParser.py',194),
+  ('expression -> MINUS expression','expression',2,'p_expression_uminus','ExpressionLanguageParser.py',200),
+  ('expression -> NOT expression','expression',2,'p_expression_not','ExpressionLanguageParser.py',204),
+  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',208),
+  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',209),
+  ('expression -> expression TIMES expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',210),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',211),
+  ('expression -> expression PERCENTUAL expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',212),
+  ('expression -> expression EXPO expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',213),
+  ('expression -> expression EQUALS expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',214),
+  ('expression -> expression LTEQUALS expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',215),
+  ('expression -> expression GTEQUALS expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',216),
+  ('expression -> expression LT expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',217),
+  ('expression -> expression GT expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',218),
+  ('expression -> expression AND expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',219),
+  ('expression -> expression OR expression','expression',3,'p_expression_binop','ExpressionLanguageParser.py',220),
+  ('expression -> function_call','expression',1,'p_expression_call','ExpressionLanguageParser.py',224),
+  ('function_call -> NAME LPAREN arguments RPAREN','function_call',4,'p_function_call','ExpressionLanguageParser.py',229),
+  ('expression -> NUMBER','expression',1,'p_expression_atom','ExpressionLanguageParser.py',233),
+  ('expression -> STRING','expression',1,'p_expression_atom','ExpressionLanguageParser.py',234),
+  ('expression -> NAME','expression',1,'p_expression_atom','ExpressionLanguageParser.py',235),
+  ('expression -> TRUE','expression',1,'p_expression_atom','ExpressionLanguageParser.py',236),
+  ('expression -> FALSE','expression',1,'p_expression_atom','ExpressionLanguageParser.py',237),
+  ('expression -> NIL','expression',1,'p_expression_atom','ExpressionLanguageParser.py',238),
 ]